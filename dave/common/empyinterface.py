@@ -5,6 +5,8 @@ Interface for Empy templating system.
 import em
 import os
 import re
+import threading
+from StringIO import StringIO
 
 class EmpyInterface(em.Interpreter):
   ''' 
@@ -13,26 +15,103 @@ class EmpyInterface(em.Interpreter):
     - dst_file: destination filename
     - param: a dict contains variable/value pairs to put in
   If there are multiple empty lines, those will be replaced with a single empty line
+  Interpreters are serialized by a lock since they share the stdout proxy of Empy,
+  which makes it safe to generate files from multiple threads.
   '''
+  _lock = threading.RLock()
+
   def __init__(self, dst_file=''): 
     self._dst_file = dst_file
-    self._dst_fid = open(dst_file, 'w')
-    em.Interpreter.__init__(self, self._dst_fid, None, em.DEFAULT_PREFIX, None, None, None, None)
 
   def __call__(self, src_file, param):
-    try:
-      self.updateGlobals(param)
-      if type(src_file) == type(''):
-        with open(src_file, 'r') as f:
-          self.file(f)
-      else:
-        self.file(src_file)
-    finally:
-      self.shutdown()
-      self._dst_fid.close()
+    with self._lock:
+      self._dst_fid = open(self._dst_file, 'w')
+      em.Interpreter.__init__(self, self._dst_fid, None, em.DEFAULT_PREFIX, None, None, None, None)
+      try:
+        self.updateGlobals(param)
+        if type(src_file) == type(''):
+          with open(src_file, 'r') as f:
+            self.file(f)
+        else:
+          self.file(src_file)
+      finally:
+        self.shutdown()
+        self._dst_fid.close()
     with open(self._dst_file, 'rt') as f:
       c = f.read()
     # replace multiple empty lines with a single empty line
     with open(self._dst_file, 'w') as f:
       f.write(re.sub(r'[\r\n][\r\n]{2,}', '\n\n', c)) 
     return os.path.abspath(self._dst_file)
+
+  @classmethod
+  def expand(cls, src, param):
+    ''' return a template string (src) expanded with param in memory '''
+    with cls._lock:
+      interpreter = em.Interpreter(StringIO(), None, em.DEFAULT_PREFIX, None, None, None, None)
+      try:
+        interpreter.updateGlobals(param)
+        return interpreter.expand(src)
+      finally:
+        interpreter.shutdown()
+
+class CompiledTemplate(object):
+  '''
+  Empy template compiled once to bind different variables repeatedly (e.g. test vectors to a testbench)
+    - src_file: source template, either a filename or a file object
+  A template which contains only text and simple variable substitutions (@name) 
+  is split into literal strings and variable slots, so binding is a join in memory 
+  followed by one write. Otherwise, it is expanded by Empy interpreter.
+  As EmpyInterface, multiple empty lines are replaced with a single empty line.
+  '''
+  IDENTIFIER = re.compile(r'^[A-Za-z_]\w*$')
+
+  def __init__(self, src_file):
+    if type(src_file) == type(''):
+      with open(src_file, 'r') as f:
+        self._src = f.read()
+    else:
+      self._src = src_file.read()
+    self._plan = self._compile(self._src)
+
+  def expand(self, param):
+    ''' return the template expanded with param, a dict of variable/value pairs '''
+    if self._plan is None or any([ name not in param for literal, name in self._plan if name != None ]):
+      return EmpyInterface.expand(self._src, param)
+    out = []
+    for literal, name in self._plan:
+      out.append(literal)
+      if name != None and param[name] is not None:
+        out.append(str(param[name]))
+    return ''.join(out)
+
+  def __call__(self, dst_file, param):
+    ''' write the template expanded with param to dst_file, and return its absolute path '''
+    with open(dst_file, 'w') as f:
+      f.write(re.sub(r'[\r\n][\r\n]{2,}', '\n\n', self.expand(param)))
+    return os.path.abspath(dst_file)
+
+  def _compile(self, src):
+    ''' return a list of (literal string, variable name or None), or None if src has other markups '''
+    plan = []
+    # a trailing newline terminates a simple expression at the end, and it is removed from the plan
+    scanner = em.Scanner(em.DEFAULT_PREFIX, src + '\n')
+    try:
+      while scanner:
+        token = scanner.one()
+        if isinstance(token, em.NullToken):
+          plan.append((token.data, None))
+        elif isinstance(token, em.PrefixToken):
+          plan.append((em.DEFAULT_PREFIX, None))
+        elif isinstance(token, em.WhitespaceToken):
+          pass
+        elif isinstance(token, em.SimpleExpressionToken) and self.IDENTIFIER.match(token.code):
+          plan.append(('', token.code))
+        else:
+          return None
+    except em.Error:
+      return None
+    if not plan or plan[-1][1] != None or not plan[-1][0].endswith('\n'):
+      return None
+    plan[-1] = (plan[-1][0][:-1], None)
+    return plan
@@ -95,6 +95,33 @@ def bin2thermdec(binstr):
   n = len(binstr)-1
   return int(sum(1 for i,bit in enumerate(binstr) if bit=='1'))
 
+def dec2bin_array(values, bw):
+  ''' convert decimal numbers(values) to a (N x bw) bit matrix, MSB first '''
+  values = np.asarray(values).astype(np.int64).reshape(-1)
+  return ((values[:,None] >> np.arange(bw-1,-1,-1)) & 1).astype(np.uint8)
+
+def bin2dec_array(bits):
+  ''' convert a (N x bw) bit matrix, MSB first, to unsigned decimal numbers '''
+  bits = np.asarray(bits, dtype=np.int64)
+  return np.dot(bits, 1 << np.arange(bits.shape[1]-1,-1,-1))
+
+def dec2binstr_array(values, bw):
+  ''' convert decimal numbers(values) to an array of binary strings w/ bit width(bw) '''
+  return (dec2bin_array(values, bw) + ord('0')).view('S%d' % bw).reshape(-1)
+
+def binstr2dec_array(binstrs, prefix=''):
+  ''' convert an array of binary strings with an optional prefix (e.g. 'b') to unsigned decimal numbers '''
+  binstrs = np.asarray(binstrs, dtype='S')
+  if prefix:
+    binstrs = np.char.lstrip(binstrs, prefix)
+  bw = binstrs.dtype.itemsize
+  bits = np.char.zfill(binstrs, bw).view(np.uint8).reshape(-1, bw) - ord('0')
+  return bin2dec_array(bits)
+
+def bin2thermdec_array(values, bw):
+  ''' convert decimal numbers(values) to thermometer-decoded numbers, i.e. # of ones in bw bits '''
+  return dec2bin_array(values, bw).sum(axis=1).astype(np.int64)
+
 def all_gray(bitw, invert=False, dtype='int'):
   ''' returns a list of all possible gray codes for given bit width 'bitw' '''
   G=lambda n:n and['0'+x for x in G(n-1)]+['1'+x for x in G(n-1)[::-1]]or['']
@@ -0,0 +1,117 @@
+__doc__ = """
+Reader of waveform dump files, e.g. the ones written by mLingua "dump"/"dump_diff"
+modules in window mode, where each line is a "time value" pair of a PWL signal.
+
+  - A dump file is parsed in chunks so that a large transient dump is loaded
+    without holding its text and a list of parsed lines in memory.
+  - The parsed data are cached in a binary sidecar file (<dump file>.npy) whose
+    first row holds the modification time and size of the dump file. The sidecar
+    is used, being memory-mapped, as long as the dump file is not changed.
+  - A waveform is resampled on a uniform time grid by linear interpolation of
+    its PWL points (np.interp) at once.
+
+Example:
+  from dave.mlingua.waveform import Waveform
+  wave = Waveform.load('output.txt')
+  time, value = wave.resample(ts, te, ti)
+"""
+
+import os
+import numpy as np
+from StringIO import StringIO
+
+CHUNK_SIZE = 1 << 22 # bytes of text parsed at once
+
+def iter_chunks(filename, chunk_size=CHUNK_SIZE):
+  ''' parse a text file of whitespace-separated numbers, and yield 2-D arrays of rows in chunks '''
+  ncol = None
+  rest = ''
+  with open(filename, 'r') as f:
+    while True:
+      text = f.read(chunk_size)
+      if text == '':
+        break
+      text = rest + text
+      idx = text.rfind('\n') + 1
+      text, rest = text[:idx], text[idx:]
+      if text.strip() == '':
+        continue
+      if ncol == None:
+        ncol = len(text.lstrip().split('\n', 1)[0].split()) # from the first line
+      yield _parse_chunk(text, ncol)
+  if rest.strip() != '': # the last line without a newline
+    if ncol == None:
+      ncol = len(rest.split())
+    yield _parse_chunk(rest + '\n', ncol)
+
+def _parse_chunk(text, ncol): # text of complete lines to an array of (no. of lines, ncol)
+  values = np.fromstring(text, sep=' ')
+  if values.size == ncol*text.count('\n'):
+    return values.reshape(-1, ncol)
+  # e.g. blank lines or an invalid number, which are left to np.loadtxt
+  return np.loadtxt(StringIO(text), ndmin=2)
+
+def parse(filename, chunk_size=CHUNK_SIZE):
+  ''' return a 2-D array of a text file of whitespace-separated numbers '''
+  chunks = list(iter_chunks(filename, chunk_size))
+  if not chunks:
+    return np.zeros((0, 0))
+  return np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+
+def get_sidecar_filename(filename):
+  return filename + '.npy'
+
+def load(filename, cache=True):
+  ''' return a 2-D array of a dump file.
+      If cache is True, it is loaded from (or saved to) its binary sidecar file.
+  '''
+  if not cache:
+    return parse(filename)
+  sidecar = get_sidecar_filename(filename)
+  stat = os.stat(filename)
+  key = [stat.st_mtime, stat.st_size] # a dump rewritten within the mtime resolution has a different size mostly
+  if os.path.isfile(sidecar):
+    try:
+      data = np.load(sidecar, mmap_mode='r')
+      if data.ndim == 2 and data.shape[0] > 0 and data.shape[1] >= 2 and list(data[0,:2]) == key:
+        return data[1:]
+    except (IOError, ValueError): # e.g. a corrupted sidecar
+      pass
+  data = parse(filename)
+  if data.ndim == 2 and data.shape[1] >= 2: # the key row needs two columns
+    header = np.zeros((1, data.shape[1]))
+    header[0,:2] = key
+    try:
+      np.save(sidecar, np.vstack([header, data]))
+    except (IOError, OSError): # e.g. a read-only directory
+      pass
+  return data
+
+#------------------------------------------------------
+class Waveform(object):
+  ''' A PWL waveform of (time, value) points
+        - t: time points in increasing order
+        - y: values at the time points
+  '''
+  def __init__(self, t, y):
+    self.t = np.asarray(t, dtype=float)
+    self.y = np.asarray(y, dtype=float)
+
+  @classmethod
+  def load(cls, filename, column=1, cache=True):
+    ''' return a waveform of a dump file whose first column is time and
+        the column-th column is a value
+    '''
+    data = load(filename, cache)
+    return cls(data[:,0], data[:,column])
+
+  def __call__(self, time):
+    ''' return values at time (a number or an array) by linear interpolation.
+        Values beyond the time points are those at the end points.
+    '''
+    return np.interp(time, self.t, self.y)
+
+  def resample(self, ts, te, ti):
+    ''' return a tuple of (time, value) arrays on a uniform grid, np.arange(ts, te, ti) '''
+    time = np.arange(ts, te, ti)
+    return time, self(time)
@@ -0,0 +1,108 @@
+__doc__ = '''
+Adaptive, sequential sampling of test vectors for on-the-fly checking.
+
+Instead of consuming pre-generated test vectors in their generated order,
+the next batch of vectors is picked from the candidate pool (i.e. the
+vector store of a mode) so that it maximizes the information of the
+current linear model (greedy D-optimal selection; a candidate with the
+largest leverage is picked one by one). Sampling stops as soon as the
+confidence intervals of the extracted linear models meet the absolute
+tolerances of the output responses.
+'''
+
+import numpy as np
+
+from dave.common.davelogger import DaVELogger
+from vectorgenerator import TestVectorGenerator
+import dave.mprobo.mchkmsg as mcode
+
+#------------------------------------------------------
+class AdaptiveSampler(object):
+  ''' Sequential D-optimal sampler over a candidate pool
+        - ph: port handler object
+        - vector: vector store (candidate pool) of a mode, which will be reordered in-place
+        - mode: a dict of digital mode
+        - order: polynomial order of the model
+        - en_interact: True if the model has the 1st order interaction terms
+        - ridge: regularization of the information matrix to start with
+  '''
+  def __init__(self, ph, vector, mode, order=1, en_interact=False, ridge=1e-6, logger_id='logger_id'):
+    self._logger = DaVELogger.get_logger('%s.%s.%s' % (logger_id, __name__, self.__class__.__name__))
+    self._ph = ph
+    self._vector = vector
+    self._X = self._build_design_matrix(vector, mode, order, en_interact)
+    self._M_inv = np.eye(self._X.shape[1])/ridge # inverse of information matrix of selected samples
+    self._n_selected = 0
+    self.index = np.arange(len(vector)) # generated order of the reordered vectors
+
+  @property
+  def n_term(self): # number of terms of the model for selection
+    return self._X.shape[1]
+
+  def select(self, start, n):
+    ''' Select n vectors out of the candidates vector[start:] and move them to vector[start:start+n].
+        Selected vectors before "start" are assumed to be already simulated.
+    '''
+    assert start == self._n_selected
+    pool = range(start, len(self._vector))
+    chosen = []
+    for i in range(min(n, len(pool))):
+      X = self._X[pool]
+      leverage = np.einsum('ij,jk,ik->i', X, self._M_inv, X)
+      k = pool.pop(int(np.argmax(leverage)))
+      x = self._X[k]
+      Mx = np.dot(self._M_inv, x) # Sherman-Morrison rank-1 update
+      self._M_inv -= np.outer(Mx, Mx)/(1.0 + np.dot(x, Mx))
+      chosen.append(k)
+    order = np.array(range(start) + chosen + pool)
+    self._vector[:] = self._vector[order]
+    self._X = self._X[order]
+    self.index = self.index[order]
+    self._n_selected += len(chosen)
+    self._logger.debug(mcode.DEBUG_021 % (len(chosen), start))
+
+  def is_converged(self, lrs):
+    ''' True if the prediction uncertainty bound of the linear models in lrs (list of LinearRegressionSM)
+        is within abstol for all the responses. The bound is the sum of
+        (half width of confidence interval)*(range of predictor) over the predictors.
+    '''
+    for lr in lrs:
+      for dv in lr.get_response_name():
+        bound = self.get_uncertainty(lr, dv)
+        abstol = self._ph.get_by_name(dv).abstol
+        self._logger.debug(mcode.DEBUG_022 % (dv, bound, abstol))
+        if not (bound <= abstol): # also catches NaN, e.g. no residual degrees of freedom
+          return False
+    return True
+
+  @classmethod
+  def get_uncertainty(cls, lr, dv):
+    ''' return the uncertainty bound of a response dv from the confidence intervals of a linear model '''
+    cint = lr.get_statistics()['confidence_interval'][dv]
+    exog = lr.exog[dv]
+    half = 0.5*np.abs(cint[:,1] - cint[:,0])
+    span = np.array([ np.ptp(exog[p]) if p != lr.get_intercept_name() else 1.0 for p in lr.get_predictors()[dv] ])
+    return np.sum(half*span)
+
+  def _build_design_matrix(self, vector, mode, order, en_interact):
+    ''' build a design matrix of candidates with the polynomial terms used for the regression.
+        Each predictor is normalized to [-1, 1].
+    '''
+    effective = TestVectorGenerator.get_effective_vector(vector, self._ph)
+    names = sorted([ k for k in effective.keys() if k not in mode.keys() ])
+    columns = []
+    for k in names:
+      v = np.asarray(effective[k], dtype=float)
+      ptp = np.ptp(v)
+      columns.append(2.0*(v-v.min())/ptp - 1.0 if ptp > 0 else np.zeros(len(v)))
+    terms = [np.ones(len(vector))] + columns
+    for p in range(2, order+1): # higher order terms of non-binary predictors
+      terms += [ c**p for k, c in zip(names, columns) if len(np.unique(c)) > 2 ]
+    if en_interact: # interaction terms between bits of different ports
+      port = [ self._get_port_name(k) for k in names ]
+      terms += [ columns[i]*columns[j] for i in range(len(names)) for j in range(i+1, len(names)) if port[i] != port[j] ]
+    return np.column_stack(terms)
+
+  def _get_port_name(self, name): # port name of an expanded quantized analog bit
+    base = name[:name.rfind('_')]
+    return base if base in self._ph.get_quantized_port_name() else name
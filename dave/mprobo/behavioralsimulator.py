@@ -0,0 +1,94 @@
+__doc__ = '''
+Pure-Python reference simulator backend, which evaluates a behavioral model
+of a circuit for each test vector instead of running an HDL simulator.
+It is meant to benchmark and regression-test mProbo without EDA tools.
+
+In sim.cfg, a model is either a Python function
+  simulator = behavioral
+  behavioral_model = <python file or module>:<function>
+where the function takes a dict of input port values and returns a dict of
+output port values, or a linear model
+  simulator = behavioral
+  [[linear_model]]
+    [[[<output port>]]]
+      const = <offset>
+      <input port> = <gain>
+The testbench is still generated, but it is not used. The measured values of
+a run are written to a measurement record (see measurement.py) instead of
+meas_<output port>.txt files, and the runs of a batch append their records to
+a results file.
+'''
+
+import os
+import imp
+import importlib
+
+from simulatorinterface import SimulatorBackend, register_simulator
+from measurement import MeasurementSink, write_record
+from dave.mprobo.environ import EnvSimcfg, EnvFileLoc
+import dave.mprobo.mchkmsg as mcode
+
+#------------------------------------------------------
+class BehavioralSimulator(SimulatorBackend):
+  ''' Simulator backend evaluating a Python function or a linear model '''
+  def __init__(self, sim_cfg, csocket=None, logger_id='logger_id'):
+    SimulatorBackend.__init__(self, sim_cfg, csocket, logger_id)
+    self._model_spec = sim_cfg.get_behavioral_model()
+    self._linear_model = sim_cfg.get_linear_model()
+    self._batch_size = sim_cfg.get_batch_size()
+    assert self._model_spec or self._linear_model, mcode.ERR_024
+    if self._model_spec:
+      self._function = self.load_function(self._model_spec)
+    else:
+      self._function = self.linear_function(self._linear_model)
+
+  def run(self, vector, option, use_cache):
+    if use_cache:
+      return 'Use cached data'
+    write_record(os.path.join(option['workdir'], EnvFileLoc().meas_record), self._function(dict(vector)))
+    return ''
+
+  def get_batch_size(self):
+    return self._batch_size
+
+  def run_batch(self, vectors, option):
+    sink = MeasurementSink(os.path.join(option['workdir'], EnvFileLoc().meas_results))
+    sink.reset()
+    for i, vector in enumerate(vectors):
+      sink.put(str(i), self._function(dict(vector)))
+    return ''
+
+  def update_fingerprint(self, fp):
+    if self._model_spec:
+      fp.update_file('behavioral_model', self._split_spec(self._model_spec)[0])
+      fp.update('behavioral_function', self._model_spec)
+    else:
+      fp.update('linear_model', sorted([ (k, sorted(v.items())) for k, v in self._linear_model.items() ]))
+
+  @classmethod
+  def load_function(cls, spec):
+    ''' return a function from "<python file or module>:<function>" '''
+    source, name = cls._split_spec(spec)
+    if source.endswith('.py') and os.path.isfile(source):
+      module = imp.load_source('mprobo_behavioral_%s' % os.path.splitext(os.path.basename(source))[0], source)
+    else:
+      module = importlib.import_module(source)
+    return getattr(module, name)
+
+  @classmethod
+  def linear_function(cls, linear_model):
+    ''' return a function evaluating a linear model,
+        a dict of {output: {'const': offset, input: gain}}
+    '''
+    const = EnvSimcfg().linear_model_const
+    def _function(vector):
+      return dict([ (dv, sum([ v if p == const else v*vector[p] for p, v in model.items() ]))
+                    for dv, model in linear_model.items() ])
+    return _function
+
+  @classmethod
+  def _split_spec(cls, spec):
+    source, name = spec.rsplit(':', 1)
+    return os.path.abspath(os.path.expandvars(os.path.expanduser(source))) if source.endswith('.py') else source, name
+
+register_simulator(EnvSimcfg().behavioral, BehavioralSimulator)
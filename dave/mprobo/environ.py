@@ -46,6 +46,16 @@ class EnvOaTable(object):
   __cfg = get_checkerconfig()
   __readonly__ = __cfg['oatable']
 
+class EnvSimCache(object):
+  __metaclass__ = ROmetaClass
+  __cfg = get_checkerconfig()
+  __readonly__ = __cfg['simcache']
+
+class EnvRunDir(object):
+  __metaclass__ = ROmetaClass
+  __cfg = get_checkerconfig()
+  __readonly__ = __cfg['rundir']
+
 class EnvTestcfgOption(object):
   __metaclass__ = ROmetaClass
   __cfg = get_checkerconfig()
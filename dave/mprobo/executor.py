@@ -0,0 +1,150 @@
+__doc__ = """
+Bounded pool of long-lived workers running simulation jobs.
+
+A job (e.g. a simulation of a test vector with either golden or revised model)
+is submitted to a single job queue shared by the workers, and its result is
+delivered as soon as the job completes. Since a job spends most of its time
+waiting for an external simulator process, workers are threads.
+
+A task which coordinates jobs (e.g. sampling a digital mode of a test) is
+spawned in its own thread so that tasks of different modes and tests share
+the workers.
+"""
+
+import sys
+import threading
+import Queue
+
+from dave.common.davelogger import DaVELogger
+import dave.mprobo.mchkmsg as mcode
+
+#------------------------------------------------------
+class Future(object):
+  ''' Result of a submitted job '''
+  POLL = 1.0 # seconds to wait at once
+  def __init__(self, key=None):
+    self.key = key # user-defined key of a job
+    self._done = threading.Event()
+    self._result = None
+    self._exc_info = None
+    self._callbacks = []
+    self._lock = threading.Lock()
+
+  def done(self):
+    return self._done.is_set()
+
+  def result(self):
+    ''' wait until the job completes and return its result.
+        An exception raised by the job is re-raised here.
+    '''
+    while not self._done.wait(self.POLL): # a timeout lets the main thread get a keyboard interrupt
+      pass
+    if self._exc_info:
+      raise self._exc_info[0], self._exc_info[1], self._exc_info[2]
+    return self._result
+
+  def add_done_callback(self, func): # func(future) is called when the job completes
+    with self._lock:
+      if not self._done.is_set():
+        self._callbacks.append(func)
+        return
+    func(self)
+
+  def _set(self, result=None, exc_info=None):
+    with self._lock:
+      self._result = result
+      self._exc_info = exc_info
+      self._done.set()
+      callbacks = self._callbacks
+      self._callbacks = []
+    for func in callbacks:
+      func(self)
+
+  def _run(self, func, args, kwargs):
+    try:
+      result = func(*args, **kwargs)
+    except KeyboardInterrupt: # only in the main thread, i.e. a job runs in the caller's thread
+      raise
+    except:
+      self._set(exc_info=sys.exc_info())
+    else:
+      self._set(result)
+
+def as_completed(futures):
+  ''' yield futures in the order of their completion '''
+  futures = list(futures)
+  q = Queue.Queue()
+  for f in futures:
+    f.add_done_callback(q.put)
+  for i in range(len(futures)):
+    while True:
+      try:
+        yield q.get(True, Future.POLL) # a timeout lets the main thread get a keyboard interrupt
+        break
+      except Queue.Empty:
+        pass
+
+#------------------------------------------------------
+class JobExecutor(object):
+  ''' Bounded pool of worker threads.
+        - n_worker: number of workers. If it is 1 or less, a job runs
+                    in the caller's thread when it is submitted.
+  '''
+  def __init__(self, n_worker=1, logger_id='logger_id'):
+    self._logger = DaVELogger.get_logger('%s.%s.%s' % (logger_id, __name__, self.__class__.__name__))
+    self._n_worker = max(1, int(n_worker))
+    self._queue = Queue.Queue()
+    self._workers = []
+    self._lock = threading.Lock()
+
+  @property
+  def n_worker(self):
+    return self._n_worker
+
+  def submit(self, key, func, *args, **kwargs):
+    ''' submit a job func(*args, **kwargs) with a key, and return its Future '''
+    future = Future(key)
+    if self._n_worker == 1:
+      future._run(func, args, kwargs)
+    else:
+      self._start()
+      self._queue.put((future, func, args, kwargs))
+    return future
+
+  def spawn(self, key, func, *args, **kwargs):
+    ''' run a coordinating task func(*args, **kwargs), which may submit jobs, in its own thread 
+        and return its Future. If there is only one worker, it runs in the caller's thread.
+    '''
+    future = Future(key)
+    if self._n_worker == 1:
+      future._run(func, args, kwargs)
+    else:
+      t = threading.Thread(target=future._run, args=(func, args, kwargs), name='mProbo_task_%s' % str(key))
+      t.daemon = True
+      t.start()
+    return future
+
+  def shutdown(self):
+    ''' stop workers after all the submitted jobs are done '''
+    for w in self._workers:
+      self._queue.put(None)
+    for w in self._workers:
+      w.join()
+    self._workers = []
+
+  def _start(self): # start workers on the first submission, which may be made by tasks at once
+    with self._lock:
+      if not self._workers:
+        self._workers = [ threading.Thread(target=self._work, name='mProbo_worker_%d' % i) for i in range(self._n_worker) ]
+        for w in self._workers:
+          w.daemon = True
+          w.start()
+        self._logger.debug(mcode.DEBUG_025 % self._n_worker)
+
+  def _work(self):
+    while True:
+      job = self._queue.get()
+      if job == None:
+        break
+      future, func, args, kwargs = job
+      future._run(func, args, kwargs)
@@ -43,8 +43,13 @@ def pass_args(client=False):
     parser.add_argument('-p', '--process', help=mcode.INFO_006, type=int, default=1)
     parser.add_argument('-c','--use-cache', action='store_true', help=mcode.INFO_007)
     parser.add_argument('-n','--no-otf-check', action='store_true', help=mcode.INFO_007_1)
+    parser.add_argument('-k','--sim-cache', action='store_true', help=mcode.INFO_007_2)
     parser.add_argument('-w','--workdir', help=mcode.INFO_005_1, type=str, default='.')
     parser.add_argument('-x','--port-xref', help=mcode.INFO_008_2 % port_xref_filename, type=str, default=port_xref_filename)
+    parser.add_argument('--scratch-dir', help=mcode.INFO_008_3, type=str, default='')
+    parser.add_argument('--scratch-quota', help=mcode.INFO_008_4, type=float, default=0)
+    parser.add_argument('--prune', action='store_true', help=mcode.INFO_008_5)
+    parser.add_argument('--profile', nargs='?', const=EnvFileLoc().profile_file, default='', help=mcode.INFO_008_6 % EnvFileLoc().profile_file)
     #parser.add_argument('-g', '--gui', action='store_true', help=mcode.INFO_008)
 
   return parser
@@ -5,17 +5,72 @@ Linear regression of sampled analog responses
 import numpy as np 
 import os
 import copy
-import re
 import statsmodels.formula.api as sm
 import pandas as pd
-from itertools import product, combinations, groupby
+from itertools import combinations, groupby
 from operator import itemgetter
 
 from dave.common.davelogger import DaVELogger
 from environ import EnvTestcfgOption
-from dave.common.misc import flatten_list
+from dave.mprobo.olsengine import DesignMatrix, OLSResult, fit_ols, parse_formula
 import dave.mprobo.mchkmsg as mcode
 
+#------------------------------------------------------------------------
+class TermRegistry(object):
+  ''' Index of inputs and terms of linear models, which is built once when data are loaded
+      so that terms are related to their ports without parsing their names again.
+        - inputs: names of inputs, where a bit of a quantized analog port is named <port>_<bit>
+        - quantized_port: names of quantized analog ports
+      An input has an integer index into self.inputs, and its port and bit are
+      self.ports[self.port_index[i]] and self.bit_index[i] (-1 if it is not a bit).
+  '''
+  def __init__(self, inputs, quantized_port):
+    self.inputs = sorted(inputs)
+    self._quantized_port = sorted(quantized_port)
+    self._index = dict([ (k, i) for i, k in enumerate(self.inputs) ])
+    self.ports = []
+    self.port_index = np.zeros(len(self.inputs), dtype=int)
+    self.bit_index = -np.ones(len(self.inputs), dtype=int)
+    qports = set(quantized_port)
+    port_index = {}
+    for i, k in enumerate(self.inputs):
+      port, sep, bit = k.rpartition('_')
+      if port in qports and bit.isdigit():
+        self.bit_index[i] = int(bit)
+      else:
+        port = k
+      if port not in port_index:
+        port_index[port] = len(self.ports)
+        self.ports.append(port)
+      self.port_index[i] = port_index[port]
+    self._terms = {} # term name -> (input indices, powers), or None if not a product of powers of inputs
+
+  def is_same(self, inputs, quantized_port):
+    ''' True if this is built from the same inputs and ports '''
+    return self.inputs == sorted(inputs) and self._quantized_port == sorted(quantized_port)
+
+  def get_port(self, name):
+    ''' return the port of an input, i.e. the quantized analog port of a bit or the input itself '''
+    i = self._index.get(name)
+    return name if i == None else self.ports[self.port_index[i]]
+
+  def get_bit(self, name):
+    ''' return the bit index of an input of a quantized analog port, otherwise -1 '''
+    i = self._index.get(name)
+    return -1 if i == None else self.bit_index[i]
+
+  def get_term(self, term):
+    ''' return (input indices, powers) of a term, e.g. 'a:I(b ** 2)' gives the indices of a and b, and [1, 2].
+        Return None if the term is not a product of powers of inputs.
+    '''
+    if term not in self._terms:
+      parsed = parse_formula(term)
+      if parsed == None or len(parsed) != 2 or not all([ v in self._index for v, n in parsed[1][1] ]):
+        self._terms[term] = None
+      else:
+        self._terms[term] = (np.array([ self._index[v] for v, n in parsed[1][1] ], dtype=int), np.array([ n for v, n in parsed[1][1] ], dtype=int))
+    return self._terms[term]
+
 #------------------------------------------------------------------------
 class LinearRegression(object):
   '''Parent class of linear regression in this module''' 
@@ -50,6 +105,8 @@ class LinearRegression(object):
     self.dv = dv
     self.iv = iv
     self.quantizedport_name = option['qaport_name']
+    if getattr(self, 'terms', None) == None or not self.terms.is_same(iv.keys(), self.quantizedport_name):
+      self.terms = TermRegistry(iv.keys(), self.quantizedport_name)
     self.regression_do_not_regress = dict([(x,[x]) for x in self.dv.keys()]) # one could not be a predictor variable of oneself.
     self.update_option( {self._tenv.regression_do_not_regress : self.regression_do_not_regress} )
     self.update_option(option)
@@ -102,10 +159,9 @@ class LinearRegression(object):
     for p in range(order):
       if p == 0: # 1st order term
         term = ['%s' % v for v in dv_iv]
-        if len(dv_iv) > 1 and en_interact == True: # add interact terms between predictors
-          interact = filter(lambda x: x[0] != x[1], list(product(dv_iv, dv_iv)))
-          term = term+[ self._interact_R(x[0], x[1]) for x in interact 
-                        if re.sub(r'_\d+$','',x[0]) != re.sub(r'_\d+$','',x[1]) ]
+        if len(dv_iv) > 1 and en_interact == True: # add interact terms between predictors of different ports
+          term = term+[ self._interact_R(x0, x1) for x0, x1 in combinations(dv_iv, 2) 
+                        if self.terms.get_port(x0) != self.terms.get_port(x1) ]
       else: # higher order term
         bin_exclude = list(set(dv_iv)-set(self.binary_iv)) # no poly for binary variable
         term = term + [ self._polynomial_R(v, p+1) for v in bin_exclude ]
@@ -135,16 +191,16 @@ class LinearRegressionSM(LinearRegression):
 
     # dict of functions for getting some linear model properties
     self.stat_func = {
-      'residuals'     : lambda x: getattr(x, 'resid').values,
-      'std_residuals' : lambda x: np.std(getattr(x, 'resid').values),
+      'residuals'     : lambda x: getattr(x, 'resid'),
+      'std_residuals' : lambda x: np.std(getattr(x, 'resid')),
       'r_sq'          : lambda x: getattr(x, 'rsquared'),
       'adjusted_r_sq' : lambda x: getattr(x, 'rsquared_adj'),
-      'confidence_interval'      : lambda x: getattr(x, 'conf_int')(1.0-self._option[self._tenv.regression_cint_threshold]).values.reshape(-1,2),
+      'confidence_interval'      : lambda x: getattr(x, 'conf_int')(1.0-self._option[self._tenv.regression_cint_threshold]).reshape(-1,2),
       'coefficient'   : lambda x: np.column_stack(( 
-                                  getattr(x,'params').values,
-                                  getattr(x,'bse').values,
-                                  getattr(x,'tvalues').values,
-                                  getattr(x,'pvalues').values
+                                  getattr(x,'params'),
+                                  getattr(x,'bse'),
+                                  getattr(x,'tvalues'),
+                                  getattr(x,'pvalues')
                                   ))
     }
 
@@ -155,6 +211,20 @@ class LinearRegressionSM(LinearRegression):
       'coef_t_statistic': lambda coefficients: coefficients[:,2], 
       'coef_p_value'    : lambda coefficients: coefficients[:,3] 
                                            }
+  def load_data(self, dv, iv, option={}, design=None):
+    ''' 
+      load data like LinearRegression.load_data()
+        - design: DesignMatrix of iv, which may be shared with other regressors on the same iv
+    '''
+    prev = getattr(self, '_design', None), getattr(self, 'dv', None)
+    if design != None:
+      self._design = design
+    elif getattr(self, 'iv', None) is not iv:
+      self._design = DesignMatrix(iv)
+    if self._design is not prev[0] or dv is not prev[1]: # new samples
+      self._fit_key = None
+    LinearRegression.load_data(self, dv, iv, option)
+
   def run(self):
     ''' Run OLS linear regression '''
     self._create_model(ignore_usermodel=False)
@@ -217,9 +287,17 @@ class LinearRegressionSM(LinearRegression):
     formula = self._make_formula(self.dv_iv_map, *opt_formula)
     self._logger.debug(mcode.WARN_017 % formula)
 
+    # the same model on the same samples is not fitted again
+    fit_key = (formula, self._option[self._tenv.regression_cint_threshold], self._design.nobs)
+    if getattr(self, '_fit_key', None) == fit_key:
+      self._logger.debug(mcode.DEBUG_031)
+      return
+
     # run regression
-    self.iv_ols, self.model_ols, self.df_ols, self.exog, self.endog, self.xnames = self._run_regression(formula) 
+    self.iv_ols, self.model_ols, self.exog, self.endog, self.xnames = self._run_regression(formula) 
+    self._predictor_index = dict([ (k, dict([ (p, i) for i, p in enumerate(v) ])) for k, v in self.iv_ols.items() ])
     self._formula = formula
+    self._fit_key = fit_key
 
     # build/get statistics from the linear regression model, and calculate normalized input sensitivity
     self.ols_stat = self._build_statistics(self.model_ols) 
@@ -260,16 +338,22 @@ class LinearRegressionSM(LinearRegression):
 
   def is_confidence_interval_embrace_zero(self, response, predictor):
     ''' check if confidence interval of the predictor variable for the response embrace 0.0 '''
-    _dv_iv = self.get_predictors()
-    idx = _dv_iv[response].index(predictor)
+    idx = self.get_predictor_index(response, predictor)
     _confint = self.get_statistics()['confidence_interval'][response][idx]
     if _confint[0]*_confint[1] <= 0.0:
       return True
     else:
       return False
 
+  def get_predictor_index(self, response, predictor):
+    ''' return the index of a predictor of the model of a response '''
+    try:
+      return self._predictor_index[response][predictor]
+    except KeyError:
+      raise ValueError('%s is not a predictor of %s' % (predictor, response))
+
   def get_coef(self, response, predictor):
-    idx = self.get_predictors()[response].index(predictor)
+    idx = self.get_predictor_index(response, predictor)
     return self.get_coefs()[response][idx]
 
   def get_max_residuals(self):
@@ -320,7 +404,7 @@ class LinearRegressionSM(LinearRegression):
 
   def export_data(self, csvfile):
     ''' export samples of linear regression models to a csv file '''
-    getattr(self, 'df_ols').to_csv(csvfile)
+    pd.DataFrame(dict(self.iv.items()+self.dv.items())).to_csv(csvfile)
 
   def get_response(self):
     ''' return a dict of { dependepnt variable : data samples } '''
@@ -384,21 +468,30 @@ class LinearRegressionSM(LinearRegression):
 
   def _build_formula_from_lr(self, model):
     ''' build a linear equation from linear regression result '''
-    dv = model.model.formula.split('~')[0]
-    pv = model.params.keys()
-    pv_expanded = list(set(flatten_list([s.split(':') for s in pv]))) # list of expanded predictors
-    qa_expanded = [s for k in self.quantizedport_name for s in pv_expanded if re.match(k+'_\d$', s)] # find terms quantized analog
-    coef = model.params.values
-    terms = ['%e*%s' %(coef[i], self._change_R_power_to_Vlog_power(pv[i]).replace(':','*')) for i in range(len(pv))]
+    dv = model.formula.split('~')[0]
+    pv = model.names
+    coef = model.params
+    terms = ['%e*%s' %(coef[i], self._get_Vlog_term(pv[i])) for i in range(len(pv))]
     terms[0] = terms[0].split('*')[0]
     expr = dv+' = '+' + '.join(terms) #+';'
-    for q in qa_expanded: # change _\d$ with [\d]
-      k = q.rfind('_')
-      if self._ph.get_by_name(q[:k]).bit_width == 1: # if bit-width ==1, replace x[0] with x
-        expr = expr.replace(q,q[:k])
-      else:
-        expr = expr.replace(q, q[:k]+'['+q[k+1:]+']')
     return expr
+
+  def _get_Vlog_term(self, pv):
+    ''' expression of a term in Verilog, where a bit of a quantized analog port, x_<bit>, is x[<bit>] (or x if its bit-width is 1) '''
+    term = self.terms.get_term(pv)
+    if term == None: # e.g. intercept, or a term of a user model which is not a product of powers of inputs
+      expr = self._change_R_power_to_Vlog_power(pv).replace(':','*')
+      for i in sorted(np.nonzero(self.terms.bit_index >= 0)[0], key=lambda i: -len(self.terms.inputs[i])):
+        expr = expr.replace(self.terms.inputs[i], self._get_Vlog_bit(i))
+      return expr
+    return '*'.join([ self._get_Vlog_bit(i) if n == 1 else '%s**%d' % (self._get_Vlog_bit(i), n) for i, n in zip(*term) ])
+
+  def _get_Vlog_bit(self, i):
+    ''' expression of the i-th input of self.terms in Verilog '''
+    if self.terms.bit_index[i] < 0:
+      return self.terms.inputs[i]
+    port = self.terms.ports[self.terms.port_index[i]]
+    return port if self._ph.get_by_name(port).bit_width == 1 else '%s[%d]' % (port, self.terms.bit_index[i])
         
   @classmethod
   def extract_coef_from_lr_formula(cls, expr):
@@ -435,16 +528,21 @@ class LinearRegressionSM(LinearRegression):
 
   def _run_regression(self, formula):
     ''' Run linear regressions for each dependent variable 
-        model = {} # key: dep. var, value : regression model instance
+        model = {} # key: dep. var, value : regression model instance (OLSResult)
         predictors = {} # key: dep. var, value: list of variables in the formula
+        The models are fitted on the design matrix of the samples (see olsengine.py), 
+        or with a statsmodels formula if the formula or samples are not supported there.
     '''
-    df = pd.DataFrame(dict(self.iv.items()+self.dv.items())) # data frame in pandas
-    model = dict([ (dv, sm.ols(formula='%s ~ %s' %(dv, formula[dv]), data=df).fit()) for dv in self.dv_iv_map.keys() ])
-    predictors = dict([ (dv, list(model[dv].params.keys())) for dv in self.dv_iv_map.keys() ])
-    exog  = dict([ (dv, model[dv].model.data.orig_exog) for dv in self.dv_iv_map.keys() ])
-    endog = dict([ (dv, model[dv].model.data.orig_endog) for dv in self.dv_iv_map.keys() ])
-    xnames = dict([ (dv, model[dv].model.data.xnames) for dv in self.dv_iv_map.keys() ])
-    return predictors, model, df, exog, endog, xnames
+    model = fit_ols(self._design, self.dv, dict([ (dv, formula[dv]) for dv in self.dv_iv_map.keys() ]))
+    others = [ dv for dv in self.dv_iv_map.keys() if dv not in model ]
+    if others:
+      df = pd.DataFrame(dict(self.iv.items()+self.dv.items())) # data frame in pandas
+      model.update([ (dv, OLSResult.from_statsmodels(dv, sm.ols(formula='%s ~ %s' %(dv, formula[dv]), data=df).fit())) for dv in others ])
+    predictors = dict([ (dv, list(model[dv].names)) for dv in self.dv_iv_map.keys() ])
+    exog  = dict([ (dv, model[dv].exog) for dv in self.dv_iv_map.keys() ])
+    endog = dict([ (dv, model[dv].endog) for dv in self.dv_iv_map.keys() ])
+    xnames = dict([ (dv, model[dv].names) for dv in self.dv_iv_map.keys() ])
+    return predictors, model, exog, endog, xnames
 
   def _build_statistics(self, model):
     ''' returns statistical inference of regression models '''
@@ -452,34 +550,6 @@ class LinearRegressionSM(LinearRegression):
     stat.update( dict([ (i, dict([(x, fn(stat['coefficient'][x])) for x in model.keys()])) for i, fn in self.stat_coef_func.items() ]) )
     return stat
 
-  def get_combinations(self, predictors, iv_key):
-    '''
-      predictors: {} where a key is an output response
-                           value is a list of predictor variables including 'Intercept'
-                           it contains all higher polynomial terms & interaction terms while iv_key is a list that only contains the input variables.
-      * Assumption
-        - all the output responses should have a full term expansion, which means that the predictor variables are the same
-        - if a bit of quantized port is included, the corresponding bits of the port should also be included
-    '''
-    comb = []
-    intercept = [self.get_intercept_name()]
-    _pvar = predictors[predictors.keys()[0]]
-    for i in range(len(iv_key)-1):
-      for subset in combinations(iv_key, i):
-        qa_in_subset = [k for s in subset for k in self.quantizedport_name if re.match(k+'_\d$', s)]
-        subset = list(subset) + [k for k in iv_key for q in qa_in_subset if re.match(q+'_\d$', k)]
-        subset = list(set(subset))
-        if len(subset)>0:
-            full_subset = [p for s in subset for p in _pvar if re.search(s,p) != None]
-            fs = sorted(subset + full_subset)
-            fs = [fs[i] for i in range(len(fs)) if i==0 or fs[i] != fs[i-1]] # remove duplicates
-            comb.append(sorted(fs))
-    comb.append(list(set(_pvar)-set(intercept)))
-    comb.sort()
-    comb = sorted(comb, key=lambda x: len(x), reverse=True) # sort by no of items
-    comb = [comb[i] for i in range(len(comb)) if i==0 or comb[i] != comb[i-1]] # remove duplicates
-    return comb
-
 def calculate_normalized_sensitivity(predictors, lr, stat, response):
   ''' calculate normalized sensitivity of each predictor to the response '''
   exog = get_exog(lr, response)
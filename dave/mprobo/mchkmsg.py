@@ -55,12 +55,17 @@ INFO_003 = 'Test configuration file. Default is "%s"'
 INFO_004 = 'Simulation configuration file. Default is "%s"'
 INFO_005 = 'Report file name in HTML format. Default is "%s"'
 INFO_005_1 = 'Working directory. Default is the current directory'
-INFO_006 = 'Number of processes. Default is 1'
+INFO_006 = 'Number of simulations running in parallel. Default is 1'
 INFO_007 = 'Use cached simulation data'
 INFO_007_1 = 'No on-the-fly pin check'
+INFO_007_2 = 'Reuse simulation results stored in the persistent simulation result cache across runs and tests for both golden and revised models (see sim_cache in the simulator configuration for a model)'
 INFO_008 = 'Start GUI application'
 INFO_008_1 = 'Extraction mode: Characterize golden model.'
 INFO_008_2 = 'Cross reference file of modules. Default is "%s"'
+INFO_008_3 = 'Scratch path (e.g. tmpfs or a local SSD) where run directories of golden/revised models are placed'
+INFO_008_4 = 'Disk quota of the scratch path in MB. Run directories of previous runs are evicted, oldest first, to fit the quota'
+INFO_008_5 = 'Keep only the files needed for cached data and reports in run directories, and compress log files'
+INFO_008_6 = 'Record the wall/CPU time of each stage to a trace file in Chrome trace format, or in JSON lines if it ends with ".jsonl". Default is "%s"'
 INFO_009 = 'Model checking is completed'
 INFO_009_1 = 'Circuit characterization is completed'
 INFO_010 = 'Start GUI application.'
@@ -127,6 +132,15 @@ INFO_055 = '\nCompiling a test configuration for the test, %s.'
 INFO_056 = 'There is no unresolved net.' 
 INFO_057 = 'The number of analog grid is set to %d and thus "max_sample" is set to %d.'
 INFO_058 = 'Checking summary of a mode (%s)'
+INFO_059 = 'Confidence intervals of the linear models of all the responses meet the absolute tolerances with %d samples. Stop sampling.'
+INFO_060 = "Simulation result cache: '%s' (%.1f/%.1f MB used)."
+INFO_061 = "Compiling the testbench once for all the test vectors at '%s'."
+INFO_062 = "Simulation results are reused from the simulation result cache for %s model(s)."
+INFO_063 = "Run directories are placed at the scratch path '%s' (quota: %s)."
+INFO_064 = "Run directory '%s' (%.1f MB) of a previous run is evicted from the scratch path."
+INFO_065 = "Stage timing is recorded to '%s'."
+INFO_066 = "Stage timing summary (%.3f seconds elapsed, trace: '%s'). Stages running concurrently are counted separately."
+INFO_067 = "Simulation results of the %s model are reused from the simulation result cache. Only the files in the simulator configuration, simulator options (-v, -f, -y, +incdir+) and netlist includes are checked for changes. Disable sim_cache of the model to simulate it again."
 
 
 WARN_001 = 'The program is interrupted by user. Terminate the program abnormally.'
@@ -140,7 +154,7 @@ WARN_007 = "The wires declared in 'wire' section of the test configuration file
 WARN_008 = 'The wires between them are %s.' 
 WARN_009 = 'The unmatched wire name%s %s.' 
 WARN_010 = "This doesn't necessarily mean that wires are really unmatched; this check does not account for the wire declaration in tb_code section. Please make sure you listed all the wires."
-WARN_011 = 'No Orthogonal array table exists for # of variables=%d, depth=%d. Switching to full Latin Hypercube Sampling mode.'
+WARN_011 = 'No Orthogonal array exists or can be constructed for # of variables=%d, depth=%d. Switching to full Latin Hypercube Sampling mode.'
 #WARN_012 = 'Random vectors are generated instead of Orthogonal Array.'
 WARN_013 = 'Random vectors (%d) are added to the generated Orthogonal Array vectors.'
 WARN_014 = '\n\n'+"="*50+'\n'+ 'Reading simulation results failed. See the details below.' +'\n'+"="*50
@@ -155,6 +169,14 @@ WARN_022 = 'Wire (%s,%s) defined in [[[wire]]] section overwrites the unresolved
 WARN_023 = 'There already exists digital mode port(s). Adding dummy digital mode port is ignored.'
 WARN_024 = 'For given "max_sample" (%d) and number of analog+quantized analog input ports (%d), the number of analog grid (%d) is smaller than the minimum number of analog grid (%d).'
 WARN_025 = "The option, '--use-cache', is enabled, but the simulation directory, %s, doesn't exist. Thus, a simulation will be performed."
+WARN_026 = '"compile_once" is not supported for %s model with "%s" simulator in this mode. The testbench is compiled for each test vector.'
+WARN_027 = "Compiling the testbench at '%s' failed. See the message below.\n%s"
+WARN_028 = '"batch_size" is not supported for %s model with "%s" simulator in this mode. A testbench simulates a single test vector.'
+WARN_029 = '"batch_size" is ignored since post-processing routines run for each test vector.'
+WARN_030 = "A process at '%s' is killed since it didn't complete in %d seconds."
+WARN_031 = "Scratch path '%s' (%.1f MB) exceeds its quota (%.1f MB) with the run directories in use."
+WARN_032 = 'Orthogonal array constructed for # of variables=%d, depth=%d has %d runs, too many for the maximum number of samples (%d). Using depth %d filled up with Latin Hypercube samples instead.'
+WARN_033 = 'Orthogonal array constructed for # of variables=%d, depth=%d has %d runs, too many for the maximum number of samples (%d). Switching to full Latin Hypercube Sampling mode.'
 
 
 
@@ -171,7 +193,7 @@ DEBUG_008 = "Running '%s' is successful."
 DEBUG_009 = 'List of post processing scripts: %s'
 DEBUG_010 = 'Post processing command: %s'
 DEBUG_011 = 'workdir: %s'
-DEBUG_012 = "Changing directory to '%s' for running post-processing script"
+DEBUG_012 = "Running post-processing script in '%s'"
 DEBUG_013 = 'Going back to tool running directory'
 DEBUG_014 = 'Using cached resuts for post-processing routine.'
 DEBUG_015 = 'Run suggested linear regression with confidence interval'
@@ -179,6 +201,19 @@ DEBUG_016 = 'Run suggested linear regression with normlized sensitivity'
 DEBUG_017 = 'Predictor %s is removed from linear regression of the response, %s, because the predictor is intercept or its confidence interval embraces 0.0'
 DEBUG_018 = 'Port class alias named %s does not exist.'
 DEBUG_019 = 'Number of available orthogonal vectors with analog discretization levels of %d: %d' 
+DEBUG_020 = 'No Orthogonal array table exists for # of variables=%d, depth=%d. The orthogonal array is constructed instead.'
+DEBUG_021 = 'Adaptive sampling: %d test vectors are selected from the candidates after %d samples.'
+DEBUG_022 = 'Adaptive sampling: uncertainty bound of %s is %e (abstol=%e).'
+DEBUG_023 = "Simulation result cache hit (key=%s). The measurement is restored for '%s'."
+DEBUG_024 = "Simulation result is stored in the simulation result cache (key=%s)."
+DEBUG_025 = 'Started %d workers for simulation jobs.'
+DEBUG_026 = "Compilation message at '%s': %s"
+DEBUG_027 = "A process at '%s' is not run since running processes are cancelled."
+DEBUG_028 = "A process is completed with return code %s. Its output is written to '%s'."
+DEBUG_029 = "Run directory '%s' is linked to '%s'."
+DEBUG_030 = "Failed to clean up %s: %s"
+DEBUG_031 = "Regression is skipped since the model and samples are the same as the previous ones."
+DEBUG_032 = "Suggested models do not change after %d iteration(s)."
 
 
 ERR_001 = 'No test configuration file, %s, exists'
@@ -204,6 +239,8 @@ ERR_019 = '%s is not defined in %s'
 ERR_020 = 'No raw testbench file %s exists'
 ERR_021 = 'There are still unresolved nets: %s. Check out port reference file %s and/or [[[wire]]] section.'
 ERR_022 = 'Bit width of a quantized analog port cannot be larger than %d.'
+ERR_023 = 'Simulator "%s" is not supported. Available simulators are %s, or give a simulator backend class as "<module>:<class>".'
+ERR_024 = 'Either "behavioral_model" or [[linear_model]] section is required for the behavioral simulator.'
 
 
 
@@ -0,0 +1,134 @@
+__doc__ = """
+Binary measurement records.
+
+A record holds the measured values of all the output ports of a simulation
+run, so that the measurement of a run is read with a single file open instead
+of reading a text file (meas_<port>.txt) for each output port.
+  - A record file (e.g. mProbo_meas.bin in a run directory) holds the record of a run.
+  - A results file (MeasurementSink) is shared by many runs, each of which appends
+    its record with a key (e.g. the name of its run directory). The records of
+    a chunk of runs are then loaded at once by reading the file.
+
+A record is
+  <number of ports: uint32> followed by, for each port,
+  <length of port name: uint16> <port name> <number of values: uint32> <values: float64>
+and a record in a results file is framed as
+  <magic: 'MPMR'> <length of key: uint16> <length of record: uint32> <key> <record>
+in little-endian.
+"""
+
+import os
+import struct
+import threading
+import numpy as np
+
+#------------------------------------------------------
+def encode(measurement):
+  ''' return a record (str) of a measurement, a dict of {port name: value or list of values} '''
+  data = [struct.pack('<I', len(measurement))]
+  for p, v in sorted(measurement.items()):
+    v = np.asarray(v, dtype='<f8')
+    p = str(p)
+    data.append(struct.pack('<H', len(p)) + p + struct.pack('<I', v.size) + v.tostring())
+  return ''.join(data)
+
+def decode(data):
+  ''' return a measurement from a record. A single value is returned as a float
+      and multiple values as a list like np.loadtxt(...).tolist()
+  '''
+  measurement = {}
+  (n,), i = struct.unpack_from('<I', data), 4
+  for k in range(n):
+    (l,) = struct.unpack_from('<H', data, i)
+    p = data[i+2:i+2+l]
+    (m,) = struct.unpack_from('<I', data, i+2+l)
+    i += 6+l
+    v = np.frombuffer(data, dtype='<f8', count=m, offset=i)
+    i += 8*m
+    measurement[p] = float(v[0]) if m == 1 else v.tolist()
+  return measurement
+
+def write_record(filename, measurement):
+  ''' write a record file of a measurement '''
+  with open(filename, 'wb') as f:
+    f.write(encode(measurement))
+
+def read_record(filename):
+  ''' return a measurement from a record file '''
+  with open(filename, 'rb') as f:
+    return decode(f.read())
+
+#------------------------------------------------------
+class MeasurementSink(object):
+  ''' Results file to which runs append their records.
+        - filename: results file name
+      A record is appended with a single write in append mode so that
+      runs (threads) can append to the same file concurrently.
+  '''
+  MAGIC = 'MPMR'
+  HEADER = struct.Struct('<4sHI')
+
+  def __init__(self, filename):
+    self._filename = os.path.abspath(filename)
+    self._lock = threading.Lock()
+    self._records = None # {key: record} loaded from the file
+
+  @property
+  def filename(self):
+    return self._filename
+
+  def reset(self):
+    ''' remove the results file '''
+    with self._lock:
+      if os.path.isfile(self._filename):
+        os.remove(self._filename)
+      self._records = None
+
+  def append(self, key, record):
+    ''' append a record (see encode()) with a key '''
+    data = self.HEADER.pack(self.MAGIC, len(key), len(record)) + key + record
+    with self._lock:
+      fd = os.open(self._filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0644)
+      try:
+        os.write(fd, data)
+      finally:
+        os.close(fd)
+      if self._records != None:
+        self._records[key] = record
+
+  def put(self, key, measurement):
+    ''' append the record of a measurement with a key '''
+    self.append(key, encode(measurement))
+
+  def get(self, key):
+    ''' return the record of a key, else None.
+        The file is read at once on the first call.
+    '''
+    with self._lock:
+      if self._records == None:
+        self._records = self.read_all()
+      return self._records.get(key)
+
+  def load(self, keys):
+    ''' return a list of measurements of keys, where a missing key is None '''
+    records = self.read_all()
+    return [ decode(records[k]) if k in records else None for k in keys ]
+
+  def read_all(self):
+    ''' return a dict of {key: record} in the results file.
+        If a key is appended more than once, the last one is returned.
+    '''
+    records = {}
+    if not os.path.isfile(self._filename):
+      return records
+    with open(self._filename, 'rb') as f:
+      data = f.read()
+    i = 0
+    while i + self.HEADER.size <= len(data):
+      magic, l, n = self.HEADER.unpack_from(data, i)
+      if magic != self.MAGIC or i + self.HEADER.size + l + n > len(data): # truncated by an interrupted run
+        break
+      i += self.HEADER.size
+      records[data[i:i+l]] = data[i+l:i+l+n]
+      i += l+n
+    return records
@@ -31,6 +31,11 @@ debug_file = .mProbo_debug.log
 dump_file  = .mProbo_dump.log
 logfile = mProbo.log
 simlogfile = mProbo_sim.log
+pplogfile = mProbo_pp.log
+compiled_dirname = compiled # testbench compiled once for all the vectors
+meas_record = mProbo_meas.bin # measurement record of a run
+meas_results = mProbo_meas_results.bin # measurement records appended by runs
+profile_file = mProbo_profile.json # stage timing trace (--profile)
 gui_prog   = mProbo_gui
 extracted_model_param_file = extracted_linear_model.yaml
 def_lfname = dave.lic
@@ -39,6 +44,15 @@ def_lfname = dave.lic
 [oatable]
 max_oa_depth = 9
 max_oa_var = 10
+oa_cache_dir = ~/.mProbo/oa_cache # constructed OAs for the ones missing from the tables
+
+[simcache]
+dbfile = ~/.mProbo/simcache.db # persistent simulation result cache
+max_size = 1024 # maximum size of the cache in MB
+
+[rundir]
+n_worker = 2 # background workers removing/compressing files, removed inline if 1
+keep_files = vector*.dat, meas_*.txt, mProbo_meas*.bin, *.log # files kept in a run directory when pruned
 
 [portname]
 AnalogInput = analoginput
@@ -88,6 +102,8 @@ DigitalOutputLabel = digital output
   regression_order = regression_order
   regression_en_interact = regression_en_interact
   regression_sval_threshold = regression_sval_threshold
+  adaptive_sampling = adaptive_sampling
+  vector_seed = vector_seed
 
   [[simtime]]
   sim_timeunit = timeunit
@@ -132,6 +148,7 @@ DigitalOutputLabel = digital output
   pp_script = script_files
   pp_command = command
   pp_measfile = measfile
+  runtime_vector_prefix = mProbo_vector_
 
 
 [simcfg]
@@ -143,12 +160,21 @@ model = model
 simulator = simulator
 vcs = vcs
 ncsim = ncsim
+behavioral = behavioral
+behavioral_model = behavioral_model
+linear_model = linear_model
+linear_model_const = const
 ams_control_file = ams_control_file
 ams_connrules = default_ams_connrules
 simulator_option = simulator_option
 hdl_files = hdl_files
 hdl_include_files = hdl_include_files
 sweep_file = sweep_file
+compile_once = compile_once
+batch_size = batch_size
+timeout = timeout
+shared_results = shared_results
+sim_cache = sim_cache
 circuit = circuit
 model_ams = ams
 model_vlog = verilog
@@ -225,27 +251,41 @@ rsq_threshold = float(min=-0.1, max=1.0, default=0.5)
 
 [golden]
 model = option("ams", "verilog")
-simulator = option("ncsim", "vcs")
+simulator = string()
 default_ams_connrules = string(default='')
 ams_control_file = string(default='') 
-simulator_option = string() 
+simulator_option = string(default='') 
 hdl_files = force_list(default='')
 hdl_include_files = force_list(default='')
 sweep_file = boolean(default=True) 
+compile_once = boolean(default=False)
+batch_size = integer(min=1, default=1)
+timeout = integer(min=0, default=0)
+shared_results = boolean(default=False)
+sim_cache = boolean(default=False)
 spice_lib = string(default='')
+behavioral_model = string(default='')
 [[circuit]]
+[[linear_model]]
 
 [revised]
 model = option("ams", "verilog")
-simulator = option("ncsim", "vcs")
+simulator = string()
 default_ams_connrules = string(default='')
 ams_control_file = string(default='') 
-simulator_option = string() 
+simulator_option = string(default='') 
 hdl_files = force_list(default='')
 hdl_include_files = force_list(default='')
 sweep_file = boolean(default=True) 
+compile_once = boolean(default=False)
+batch_size = integer(min=1, default=1)
+timeout = integer(min=0, default=0)
+shared_results = boolean(default=False)
+sim_cache = boolean(default=False)
 spice_lib = string(default='')
+behavioral_model = string(default='')
 [[circuit]]
+[[linear_model]]
 """)
 
 testcfg = StringIO("""
@@ -270,6 +310,8 @@ regression_basis = option("polynomial", default="polynomial")
 regression_order = integer(min=1,max=10, default=1)
 regression_en_interact = boolean(default=True)
 regression_sval_threshold = float(min=0.0, max=100.0, default=5.0) # in %
+adaptive_sampling = boolean(default=False)
+vector_seed = integer(min=0, default=None)
 
 [[[regression_do_not_regress]]]
 
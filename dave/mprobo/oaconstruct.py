@@ -0,0 +1,241 @@
+__doc__ = """
+Algorithmic construction of Orthogonal Arrays (OA) with the strength of two
+for (n_var, depth) that are not found in the pre-defined OA tables.
+
+  - Rao-Hamming (Bose/Bush) construction: OA(q^n, (q^n-1)/(q-1), q, 2)
+    for a prime power q
+  - Addelman-Kempthorne construction: OA(2q^2, 2q+1, q, 2) for an odd prime power q
+  - Kronecker product of the above for a depth which is a product of
+    co-prime prime powers (e.g. depth=6 is made of 2 and 3)
+
+Constructed OAs are cached on disk as <cache_dir>/OA.V<n_var>.L<depth>.npy.
+Levels of a constructed OA start from 0.
+"""
+
+import os
+import numpy as np
+from itertools import product
+
+MAX_DEPTH = 256 # OA levels are stored in uint8
+OA_CACHE_FILENAME = 'OA.V%d.L%d.npy'
+
+#------------------------------------------------------
+def factorize(n):
+  ''' return prime factorization of n as a list of (prime, power) '''
+  factors = []
+  p = 2
+  while p*p <= n:
+    m = 0
+    while n % p == 0:
+      n /= p
+      m += 1
+    if m > 0: factors.append((p, m))
+    p += 1
+  if n > 1: factors.append((n, 1))
+  return factors
+
+#------------------------------------------------------
+class GaloisField(object):
+  ''' Arithmetic tables of a Galois field GF(q) where q=p^m is a prime power.
+      An element is represented by an integer whose base-p digits are
+      the coefficients of a polynomial over GF(p).
+  '''
+  def __init__(self, q):
+    factors = factorize(q)
+    assert len(factors) == 1, '%d is not a prime power' % q
+    self.q = q
+    self.p, self.m = factors[0]
+    self._build_tables()
+
+  def _digits(self, x): # base-p digits of x, lowest order first
+    return [ (x/self.p**i) % self.p for i in range(self.m) ]
+
+  def _from_digits(self, d):
+    return sum([ c*self.p**i for i, c in enumerate(d) ])
+
+  def _polymod(self, d, poly): # remainder of polynomial d divided by a monic poly
+    d = list(d)
+    deg = len(poly) - 1
+    for i in range(len(d)-1, deg-1, -1):
+      c = d[i]
+      if c:
+        for j in range(deg+1):
+          d[i-deg+j] = (d[i-deg+j] - c*poly[j]) % self.p
+    return d[:deg]
+
+  def _polymul(self, a, b):
+    d = [0]*(len(a)+len(b)-1)
+    for i, x in enumerate(a):
+      for j, y in enumerate(b):
+        d[i+j] = (d[i+j] + x*y) % self.p
+    return d
+
+  def _is_irreducible(self, poly): # test a monic poly has no monic factor of degree <= m/2
+    deg = len(poly) - 1
+    for k in range(1, deg/2+1):
+      for c in product(range(self.p), repeat=k):
+        if not any(self._polymod(poly, list(c)+[1])):
+          return False
+    return True
+
+  def _find_irreducible(self): # lowest monic irreducible polynomial of degree m
+    for c in product(range(self.p), repeat=self.m):
+      poly = list(reversed(c)) + [1]
+      if poly[0] != 0 and self._is_irreducible(poly):
+        return poly
+
+  def _build_tables(self):
+    q, p = self.q, self.p
+    digits = np.array([ self._digits(x) for x in range(q) ])
+    weight = p**np.arange(self.m)
+    self.add = np.dot((digits[:,None,:] + digits[None,:,:]) % p, weight)
+    if self.m == 1:
+      self.mul = np.outer(np.arange(q), np.arange(q)) % q
+    else:
+      poly = self._find_irreducible()
+      self.mul = np.zeros((q, q), dtype=int)
+      for a in range(q):
+        for b in range(a, q):
+          self.mul[a,b] = self.mul[b,a] = self._from_digits(self._polymod(self._polymul(self._digits(a), self._digits(b)), poly))
+    self.neg = np.argmin(self.add, axis=1) # x + neg[x] = 0
+    self.inv = np.zeros(q, dtype=int)
+    self.inv[1:] = np.argmax(self.mul[1:] == 1, axis=1)
+
+  def square(self): # set of quadratic residues
+    return set(np.diag(self.mul)[1:])
+
+#------------------------------------------------------
+def rao_hamming(gf, n, n_var):
+  ''' OA(q^n, n_var, q, 2) with n_var <= (q^n-1)/(q-1).
+      Rows are all the vectors x in GF(q)^n and a column is (x . c) for
+      a nonzero vector c whose first nonzero entry is 1.
+  '''
+  q = gf.q
+  rows = np.array(list(product(range(q), repeat=n)), dtype=int)
+  cols = [ c for c in product(range(q), repeat=n) if any(c) and c[[i for i, v in enumerate(c) if v][0]] == 1 ]
+  cols = sorted(cols, key=lambda c: (sum([1 for v in c if v]), c))[:n_var] # sparse columns first
+  oa = np.zeros((rows.shape[0], n_var), dtype=int)
+  for j, c in enumerate(cols):
+    for i, v in enumerate(c):
+      if v:
+        oa[:,j] = gf.add[oa[:,j], gf.mul[rows[:,i], v]]
+  return oa
+
+def addelman_kempthorne(gf, n_var):
+  ''' OA(2q^2, n_var, q, 2) with n_var <= 2q+1 for an odd prime power q.
+      Rows of the first half are (x, y) in GF(q)^2 with columns
+        x, y + a*x, y + b*x + x^2  for a, b in GF(q)
+      and those of the second half are
+        x, y + a*x + k_a, y + v*b*x + v*x^2 + c_b
+      where v is a non-residue, k_a = (v-1)a^2/(4v), and c_b = (v-1)b^2/4.
+  '''
+  q = gf.q
+  assert q % 2 == 1, 'Addelman-Kempthorne construction requires an odd prime power'
+  add, mul = gf.add, gf.mul
+  sub = lambda a, b: add[a, gf.neg[b]]
+  v = min(set(range(1, q)) - gf.square())
+  four = add[add[1,1], add[1,1]]
+  vm1 = sub(v, 1)
+  k = [ mul[mul[vm1, mul[a,a]], gf.inv[mul[four, v]]] for a in range(q) ]
+  c = [ mul[mul[vm1, mul[b,b]], gf.inv[four]] for b in range(q) ]
+
+  x, y = [ np.array(z, dtype=int) for z in zip(*product(range(q), repeat=2)) ]
+  xx = mul[x, x]
+  half1 = [x] + [ add[y, mul[a,x]] for a in range(q) ] + [ add[add[y, mul[b,x]], xx] for b in range(q) ]
+  half2 = [x] + [ add[add[y, mul[a,x]], k[a]] for a in range(q) ] + [ add[add[add[y, mul[mul[v,b],x]], mul[v,xx]], c[b]] for b in range(q) ]
+  return np.vstack((np.array(half1).T, np.array(half2).T))[:,:n_var]
+
+#------------------------------------------------------
+def _prime_power_run(q, n_var):
+  ''' return (# of runs, construction) of the smallest OA(N, n_var, q, 2) '''
+  n = 2
+  while (q**n-1)/(q-1) < n_var:
+    n += 1
+  run, method = q**n, ('rao_hamming', n)
+  if q % 2 == 1 and n_var <= 2*q+1 and 2*q*q < run:
+    run, method = 2*q*q, ('addelman_kempthorne', None)
+  return run, method
+
+def _construct_prime_power(q, n_var):
+  run, (method, n) = _prime_power_run(q, n_var)
+  gf = GaloisField(q)
+  if method == 'rao_hamming':
+    return rao_hamming(gf, n, n_var)
+  else:
+    return addelman_kempthorne(gf, n_var)
+
+def get_run(n_var, depth):
+  ''' return the number of runs of the OA which will be constructed
+      for given # of vars, OA depth. 0 if it cannot be constructed.
+  '''
+  if n_var < 1 or depth < 2 or depth > MAX_DEPTH:
+    return 0
+  if n_var == 1:
+    return depth
+  return int(np.prod([ _prime_power_run(p**m, n_var)[0] for p, m in factorize(depth) ]))
+
+def construct(n_var, depth):
+  ''' construct an OA for given # of vars, OA depth. Return None if impossible '''
+  if get_run(n_var, depth) == 0:
+    return None
+  if n_var == 1:
+    return np.arange(depth).reshape(depth, 1).astype(np.uint8)
+  oa = np.zeros((1, n_var), dtype=int)
+  for p, m in factorize(depth): # Kronecker product of OAs of co-prime prime powers
+    q = p**m
+    sub = _construct_prime_power(q, n_var)
+    oa = (oa[:,None,:]*q + sub[None,:,:]).reshape(-1, n_var)
+  return oa.astype(np.uint8)
+
+#------------------------------------------------------
+class OrthogonalArrayGenerator(object):
+  ''' Constructs OAs for table misses and caches them on disk.
+        - cache_dir: directory where constructed OAs are stored.
+                     Caching is disabled if it is None or not writable.
+  '''
+  def __init__(self, cache_dir=None):
+    self._cache_dir = os.path.abspath(os.path.expandvars(os.path.expanduser(cache_dir))) if cache_dir else None
+    self._oa = {} # in-memory cache
+
+  def get_run(self, n_var, depth): # number of runs of OA if it can be constructed, else 0
+    return get_run(n_var, depth)
+
+  def lookup(self, n_var, depth):
+    ''' return a read-only constructed OA if possible, else None '''
+    key = (n_var, depth)
+    if key not in self._oa:
+      oa = self._load(n_var, depth)
+      if oa is None:
+        oa = construct(n_var, depth)
+        if oa is None:
+          return None
+        self._save(n_var, depth, oa)
+        oa.flags.writeable = False
+      self._oa[key] = oa
+    return self._oa[key]
+
+  def _get_filename(self, n_var, depth):
+    return os.path.join(self._cache_dir, OA_CACHE_FILENAME % (n_var, depth))
+
+  def _load(self, n_var, depth):
+    if self._cache_dir and n_var > 1:
+      try:
+        oa = np.load(self._get_filename(n_var, depth), mmap_mode='r')
+        if oa.shape == (get_run(n_var, depth), n_var):
+          return oa.view(np.ndarray)
+      except (IOError, ValueError):
+        pass
+    return None
+
+  def _save(self, n_var, depth, oa): # write to a temp file and rename for concurrent runs
+    if self._cache_dir and n_var > 1:
+      try:
+        if not os.path.exists(self._cache_dir):
+          os.makedirs(self._cache_dir)
+        filename = self._get_filename(n_var, depth)
+        tmpfile = '%s.%d.tmp' % (filename, os.getpid())
+        with open(tmpfile, 'wb') as f:
+          np.save(f, oa)
+        os.rename(tmpfile, filename)
+      except (IOError, OSError):
+        pass
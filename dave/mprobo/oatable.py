@@ -1,4769 +1,133 @@
-from StringIO import StringIO
-
 __doc__ = """
 This contains some Orthogonal Array (OA) tables for test vector generation.
-"""
-
-OA_V9_L4_tbl=StringIO("""
-4 2 3 1 2 4 1 3 2
-3 3 3 3 3 3 3 3 1
-2 1 3 4 3 4 2 1 4
-2 2 1 1 3 3 4 4 3
-1 3 2 4 3 1 4 2 2
-1 2 4 3 4 3 1 2 4
-1 3 1 3 2 4 2 4 4
-4 4 4 4 4 4 4 4 1
-3 1 3 1 4 2 4 2 4
-4 4 3 3 1 1 2 2 3
-2 1 4 3 2 1 4 3 2
-3 4 1 2 3 4 1 2 2
-4 2 4 2 3 1 3 1 4
-2 4 1 3 4 2 3 1 2
-2 3 4 1 1 4 3 2 3
-1 2 3 4 1 2 3 4 2
-4 3 1 2 1 2 4 3 4
-1 1 2 2 4 4 3 3 3
-4 3 2 1 4 3 2 1 2
-2 2 2 2 2 2 2 2 1
-1 4 3 2 2 3 4 1 3
-2 3 3 2 4 1 1 4 1
-3 3 4 4 2 2 1 1 3
-4 1 2 3 3 2 1 4 3
-1 1 1 1 1 1 1 1 1
-1 4 4 1 3 2 2 3 1
-2 4 2 4 1 3 1 3 4
-3 4 2 1 2 1 3 4 4
-4 1 1 4 2 3 3 2 1
-3 1 4 2 1 3 2 4 2
-3 2 2 3 1 4 4 1 1
-3 2 1 4 4 1 2 3 3
-""")
-
-OA_V2_L2_tbl=StringIO("""
-1 1
-2 1
-2 2
-1 2
-""")
-
-OA_V10_L4_tbl=StringIO("""
-3 1 1 1 2 2 2 4 4 4
-4 4 2 3 1 3 2 4 1 2
-4 1 4 3 4 1 2 3 2 1
-3 2 4 1 1 4 3 3 4 2
-2 1 4 3 2 4 1 1 3 2
-3 3 1 4 2 4 1 3 2 1
-3 2 2 2 4 4 4 1 1 1
-1 1 2 4 3 1 4 3 4 2
-1 3 3 3 4 4 4 2 2 2
-1 4 1 2 1 4 3 2 3 4
-4 2 2 2 1 1 1 3 3 3
-1 2 1 3 2 3 4 3 1 4
-1 1 1 1 1 1 1 1 1 1
-3 3 4 2 1 3 2 1 2 4
-3 4 2 3 2 1 3 2 4 1
-1 2 4 1 4 3 1 4 2 3
-2 3 3 3 1 1 1 4 4 4
-2 4 4 4 3 3 3 1 1 1
-4 4 4 4 4 4 4 4 4 4
-2 2 2 2 2 2 2 2 2 2
-1 4 4 4 2 2 2 3 3 3
-4 1 3 2 2 3 4 4 3 1
-2 4 3 1 1 2 4 3 2 1
-2 3 2 1 2 3 4 1 4 3
-4 4 3 1 2 4 1 2 1 3
-1 3 4 2 2 1 3 4 1 2
-3 1 4 3 1 2 4 2 1 3
-1 3 2 1 3 4 2 4 3 1
-3 3 3 3 3 3 3 3 3 3
-1 4 2 3 3 2 1 1 2 4
-4 3 4 2 3 2 1 2 4 1
-2 2 1 3 4 2 3 4 3 1
-2 1 2 4 1 4 3 4 2 3
-1 1 3 2 4 2 3 1 4 3
-4 3 2 1 4 2 3 3 1 4
-2 3 1 4 4 1 2 2 1 3
-3 4 1 2 3 1 4 4 2 3
-1 2 3 4 1 3 2 2 4 1
-2 4 1 2 4 3 1 3 4 2
-2 1 3 2 3 4 2 3 1 4
-4 2 1 3 3 4 2 1 4 3
-3 2 3 4 3 2 1 4 1 2
-4 1 1 1 3 3 3 2 2 2
-2 2 4 1 3 1 4 2 3 4
-4 3 1 4 1 2 4 1 3 2
-3 4 3 1 4 1 2 1 3 2
-3 1 2 4 4 3 1 2 3 4
-4 2 3 4 2 1 3 1 2 4
-""")
-
-OA_V27_L2_tbl=StringIO("""
-2 1 2 2 1 1 2 1 1 2 1 2 1 2 2 1 2 1 2 1 2 1 2 2 2 1 1
-2 2 2 2 2 1 2 1 2 2 2 1 2 1 1 1 2 1 1 1 1 2 1 2 1 2 1
-1 1 2 2 1 2 2 1 2 1 2 1 1 2 1 2 1 2 1 2 2 1 1 2 2 2 1
-1 1 2 1 2 1 1 2 1 2 2 1 1 1 2 1 2 2 2 2 2 1 1 2 1 2 2
-1 1 1 1 2 2 1 1 2 2 2 2 2 2 1 1 2 1 2 2 1 1 2 1 2 2 1
-1 1 1 2 2 2 2 2 2 1 1 1 2 1 2 2 2 2 2 1 1 1 2 2 1 1 1
-1 2 2 1 1 2 1 2 2 1 2 2 2 1 2 1 1 1 2 1 2 2 1 2 2 1 1
-1 2 2 1 2 1 2 2 2 2 1 1 1 2 1 2 1 1 2 2 2 2 2 1 1 1 1
-1 2 1 2 1 1 1 1 1 2 2 1 2 1 2 2 2 2 1 2 2 2 2 1 2 1 1
-2 2 2 1 2 2 1 1 2 1 1 1 1 1 2 2 2 1 1 1 2 1 2 1 2 2 2
-2 2 1 1 1 2 2 2 1 1 2 1 2 2 1 1 2 1 1 2 2 1 2 2 1 1 2
-2 2 1 2 2 2 1 1 1 1 1 2 1 1 1 1 1 2 2 2 2 2 2 2 1 2 1
-1 2 1 2 2 1 2 1 1 1 2 2 2 2 2 2 1 1 2 1 2 1 1 1 1 2 2
-2 1 1 2 2 1 1 2 2 2 1 2 2 1 1 2 1 1 1 2 2 1 1 2 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 1 1 1 2 2 2 2 1 2 1 1 2 2 2 1 1 2 1 1 2 2 1 1 2 2 1
-1 1 2 1 1 2 2 1 1 2 1 2 2 1 2 2 1 1 1 2 1 2 2 2 1 2 2
-2 2 2 1 1 1 2 2 1 1 1 2 2 1 1 2 2 2 2 2 1 1 1 1 2 2 1
-1 1 2 2 1 1 1 2 2 1 1 2 2 2 1 1 2 2 1 1 2 2 2 1 1 2 2
-1 2 1 2 1 2 1 2 1 2 1 1 1 2 1 2 2 1 2 1 1 2 1 2 2 2 2
-2 1 1 2 1 1 2 2 2 1 2 1 1 1 2 1 1 1 2 2 1 2 2 1 2 2 2
-2 2 2 2 1 2 1 1 2 2 1 1 2 2 2 1 1 2 2 2 1 1 1 1 1 1 2
-1 2 1 1 2 1 2 1 2 1 1 2 1 2 2 1 2 2 1 2 1 2 1 2 2 1 2
-2 1 2 2 2 2 1 2 1 1 2 2 1 2 2 2 2 1 1 2 1 2 1 1 1 1 1
-2 1 1 1 1 2 2 1 2 2 2 2 1 1 1 2 2 2 2 1 2 2 1 1 1 1 2
-1 2 2 2 2 2 2 2 1 2 2 2 1 1 1 1 1 2 1 1 1 1 2 1 2 1 2
-2 2 1 1 1 1 1 2 2 2 2 2 1 2 2 2 1 2 1 1 1 1 2 2 1 2 1
-2 1 2 1 2 1 1 1 1 1 2 1 2 2 1 2 1 2 2 1 1 2 2 2 2 1 2
-""")
-
-OA_V2_L4_tbl=StringIO("""
-2 1
-2 3
-1 2
-1 4
-1 3
-4 4
-4 2
-4 1
-2 4
-4 3
-1 1
-3 4
-3 3
-3 2
-3 1
-2 2
-""")
-
-OA_V7_L6_tbl=StringIO("""
-4 1 6 5 2 4 1
-4 2 1 3 4 2 6
-6 1 5 3 6 4 3
-2 4 6 1 5 2 3
-3 6 3 5 4 5 4
-1 2 2 2 2 2 2
-3 5 2 4 3 4 3
-3 5 5 6 2 3 1
-2 2 4 5 3 6 1
-6 6 4 3 4 1 1
-2 5 2 5 1 1 2
-3 2 2 3 5 6 4
-4 2 1 6 3 5 2
-6 6 4 2 5 3 2
-5 3 4 1 6 5 2
-2 6 3 6 2 2 3
-5 4 5 2 1 6 3
-3 3 6 2 1 2 1
-2 4 1 4 6 6 1
-5 2 3 6 5 4 1
-6 2 6 5 6 3 3
-5 2 3 1 1 3 5
-1 4 4 4 4 4 4
-3 2 5 1 6 1 6
-4 4 3 5 6 4 2
-3 1 4 6 5 6 5
-5 6 1 4 3 2 5
-6 5 3 1 4 2 1
-4 6 5 1 2 6 4
-1 3 5 5 3 2 4
-6 3 1 6 1 4 4
-2 1 4 1 3 3 4
-5 6 1 5 5 1 3
-5 1 2 6 6 2 4
-3 4 4 5 1 2 6
-4 4 3 2 5 1 4
-2 3 6 3 5 5 6
-3 6 6 1 3 4 2
-1 1 3 3 1 6 2
-4 5 4 3 6 2 5
-1 3 3 3 3 3 3
-1 5 5 5 5 5 5
-2 1 3 4 2 5 6
-1 6 6 6 6 6 6
-1 5 1 1 5 4 6
-1 4 6 6 4 3 5
-3 3 3 4 6 1 5
-5 1 2 5 4 3 6
-6 2 6 4 1 5 4
-5 4 5 3 3 5 1
-3 1 1 2 4 5 3
-4 6 5 4 1 3 6
-2 3 5 6 4 1 2
-3 4 1 3 2 3 2
-1 2 4 4 2 1 3
-4 3 2 4 5 3 1
-6 1 5 4 5 2 2
-2 2 5 2 4 4 5
-5 5 6 3 2 1 4
-1 1 1 1 1 1 1
-5 3 4 2 2 4 6
-6 3 1 5 2 6 5
-2 5 1 2 6 3 4
-5 5 6 4 4 6 2
-4 1 6 2 3 1 5
-1 6 2 2 6 5 1
-6 4 2 1 2 5 5
-4 3 2 1 4 6 3
-6 4 2 6 3 1 6
-4 5 4 6 1 5 3
-6 5 3 2 3 6 6
-2 6 2 3 1 4 5
-""")
-
-OA_V24_L2_tbl=StringIO("""
-1 2 2 1 2 1 2 2 2 2 1 1 1 2 1 2 1 1 2 2 2 2 2 1
-2 1 1 1 1 2 2 1 2 2 2 2 1 1 1 2 2 2 2 1 2 2 1 1
-1 1 2 1 2 1 1 2 1 2 2 1 1 1 2 1 2 2 2 2 2 1 1 2
-2 1 1 2 2 1 1 2 2 2 1 2 2 1 1 2 1 1 1 2 2 1 1 2
-1 2 2 2 2 2 2 2 1 2 2 2 1 1 1 1 1 2 1 1 1 1 2 1
-2 1 2 1 2 1 1 1 1 1 2 1 2 2 1 2 1 2 2 1 1 2 2 2
-1 1 1 1 2 2 1 1 2 2 2 2 2 2 1 1 2 1 2 2 1 1 2 1
-2 2 1 2 2 2 1 1 1 1 1 2 1 1 1 1 1 2 2 2 2 2 2 2
-1 2 1 2 1 2 1 2 1 2 1 1 1 2 1 2 2 1 2 1 1 2 1 2
-1 1 2 1 1 2 2 1 1 2 1 2 2 1 2 2 1 1 1 2 1 2 2 2
-2 2 2 2 1 2 1 1 2 2 1 1 2 2 2 1 1 2 2 2 1 1 1 1
-1 2 1 2 1 1 1 1 1 2 2 1 2 1 2 2 2 2 1 2 2 2 2 1
-2 2 1 1 1 2 2 2 1 1 2 1 2 2 1 1 2 1 1 2 2 1 2 2
-2 2 2 1 2 2 1 1 2 1 1 1 1 1 2 2 2 1 1 1 2 1 2 1
-2 1 1 2 1 1 2 2 2 1 2 1 1 1 2 1 1 1 2 2 1 2 2 1
-1 1 2 2 1 2 2 1 2 1 2 1 1 2 1 2 1 2 1 2 2 1 1 2
-1 1 2 2 1 1 1 2 2 1 1 2 2 2 1 1 2 2 1 1 2 2 2 1
-2 1 2 2 2 2 1 2 1 1 2 2 1 2 2 2 2 1 1 2 1 2 1 1
-1 2 2 1 1 2 1 2 2 1 2 2 2 1 2 1 1 1 2 1 2 2 1 2
-2 1 2 2 1 1 2 1 1 2 1 2 1 2 2 1 2 1 2 1 2 1 2 2
-1 2 1 2 2 1 2 1 1 1 2 2 2 2 2 2 1 1 2 1 2 1 1 1
-1 1 1 2 2 2 2 2 2 1 1 1 2 1 2 2 2 2 2 1 1 1 2 2
-2 2 2 1 1 1 2 2 1 1 1 2 2 1 1 2 2 2 2 2 1 1 1 1
-2 1 1 1 2 2 2 2 1 2 1 1 2 2 2 1 1 2 1 1 2 2 1 1
-2 2 2 2 2 1 2 1 2 2 2 1 2 1 1 1 2 1 1 1 1 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 2 1 1 1 1 1 2 2 2 2 2 1 2 2 2 1 2 1 1 1 1 2 2
-1 2 1 1 2 1 2 1 2 1 1 2 1 2 2 1 2 2 1 2 1 2 1 2
-""")
-
-OA_V25_L2_tbl=StringIO("""
-2 1 1 2 1 1 2 2 2 1 2 1 1 1 2 1 1 1 2 2 1 2 2 1 2
-1 2 2 1 1 2 1 2 2 1 2 2 2 1 2 1 1 1 2 1 2 2 1 2 2
-2 1 1 2 2 1 1 2 2 2 1 2 2 1 1 2 1 1 1 2 2 1 1 2 2
-2 1 2 2 1 1 2 1 1 2 1 2 1 2 2 1 2 1 2 1 2 1 2 2 2
-2 1 1 1 1 2 2 1 2 2 2 2 1 1 1 2 2 2 2 1 2 2 1 1 1
-1 2 1 2 1 1 1 1 1 2 2 1 2 1 2 2 2 2 1 2 2 2 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-1 2 2 2 2 2 2 2 1 2 2 2 1 1 1 1 1 2 1 1 1 1 2 1 2
-2 1 2 1 2 1 1 1 1 1 2 1 2 2 1 2 1 2 2 1 1 2 2 2 2
-1 2 1 1 2 1 2 1 2 1 1 2 1 2 2 1 2 2 1 2 1 2 1 2 2
-2 2 2 1 2 2 1 1 2 1 1 1 1 1 2 2 2 1 1 1 2 1 2 1 2
-1 1 2 1 1 2 2 1 1 2 1 2 2 1 2 2 1 1 1 2 1 2 2 2 1
-2 1 2 2 2 2 1 2 1 1 2 2 1 2 2 2 2 1 1 2 1 2 1 1 1
-2 2 2 1 1 1 2 2 1 1 1 2 2 1 1 2 2 2 2 2 1 1 1 1 2
-2 2 1 1 1 2 2 2 1 1 2 1 2 2 1 1 2 1 1 2 2 1 2 2 1
-2 1 1 1 2 2 2 2 1 2 1 1 2 2 2 1 1 2 1 1 2 2 1 1 2
-2 2 2 2 1 2 1 1 2 2 1 1 2 2 2 1 1 2 2 2 1 1 1 1 1
-1 1 2 1 2 1 1 2 1 2 2 1 1 1 2 1 2 2 2 2 2 1 1 2 1
-2 2 2 2 2 1 2 1 2 2 2 1 2 1 1 1 2 1 1 1 1 2 1 2 1
-1 1 2 2 1 1 1 2 2 1 1 2 2 2 1 1 2 2 1 1 2 2 2 1 1
-1 2 2 1 2 1 2 2 2 2 1 1 1 2 1 2 1 1 2 2 2 2 2 1 1
-2 2 1 2 2 2 1 1 1 1 1 2 1 1 1 1 1 2 2 2 2 2 2 2 1
-1 1 2 2 1 2 2 1 2 1 2 1 1 2 1 2 1 2 1 2 2 1 1 2 2
-1 1 1 2 2 2 2 2 2 1 1 1 2 1 2 2 2 2 2 1 1 1 2 2 1
-1 2 1 2 1 2 1 2 1 2 1 1 1 2 1 2 2 1 2 1 1 2 1 2 2
-2 2 1 1 1 1 1 2 2 2 2 2 1 2 2 2 1 2 1 1 1 1 2 2 1
-1 2 1 2 2 1 2 1 1 1 2 2 2 2 2 2 1 1 2 1 2 1 1 1 1
-1 1 1 1 2 2 1 1 2 2 2 2 2 2 1 1 2 1 2 2 1 1 2 1 2
-""")
-
-OA_V17_L2_tbl=StringIO("""
-1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2
-2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1
-2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2
-1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1
-2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1
-1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2
-1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2
-1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1
-2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1
-1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2
-2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1
-1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1
-2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2
-1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1
-2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1
-1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1
-1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2
-2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2
-2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2
-2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2
-""")
-
-OA_V31_L2_tbl=StringIO("""
-2 1 1 2 2 2 1 1 2 2 2 2 1 1 2 2 2 2 1 1 1 1 2 1 2 1 1 1 2 1 2
-1 1 1 1 1 1 1 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2
-1 2 2 1 2 2 1 1 2 2 1 1 1 2 1 2 2 2 1 2 1 2 2 2 1 1 2 2 1 1 1
-1 1 2 2 2 1 2 1 2 2 1 2 2 1 1 1 1 1 1 2 1 2 2 1 2 2 2 1 2 2 1
-2 2 1 1 2 1 2 1 1 1 2 2 1 2 1 2 1 2 2 1 2 2 2 1 2 2 2 1 1 1 1
-1 1 1 1 1 1 1 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2
-1 2 1 2 1 2 2 2 2 1 2 1 2 1 2 2 1 1 1 2 2 1 2 1 2 1 2 2 1 1 1
-2 2 2 2 1 1 1 2 2 1 1 1 1 1 1 1 2 2 1 1 2 2 2 1 2 2 1 2 1 2 2
-2 1 2 1 1 2 2 2 2 1 1 2 2 2 1 2 1 1 1 1 2 2 2 2 1 1 1 1 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 1 2 1 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 2 1 2 1 1 1 2 2 1 1 2 2
-1 2 1 2 1 2 2 1 2 2 1 1 1 2 2 1 2 1 2 1 2 2 1 1 1 2 2 1 2 1 2
-1 2 1 2 1 2 2 1 1 1 1 2 2 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 2 1
-2 2 1 1 2 1 2 2 1 2 1 2 2 1 1 1 2 2 1 2 2 1 1 1 1 1 2 2 2 1 2
-1 2 2 1 2 2 1 2 1 2 2 2 1 1 2 2 1 1 1 1 2 2 1 1 1 2 1 2 2 2 1
-1 2 2 1 2 2 1 2 2 1 2 1 2 1 1 1 1 2 2 1 1 1 1 2 2 2 2 1 2 1 2
-2 1 2 1 1 2 2 1 2 2 2 2 1 1 1 1 2 1 2 2 2 1 1 2 2 2 1 2 1 1 1
-1 1 1 1 1 1 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1
-2 2 2 2 1 1 1 2 1 2 1 2 2 1 2 2 2 1 2 1 1 1 2 2 1 2 2 1 1 1 1
-2 1 1 2 2 2 1 2 2 1 1 2 2 2 2 1 1 2 2 2 1 2 1 1 1 2 1 2 1 1 1
-1 1 2 2 2 1 2 2 1 2 2 1 2 2 2 1 2 2 1 1 2 2 1 2 2 1 1 1 1 1 1
-2 2 1 1 2 1 2 1 2 2 2 1 2 2 2 1 1 1 1 1 1 1 2 2 1 2 1 2 1 2 2
-1 1 2 2 2 1 2 1 1 1 1 1 1 1 2 2 1 2 2 2 2 1 2 2 1 2 1 2 2 1 2
-2 1 1 2 2 2 1 2 1 2 1 1 1 2 1 2 1 1 1 2 2 1 1 2 2 2 2 1 1 2 2
-2 1 1 2 2 2 1 1 1 1 2 1 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 2 2 1
-1 2 2 1 2 2 1 1 1 1 1 2 2 2 2 1 2 1 2 2 2 1 2 1 2 1 1 1 1 2 2
-2 2 2 2 1 1 1 1 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 2 1 2
-2 2 2 2 1 1 1 1 2 2 2 1 2 2 1 2 1 2 2 2 2 1 1 1 1 1 1 1 2 2 1
-2 1 2 1 1 2 2 2 1 2 1 1 1 2 2 1 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1
-2 2 1 1 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 1 2 1 2 2 1 1 1 2 2 1
-1 1 2 2 2 1 2 2 2 1 2 2 1 2 1 2 2 1 2 1 1 1 1 1 1 1 2 2 1 2 2
-1 2 1 2 1 2 2 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 2 1 1 1 1 1 2 2
-""")
-
-OA_V1_L5_tbl=StringIO("""
-1
-2
-3
-4
-5
-""")
-
-OA_V3_L4_tbl=StringIO("""
-4 4 4
-1 4 3
-1 1 1
-1 3 2
-2 2 2
-4 1 2
-3 4 2
-2 1 3
-3 2 1
-3 1 4
-4 2 3
-4 3 1
-3 3 3
-2 4 1
-2 3 4
-1 2 4
-""")
-
-OA_V3_L5_tbl=StringIO("""
-3 5 2
-4 5 1
-3 1 4
-5 1 2
-2 3 4
-4 1 3
-5 4 3
-2 2 2
-5 5 5
-2 4 1
-3 2 1
-2 5 3
-1 3 5
-2 1 5
-3 4 5
-1 2 3
-1 4 2
-4 3 2
-5 2 4
-3 3 3
-4 4 4
-1 1 1
-4 2 5
-1 5 4
-5 3 1
-""")
-
-OA_V9_L2_tbl=StringIO("""
-2 1 1 2 1 2 2 2 1
-2 2 2 1 1 1 2 1 1
-2 1 1 1 2 1 1 2 1
-1 1 2 1 1 2 1 2 2
-1 2 1 1 2 1 2 2 2
-2 2 1 1 1 2 1 1 2
-1 2 2 2 1 1 1 2 1
-2 2 2 2 2 2 2 2 2
-1 1 1 2 1 1 2 1 2
-1 1 2 1 2 2 2 1 1
-1 2 1 2 2 2 1 1 1
-2 1 2 2 2 1 1 1 2
-""")
-
-OA_V2_L9_tbl=StringIO("""
-6 1
-6 5
-9 5
-8 1
-5 6
-1 8
-2 1
-4 7
-2 3
-6 9
-1 9
-5 3
-3 5
-1 1
-7 9
-3 9
-9 1
-4 2
-2 9
-3 3
-5 7
-5 1
-2 7
-5 4
-3 6
-4 5
-6 7
-7 6
-4 1
-7 4
-6 6
-5 5
-3 1
-1 4
-8 2
-9 2
-3 4
-8 7
-9 6
-7 8
-6 3
-2 4
-1 5
-4 3
-9 9
-8 3
-5 2
-3 8
-6 8
-1 3
-5 8
-2 8
-7 7
-9 7
-6 2
-5 9
-6 4
-7 1
-1 6
-8 8
-2 5
-2 6
-9 3
-8 9
-8 5
-4 4
-4 8
-7 3
-3 2
-7 2
-7 5
-1 2
-8 4
-8 6
-1 7
-9 4
-3 7
-4 9
-4 6
-2 2
-9 8
-""")
-
-OA_V9_L3_tbl=StringIO("""
-2 3 1 3 1 2 1 2 3
-2 3 1 1 2 3 3 1 2
-3 1 2 3 1 2 3 1 2
-2 3 1 2 3 1 2 3 1
-1 2 3 2 3 1 3 1 2
-2 1 3 3 2 1 1 3 2
-3 1 2 1 2 3 2 3 1
-3 3 3 1 1 1 2 2 2
-1 1 1 1 1 1 1 1 1
-3 1 2 2 3 1 1 2 3
-3 2 1 1 3 2 2 1 3
-3 2 1 2 1 3 1 3 2
-2 2 2 2 2 2 2 2 2
-1 3 2 2 1 3 3 2 1
-2 2 2 1 1 1 3 3 3
-2 1 3 1 3 2 3 2 1
-1 1 1 3 3 3 2 2 2
-3 3 3 2 2 2 1 1 1
-3 3 3 3 3 3 3 3 3
-1 1 1 2 2 2 3 3 3
-2 2 2 3 3 3 1 1 1
-2 1 3 2 1 3 2 1 3
-1 3 2 1 3 2 1 3 2
-3 2 1 3 2 1 3 2 1
-1 3 2 3 2 1 2 1 3
-1 2 3 1 2 3 1 2 3
-1 2 3 3 1 2 2 3 1
-""")
-
-OA_V1_L7_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-""")
-
-OA_V10_L6_tbl=StringIO("""
-1 4 6 4 5 2 6 1 6 1
-3 5 3 3 5 6 6 2 1 1
-3 1 4 4 6 3 5 3 1 5
-2 1 4 6 5 1 6 6 5 2
-5 1 3 3 5 2 2 4 3 3
-4 5 1 4 2 2 3 6 2 5
-5 1 1 1 3 6 6 2 5 5
-6 5 6 2 1 1 6 6 1 4
-3 4 4 3 4 6 5 6 1 2
-3 4 2 1 2 4 3 4 3 4
-3 5 1 1 3 4 4 6 3 3
-5 4 1 2 5 1 5 4 6 2
-1 6 5 6 3 1 5 4 4 6
-4 3 6 2 1 5 4 4 5 2
-4 4 3 2 2 2 4 3 1 6
-1 3 1 1 3 2 2 4 1 1
-2 3 3 6 4 2 3 6 4 1
-1 4 4 2 3 6 4 5 2 3
-4 5 5 2 6 6 1 4 4 1
-4 1 2 5 5 4 1 1 2 2
-4 3 4 6 5 3 2 2 1 4
-3 2 1 2 5 5 3 2 4 6
-4 2 4 5 2 1 4 2 6 5
-6 1 1 4 2 4 5 2 4 1
-1 1 1 5 4 1 2 5 2 6
-2 2 3 2 2 6 2 1 5 4
-6 1 3 6 4 6 1 4 2 5
-5 3 6 6 2 1 3 1 1 5
-4 2 6 1 4 3 6 4 4 3
-6 5 2 4 3 3 2 2 5 2
-5 5 5 3 2 3 4 1 2 6
-2 1 2 4 3 5 4 4 1 4
-3 2 5 6 3 3 1 6 6 2
-5 3 2 2 4 3 5 3 5 3
-6 6 3 2 2 4 6 5 3 2
-5 5 1 5 4 5 6 3 6 4
-3 3 3 1 6 5 6 3 2 6
-6 6 5 4 4 6 2 1 1 6
-2 6 4 5 2 5 2 6 4 3
-2 6 6 1 4 1 4 2 2 1
-4 3 2 4 3 1 6 6 3 6
-5 3 4 4 6 5 1 5 3 1
-2 3 1 4 2 6 1 4 6 3
-1 5 6 6 2 3 5 3 3 1
-5 6 4 3 4 2 1 2 3 4
-6 4 2 3 6 1 4 2 4 3
-6 2 5 1 5 1 1 3 5 1
-5 5 3 1 6 1 2 5 4 2
-1 6 1 2 5 3 1 6 2 4
-4 6 1 3 1 1 1 3 1 3
-1 3 5 5 1 6 6 2 3 3
-1 3 3 3 5 4 4 6 5 5
-1 2 4 3 4 4 3 4 5 6
-6 4 4 5 2 3 6 4 2 1
-4 1 6 3 3 2 5 5 4 4
-4 4 5 4 4 4 6 5 5 4
-6 6 1 6 6 2 4 3 5 4
-6 1 5 2 6 2 3 6 6 3
-3 2 3 4 1 1 5 4 2 4
-1 5 4 4 6 1 3 1 5 3
-3 3 5 3 2 1 2 5 6 4
-2 2 1 6 6 4 6 5 1 6
-5 2 4 2 3 4 2 3 6 1
-2 5 6 3 3 6 3 3 2 2
-2 4 3 5 3 1 1 3 3 5
-2 6 2 3 6 3 6 4 6 5
-2 4 1 3 1 5 5 1 5 1
-6 4 6 1 4 5 2 6 6 5
-2 1 6 2 1 3 2 2 3 6
-1 1 5 3 2 5 6 3 4 2
-4 2 2 3 6 5 2 6 2 1
-3 6 6 4 5 4 2 3 2 3
-3 4 6 5 6 2 1 2 5 6
-3 6 2 6 1 6 4 5 6 1
-6 5 4 6 5 5 4 4 3 6
-4 6 5 1 5 5 5 1 3 5
-4 4 1 6 6 6 2 1 3 2
-1 2 2 1 2 2 1 2 1 2
-6 3 4 1 1 2 5 5 2 2
-1 2 6 5 6 6 5 6 3 4
-6 3 6 3 3 4 1 1 6 6
-2 2 5 4 4 2 4 3 3 2
-2 5 4 1 1 4 1 1 4 4
-3 1 6 6 2 5 1 5 5 3
-5 1 5 5 1 4 4 6 1 1
-5 4 3 4 1 3 1 6 4 6
-6 2 1 3 1 3 3 5 3 5
-6 3 2 5 5 6 3 3 4 4
-1 1 3 1 6 3 4 1 6 4
-4 1 4 1 1 6 3 3 6 6
-6 2 3 5 3 5 5 1 1 3
-4 5 3 6 4 4 5 2 6 3
-3 5 5 5 1 2 2 4 5 5
-3 6 4 2 3 2 6 1 4 5
-1 5 2 2 4 5 1 5 1 5
-3 1 2 2 4 1 3 1 3 1
-2 3 5 2 6 4 5 2 2 5
-1 4 2 6 1 4 2 3 4 5
-5 6 2 1 2 6 5 6 5 6
-3 3 1 5 4 3 4 1 4 2
-5 6 6 5 6 4 3 4 1 2
-5 4 5 6 3 5 3 2 2 4
-5 2 6 4 5 6 4 5 4 5
-1 6 3 4 1 5 3 2 6 2
-2 5 2 5 5 2 5 5 6 6
-5 2 2 6 1 2 6 1 2 3
-4 6 3 5 3 3 3 5 5 1
-2 4 5 1 5 3 3 5 1 3
-""")
-
-OA_V10_L2_tbl=StringIO("""
-1 1 2 1 1 2 1 2 2 2
-2 2 1 1 1 2 1 1 2 1
-1 2 1 1 2 1 2 2 2 1
-2 2 2 2 2 2 2 2 2 2
-2 1 1 1 2 1 1 2 1 2
-2 1 1 2 1 2 2 2 1 1
-1 2 1 2 2 2 1 1 1 2
-1 1 1 2 1 1 2 1 2 2
-2 1 2 2 2 1 1 1 2 1
-1 1 2 1 2 2 2 1 1 1
-2 2 2 1 1 1 2 1 1 2
-1 2 2 2 1 1 1 2 1 1
-""")
-
-OA_V33_L2_tbl=StringIO("""
-1 2 1 2 2 2 1 2 2 2 1 1 2 2 1 1 2 2 2 1 1 1 2 2 1 1 2 1 2 2 1 2 1
-2 1 2 1 1 2 1 2 1 1 2 2 2 2 1 1 2 1 2 2 1 2 1 2 1 2 2 1 1 1 1 2 2
-1 1 2 2 1 2 2 2 2 1 1 1 1 1 2 1 1 2 2 2 1 1 1 2 1 1 2 2 1 2 2 1 2
-2 2 1 1 1 1 2 2 2 1 1 2 2 2 2 1 1 1 1 1 2 2 2 2 1 1 2 2 2 1 1 1 1
-2 2 2 1 2 2 1 1 1 1 2 1 2 1 1 2 2 2 1 1 1 2 2 2 1 1 1 2 1 2 2 1 1
-2 1 1 1 2 1 2 2 1 2 1 2 2 2 1 2 1 2 1 2 1 1 1 2 2 1 1 1 2 2 2 1 2
-1 1 2 1 2 1 2 1 2 1 2 2 2 2 1 2 1 2 2 2 1 1 2 1 2 1 2 2 1 1 1 2 1
-2 2 2 1 2 2 1 1 2 1 1 2 1 1 1 1 1 2 1 1 2 1 1 1 2 2 2 2 2 2 1 2 2
-1 2 2 1 1 1 2 1 1 2 1 1 2 1 2 2 2 1 2 1 1 2 1 1 2 1 2 1 2 2 1 2 2
-1 1 2 2 1 2 2 2 2 1 2 2 2 1 1 2 2 1 1 1 2 1 1 2 2 2 1 1 2 2 1 1 1
-2 1 1 2 2 1 1 2 1 1 2 2 1 1 2 2 1 2 2 1 1 2 2 1 1 2 2 1 2 2 1 1 2
-1 1 1 1 2 1 1 2 2 1 1 1 1 2 1 2 2 1 2 2 2 2 1 1 1 2 1 2 2 2 2 2 1
-1 2 2 2 2 1 1 2 2 2 1 2 2 1 2 2 2 1 1 2 1 1 2 1 1 2 1 2 1 1 1 1 2
-1 2 2 2 1 1 1 1 1 2 1 2 1 2 1 1 1 2 2 2 2 2 2 2 2 2 1 1 1 2 1 1 1
-2 2 1 2 2 2 2 2 1 2 1 1 1 1 1 2 1 1 1 2 1 2 1 2 2 2 2 2 1 1 1 2 1
-2 1 2 2 2 1 2 1 2 2 1 1 2 2 1 1 2 2 1 1 2 2 1 1 1 2 2 1 1 1 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 1 1 2 2 2 2 1 2 2 2 2 1 2 2 1 2 1 2 1 1 2 1 1 2 1 1 2 1 2 1 1 1
-1 2 1 1 1 1 1 2 2 2 2 2 1 1 1 2 2 2 2 1 2 2 1 2 2 1 2 2 1 1 2 1 2
-2 2 2 2 2 1 2 2 1 1 2 1 1 1 1 1 2 1 2 2 2 1 2 1 2 1 2 1 2 1 2 1 1
-1 1 2 2 2 1 1 1 1 2 2 2 2 1 2 1 1 1 1 2 2 2 1 2 1 1 2 2 2 2 2 2 1
-1 1 1 1 2 2 2 1 1 1 1 1 2 1 2 1 2 2 2 2 2 2 2 2 2 2 1 2 2 1 1 1 2
-2 1 1 1 1 1 2 1 2 2 2 1 1 1 2 2 2 2 1 2 2 1 2 2 1 2 2 1 1 2 1 2 1
-2 2 1 2 1 1 1 2 1 1 2 1 2 2 2 1 2 2 1 2 2 1 1 1 2 1 1 2 1 2 1 2 2
-2 2 1 2 1 2 2 1 2 1 1 2 2 1 1 2 1 1 2 2 2 2 2 1 1 1 1 1 1 2 2 2 2
-2 2 2 1 2 2 1 1 2 2 2 1 1 2 2 2 1 1 2 2 2 1 1 2 1 1 1 1 2 1 1 1 2
-1 2 2 1 2 1 2 2 2 1 2 1 1 2 2 1 1 1 1 1 1 2 2 2 2 2 1 1 1 2 2 2 2
-1 1 2 2 1 2 2 2 1 2 2 1 1 2 1 2 1 2 1 1 2 2 2 1 1 1 1 2 2 1 1 2 2
-2 1 2 1 1 2 1 2 2 2 1 2 1 1 2 1 2 2 1 2 1 2 2 1 2 1 1 1 2 1 2 2 1
-1 2 1 1 1 2 2 1 1 2 2 2 1 2 1 1 2 1 1 2 1 1 2 1 1 2 2 2 2 2 2 1 2
-2 2 2 2 1 1 2 1 1 1 1 2 1 2 2 2 2 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 1
-1 1 1 2 2 2 1 1 1 1 1 2 1 2 2 2 2 1 1 1 2 1 2 2 2 1 2 1 1 1 2 2 2
-2 1 1 2 1 1 1 1 2 2 2 1 2 1 1 1 1 1 2 1 1 1 2 2 2 2 1 2 2 1 2 2 2
-1 2 1 2 1 2 1 1 2 1 2 1 2 2 2 2 1 2 1 2 1 2 1 1 2 2 2 1 2 1 2 1 1
-1 2 1 1 2 2 2 2 1 2 2 2 2 1 2 1 1 2 2 1 2 1 1 1 1 2 1 1 1 1 2 2 1
-2 1 2 1 1 2 1 2 1 2 1 1 2 2 2 2 1 1 2 1 2 1 2 1 2 2 2 2 1 2 2 1 1
-""")
-
-OA_V7_L4_tbl=StringIO("""
-4 1 1 4 3 2 3
-1 3 2 4 2 4 4
-1 4 2 3 3 2 1
-3 3 3 3 3 3 1
-2 4 3 1 4 2 2
-3 2 4 1 1 4 1
-3 3 1 1 2 2 3
-2 1 4 3 2 1 2
-3 1 2 4 1 3 2
-2 2 4 4 3 3 3
-4 2 1 3 2 4 2
-1 3 4 2 3 1 2
-2 4 1 3 1 3 4
-2 1 2 1 3 4 4
-4 2 3 1 3 1 4
-4 3 2 1 4 3 2
-1 2 1 2 4 3 4
-4 4 2 2 1 1 3
-1 1 3 3 4 4 3
-1 1 1 1 1 1 1
-4 4 4 4 4 4 1
-4 3 4 3 1 2 4
-1 2 3 4 1 2 2
-2 3 1 4 4 1 1
-3 4 1 2 3 4 2
-2 3 3 2 1 4 3
-3 2 2 3 4 1 3
-2 2 2 2 2 2 1
-3 4 3 4 2 1 4
-1 4 4 1 2 3 3
-3 1 4 2 4 2 4
-4 1 3 2 2 3 1
-""")
-
-OA_V7_L9_tbl=StringIO("""
-6 7 2 4 8 3 5
-3 7 5 8 6 1 8
-2 8 5 4 1 7 7
-8 8 8 8 8 8 1
-1 7 4 6 3 9 7
-7 2 6 8 3 4 5
-8 3 4 9 1 5 5
-2 7 6 1 9 5 9
-2 9 4 7 5 3 8
-9 7 8 3 1 2 2
-7 7 7 7 7 7 1
-3 5 7 4 9 2 6
-3 9 6 5 2 8 7
-3 2 1 9 8 7 3
-5 9 1 6 7 2 5
-7 6 2 9 5 1 9
-4 9 2 8 1 6 6
-5 1 9 4 3 8 9
-8 6 1 4 2 9 8
-4 7 1 2 5 8 4
-1 3 2 7 9 8 3
-8 1 6 3 5 7 6
-5 4 6 2 1 3 3
-6 2 7 5 1 9 9
-6 4 5 9 7 8 2
-3 8 4 2 7 6 9
-4 4 4 4 4 4 1
-3 6 9 7 1 4 4
-1 4 7 8 2 5 4
-9 3 6 4 7 1 4
-5 7 3 9 2 4 6
-5 6 4 8 9 7 2
-2 4 9 6 8 1 6
-5 8 2 3 6 9 4
-1 8 6 9 4 2 8
-8 7 9 5 4 6 3
-4 3 8 6 2 7 9
-5 2 8 7 4 1 7
-3 4 8 1 5 9 5
-5 5 5 5 5 5 1
-1 5 9 2 6 7 5
-8 9 7 2 3 1 2
-9 9 9 9 9 9 1
-3 3 3 3 3 3 1
-4 8 3 5 9 1 5
-1 9 5 3 8 4 9
-1 1 1 1 1 1 1
-7 4 1 3 9 6 7
-7 1 4 5 8 2 4
-2 3 1 5 6 4 2
-4 6 5 1 3 2 3
-8 2 5 6 9 3 4
-4 2 9 3 7 5 8
-1 6 8 5 7 3 6
-1 2 3 4 5 6 2
-7 8 9 1 2 3 2
-6 3 9 8 5 2 7
-6 5 4 3 2 1 3
-9 5 1 8 4 3 9
-9 8 7 6 5 4 3
-6 9 3 1 4 7 4
-9 6 3 2 8 5 7
-4 1 7 9 6 3 7
-6 8 1 7 3 5 6
-8 5 2 1 7 4 7
-2 5 8 9 3 6 4
-7 9 8 4 6 5 3
-9 1 5 7 2 6 5
-7 5 3 6 1 8 8
-2 6 7 3 4 8 5
-5 3 7 1 8 6 8
-7 3 5 2 4 9 6
-6 1 8 2 9 4 8
-9 2 4 1 6 8 6
-8 4 3 7 6 2 9
-4 5 6 7 8 9 2
-3 1 2 6 4 5 2
-6 6 6 6 6 6 1
-2 2 2 2 2 2 1
-9 4 2 5 3 7 8
-2 1 3 8 7 9 3
-""")
-
-OA_V9_L9_tbl=StringIO("""
-6 5 1 3 2 7 9 8 3
-8 6 9 4 2 5 3 7 8
-4 6 2 1 3 8 7 9 3
-3 5 2 4 9 6 8 1 6
-4 2 5 3 7 1 8 6 8
-2 1 9 8 7 6 5 4 3
-3 2 7 9 8 4 6 5 3
-1 4 5 8 2 3 6 9 4
-8 8 8 8 8 8 8 8 1
-6 7 3 4 8 1 5 9 5
-9 9 9 9 9 9 9 9 1
-7 6 1 9 5 3 8 4 9
-7 3 9 2 4 1 6 8 6
-9 7 2 3 1 5 6 4 2
-9 3 1 4 7 8 2 5 4
-4 9 6 8 1 7 3 5 6
-3 4 9 1 5 7 2 6 5
-2 7 5 1 9 4 3 8 9
-7 5 8 6 1 4 2 9 8
-6 8 5 7 3 9 2 4 6
-2 6 8 3 4 9 1 5 5
-1 2 6 4 5 9 7 8 2
-5 7 4 9 2 8 1 6 6
-2 4 1 6 8 5 7 3 6
-4 5 9 7 8 3 1 2 2
-1 5 7 2 6 8 3 4 5
-4 8 1 5 9 2 6 7 5
-7 7 7 7 7 7 7 7 1
-8 5 4 1 7 9 6 3 7
-4 4 4 4 4 4 4 4 1
-3 1 5 6 4 8 9 7 2
-6 3 2 8 5 4 1 7 7
-1 3 8 7 9 5 4 6 3
-6 2 9 5 1 8 4 3 9
-2 2 2 2 2 2 2 2 1
-8 1 7 3 5 2 4 9 6
-1 6 3 5 7 4 9 2 6
-5 6 7 8 9 1 2 3 2
-9 1 6 7 2 4 8 3 5
-9 6 5 2 8 7 4 1 7
-7 8 3 1 2 6 4 5 2
-4 1 3 9 6 5 2 8 7
-1 9 4 3 8 6 2 7 9
-6 4 8 9 7 2 3 1 2
-9 5 3 8 4 2 7 6 9
-3 6 4 7 1 2 5 8 4
-9 2 8 1 6 3 5 7 6
-6 6 6 6 6 6 6 6 1
-8 9 1 2 3 4 5 6 2
-1 7 9 6 3 2 8 5 7
-1 8 2 9 4 7 5 3 8
-5 9 2 6 7 3 4 8 5
-3 8 6 2 7 5 1 9 9
-3 3 3 3 3 3 3 3 1
-9 8 4 6 5 1 3 2 3
-7 1 2 5 8 9 3 6 4
-5 2 1 7 4 6 3 9 7
-2 3 4 5 6 7 8 9 2
-4 7 8 2 5 6 9 3 4
-6 9 7 1 4 5 8 2 4
-6 1 4 2 9 3 7 5 8
-4 3 7 6 2 9 5 1 9
-3 9 8 5 2 1 7 4 7
-2 5 6 9 3 1 4 7 4
-5 4 3 2 1 9 8 7 3
-5 5 5 5 5 5 5 5 1
-2 9 3 7 5 8 6 1 8
-5 8 9 3 6 4 7 1 4
-7 9 5 4 6 2 1 3 3
-2 8 7 4 1 3 9 6 7
-9 4 7 5 3 6 1 8 8
-8 3 5 9 1 6 7 2 5
-8 4 2 7 6 1 9 5 9
-8 7 6 5 4 3 2 1 3
-7 2 4 8 3 5 9 1 5
-5 3 6 1 8 2 9 4 8
-8 2 3 6 9 7 1 4 4
-3 7 1 8 6 9 4 2 8
-5 1 8 4 3 7 6 2 9
-1 1 1 1 1 1 1 1 1
-7 4 6 3 9 8 5 2 7
-""")
-
-OA_V20_L2_tbl=StringIO("""
-2 1 1 1 2 1 1 2 1 2 1 2 2 2 1 2 2 1 2 1
-1 1 2 1 1 2 1 2 2 2 2 2 1 2 2 1 2 1 1 1
-2 1 2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2
-2 2 2 2 2 2 2 2 2 2 1 1 1 1 1 1 1 1 1 1
-1 1 1 2 1 1 2 1 2 2 2 2 2 1 2 2 1 2 1 1
-1 2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1
-2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 1
-2 1 2 2 2 1 1 1 2 1 2 1 2 2 2 1 1 1 2 1
-2 1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 2
-1 2 1 1 2 1 2 2 2 1 2 1 2 2 1 2 1 1 1 2
-2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 1 2
-2 2 2 1 1 1 2 1 1 2 2 2 2 1 1 1 2 1 1 2
-1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2 1
-1 1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2
-2 2 1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1
-1 1 2 1 2 2 2 1 1 1 1 1 2 1 2 2 2 1 1 1
-2 1 1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2
-1 2 1 2 2 2 1 1 1 2 1 2 1 2 2 2 1 1 1 2
-1 1 2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2
-2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1 1
-1 2 2 2 1 1 1 2 1 1 1 2 2 2 1 1 1 2 1 1
-1 2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2
-1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 2 2
-2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2
-""")
-
-OA_V26_L2_tbl=StringIO("""
-2 2 1 2 2 2 1 1 1 1 1 2 1 1 1 1 1 2 2 2 2 2 2 2 1 2
-1 1 1 2 2 2 2 2 2 1 1 1 2 1 2 2 2 2 2 1 1 1 2 2 1 1
-1 1 1 1 2 2 1 1 2 2 2 2 2 2 1 1 2 1 2 2 1 1 2 1 2 2
-2 2 1 1 1 2 2 2 1 1 2 1 2 2 1 1 2 1 1 2 2 1 2 2 1 1
-1 2 1 2 1 2 1 2 1 2 1 1 1 2 1 2 2 1 2 1 1 2 1 2 2 2
-2 2 2 1 1 1 2 2 1 1 1 2 2 1 1 2 2 2 2 2 1 1 1 1 2 2
-1 2 2 1 1 2 1 2 2 1 2 2 2 1 2 1 1 1 2 1 2 2 1 2 2 1
-2 2 1 1 1 1 1 2 2 2 2 2 1 2 2 2 1 2 1 1 1 1 2 2 1 2
-1 1 2 1 2 1 1 2 1 2 2 1 1 1 2 1 2 2 2 2 2 1 1 2 1 2
-1 2 1 2 2 1 2 1 1 1 2 2 2 2 2 2 1 1 2 1 2 1 1 1 1 2
-1 2 1 1 2 1 2 1 2 1 1 2 1 2 2 1 2 2 1 2 1 2 1 2 2 1
-1 2 2 2 2 2 2 2 1 2 2 2 1 1 1 1 1 2 1 1 1 1 2 1 2 1
-1 1 2 2 1 2 2 1 2 1 2 1 1 2 1 2 1 2 1 2 2 1 1 2 2 2
-1 2 2 1 2 1 2 2 2 2 1 1 1 2 1 2 1 1 2 2 2 2 2 1 1 1
-2 2 2 1 2 2 1 1 2 1 1 1 1 1 2 2 2 1 1 1 2 1 2 1 2 2
-2 1 2 1 2 1 1 1 1 1 2 1 2 2 1 2 1 2 2 1 1 2 2 2 2 1
-2 1 2 2 1 1 2 1 1 2 1 2 1 2 2 1 2 1 2 1 2 1 2 2 2 1
-2 1 1 2 1 1 2 2 2 1 2 1 1 1 2 1 1 1 2 2 1 2 2 1 2 2
-1 2 1 2 1 1 1 1 1 2 2 1 2 1 2 2 2 2 1 2 2 2 2 1 2 1
-1 1 2 2 1 1 1 2 2 1 1 2 2 2 1 1 2 2 1 1 2 2 2 1 1 2
-2 2 2 2 1 2 1 1 2 2 1 1 2 2 2 1 1 2 2 2 1 1 1 1 1 1
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 1 1 1 2 2 2 2 1 2 1 1 2 2 2 1 1 2 1 1 2 2 1 1 2 2
-1 1 2 1 1 2 2 1 1 2 1 2 2 1 2 2 1 1 1 2 1 2 2 2 1 2
-2 1 1 1 1 2 2 1 2 2 2 2 1 1 1 2 2 2 2 1 2 2 1 1 1 1
-2 1 2 2 2 2 1 2 1 1 2 2 1 2 2 2 2 1 1 2 1 2 1 1 1 1
-2 1 1 2 2 1 1 2 2 2 1 2 2 1 1 2 1 1 1 2 2 1 1 2 2 1
-2 2 2 2 2 1 2 1 2 2 2 1 2 1 1 1 2 1 1 1 1 2 1 2 1 2
-""")
-
-OA_V7_L2_tbl=StringIO("""
-2 1 1 2 2 2 1
-2 2 1 1 2 1 2
-1 2 2 1 2 2 1
-1 1 2 2 2 1 2
-2 2 2 2 1 1 1
-1 2 1 2 1 2 2
-2 1 2 1 1 2 2
-1 1 1 1 1 1 1
-""")
-
-OA_V6_L4_tbl=StringIO("""
-1 4 2 4 2 4
-2 3 4 1 2 2
-4 3 1 4 2 2
-2 2 3 4 1 3
-2 1 2 4 3 4
-1 4 3 2 1 2
-1 1 4 3 2 3
-2 3 1 3 1 4
-3 2 1 4 3 2
-4 2 3 3 2 1
-3 2 4 2 4 4
-1 3 3 4 4 3
-3 4 3 1 2 4
-1 1 1 1 1 1
-4 1 3 1 3 4
-4 4 4 4 4 1
-3 1 4 4 1 1
-4 1 2 3 4 2
-3 3 3 3 3 1
-2 4 1 1 4 1
-2 2 2 2 2 1
-1 3 2 2 3 1
-2 1 3 2 4 2
-2 4 4 3 3 3
-4 4 1 2 3 3
-3 3 2 1 4 3
-4 3 4 2 1 4
-3 4 2 3 1 2
-4 2 2 1 1 3
-1 2 4 1 3 2
-1 2 1 3 4 4
-3 1 1 2 2 3
-""")
-
-OA_V4_L8_tbl=StringIO("""
-1 8 1 2
-5 7 8 6
-8 6 6 2
-4 3 5 7
-3 5 1 5
-4 1 7 1
-4 4 8 2
-8 5 7 7
-7 5 5 8
-3 6 4 4
-7 7 7 2
-6 3 2 2
-6 1 4 8
-5 8 5 3
-1 4 5 5
-8 1 3 4
-6 6 5 6
-3 2 8 7
-6 2 1 1
-7 1 1 3
-8 8 8 8
-2 7 2 8
-2 3 6 3
-1 5 2 1
-7 6 8 1
-7 2 4 6
-8 2 2 5
-7 8 6 7
-4 7 1 4
-5 4 1 8
-7 4 2 4
-8 4 4 3
-5 1 2 7
-7 3 3 5
-5 6 7 5
-2 1 8 5
-3 3 7 8
-2 5 4 2
-3 4 6 1
-1 2 7 3
-5 3 4 1
-4 8 4 5
-8 7 5 1
-4 6 2 3
-6 4 3 7
-4 2 6 8
-1 6 3 8
-5 2 3 2
-3 8 2 6
-3 7 3 3
-5 5 6 4
-3 1 5 2
-2 8 3 1
-1 1 6 6
-2 4 7 6
-6 7 6 5
-2 2 5 4
-8 3 1 6
-1 7 4 7
-4 5 3 6
-1 3 8 4
-2 6 1 7
-6 5 8 3
-6 8 7 4
-""")
-
-OA_V7_L8_tbl=StringIO("""
-3 3 3 3 3 3 1
-4 1 5 8 3 2 4
-5 2 1 6 8 3 6
-7 7 7 7 7 7 1
-6 2 8 4 3 7 5
-4 8 2 6 5 1 5
-7 1 6 4 5 3 7
-4 7 8 3 1 6 6
-6 8 5 7 1 3 3
-5 8 4 1 6 7 4
-8 5 1 4 7 6 4
-1 6 5 2 4 7 6
-6 3 1 8 4 5 8
-3 2 6 7 4 1 4
-4 3 6 5 8 7 2
-3 8 7 4 2 5 6
-7 2 4 5 1 8 8
-2 2 2 2 2 2 1
-2 3 7 6 1 4 4
-8 2 5 3 6 4 7
-1 7 4 6 3 5 7
-1 8 6 3 7 2 8
-8 4 6 2 1 5 5
-7 6 2 3 8 5 4
-4 6 1 7 2 8 7
-5 6 3 4 1 2 2
-6 1 2 5 7 4 6
-5 3 8 2 7 1 7
-6 6 6 6 6 6 1
-3 1 4 2 8 6 3
-2 8 3 5 4 6 7
-3 6 8 1 5 4 8
-7 8 1 2 3 4 2
-1 2 7 8 5 6 2
-2 6 4 8 7 3 5
-3 5 2 8 1 7 7
-6 7 3 2 5 8 4
-5 4 2 7 3 6 8
-5 5 5 5 5 5 1
-3 4 5 6 7 8 2
-1 5 3 7 8 4 5
-4 4 4 4 4 4 1
-6 4 7 1 8 2 7
-2 5 6 1 3 8 6
-1 1 1 1 1 1 1
-4 5 7 2 6 3 8
-7 4 3 8 6 1 6
-5 7 6 8 2 4 3
-3 7 1 5 6 2 5
-1 3 2 4 6 8 3
-4 2 3 1 7 5 3
-8 7 2 1 4 3 2
-8 8 8 8 8 8 1
-8 1 3 6 2 7 8
-2 4 1 3 5 7 3
-8 3 4 7 5 2 6
-5 1 7 3 4 8 5
-2 1 8 7 6 5 2
-7 3 5 1 2 6 5
-1 4 8 5 2 3 4
-2 7 5 4 8 1 8
-8 6 7 5 3 1 3
-7 5 8 6 4 2 3
-6 5 4 3 2 1 2
-""")
-
-OA_V9_L7_tbl=StringIO("""
-2 5 1 4 7 3 6 7 3
-1 3 6 3 1 7 7 2 5
-5 7 2 4 6 1 3 1 3
-2 1 1 2 4 7 4 3 5
-6 1 3 5 7 2 4 2 4
-4 3 3 4 6 2 6 5 7
-2 4 7 4 2 1 1 3 6
-7 7 7 7 7 7 7 7 7
-5 4 4 5 7 3 7 6 1
-7 2 4 6 1 3 5 3 5
-3 2 1 7 6 5 4 2 1
-7 4 1 5 2 6 3 5 2
-5 5 5 5 5 5 5 5 5
-6 1 4 1 6 5 5 7 3
-2 1 7 6 5 4 3 1 7
-1 3 5 7 2 4 6 4 6
-6 2 6 4 3 3 4 1 2
-6 6 6 6 6 6 6 6 6
-3 3 4 6 2 6 4 7 7
-6 3 7 4 1 5 2 4 1
-3 4 5 6 7 1 2 2 3
-1 7 6 5 4 3 2 7 6
-1 4 7 3 6 2 5 6 2
-5 1 5 3 2 2 3 7 1
-5 6 1 4 1 6 5 2 7
-3 7 4 1 5 2 6 1 5
-2 6 3 7 4 1 5 7 4
-3 1 7 7 1 3 6 5 2
-5 2 6 3 7 4 1 3 7
-6 5 4 3 2 1 7 5 4
-5 3 1 6 4 2 7 1 6
-6 2 5 1 4 7 3 4 7
-2 2 3 5 1 5 3 6 6
-1 2 4 7 4 2 1 5 3
-4 4 4 4 4 4 4 4 4
-4 5 6 7 1 2 3 3 4
-1 1 1 1 1 1 1 1 1
-6 4 3 3 4 6 2 1 5
-1 6 4 2 7 5 3 4 2
-1 5 2 6 3 7 4 6 3
-6 4 2 7 5 3 1 2 7
-7 5 4 4 5 7 3 2 6
-1 4 1 6 5 5 6 3 4
-7 4 2 1 1 2 4 7 6
-5 5 6 1 4 1 6 2 2
-5 4 3 2 1 7 6 4 3
-4 4 5 7 3 7 5 1 1
-3 3 3 3 3 3 3 3 3
-6 5 5 6 1 4 1 7 2
-2 7 6 6 7 2 5 4 1
-4 2 1 1 2 4 7 6 3
-1 1 2 4 7 4 2 5 5
-4 6 1 3 5 7 2 7 2
-2 3 5 1 5 3 2 6 4
-5 1 4 7 3 6 2 3 6
-1 7 7 1 3 6 3 2 4
-6 7 1 2 3 4 5 5 6
-7 6 6 7 2 5 2 1 3
-7 2 5 2 7 6 6 1 4
-1 2 3 4 5 6 7 7 1
-4 7 4 2 1 1 2 6 7
-1 6 5 5 6 1 4 3 7
-2 7 5 3 1 6 4 5 3
-3 4 6 2 6 4 3 7 5
-6 7 2 5 2 7 6 3 1
-2 4 6 1 3 5 7 5 7
-6 6 7 2 5 2 7 3 3
-7 1 3 6 3 1 7 4 2
-5 3 2 2 3 5 1 7 4
-5 7 3 7 5 4 4 6 2
-4 6 2 6 4 3 3 5 1
-7 7 1 3 6 3 1 4 4
-2 5 2 7 6 6 7 4 5
-4 3 2 1 7 6 5 3 2
-5 6 7 1 2 3 4 4 5
-7 5 3 1 6 4 2 3 1
-3 5 1 5 3 2 2 4 7
-4 1 6 5 5 6 1 4 3
-4 5 7 3 7 5 4 1 6
-3 1 6 4 2 7 5 6 4
-3 6 3 1 7 7 1 5 6
-3 7 5 4 4 5 7 3 2
-4 7 3 6 2 5 1 2 5
-4 2 7 5 3 1 6 7 5
-2 6 4 3 3 4 6 2 1
-3 2 2 3 5 1 5 4 6
-2 3 4 5 6 7 1 1 2
-7 3 6 2 5 1 4 5 1
-1 5 3 2 2 3 5 1 7
-5 2 7 6 6 7 2 5 4
-3 6 2 5 1 4 7 1 4
-4 1 5 2 6 3 7 2 6
-3 5 7 2 4 6 1 6 1
-6 3 1 7 7 1 3 6 5
-7 6 5 4 3 2 1 6 5
-7 1 2 3 4 5 6 6 7
-2 2 2 2 2 2 2 2 2
-7 3 7 5 4 4 5 2 3
-""")
-
-OA_V9_L8_tbl=StringIO("""
-5 1 2 6 4 8 7 3 5
-8 3 1 6 5 2 4 7 6
-8 4 3 7 1 5 6 2 5
-8 1 5 4 2 7 3 6 8
-2 2 2 2 2 2 2 2 1
-1 8 4 5 7 2 6 3 8
-6 2 1 5 3 7 8 4 5
-5 3 6 4 7 1 8 2 7
-5 2 4 7 8 3 1 6 6
-7 8 5 6 3 4 1 2 2
-4 6 3 5 2 8 1 7 7
-6 7 4 1 5 8 3 2 4
-8 8 8 8 8 8 8 8 1
-2 4 6 8 5 7 1 3 3
-6 6 6 6 6 6 6 6 1
-8 7 6 5 4 3 2 1 2
-1 6 8 3 4 7 5 2 6
-5 4 8 1 3 6 2 7 8
-7 6 1 4 8 5 2 3 4
-3 2 5 8 4 1 6 7 4
-1 3 5 7 6 8 2 4 3
-6 4 5 3 8 2 7 1 7
-6 8 2 4 1 3 5 7 3
-8 6 4 2 3 1 7 5 3
-3 1 7 5 8 6 4 2 3
-7 7 7 7 7 7 7 7 1
-8 2 7 1 6 4 5 3 7
-7 1 8 2 5 3 6 4 7
-4 3 2 1 8 7 6 5 2
-2 7 3 6 8 1 5 4 8
-2 3 8 5 1 4 7 6 4
-5 5 5 5 5 5 5 5 1
-4 4 4 4 4 4 4 4 1
-3 8 6 1 2 5 7 4 6
-2 5 7 4 3 8 6 1 6
-7 3 4 8 2 6 5 1 5
-1 4 7 6 2 3 8 5 4
-7 4 2 5 6 1 3 8 6
-3 4 1 2 7 8 5 6 2
-4 5 1 8 6 3 7 2 8
-1 5 6 2 8 4 3 7 5
-6 1 3 8 7 4 2 5 6
-3 6 2 7 5 4 8 1 8
-5 8 3 2 6 7 4 1 4
-4 8 7 3 5 1 2 6 5
-5 7 1 3 2 4 6 8 3
-3 3 3 3 3 3 3 3 1
-1 1 1 1 1 1 1 1 1
-6 5 8 7 2 1 4 3 2
-6 3 7 2 4 5 1 8 8
-2 1 4 3 6 5 8 7 2
-8 5 2 3 7 6 1 4 4
-7 2 6 3 1 8 4 5 8
-4 7 5 2 1 6 8 3 6
-1 7 2 8 3 5 4 6 7
-7 5 3 1 4 2 8 6 3
-2 6 5 1 7 3 4 8 5
-5 6 7 8 1 2 3 4 2
-1 2 3 4 5 6 7 8 2
-3 7 8 4 6 2 1 5 5
-3 5 4 6 1 7 2 8 7
-4 1 6 7 3 2 5 8 4
-2 8 1 7 4 6 3 5 7
-4 2 8 6 7 5 3 1 3
-""")
-
-OA_V5_L7_tbl=StringIO("""
-7 1 2 3 4
-1 4 7 3 6
-1 7 6 5 4
-6 5 4 3 2
-5 3 1 6 4
-1 2 3 4 5
-4 1 5 2 6
-3 7 4 1 5
-3 1 6 4 2
-2 2 2 2 2
-7 2 4 6 1
-7 6 5 4 3
-3 4 5 6 7
-2 3 4 5 6
-3 6 2 5 1
-1 1 1 1 1
-1 3 5 7 2
-1 6 4 2 7
-2 1 7 6 5
-6 3 7 4 1
-6 1 3 5 7
-6 7 1 2 3
-5 7 2 4 6
-5 5 5 5 5
-5 2 6 3 7
-7 5 3 1 6
-2 5 1 4 7
-6 4 2 7 5
-7 7 7 7 7
-3 5 7 2 4
-6 2 5 1 4
-4 2 7 5 3
-6 6 6 6 6
-3 3 3 3 3
-5 1 4 7 3
-2 4 6 1 3
-4 6 1 3 5
-7 4 1 5 2
-4 3 2 1 7
-5 4 3 2 1
-4 7 3 6 2
-7 3 6 2 5
-1 5 2 6 3
-3 2 1 7 6
-4 4 4 4 4
-2 7 5 3 1
-2 6 3 7 4
-5 6 7 1 2
-4 5 6 7 1
-""")
-
-OA_V28_L2_tbl=StringIO("""
-2 2 2 2 1 1 1 2 1 2 1 2 2 1 2 2 2 1 2 1 1 1 2 2 1 2 2 1
-2 2 1 1 2 1 2 2 1 2 1 2 2 1 1 1 2 2 1 2 2 1 1 1 1 1 2 2
-2 1 1 2 2 2 1 2 2 1 1 2 2 2 2 1 1 2 2 2 1 2 1 1 1 2 1 2
-1 1 1 1 1 1 1 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2
-1 2 1 2 1 2 2 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 2 1 1 1 1
-1 2 2 1 2 2 1 2 2 1 2 1 2 1 1 1 1 2 2 1 1 1 1 2 2 2 2 1
-1 2 1 2 1 2 2 2 2 1 2 1 2 1 2 2 1 1 1 2 2 1 2 1 2 1 2 2
-2 1 1 2 2 2 1 1 1 1 2 1 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2
-2 1 2 1 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 2 1 2 1 1 1 2 2 1
-2 2 1 1 2 1 2 1 2 2 2 1 2 2 2 1 1 1 1 1 1 1 2 2 1 2 1 2
-1 1 2 2 2 1 2 1 2 2 1 2 2 1 1 1 1 1 1 2 1 2 2 1 2 2 2 1
-2 2 2 2 1 1 1 1 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2
-1 1 1 1 1 1 1 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2
-1 2 2 1 2 2 1 2 1 2 2 2 1 1 2 2 1 1 1 1 2 2 1 1 1 2 1 2
-2 2 2 2 1 1 1 1 2 2 2 1 2 2 1 2 1 2 2 2 2 1 1 1 1 1 1 1
-1 1 2 2 2 1 2 2 1 2 2 1 2 2 2 1 2 2 1 1 2 2 1 2 2 1 1 1
-2 2 2 2 1 1 1 2 2 1 1 1 1 1 1 1 2 2 1 1 2 2 2 1 2 2 1 2
-2 1 2 1 1 2 2 2 2 1 1 2 2 2 1 2 1 1 1 1 2 2 2 2 1 1 1 1
-2 2 1 1 2 1 2 1 1 1 2 2 1 2 1 2 1 2 2 1 2 2 2 1 2 2 2 1
-2 1 1 2 2 2 1 1 2 2 2 2 1 1 2 2 2 2 1 1 1 1 2 1 2 1 1 1
-1 1 2 2 2 1 2 1 1 1 1 1 1 1 2 2 1 2 2 2 2 1 2 2 1 2 1 2
-2 1 2 1 1 2 2 1 2 2 2 2 1 1 1 1 2 1 2 2 2 1 1 2 2 2 1 2
-1 1 1 1 1 1 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1
-2 1 2 1 1 2 2 2 1 2 1 1 1 2 2 1 1 2 2 1 1 1 2 1 2 1 2 2
-1 2 2 1 2 2 1 1 1 1 1 2 2 2 2 1 2 1 2 2 2 1 2 1 2 1 1 1
-1 2 2 1 2 2 1 1 2 2 1 1 1 2 1 2 2 2 1 2 1 2 2 2 1 1 2 2
-2 2 1 1 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 1 2 1 2 2 1 1 1
-1 1 2 2 2 1 2 2 2 1 2 2 1 2 1 2 2 1 2 1 1 1 1 1 1 1 2 2
-1 2 1 2 1 2 2 1 2 2 1 1 1 2 2 1 2 1 2 1 2 2 1 1 1 2 2 1
-2 1 1 2 2 2 1 2 1 2 1 1 1 2 1 2 1 1 1 2 2 1 1 2 2 2 2 1
-1 2 1 2 1 2 2 1 1 1 1 2 2 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-""")
-
-OA_V18_L2_tbl=StringIO("""
-2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1
-2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2
-1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2
-2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1
-1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1
-2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2
-2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1
-1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1
-2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2
-1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2
-2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2
-2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1
-1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2
-2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2
-2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1
-1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1
-1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2
-1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1
-1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1
-1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2
-""")
-
-OA_V5_L4_tbl=StringIO("""
-4 1 4 2 3
-4 3 2 4 1
-4 2 3 1 4
-2 2 1 4 3
-1 3 3 3 3
-3 4 2 1 3
-3 3 1 2 4
-2 3 4 1 2
-3 1 3 4 2
-1 1 1 1 1
-2 4 3 2 1
-1 2 2 2 2
-4 4 1 3 2
-3 2 4 3 1
-1 4 4 4 4
-2 1 2 3 4
-""")
-
-OA_V4_L6_tbl=StringIO("""
-5 1 2 2
-3 1 1 4
-2 5 5 2
-3 2 6 6
-1 5 3 6
-6 1 5 2
-3 5 4 1
-4 5 1 5
-6 6 4 3
-4 1 3 6
-1 3 5 4
-3 3 3 5
-2 6 6 1
-4 4 6 2
-5 4 4 5
-2 3 2 3
-5 6 3 1
-5 2 5 4
-4 5 1 2
-5 5 6 3
-5 3 1 3
-2 2 3 5
-5 6 3 4
-1 6 1 2
-1 3 5 1
-5 1 2 5
-2 6 6 4
-6 4 3 1
-1 2 4 2
-1 1 6 4
-6 1 5 5
-3 4 5 6
-6 3 6 2
-2 1 4 3
-5 4 4 2
-1 6 1 5
-2 3 2 6
-1 4 2 3
-2 4 1 4
-2 1 4 6
-6 3 6 5
-4 6 5 3
-5 2 5 1
-6 6 4 6
-3 5 4 4
-4 3 4 1
-5 5 6 6
-2 4 1 1
-3 6 2 5
-5 3 1 6
-4 3 4 4
-6 2 1 3
-4 6 5 6
-1 2 4 5
-1 1 6 1
-1 4 2 6
-6 5 2 4
-4 2 2 4
-1 5 3 3
-6 2 1 6
-3 6 2 2
-3 4 5 3
-4 4 6 5
-6 4 3 4
-4 2 2 1
-2 5 5 5
-3 2 6 3
-3 1 1 1
-3 3 3 2
-6 5 2 1
-4 1 3 3
-2 2 3 2
-""")
-
-OA_V6_L5_tbl=StringIO("""
-1 1 1 1 1 1
-3 4 5 1 2 2
-5 5 5 5 5 1
-2 5 3 1 4 4
-3 1 4 2 5 4
-2 3 4 5 1 2
-5 1 2 3 4 2
-3 2 1 5 4 5
-4 2 5 3 1 4
-2 2 2 2 2 1
-5 2 4 1 3 3
-4 1 3 5 2 3
-1 3 5 2 4 3
-1 5 4 3 2 5
-1 4 2 5 3 4
-1 2 3 4 5 2
-5 3 1 4 2 4
-2 1 5 4 3 5
-4 3 2 1 5 5
-3 3 3 3 3 1
-4 4 4 4 4 1
-3 5 2 4 1 3
-5 4 3 2 1 5
-2 4 1 3 5 3
-4 5 1 2 3 2
-""")
-
-OA_V6_L3_tbl=StringIO("""
-2 3 2 1 1 3
-3 3 1 1 2 2
-2 1 3 1 3 2
-3 2 1 2 1 3
-1 1 2 2 3 3
-2 2 2 2 2 2
-2 1 1 3 2 3
-2 3 1 2 3 1
-3 1 3 2 2 1
-3 3 3 3 3 3
-3 1 2 3 1 2
-1 1 1 1 1 1
-1 2 1 3 3 2
-1 2 3 1 2 3
-2 2 3 3 1 1
-1 3 2 3 2 1
-3 2 2 1 3 1
-1 3 3 2 1 2
-""")
-
-OA_V36_L2_tbl=StringIO("""
-1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1
-1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2
-2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1
-2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2
-2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2
-1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1
-2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1
-1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1
-2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1
-1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2
-2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2
-1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1
-1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1
-1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2
-2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2
-2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1
-1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2
-1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2
-2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2
-1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2
-2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1
-1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1
-2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1
-2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1
-1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2
-1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1
-2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1
-2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2
-1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2
-2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2
-2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1
-2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2
-1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2
-2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1
-1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1
-2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2
-1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1
-""")
-
-OA_V22_L2_tbl=StringIO("""
-1 2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1 1 2
-2 1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 2 1 1
-1 1 2 1 1 2 1 2 2 2 2 2 1 2 2 1 2 1 1 1 2 2
-2 2 2 1 1 1 2 1 1 2 2 2 2 1 1 1 2 1 1 2 1 2
-1 1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2 2 1
-1 1 1 2 1 1 2 1 2 2 2 2 2 1 2 2 1 2 1 1 2 1
-1 2 1 1 2 1 2 2 2 1 2 1 2 2 1 2 1 1 1 2 2 2
-2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 1 2 2
-1 2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 2 1
-2 2 2 2 2 2 2 2 2 2 1 1 1 1 1 1 1 1 1 1 2 1
-2 1 1 1 2 1 1 2 1 2 1 2 2 2 1 2 2 1 2 1 2 1
-2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 1 1
-1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 2 2 1 1
-2 1 2 2 2 1 1 1 2 1 2 1 2 2 2 1 1 1 2 1 1 2
-1 2 2 2 1 1 1 2 1 1 1 2 2 2 1 1 1 2 1 1 1 1
-2 1 1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2 2
-2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 1 2 2 1
-2 2 1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 1 1
-2 1 2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 2
-1 2 1 2 2 2 1 1 1 2 1 2 1 2 2 2 1 1 1 2 1 2
-1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2 1 2 2
-1 1 2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1 2
-1 1 2 1 2 2 2 1 1 1 1 1 2 1 2 2 2 1 1 1 1 1
-2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1 1 1 2
-""")
-
-OA_V11_L2_tbl=StringIO("""
-2 2 2 2 2 2 2 2 2 2 2
-1 2 1 2 2 2 1 1 1 2 1
-2 1 1 2 1 2 2 2 1 1 1
-1 2 1 1 2 1 2 2 2 1 1
-1 1 2 1 1 2 1 2 2 2 1
-2 2 1 1 1 2 1 1 2 1 2
-2 2 2 1 1 1 2 1 1 2 1
-1 2 2 2 1 1 1 2 1 1 2
-2 1 2 2 2 1 1 1 2 1 1
-2 1 1 1 2 1 1 2 1 2 2
-1 1 2 1 2 2 2 1 1 1 2
-1 1 1 2 1 1 2 1 2 2 2
-""")
-
-OA_V6_L7_tbl=StringIO("""
-5 1 4 7 3 6
-5 2 6 3 7 4
-4 2 7 5 3 1
-6 1 3 5 7 2
-4 5 6 7 1 2
-3 3 3 3 3 3
-7 2 4 6 1 3
-2 6 3 7 4 1
-3 5 7 2 4 6
-2 2 2 2 2 2
-6 2 5 1 4 7
-5 5 5 5 5 5
-7 7 7 7 7 7
-4 6 1 3 5 7
-4 7 3 6 2 5
-7 6 5 4 3 2
-2 7 5 3 1 6
-2 3 4 5 6 7
-5 6 7 1 2 3
-3 1 6 4 2 7
-7 3 6 2 5 1
-1 3 5 7 2 4
-1 7 6 5 4 3
-7 4 1 5 2 6
-2 4 6 1 3 5
-6 6 6 6 6 6
-6 3 7 4 1 5
-5 7 2 4 6 1
-7 5 3 1 6 4
-5 3 1 6 4 2
-2 1 7 6 5 4
-2 5 1 4 7 3
-3 6 2 5 1 4
-7 1 2 3 4 5
-1 5 2 6 3 7
-5 4 3 2 1 7
-3 4 5 6 7 1
-3 2 1 7 6 5
-4 3 2 1 7 6
-4 4 4 4 4 4
-1 4 7 3 6 2
-6 7 1 2 3 4
-1 1 1 1 1 1
-4 1 5 2 6 3
-3 7 4 1 5 2
-1 6 4 2 7 5
-6 4 2 7 5 3
-6 5 4 3 2 1
-1 2 3 4 5 6
-""")
-
-OA_V3_L9_tbl=StringIO("""
-1 9 9
-1 6 6
-7 9 3
-1 4 4
-2 1 3
-5 7 6
-2 4 6
-2 2 1
-6 8 6
-2 9 8
-7 3 6
-5 5 1
-3 3 1
-6 9 4
-4 9 6
-7 6 9
-6 5 3
-9 3 4
-3 2 3
-9 8 3
-9 9 1
-8 8 1
-6 2 9
-2 6 5
-3 5 6
-4 2 8
-5 6 2
-6 7 5
-8 9 2
-1 7 7
-5 9 5
-8 6 8
-8 1 6
-4 7 4
-9 1 5
-7 7 1
-6 1 8
-7 5 8
-4 3 9
-8 2 4
-5 1 9
-3 1 2
-2 7 9
-3 6 4
-6 6 1
-1 5 5
-7 4 7
-2 8 7
-8 3 5
-7 1 4
-9 7 2
-1 8 8
-2 5 4
-8 7 3
-4 6 3
-4 1 7
-3 4 5
-5 4 3
-2 3 2
-3 9 7
-6 4 2
-5 3 8
-1 1 1
-6 3 7
-5 8 4
-4 5 2
-9 2 6
-7 8 2
-8 5 7
-8 4 9
-3 8 9
-1 3 3
-9 4 8
-5 2 7
-9 5 9
-3 7 8
-9 6 7
-4 4 1
-7 2 5
-1 2 2
-4 8 5
-""")
-
-OA_V1_L8_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-""")
-
-OA_V1_L6_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-""")
-
-OA_V3_L3_tbl=StringIO("""
-3 3 3
-3 1 2
-3 2 1
-1 2 3
-2 1 3
-1 1 1
-1 3 2
-2 2 2
-2 3 1
-""")
-
-OA_V34_L2_tbl=StringIO("""
-1 1 1 1 2 2 2 1 1 1 1 1 2 1 2 1 2 2 2 2 2 2 2 2 2 2 1 2 2 1 1 1 2 1
-2 2 2 1 2 2 1 1 2 1 1 2 1 1 1 1 1 2 1 1 2 1 1 1 2 2 2 2 2 2 1 2 2 1
-1 2 1 1 1 1 1 2 2 2 2 2 1 1 1 2 2 2 2 1 2 2 1 2 2 1 2 2 1 1 2 1 2 1
-2 1 2 1 1 2 1 2 1 1 2 2 2 2 1 1 2 1 2 2 1 2 1 2 1 2 2 1 1 1 1 2 2 1
-2 1 1 2 1 1 1 1 2 2 2 1 2 1 1 1 1 1 2 1 1 1 2 2 2 2 1 2 2 1 2 2 2 2
-1 2 1 2 2 2 1 2 2 2 1 1 2 2 1 1 2 2 2 1 1 1 2 2 1 1 2 1 2 2 1 2 1 1
-2 2 2 1 2 2 1 1 2 2 2 1 1 2 2 2 1 1 2 2 2 1 1 2 1 1 1 1 2 1 1 1 2 2
-1 2 1 1 2 2 2 2 1 2 2 2 2 1 2 1 1 2 2 1 2 1 1 1 1 2 1 1 1 1 2 2 1 2
-1 1 2 2 2 1 1 1 1 2 2 2 2 1 2 1 1 1 1 2 2 2 1 2 1 1 2 2 2 2 2 2 1 1
-2 2 1 1 1 1 2 2 2 1 1 2 2 2 2 1 1 1 1 1 2 2 2 2 1 1 2 2 2 1 1 1 1 2
-2 2 2 2 2 1 2 2 1 1 2 1 1 1 1 1 2 1 2 2 2 1 2 1 2 1 2 1 2 1 2 1 1 1
-1 1 2 2 1 2 2 2 2 1 1 1 1 1 2 1 1 2 2 2 1 1 1 2 1 1 2 2 1 2 2 1 2 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-1 2 1 2 1 2 1 1 2 1 2 1 2 2 2 2 1 2 1 2 1 2 1 1 2 2 2 1 2 1 2 1 1 1
-2 1 2 2 2 1 2 1 2 2 1 1 2 2 1 1 2 2 1 1 2 2 1 1 1 2 2 1 1 1 2 1 2 2
-2 1 1 2 2 1 1 2 1 1 2 2 1 1 2 2 1 2 2 1 1 2 2 1 1 2 2 1 2 2 1 1 2 2
-1 1 2 2 1 2 2 2 1 2 2 1 1 2 1 2 1 2 1 1 2 2 2 1 1 1 1 2 2 1 1 2 2 1
-2 2 1 2 2 2 2 2 1 2 1 1 1 1 1 2 1 1 1 2 1 2 1 2 2 2 2 2 1 1 1 2 1 2
-1 1 2 2 1 2 2 2 2 1 2 2 2 1 1 2 2 1 1 1 2 1 1 2 2 2 1 1 2 2 1 1 1 2
-1 2 2 1 2 1 2 2 2 1 2 1 1 2 2 1 1 1 1 1 1 2 2 2 2 2 1 1 1 2 2 2 2 1
-2 2 2 2 1 1 2 1 1 1 1 2 1 2 2 2 2 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 1 1
-2 1 2 1 1 2 1 2 1 2 1 1 2 2 2 2 1 1 2 1 2 1 2 1 2 2 2 2 1 2 2 1 1 1
-2 2 1 2 1 2 2 1 2 1 1 2 2 1 1 2 1 1 2 2 2 2 2 1 1 1 1 1 1 2 2 2 2 1
-2 2 1 2 1 1 1 2 1 1 2 1 2 2 2 1 2 2 1 2 2 1 1 1 2 1 1 2 1 2 1 2 2 2
-2 1 2 1 1 2 1 2 2 2 1 2 1 1 2 1 2 2 1 2 1 2 2 1 2 1 1 1 2 1 2 2 1 2
-2 2 2 1 2 2 1 1 1 1 2 1 2 1 1 2 2 2 1 1 1 2 2 2 1 1 1 2 1 2 2 1 1 2
-1 1 1 1 2 1 1 2 2 1 1 1 1 2 1 2 2 1 2 2 2 2 1 1 1 2 1 2 2 2 2 2 1 2
-1 2 1 1 1 2 2 1 1 2 2 2 1 2 1 1 2 1 1 2 1 1 2 1 1 2 2 2 2 2 2 1 2 2
-2 1 1 1 1 1 2 1 2 2 2 1 1 1 2 2 2 2 1 2 2 1 2 2 1 2 2 1 1 2 1 2 1 1
-1 2 2 2 2 1 1 2 2 2 1 2 2 1 2 2 2 1 1 2 1 1 2 1 1 2 1 2 1 1 1 1 2 1
-1 1 1 2 2 2 1 1 1 1 1 2 1 2 2 2 2 1 1 1 2 1 2 2 2 1 2 1 1 1 2 2 2 2
-2 1 1 1 2 1 2 2 1 2 1 2 2 2 1 2 1 2 1 2 1 1 1 2 2 1 1 1 2 2 2 1 2 1
-1 2 2 2 1 1 1 1 1 2 1 2 1 2 1 1 1 2 2 2 2 2 2 2 2 2 1 1 1 2 1 1 1 2
-1 1 2 1 2 1 2 1 2 1 2 2 2 2 1 2 1 2 2 2 1 1 2 1 2 1 2 2 1 1 1 2 1 2
-2 1 1 2 2 2 2 1 2 2 2 2 1 2 2 1 2 1 2 1 1 2 1 1 2 1 1 2 1 2 1 1 1 1
-1 2 2 1 1 1 2 1 1 2 1 1 2 1 2 2 2 1 2 1 1 2 1 1 2 1 2 1 2 2 1 2 2 2
-""")
-
-OA_V8_L2_tbl=StringIO("""
-1 1 2 1 1 2 1 2
-1 1 1 2 1 1 2 1
-2 2 1 1 1 2 1 1
-1 2 2 2 1 1 1 2
-1 2 1 2 2 2 1 1
-1 1 2 1 2 2 2 1
-2 2 2 1 1 1 2 1
-2 1 2 2 2 1 1 1
-2 1 1 1 2 1 1 2
-2 2 2 2 2 2 2 2
-1 2 1 1 2 1 2 2
-2 1 1 2 1 2 2 2
-""")
-
-OA_V8_L8_tbl=StringIO("""
-8 7 3 5 1 2 6 5
-2 8 6 7 5 3 1 3
-5 1 8 6 3 7 2 8
-1 5 4 2 7 3 6 8
-8 8 8 8 8 8 8 1
-8 1 7 4 6 3 5 7
-5 3 1 4 2 8 6 3
-1 3 8 7 4 2 5 6
-8 4 5 7 2 6 3 8
-6 3 5 2 8 1 7 7
-6 7 8 1 2 3 4 2
-8 3 2 6 7 4 1 4
-3 6 4 7 1 8 2 7
-4 5 3 8 2 7 1 7
-3 3 3 3 3 3 3 1
-5 5 5 5 5 5 5 1
-7 3 6 8 1 5 4 8
-3 5 7 6 8 2 4 3
-5 4 6 1 7 2 8 7
-3 2 1 8 7 6 5 2
-4 3 7 1 5 6 2 5
-1 6 7 3 2 5 8 4
-6 4 2 3 1 7 5 3
-8 6 1 2 5 7 4 6
-7 2 8 3 5 4 6 7
-4 1 2 7 8 5 6 2
-8 2 4 1 3 5 7 3
-2 6 3 1 8 4 5 8
-2 7 1 6 4 5 3 7
-7 1 3 2 4 6 8 3
-1 1 1 1 1 1 1 1
-3 1 6 5 2 4 7 6
-4 4 4 4 4 4 4 1
-7 4 1 5 8 3 2 4
-8 5 6 3 4 1 2 2
-2 1 5 3 7 8 4 5
-2 4 7 8 3 1 6 6
-4 8 1 3 6 2 7 8
-1 4 3 6 5 8 7 2
-4 7 6 2 3 8 5 4
-1 7 5 8 6 4 2 3
-5 6 2 8 4 3 7 5
-3 8 5 1 4 7 6 4
-2 5 8 4 1 6 7 4
-5 8 7 2 1 4 3 2
-5 2 3 7 6 1 4 4
-2 2 2 2 2 2 2 1
-7 6 5 4 3 2 1 2
-3 4 8 2 6 5 1 5
-4 2 5 6 1 3 8 6
-6 1 4 8 5 2 3 4
-1 8 2 5 3 6 4 7
-1 2 6 4 8 7 3 5
-4 6 8 5 7 1 3 3
-6 2 7 5 4 8 1 8
-7 8 4 6 2 1 5 5
-5 7 4 3 8 6 1 6
-6 6 6 6 6 6 6 1
-6 8 3 4 7 5 2 6
-7 7 7 7 7 7 7 1
-3 7 2 4 5 1 8 8
-7 5 2 1 6 8 3 6
-2 3 4 5 6 7 8 2
-6 5 1 7 3 4 8 5
-""")
-
-OA_V29_L2_tbl=StringIO("""
-2 1 2 1 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 2 1 2 1 1 1 2 2 1 1
-2 2 1 1 2 1 2 1 1 1 2 2 1 2 1 2 1 2 2 1 2 2 2 1 2 2 2 1 1
-2 2 2 2 1 1 1 2 2 1 1 1 1 1 1 1 2 2 1 1 2 2 2 1 2 2 1 2 1
-2 1 1 2 2 2 1 1 2 2 2 2 1 1 2 2 2 2 1 1 1 1 2 1 2 1 1 1 2
-2 1 1 2 2 2 1 1 1 1 2 1 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 2
-2 2 1 1 2 1 2 2 1 2 1 2 2 1 1 1 2 2 1 2 2 1 1 1 1 1 2 2 2
-1 2 2 1 2 2 1 1 1 1 1 2 2 2 2 1 2 1 2 2 2 1 2 1 2 1 1 1 1
-2 2 2 2 1 1 1 1 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 2
-2 1 1 2 2 2 1 2 2 1 1 2 2 2 2 1 1 2 2 2 1 2 1 1 1 2 1 2 1
-1 2 1 2 1 2 2 1 2 2 1 1 1 2 2 1 2 1 2 1 2 2 1 1 1 2 2 1 2
-1 2 2 1 2 2 1 2 2 1 2 1 2 1 1 1 1 2 2 1 1 1 1 2 2 2 2 1 2
-2 1 1 2 2 2 1 2 1 2 1 1 1 2 1 2 1 1 1 2 2 1 1 2 2 2 2 1 1
-1 2 1 2 1 2 2 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 2 1 1 1 1 1
-1 1 1 1 1 1 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-1 1 1 1 1 1 1 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2
-1 2 1 2 1 2 2 2 2 1 2 1 2 1 2 2 1 1 1 2 2 1 2 1 2 1 2 2 1
-2 2 2 2 1 1 1 2 1 2 1 2 2 1 2 2 2 1 2 1 1 1 2 2 1 2 2 1 1
-1 1 2 2 2 1 2 2 2 1 2 2 1 2 1 2 2 1 2 1 1 1 1 1 1 1 2 2 1
-2 2 2 2 1 1 1 1 2 2 2 1 2 2 1 2 1 2 2 2 2 1 1 1 1 1 1 1 2
-1 1 2 2 2 1 2 2 1 2 2 1 2 2 2 1 2 2 1 1 2 2 1 2 2 1 1 1 1
-2 1 2 1 1 2 2 2 2 1 1 2 2 2 1 2 1 1 1 1 2 2 2 2 1 1 1 1 2
-1 1 2 2 2 1 2 1 2 2 1 2 2 1 1 1 1 1 1 2 1 2 2 1 2 2 2 1 2
-1 2 2 1 2 2 1 2 1 2 2 2 1 1 2 2 1 1 1 1 2 2 1 1 1 2 1 2 2
-2 2 1 1 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 1 2 1 2 2 1 1 1 2
-2 1 2 1 1 2 2 1 2 2 2 2 1 1 1 1 2 1 2 2 2 1 1 2 2 2 1 2 1
-2 2 1 1 2 1 2 1 2 2 2 1 2 2 2 1 1 1 1 1 1 1 2 2 1 2 1 2 1
-1 2 2 1 2 2 1 1 2 2 1 1 1 2 1 2 2 2 1 2 1 2 2 2 1 1 2 2 1
-1 1 1 1 1 1 1 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1
-1 1 2 2 2 1 2 1 1 1 1 1 1 1 2 2 1 2 2 2 2 1 2 2 1 2 1 2 2
-1 2 1 2 1 2 2 1 1 1 1 2 2 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2
-2 1 2 1 1 2 2 2 1 2 1 1 1 2 2 1 1 2 2 1 1 1 2 1 2 1 2 2 2
-""")
-
-OA_V8_L5_tbl=StringIO("""
-4 5 1 2 3 3 4 5
-4 3 3 4 1 2 5 5
-5 4 3 2 1 4 3 2
-5 5 5 5 5 5 5 5
-1 5 5 1 3 4 2 2
-4 1 3 5 2 5 2 4
-1 1 2 4 2 3 3 5
-4 5 2 5 4 1 3 2
-2 2 3 5 3 4 4 1
-3 3 3 3 3 3 3 3
-3 2 2 3 5 1 4 4
-3 1 4 2 5 4 2 5
-2 5 3 1 4 3 1 4
-5 3 1 4 2 1 4 2
-1 4 2 5 3 2 5 3
-2 3 5 3 2 4 1 5
-1 4 3 3 4 1 2 5
-3 3 4 1 4 5 5 2
-2 5 4 4 5 2 3 1
-2 3 4 5 1 1 2 3
-5 2 5 4 4 3 2 3
-1 3 5 2 4 2 4 1
-3 5 3 2 2 1 5 1
-2 2 2 2 2 2 2 2
-1 2 3 4 5 5 1 2
-5 4 4 5 2 3 1 1
-5 2 4 1 3 1 3 5
-5 5 1 3 1 2 2 4
-4 3 2 1 5 3 2 1
-4 4 4 4 4 4 4 4
-2 4 2 1 1 5 4 5
-3 4 1 4 3 5 2 1
-3 1 5 5 1 3 4 2
-5 1 2 3 4 4 5 1
-3 2 1 5 4 2 1 5
-5 3 2 2 3 5 1 4
-1 2 4 2 1 3 5 4
-2 1 1 2 4 5 3 3
-1 5 4 3 2 5 4 3
-4 2 5 3 1 5 3 1
-4 2 1 1 2 4 5 3
-3 4 5 1 2 2 3 4
-3 5 2 4 1 4 1 3
-4 4 5 2 5 1 1 3
-4 1 4 3 3 2 1 2
-1 1 1 1 1 1 1 1
-5 1 3 1 5 2 4 3
-2 1 5 4 3 1 5 4
-1 3 1 5 5 4 3 4
-2 4 1 3 5 3 5 2
-""")
-
-OA_V3_L2_tbl=StringIO("""
-1 1 1
-2 1 2
-1 2 2
-2 2 1
-""")
-
-OA_V8_L4_tbl=StringIO("""
-4 1 3 4 2 3 1 2
-4 1 2 3 4 1 2 2
-4 2 4 1 3 1 3 4
-3 1 2 1 2 4 3 4
-2 4 3 4 3 1 2 4
-1 4 2 1 3 2 4 2
-1 3 4 3 4 2 1 4
-3 1 3 2 4 2 4 4
-3 3 3 3 3 3 3 1
-3 4 4 2 2 1 1 3
-2 1 4 4 1 2 3 3
-2 2 2 2 2 2 2 1
-2 2 3 1 4 4 1 1
-1 4 3 2 1 4 3 2
-1 2 3 3 2 1 4 3
-3 4 1 1 4 3 2 3
-2 4 2 3 1 3 1 4
-1 2 2 4 4 3 3 3
-2 3 1 2 4 1 3 2
-4 2 1 2 1 3 4 4
-4 4 4 4 4 4 4 1
-2 1 1 3 3 4 4 3
-2 3 4 1 2 3 4 2
-3 2 1 4 3 2 1 2
-1 1 4 2 3 3 2 1
-4 4 1 3 2 2 3 1
-1 1 1 1 1 1 1 1
-3 3 2 4 1 1 4 1
-4 3 2 2 3 4 1 3
-4 3 3 1 1 2 2 3
-1 3 1 4 2 4 2 4
-3 2 4 3 1 4 2 2
-""")
-
-OA_V12_L2_tbl=StringIO("""
-1 1 1 1 1 1 1 1 1 1 1 1
-2 2 1 1 1 1 2 1 2 1 2 2
-2 2 1 2 1 2 1 2 2 1 1 1
-2 2 1 2 2 1 2 2 1 2 2 1
-1 1 1 2 1 2 2 2 1 1 2 2
-1 1 1 1 2 2 2 1 2 2 2 1
-2 1 2 1 1 1 1 2 2 2 2 1
-2 1 2 2 2 1 1 1 1 1 2 2
-1 2 2 1 1 1 2 2 1 2 1 2
-1 1 1 2 2 1 1 2 2 2 1 2
-1 2 2 2 2 1 2 1 2 1 1 1
-2 1 2 1 2 2 2 2 1 1 1 1
-1 2 2 2 1 2 1 1 1 2 2 1
-2 1 2 2 1 2 2 1 2 2 1 2
-1 2 2 1 2 2 1 2 2 1 2 2
-2 2 1 1 2 2 1 1 1 2 1 2
-""")
-
-OA_V10_L9_tbl=StringIO("""
-9 3 6 4 7 1 2 5 8 4
-3 9 6 5 2 8 7 4 1 7
-9 1 5 7 2 6 8 3 4 5
-4 9 2 8 1 6 3 5 7 6
-6 6 6 6 6 6 6 6 6 1
-7 9 8 4 6 5 1 3 2 3
-6 2 7 5 1 9 4 3 8 9
-2 2 2 2 2 2 2 2 2 1
-3 7 5 8 6 1 4 2 9 8
-9 6 3 2 8 5 4 1 7 7
-3 3 3 3 3 3 3 3 3 1
-2 8 5 4 1 7 9 6 3 7
-5 3 7 1 8 6 9 4 2 8
-5 4 6 2 1 3 8 7 9 3
-1 4 7 8 2 5 6 9 3 4
-9 7 8 3 1 2 6 4 5 2
-8 8 8 8 8 8 8 8 8 1
-9 2 4 1 6 8 5 7 3 6
-7 4 1 3 9 6 5 2 8 7
-3 2 1 9 8 7 6 5 4 3
-8 4 3 7 6 2 9 5 1 9
-2 4 9 6 8 1 7 3 5 6
-1 7 4 6 3 9 8 5 2 7
-1 1 1 1 1 1 1 1 1 1
-8 6 1 4 2 9 3 7 5 8
-1 3 2 7 9 8 4 6 5 3
-9 9 9 9 9 9 9 9 9 1
-1 2 3 4 5 6 7 8 9 2
-4 6 5 1 3 2 7 9 8 3
-8 9 7 2 3 1 5 6 4 2
-8 3 4 9 1 5 7 2 6 5
-6 4 5 9 7 8 3 1 2 2
-5 6 4 8 9 7 2 3 1 2
-8 1 6 3 5 7 4 9 2 6
-7 5 3 6 1 8 2 9 4 8
-6 7 2 4 8 3 5 9 1 5
-6 9 3 1 4 7 8 2 5 4
-4 7 1 2 5 8 9 3 6 4
-7 7 7 7 7 7 7 7 7 1
-4 8 3 5 9 1 6 7 2 5
-2 6 7 3 4 8 1 5 9 5
-4 2 9 3 7 5 8 6 1 8
-7 8 9 1 2 3 4 5 6 2
-2 7 6 1 9 5 3 8 4 9
-8 7 9 5 4 6 2 1 3 3
-6 3 9 8 5 2 1 7 4 7
-9 5 1 8 4 3 7 6 2 9
-7 3 5 2 4 9 6 8 1 6
-3 6 9 7 1 4 5 8 2 4
-5 2 8 7 4 1 3 9 6 7
-3 4 8 1 5 9 2 6 7 5
-5 5 5 5 5 5 5 5 5 1
-2 5 8 9 3 6 4 7 1 4
-5 7 3 9 2 4 1 6 8 6
-4 3 8 6 2 7 5 1 9 9
-1 6 8 5 7 3 9 2 4 6
-9 4 2 5 3 7 1 8 6 8
-9 8 7 6 5 4 3 2 1 3
-2 3 1 5 6 4 8 9 7 2
-5 1 9 4 3 8 6 2 7 9
-7 6 2 9 5 1 8 4 3 9
-6 5 4 3 2 1 9 8 7 3
-8 2 5 6 9 3 1 4 7 4
-4 4 4 4 4 4 4 4 4 1
-6 8 1 7 3 5 2 4 9 6
-1 9 5 3 8 4 2 7 6 9
-2 1 3 8 7 9 5 4 6 3
-7 2 6 8 3 4 9 1 5 5
-8 5 2 1 7 4 6 3 9 7
-3 1 2 6 4 5 9 7 8 2
-5 9 1 6 7 2 4 8 3 5
-5 8 2 3 6 9 7 1 4 4
-1 8 6 9 4 2 5 3 7 8
-3 8 4 2 7 6 1 9 5 9
-2 9 4 7 5 3 6 1 8 8
-4 5 6 7 8 9 1 2 3 2
-4 1 7 9 6 3 2 8 5 7
-1 5 9 2 6 7 3 4 8 5
-7 1 4 5 8 2 3 6 9 4
-6 1 8 2 9 4 7 5 3 8
-3 5 7 4 9 2 8 1 6 6
-""")
-
-OA_V38_L2_tbl=StringIO("""
-1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 2 1
-2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 2 1
-2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 1
-2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 2
-1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2
-2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 2
-1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 2
-1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2
-1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 1 1
-2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 1
-1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 2 1
-2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2
-2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2
-2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2
-2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 2
-2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 2
-2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1
-1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2
-1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 2
-1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2
-1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 2
-2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 2 1
-1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 1
-2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 1
-1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2
-1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2
-2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 2
-2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 2 1
-2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2
-2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2
-2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 1 1
-1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 2 1
-1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 2 1
-2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 2 1
-2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 2 1
-1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1
-1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 1 1
-1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 2 1
-""")
-
-OA_V2_L7_tbl=StringIO("""
-4 6
-4 5
-3 6
-6 6
-6 4
-1 3
-2 5
-4 1
-4 7
-4 2
-4 4
-5 3
-2 6
-7 7
-5 5
-7 2
-4 3
-3 4
-7 6
-3 5
-2 2
-3 3
-6 5
-1 1
-2 3
-1 4
-3 2
-7 1
-1 6
-5 4
-7 4
-2 7
-2 1
-7 5
-6 1
-3 1
-6 7
-1 7
-1 5
-7 3
-1 2
-5 6
-3 7
-5 1
-5 2
-6 3
-2 4
-6 2
-5 7
-""")
-
-OA_V2_L3_tbl=StringIO("""
-1 3
-1 2
-3 2
-2 2
-2 3
-2 1
-3 1
-3 3
-1 1
-""")
-
-OA_V5_L9_tbl=StringIO("""
-3 9 2 4 6
-2 4 8 3 5
-4 9 1 5 5
-6 3 5 7 6
-2 5 3 7 8
-5 7 2 6 5
-1 6 7 2 5
-3 6 1 8 8
-9 7 1 4 4
-7 5 1 9 9
-9 6 8 1 6
-1 2 5 8 4
-9 1 2 3 2
-5 2 4 9 6
-4 1 6 8 6
-4 5 8 2 4
-9 8 5 2 7
-1 7 3 5 6
-1 4 2 9 8
-1 1 1 1 1
-7 2 3 1 2
-8 1 5 9 5
-1 8 4 3 9
-6 8 3 4 5
-9 4 3 8 9
-5 9 7 8 2
-2 3 6 9 4
-6 1 9 5 9
-2 1 7 4 7
-8 2 9 4 8
-2 2 2 2 1
-8 3 1 2 2
-2 7 9 8 3
-7 8 2 5 4
-7 3 4 8 5
-3 4 5 6 2
-4 3 2 1 3
-8 7 4 1 7
-4 2 7 6 9
-7 7 7 7 1
-3 3 3 3 1
-4 6 3 9 7
-3 1 4 7 4
-1 5 6 4 2
-6 9 4 2 8
-8 6 2 7 9
-4 8 9 7 2
-3 8 7 9 3
-6 7 8 9 2
-5 4 1 7 7
-8 9 3 6 4
-8 8 8 8 1
-4 7 5 3 8
-6 2 1 3 3
-5 8 6 1 8
-6 5 2 8 7
-9 2 6 7 5
-4 4 4 4 1
-2 6 4 5 2
-2 9 5 1 9
-7 1 8 6 8
-8 4 6 5 3
-5 1 3 2 3
-9 9 9 9 1
-6 4 7 1 4
-6 6 6 6 1
-7 4 9 2 6
-2 8 1 6 6
-3 5 9 1 5
-8 5 7 3 6
-5 6 9 3 4
-9 5 4 6 3
-3 2 8 5 7
-3 7 6 2 9
-1 9 8 7 3
-7 6 5 4 3
-1 3 9 6 7
-5 5 5 5 1
-9 3 7 5 8
-5 3 8 4 9
-7 9 6 3 7
-""")
 
-OA_V5_L8_tbl=StringIO("""
-7 7 2 6 4
-2 1 7 6 7
-8 1 5 1 5
-5 7 8 4 3
-3 7 6 7 1
-2 8 6 3 6
-7 1 6 5 3
-5 5 2 1 6
-3 3 8 5 7
-6 2 6 1 8
-4 5 3 2 2
-5 8 1 6 1
-7 5 8 7 5
-1 1 8 2 1
-3 2 7 2 4
-8 5 7 3 3
-1 5 6 4 7
-2 6 4 2 3
-8 8 8 8 8
-7 4 5 2 8
-3 4 1 3 5
-7 6 1 1 7
-6 6 8 3 2
-4 8 4 5 5
-8 6 2 5 1
-8 3 3 4 4
-8 4 6 6 2
-5 3 6 2 5
-6 8 2 2 7
-4 2 8 6 6
-5 2 5 5 2
-4 1 1 4 8
-8 2 4 7 7
-1 3 2 3 8
-5 4 3 8 7
-5 1 4 3 4
-7 3 4 8 6
-6 4 4 4 1
-8 7 1 2 6
-5 6 7 7 8
-7 8 7 4 2
-3 5 4 6 8
-3 1 2 8 2
-1 4 7 5 6
-4 7 5 3 7
-6 1 3 7 6
-7 2 3 3 1
-2 5 5 8 1
-1 8 5 7 4
-2 2 2 4 5
-1 2 1 8 3
-6 3 5 6 3
-6 7 7 8 5
-4 4 2 7 3
-2 4 8 1 4
-2 7 3 5 8
-1 7 4 1 2
-2 3 1 7 2
-3 6 5 4 6
-4 3 7 1 1
-1 6 3 6 5
-6 5 1 5 4
-3 8 3 1 3
-4 6 6 8 4
-""")
-
-OA_V15_L2_tbl=StringIO("""
-1 2 2 2 2 1 2 1 2 1 1 1 2 1 2
-2 1 2 2 2 1 1 1 1 1 2 2 1 2 2
-2 2 1 1 1 1 2 1 2 1 2 2 2 2 1
-1 2 2 1 1 1 2 2 1 2 1 2 1 2 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 2 1 2 1 2 1 2 2 1 1 1 1 2 2
-1 1 1 2 2 1 1 2 2 2 1 2 2 2 1
-2 1 2 1 2 2 2 2 1 1 1 1 2 2 1
-1 2 2 2 1 2 1 1 1 2 2 1 2 2 1
-2 1 2 2 1 2 2 1 2 2 1 2 1 1 1
-1 1 1 2 1 2 2 2 1 1 2 2 2 1 2
-1 2 2 1 2 2 1 2 2 1 2 2 1 1 1
-2 2 1 2 2 1 2 2 1 2 2 1 1 1 1
-2 2 1 1 2 2 1 1 1 2 1 2 2 1 2
-2 1 2 1 1 1 1 2 2 2 2 1 2 1 2
-1 1 1 1 2 2 2 1 2 2 2 1 1 2 2
-""")
-
-OA_V10_L8_tbl=StringIO("""
-1 8 5 7 1 4 6 6 1 6
-1 7 3 3 8 7 2 8 1 3
-4 7 7 7 5 5 7 7 6 8
-1 1 8 7 2 6 5 6 6 7
-7 1 2 1 8 6 6 5 4 5
-2 5 6 1 4 4 2 6 6 7
-5 2 7 8 3 7 6 5 8 7
-1 8 8 1 5 1 7 4 8 4
-8 4 4 1 1 7 3 3 2 2
-4 8 4 5 8 3 2 3 3 7
-3 4 3 5 2 8 8 5 6 1
-4 1 4 3 3 8 4 5 1 4
-2 8 2 2 2 8 7 7 2 6
-6 7 1 1 3 5 8 8 4 6
-3 6 8 1 8 5 3 7 1 5
-5 1 4 6 2 1 3 1 1 8
-3 6 5 7 4 8 2 1 8 3
-7 8 3 1 7 4 5 5 7 8
-7 5 7 2 5 8 4 8 3 5
-5 6 2 7 2 5 4 8 7 7
-8 3 7 3 4 1 6 7 7 1
-7 3 4 6 3 5 7 6 8 1
-5 6 3 1 6 8 1 2 2 1
-4 5 5 4 2 6 6 8 2 4
-3 5 3 3 5 3 6 3 8 6
-6 6 8 8 5 4 4 3 1 1
-8 5 4 7 6 4 1 5 4 5
-7 7 8 3 6 6 4 1 2 7
-7 1 3 7 4 7 7 3 5 3
-1 5 1 8 3 8 3 7 5 7
-5 4 5 3 8 8 7 6 4 3
-2 4 6 7 7 7 4 4 8 4
-4 4 5 6 5 1 8 2 4 7
-3 8 7 4 7 7 3 2 4 7
-7 6 4 4 8 2 5 4 6 6
-6 4 2 6 7 4 6 7 3 3
-5 1 1 4 6 4 2 7 8 2
-1 3 6 4 5 5 8 5 2 3
-7 2 8 5 1 1 2 7 4 4
-7 7 5 5 2 7 1 7 7 1
-2 6 1 3 1 6 7 2 3 8
-8 7 3 6 5 2 1 4 1 7
-6 2 4 1 4 3 7 8 7 7
-4 8 1 3 4 2 3 5 6 1
-7 5 6 8 1 5 1 2 6 3
-8 5 1 1 2 1 4 3 5 3
-5 5 8 3 7 2 8 6 7 2
-3 2 1 2 5 7 5 6 2 5
-5 7 6 8 4 1 5 5 3 6
-3 1 6 4 8 1 4 2 7 6
-6 7 4 7 7 8 5 2 5 4
-2 5 7 7 8 1 3 4 3 1
-6 6 5 2 1 1 1 5 8 7
-6 5 2 4 4 7 8 1 1 8
-4 4 8 4 1 4 5 8 5 1
-6 5 3 6 8 6 5 7 8 2
-3 5 2 5 1 2 7 5 1 4
-6 1 7 3 1 5 2 4 2 8
-8 2 3 4 2 5 3 6 3 4
-2 4 7 1 3 6 1 6 1 6
-8 8 5 2 4 5 5 2 1 2
-2 1 2 8 5 3 5 1 4 1
-3 7 4 2 6 1 6 6 5 8
-4 2 6 7 6 3 8 7 1 5
-8 7 2 4 1 3 4 6 8 1
-4 6 2 2 3 4 3 4 7 3
-7 6 1 6 4 3 8 6 3 4
-1 1 5 1 6 7 8 4 3 1
-4 5 8 6 6 7 7 2 7 6
-2 7 5 4 3 2 2 3 7 5
-5 8 1 6 1 7 4 1 6 5
-5 4 8 5 4 5 6 4 5 5
-2 2 5 6 8 5 4 5 5 2
-5 3 3 7 1 3 3 8 4 6
-3 4 2 3 6 5 5 3 3 7
-3 3 5 1 7 3 4 7 6 8
-5 3 2 1 5 2 2 2 5 4
-1 3 7 6 1 8 5 3 7 5
-1 4 4 8 4 2 4 7 2 6
-3 2 4 8 1 6 8 4 7 3
-8 2 2 6 6 8 2 4 6 6
-8 3 6 5 8 4 7 1 2 7
-6 2 1 7 8 2 6 2 2 1
-2 3 1 5 6 1 5 8 1 3
-8 6 7 5 7 6 8 1 5 6
-2 7 8 6 7 3 3 5 2 3
-1 4 1 2 8 3 1 1 7 4
-3 1 7 6 4 4 1 8 2 4
-5 8 4 4 5 6 1 7 3 3
-1 5 4 2 7 5 2 1 4 1
-2 8 3 8 6 5 6 1 7 4
-3 8 6 6 3 6 2 8 5 1
-8 6 6 3 3 7 5 7 4 4
-7 8 2 7 3 1 8 3 2 2
-6 4 3 4 3 1 7 1 6 5
-7 2 5 3 5 4 3 1 5 6
-6 3 8 2 2 7 2 5 3 6
-2 1 3 2 1 2 8 7 5 7
-7 4 6 2 6 2 3 8 8 8
-8 1 8 2 3 3 6 2 6 3
-4 6 3 8 7 1 2 6 2 5
-3 7 1 8 2 4 7 4 4 2
-5 5 5 5 3 3 5 4 2 8
-1 6 6 6 2 2 6 3 4 8
-6 1 6 5 5 8 3 6 7 2
-5 7 7 2 8 4 8 3 6 4
-4 1 1 5 7 5 1 3 8 6
-1 7 2 5 4 6 3 2 8 5
-7 4 7 8 2 3 2 2 1 2
-4 3 2 8 8 7 1 6 5 8
-2 6 4 5 5 7 6 8 6 2
-7 3 1 4 7 8 6 4 1 7
-2 2 8 4 4 8 1 3 4 8
-4 3 3 2 4 6 4 4 4 2
-6 8 7 5 6 2 4 6 4 3
-8 1 5 8 7 2 7 8 3 5
-6 3 5 8 6 6 3 3 6 4
-1 6 7 4 6 3 7 5 5 2
-4 7 6 1 1 8 6 1 3 2
-5 2 6 2 7 6 7 3 1 1
-1 2 3 5 3 4 4 2 3 8
-8 4 1 7 5 6 2 5 7 8
-3 3 8 7 3 2 1 1 3 2
-2 3 4 3 2 4 8 2 8 5
-4 2 7 1 2 2 5 1 8 3
-1 2 2 3 7 1 1 8 6 2
-6 8 6 3 2 3 1 4 5 5
-8 8 8 8 8 8 8 8 8 8
-""")
-
-OA_V19_L2_tbl=StringIO("""
-2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1
-2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1
-2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1
-2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2
-1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1
-1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2
-1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1
-1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2
-2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2
-2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2
-1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1
-1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1
-2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1
-1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1
-2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1
-1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2
-1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2
-1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2
-2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2
-2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2
-""")
-
-OA_V5_L2_tbl=StringIO("""
-1 1 1 1 1
-1 2 2 1 2
-2 2 1 1 2
-1 2 1 2 1
-2 1 2 1 1
-2 1 1 2 2
-1 1 2 2 2
-2 2 2 2 1
-""")
-
-OA_V2_L8_tbl=StringIO("""
-3 1
-1 4
-4 6
-3 4
-4 4
-8 4
-3 2
-8 1
-5 7
-6 1
-8 5
-3 6
-5 8
-1 7
-7 8
-4 2
-2 2
-6 8
-2 7
-8 7
-8 3
-5 4
-1 3
-5 2
-7 6
-6 4
-5 5
-3 7
-6 3
-1 1
-3 3
-8 8
-5 1
-1 2
-7 3
-4 5
-4 7
-2 3
-6 6
-2 6
-1 5
-7 1
-1 6
-4 8
-7 4
-1 8
-8 2
-6 7
-2 8
-4 3
-5 3
-3 5
-7 7
-2 1
-2 5
-7 5
-2 4
-6 5
-8 6
-4 1
-3 8
-5 6
-7 2
-6 2
-""")
-
-OA_V7_L3_tbl=StringIO("""
-3 1 3 2 2 1 3
-3 2 1 2 1 3 2
-2 3 2 1 1 3 3
-2 2 2 2 2 2 1
-2 3 1 2 3 1 1
-3 1 2 3 1 2 1
-3 2 2 1 3 1 3
-1 2 3 1 2 3 1
-1 3 2 3 2 1 2
-2 1 1 3 2 3 3
-1 2 1 3 3 2 3
-2 1 3 1 3 2 2
-3 3 1 1 2 2 2
-1 3 3 2 1 2 3
-2 2 3 3 1 1 2
-1 1 2 2 3 3 2
-1 1 1 1 1 1 1
-3 3 3 3 3 3 1
-""")
-
-OA_V3_L7_tbl=StringIO("""
-6 7 1
-2 1 7
-4 7 3
-4 1 5
-4 5 6
-2 3 4
-2 6 3
-3 6 2
-5 4 3
-7 1 2
-1 2 3
-5 6 7
-5 3 1
-6 3 7
-3 7 4
-7 7 7
-1 6 4
-4 2 7
-7 5 3
-6 6 6
-3 3 3
-3 5 7
-6 4 2
-6 2 5
-1 4 7
-5 1 4
-1 3 5
-4 4 4
-2 2 2
-2 5 1
-3 1 6
-2 4 6
-5 5 5
-7 2 4
-2 7 5
-7 3 6
-1 7 6
-5 2 6
-5 7 2
-3 2 1
-6 1 3
-1 5 2
-6 5 4
-7 4 1
-4 3 2
-1 1 1
-3 4 5
-7 6 5
-4 6 1
-""")
-
-OA_V9_L6_tbl=StringIO("""
-5 1 1 3 4 4 6 3 3
-4 4 3 4 6 5 6 1 2
-1 1 1 3 6 6 2 5 5
-5 4 4 6 1 3 1 5 3
-3 2 2 4 3 5 3 5 3
-5 4 1 1 4 1 1 4 4
-3 5 5 1 6 6 2 3 3
-2 2 6 1 2 6 1 2 3
-2 3 2 2 6 2 1 5 4
-4 6 1 4 5 2 6 6 5
-6 5 4 4 6 2 1 1 6
-4 1 3 1 5 5 1 5 1
-2 2 3 6 5 2 6 2 1
-4 2 6 1 4 2 3 4 5
-3 2 4 3 1 6 6 3 6
-5 6 2 1 1 6 6 1 4
-3 4 6 5 3 2 2 1 4
-5 6 3 3 6 3 3 2 2
-1 3 3 5 2 2 4 3 3
-2 5 1 5 1 1 3 5 1
-4 3 2 2 2 4 3 1 6
-1 2 2 4 1 3 1 3 1
-1 3 1 6 3 4 1 6 4
-6 6 5 6 4 3 4 1 2
-2 4 5 2 1 4 2 6 5
-2 4 2 3 4 2 3 6 1
-2 5 6 3 3 1 6 6 2
-4 4 5 2 3 6 4 2 1
-1 6 2 1 3 2 2 3 6
-5 5 3 2 3 4 1 2 6
-4 4 2 3 6 4 5 2 3
-5 2 2 4 5 1 5 1 5
-4 5 4 4 4 6 5 5 4
-1 2 5 5 4 1 1 2 2
-3 2 5 5 6 3 3 4 4
-1 1 4 2 4 5 2 4 1
-6 3 4 1 5 3 2 6 2
-6 5 1 5 5 5 1 3 5
-3 1 1 3 2 2 4 1 1
-6 6 1 4 1 4 2 2 1
-5 2 5 5 2 5 5 6 6
-3 3 1 6 5 6 3 2 6
-1 1 5 4 1 2 5 2 6
-1 5 3 2 5 6 3 4 2
-4 6 5 6 2 1 2 5 6
-5 1 5 4 5 6 3 6 4
-3 5 2 6 4 5 2 2 5
-4 5 6 3 5 3 2 2 4
-1 3 6 4 6 1 4 2 5
-5 6 6 2 3 5 3 3 1
-2 4 3 4 4 3 4 5 6
-4 3 5 3 1 1 3 3 5
-6 3 5 3 3 3 5 5 1
-1 5 5 1 4 4 6 1 1
-5 3 1 6 1 2 5 4 2
-5 2 4 3 3 2 2 5 2
-2 5 4 4 2 4 3 3 2
-6 5 6 3 1 5 4 4 6
-1 4 4 6 3 5 3 1 5
-3 1 4 2 6 1 4 6 3
-3 4 4 6 5 1 5 3 1
-6 1 2 5 3 1 6 2 4
-1 6 6 2 5 1 5 5 3
-4 5 1 5 3 3 5 1 3
-2 6 4 5 6 4 5 4 5
-5 5 2 6 6 1 4 4 1
-5 3 3 5 6 6 2 1 1
-6 4 3 4 2 1 2 3 4
-4 2 3 6 1 4 2 4 3
-1 6 3 3 2 5 5 4 4
-6 1 3 1 1 1 3 1 3
-3 1 5 4 3 4 1 4 2
-4 2 1 2 4 3 4 3 4
-6 3 2 2 4 6 5 3 2
-2 6 5 6 6 5 6 3 4
-4 6 4 5 2 6 1 6 1
-2 3 5 3 5 5 1 1 3
-1 2 4 3 5 4 4 1 4
-6 2 1 2 6 5 6 5 6
-6 4 2 3 2 6 1 4 5
-2 6 1 4 3 6 4 4 3
-2 1 2 5 5 3 2 4 6
-5 5 5 1 2 2 4 5 5
-2 1 3 1 3 3 5 3 5
-5 3 6 4 4 5 2 6 3
-2 2 1 2 2 1 2 1 2
-6 6 4 5 4 2 3 2 3
-3 5 3 2 1 2 5 6 4
-3 6 6 2 1 3 1 1 5
-5 1 4 2 2 3 6 2 5
-6 2 3 6 3 6 4 6 5
-1 4 6 5 1 6 6 5 2
-4 3 4 1 3 1 6 4 6
-1 5 2 6 2 3 6 6 3
-3 6 3 3 4 1 1 6 6
-6 2 6 1 6 4 5 6 1
-4 1 2 5 1 5 4 6 2
-2 1 6 6 4 6 5 1 6
-3 3 3 5 4 4 6 5 5
-6 1 6 6 2 4 3 5 4
-3 4 1 1 2 5 5 2 2
-4 1 6 6 6 2 1 3 2
-6 4 5 2 5 2 6 4 3
-5 4 6 5 5 4 4 3 6
-1 4 1 1 6 3 3 6 6
-3 3 6 4 2 3 6 4 1
-3 6 2 1 5 4 4 5 2
-2 3 4 1 1 5 4 2 4
-""")
-
-OA_V2_L6_tbl=StringIO("""
-4 2
-5 2
-1 3
-1 2
-6 5
-3 6
-1 6
-3 3
-2 4
-6 6
-3 5
-2 5
-4 6
-6 4
-6 1
-4 4
-5 6
-4 3
-1 5
-3 2
-6 2
-2 2
-6 3
-4 5
-1 1
-2 6
-5 3
-2 1
-3 4
-4 1
-2 3
-5 4
-1 4
-5 5
-3 1
-5 1
-""")
-
-OA_V5_L5_tbl=StringIO("""
-3 4 5 1 2
-4 5 1 2 3
-2 4 1 3 5
-4 2 5 3 1
-2 5 3 1 4
-5 1 2 3 4
-3 1 4 2 5
-2 2 2 2 2
-4 3 2 1 5
-4 1 3 5 2
-3 2 1 5 4
-3 5 2 4 1
-1 1 1 1 1
-2 3 4 5 1
-1 5 4 3 2
-3 3 3 3 3
-1 3 5 2 4
-1 2 3 4 5
-5 2 4 1 3
-1 4 2 5 3
-4 4 4 4 4
-5 3 1 4 2
-2 1 5 4 3
-5 5 5 5 5
-5 4 3 2 1
-""")
-
-OA_V30_L2_tbl=StringIO("""
-2 2 2 2 1 1 1 1 2 2 2 1 2 2 1 2 1 2 2 2 2 1 1 1 1 1 1 1 2 2
-2 2 1 1 2 1 2 2 1 2 1 2 2 1 1 1 2 2 1 2 2 1 1 1 1 1 2 2 2 1
-2 1 1 2 2 2 1 2 1 2 1 1 1 2 1 2 1 1 1 2 2 1 1 2 2 2 2 1 1 2
-1 2 2 1 2 2 1 2 2 1 2 1 2 1 1 1 1 2 2 1 1 1 1 2 2 2 2 1 2 1
-1 2 1 2 1 2 2 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 2 1 1 1 1 1 2
-2 2 1 1 2 1 2 1 1 1 2 2 1 2 1 2 1 2 2 1 2 2 2 1 2 2 2 1 1 1
-2 2 2 2 1 1 1 2 2 1 1 1 1 1 1 1 2 2 1 1 2 2 2 1 2 2 1 2 1 2
-1 2 2 1 2 2 1 1 1 1 1 2 2 2 2 1 2 1 2 2 2 1 2 1 2 1 1 1 1 2
-1 2 1 2 1 2 2 1 1 1 1 2 2 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 2
-1 1 1 1 1 1 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2
-1 1 2 2 2 1 2 1 2 2 1 2 2 1 1 1 1 1 1 2 1 2 2 1 2 2 2 1 2 2
-2 2 1 1 2 1 2 1 2 2 2 1 2 2 2 1 1 1 1 1 1 1 2 2 1 2 1 2 1 2
-2 2 1 1 2 1 2 2 2 1 1 1 1 1 2 2 2 1 2 2 1 2 1 2 2 1 1 1 2 2
-2 1 2 1 1 2 2 2 1 2 1 1 1 2 2 1 1 2 2 1 1 1 2 1 2 1 2 2 2 2
-1 2 2 1 2 2 1 2 1 2 2 2 1 1 2 2 1 1 1 1 2 2 1 1 1 2 1 2 2 2
-1 1 2 2 2 1 2 1 1 1 1 1 1 1 2 2 1 2 2 2 2 1 2 2 1 2 1 2 2 1
-1 2 2 1 2 2 1 1 2 2 1 1 1 2 1 2 2 2 1 2 1 2 2 2 1 1 2 2 1 1
-2 1 2 1 1 2 2 1 2 2 2 2 1 1 1 1 2 1 2 2 2 1 1 2 2 2 1 2 1 1
-1 1 2 2 2 1 2 2 1 2 2 1 2 2 2 1 2 2 1 1 2 2 1 2 2 1 1 1 1 1
-2 2 2 2 1 1 1 2 1 2 1 2 2 1 2 2 2 1 2 1 1 1 2 2 1 2 2 1 1 1
-2 1 2 1 1 2 2 2 2 1 1 2 2 2 1 2 1 1 1 1 2 2 2 2 1 1 1 1 2 1
-2 1 1 2 2 2 1 1 2 2 2 2 1 1 2 2 2 2 1 1 1 1 2 1 2 1 1 1 2 1
-2 1 1 2 2 2 1 1 1 1 2 1 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 2 2
-1 1 1 1 1 1 1 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 1 1 2 2 2 1 2 2 1 1 2 2 2 2 1 1 2 2 2 1 2 1 1 1 2 1 2 1 1
-1 1 2 2 2 1 2 2 2 1 2 2 1 2 1 2 2 1 2 1 1 1 1 1 1 1 2 2 1 2
-1 1 1 1 1 1 1 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1 2 2 1
-2 1 2 1 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 2 1 2 1 1 1 2 2 1 1 2
-2 2 2 2 1 1 1 1 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 2 1
-1 2 1 2 1 2 2 1 2 2 1 1 1 2 2 1 2 1 2 1 2 2 1 1 1 2 2 1 2 1
-1 2 1 2 1 2 2 2 2 1 2 1 2 1 2 2 1 1 1 2 2 1 2 1 2 1 2 2 1 1
-""")
-
-OA_V10_L7_tbl=StringIO("""
-1 1 2 4 7 4 2 5 5 3
-3 4 6 2 6 4 3 7 5 1
-5 7 2 4 6 1 3 1 3 5
-3 3 4 6 2 6 4 7 7 5
-2 7 6 6 7 2 5 4 1 3
-6 5 5 6 1 4 1 7 2 2
-4 7 3 6 2 5 1 2 5 1
-1 3 5 7 2 4 6 4 6 1
-5 6 1 4 1 6 5 2 7 3
-3 1 7 7 1 3 6 5 2 4
-5 1 4 7 3 6 2 3 6 2
-4 5 7 3 7 5 4 1 6 2
-6 4 3 3 4 6 2 1 5 7
-4 5 6 7 1 2 3 3 4 5
-1 5 3 2 2 3 5 1 7 4
-7 7 7 7 7 7 7 7 7 7
-3 7 4 1 5 2 6 1 5 2
-1 2 4 7 4 2 1 5 3 6
-4 4 4 4 4 4 4 4 4 4
-6 3 7 4 1 5 2 4 1 5
-3 7 5 4 4 5 7 3 2 6
-4 3 3 4 6 2 6 5 7 7
-3 5 7 2 4 6 1 6 1 3
-1 5 2 6 3 7 4 6 3 7
-5 2 7 6 6 7 2 5 4 1
-4 3 2 1 7 6 5 3 2 1
-2 2 2 2 2 2 2 2 2 2
-6 3 1 7 7 1 3 6 5 2
-4 1 5 2 6 3 7 2 6 3
-2 6 3 7 4 1 5 7 4 1
-5 4 4 5 7 3 7 6 1 1
-1 7 6 5 4 3 2 7 6 5
-4 4 5 7 3 7 5 1 1 6
-7 2 4 6 1 3 5 3 5 7
-4 6 2 6 4 3 3 5 1 2
-3 3 3 3 3 3 3 3 3 3
-4 7 4 2 1 1 2 6 7 6
-5 2 6 3 7 4 1 3 7 4
-2 5 2 7 6 6 7 4 5 4
-2 1 1 2 4 7 4 3 5 5
-5 5 5 5 5 5 5 5 5 5
-6 7 1 2 3 4 5 5 6 7
-3 6 3 1 7 7 1 5 6 5
-7 1 2 3 4 5 6 6 7 1
-4 2 7 5 3 1 6 7 5 3
-2 1 7 6 5 4 3 1 7 6
-7 3 6 2 5 1 4 5 1 4
-1 4 7 3 6 2 5 6 2 5
-4 1 6 5 5 6 1 4 3 7
-3 1 6 4 2 7 5 6 4 2
-4 6 1 3 5 7 2 7 2 4
-6 2 5 1 4 7 3 4 7 3
-2 4 6 1 3 5 7 5 7 2
-5 3 1 6 4 2 7 1 6 4
-5 3 2 2 3 5 1 7 4 6
-7 7 1 3 6 3 1 4 4 2
-6 1 3 5 7 2 4 2 4 6
-6 5 4 3 2 1 7 5 4 3
-2 7 5 3 1 6 4 5 3 1
-7 3 7 5 4 4 5 2 3 2
-5 6 7 1 2 3 4 4 5 6
-7 5 3 1 6 4 2 3 1 6
-3 2 2 3 5 1 5 4 6 6
-7 5 4 4 5 7 3 2 6 1
-6 4 2 7 5 3 1 2 7 5
-7 1 3 6 3 1 7 4 2 5
-6 2 6 4 3 3 4 1 2 1
-7 4 2 1 1 2 4 7 6 3
-5 7 3 7 5 4 4 6 2 3
-2 3 5 1 5 3 2 6 4 7
-6 6 6 6 6 6 6 6 6 6
-2 6 4 3 3 4 6 2 1 5
-5 4 3 2 1 7 6 4 3 2
-1 1 1 1 1 1 1 1 1 1
-1 6 4 2 7 5 3 4 2 7
-6 1 4 1 6 5 5 7 3 4
-4 2 1 1 2 4 7 6 3 5
-2 4 7 4 2 1 1 3 6 7
-7 6 6 7 2 5 2 1 3 3
-5 5 6 1 4 1 6 2 2 7
-2 5 1 4 7 3 6 7 3 6
-7 6 5 4 3 2 1 6 5 4
-3 2 1 7 6 5 4 2 1 7
-5 1 5 3 2 2 3 7 1 7
-1 4 1 6 5 5 6 3 4 3
-1 3 6 3 1 7 7 2 5 6
-1 2 3 4 5 6 7 7 1 2
-1 6 5 5 6 1 4 3 7 2
-2 2 3 5 1 5 3 6 6 4
-3 6 2 5 1 4 7 1 4 7
-7 2 5 2 7 6 6 1 4 5
-7 4 1 5 2 6 3 5 2 6
-6 7 2 5 2 7 6 3 1 4
-1 7 7 1 3 6 3 2 4 4
-2 3 4 5 6 7 1 1 2 3
-3 5 1 5 3 2 2 4 7 1
-6 6 7 2 5 2 7 3 3 1
-3 4 5 6 7 1 2 2 3 4
-""")
-
-OA_V9_L5_tbl=StringIO("""
-5 4 3 2 1 4 3 2 1
-2 3 4 5 1 1 2 3 4
-2 1 1 2 4 5 3 3 5
-2 4 1 3 5 3 5 2 4
-5 4 4 5 2 3 1 1 3
-3 5 3 2 2 1 5 1 4
-3 2 1 5 4 2 1 5 4
-3 2 2 3 5 1 4 4 1
-3 1 4 2 5 4 2 5 3
-2 5 4 4 5 2 3 1 1
-3 5 2 4 1 4 1 3 5
-2 4 2 1 1 5 4 5 3
-2 5 3 1 4 3 1 4 2
-4 5 1 2 3 3 4 5 1
-5 3 2 2 3 5 1 4 4
-2 1 5 4 3 1 5 4 3
-4 2 1 1 2 4 5 3 3
-4 3 3 4 1 2 5 5 2
-1 4 2 5 3 2 5 3 1
-5 5 5 5 5 5 5 5 5
-4 5 2 5 4 1 3 2 3
-2 2 2 2 2 2 2 2 2
-3 4 5 1 2 2 3 4 5
-1 4 3 3 4 1 2 5 5
-5 5 1 3 1 2 2 4 3
-1 1 1 1 1 1 1 1 1
-2 3 5 3 2 4 1 5 1
-1 2 3 4 5 5 1 2 3
-3 1 5 5 1 3 4 2 2
-1 5 5 1 3 4 2 2 4
-1 3 5 2 4 2 4 1 3
-1 3 1 5 5 4 3 4 2
-5 1 2 3 4 4 5 1 2
-1 5 4 3 2 5 4 3 2
-5 2 5 4 4 3 2 3 1
-4 2 5 3 1 5 3 1 4
-4 1 3 5 2 5 2 4 1
-4 1 4 3 3 2 1 2 5
-4 3 2 1 5 3 2 1 5
-5 2 4 1 3 1 3 5 2
-3 4 1 4 3 5 2 1 2
-3 3 4 1 4 5 5 2 1
-5 1 3 1 5 2 4 3 4
-2 2 3 5 3 4 4 1 5
-1 2 4 2 1 3 5 4 5
-4 4 4 4 4 4 4 4 4
-1 1 2 4 2 3 3 5 4
-3 3 3 3 3 3 3 3 3
-5 3 1 4 2 1 4 2 5
-4 4 5 2 5 1 1 3 2
-""")
-
-OA_V10_L3_tbl=StringIO("""
-2 2 2 1 1 1 3 3 3 1
-3 1 2 3 1 2 3 1 2 2
-1 3 2 1 3 2 1 3 2 3
-2 3 1 2 3 1 2 3 1 2
-3 1 2 1 2 3 2 3 1 2
-1 1 1 2 2 2 3 3 3 1
-2 3 1 1 2 3 3 1 2 2
-3 1 2 2 3 1 1 2 3 2
-3 3 3 2 2 2 1 1 1 1
-3 3 3 3 3 3 3 3 3 1
-1 2 3 1 2 3 1 2 3 2
-1 1 1 1 1 1 1 1 1 1
-3 2 1 2 1 3 1 3 2 3
-2 2 2 2 2 2 2 2 2 1
-3 2 1 3 2 1 3 2 1 3
-3 3 3 1 1 1 2 2 2 1
-1 2 3 3 1 2 2 3 1 2
-2 1 3 1 3 2 3 2 1 3
-2 3 1 3 1 2 1 2 3 2
-1 1 1 3 3 3 2 2 2 1
-3 2 1 1 3 2 2 1 3 3
-2 1 3 2 1 3 2 1 3 3
-1 2 3 2 3 1 3 1 2 2
-2 2 2 3 3 3 1 1 1 1
-2 1 3 3 2 1 1 3 2 3
-1 3 2 2 1 3 3 2 1 3
-1 3 2 3 2 1 2 1 3 3
-""")
-
-OA_V21_L2_tbl=StringIO("""
-1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 2 2 1
-1 2 2 2 1 1 1 2 1 1 1 2 2 2 1 1 1 2 1 1 1
-1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2 1 2
-2 1 2 2 2 1 1 1 2 1 2 1 2 2 2 1 1 1 2 1 1
-2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 1
-1 2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 2
-1 1 2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1
-1 1 2 1 1 2 1 2 2 2 2 2 1 2 2 1 2 1 1 1 2
-1 1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2 2
-1 2 1 1 2 1 2 2 2 1 2 1 2 2 1 2 1 1 1 2 2
-2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1 1 1
-2 1 1 1 2 1 1 2 1 2 1 2 2 2 1 2 2 1 2 1 2
-1 1 1 2 1 1 2 1 2 2 2 2 2 1 2 2 1 2 1 1 2
-2 1 1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2
-1 2 1 2 2 2 1 1 1 2 1 2 1 2 2 2 1 1 1 2 1
-2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 1 2 2
-2 2 2 2 2 2 2 2 2 2 1 1 1 1 1 1 1 1 1 1 2
-2 1 2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2
-2 2 2 1 1 1 2 1 1 2 2 2 2 1 1 1 2 1 1 2 1
-2 2 1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 1
-2 1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 2 1
-1 2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1 1
-1 1 2 1 2 2 2 1 1 1 1 1 2 1 2 2 2 1 1 1 1
-2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 1 2
-""")
-
-OA_V8_L6_tbl=StringIO("""
-6 6 1 3 3 3 3 5
-3 1 3 4 5 3 6 2
-4 6 2 4 3 2 5 2
-6 2 2 4 5 4 1 4
-2 1 4 3 4 3 5 6
-4 3 4 3 6 5 1 2
-6 5 6 5 4 3 1 2
-3 4 4 1 6 3 6 6
-3 6 6 1 5 2 6 5
-3 5 6 6 1 3 1 5
-6 3 1 5 3 4 4 2
-3 1 1 2 3 1 2 4
-3 2 3 2 6 2 5 4
-1 4 6 1 3 6 4 3
-5 2 4 5 5 2 4 3
-6 1 6 4 2 6 6 1
-3 3 3 3 6 6 1 1
-5 5 1 1 6 6 5 5
-6 4 3 6 4 5 6 3
-2 2 5 1 3 3 1 3
-3 3 5 5 2 2 5 5
-3 4 6 3 2 5 4 4
-5 1 6 6 3 5 3 1
-5 2 2 3 3 6 6 5
-2 5 5 3 3 4 2 6
-5 5 3 3 2 2 3 3
-2 6 3 6 6 1 2 5
-5 1 4 4 1 3 5 3
-2 4 6 2 5 4 5 2
-5 6 4 1 2 5 2 2
-4 2 3 6 2 3 4 1
-1 4 4 5 1 4 6 5
-5 3 3 4 1 5 2 4
-3 6 2 3 1 4 4 3
-2 5 3 1 1 2 4 2
-6 3 5 3 1 2 6 4
-4 3 2 1 4 3 3 4
-2 4 4 6 3 2 1 4
-4 6 4 6 5 4 3 6
-3 6 4 5 3 6 2 1
-1 2 6 3 6 3 2 2
-4 3 6 5 2 1 5 6
-5 6 2 5 6 3 4 4
-3 2 5 4 2 4 3 2
-4 5 6 4 6 4 4 5
-5 6 6 3 4 1 6 6
-6 4 5 2 6 1 4 1
-1 5 1 2 1 5 6 2
-1 3 4 4 3 5 1 5
-3 4 2 5 4 1 2 2
-6 3 3 1 5 6 2 6
-2 3 4 2 2 6 4 5
-6 5 2 1 6 5 5 6
-5 3 1 2 5 3 4 6
-2 1 6 5 6 5 3 4
-1 1 1 1 2 2 1 1
-5 3 5 6 3 1 6 2
-1 2 4 1 4 1 4 4
-2 3 6 4 4 2 2 3
-4 1 1 5 1 2 2 6
-1 1 5 5 6 6 3 3
-5 4 1 6 6 2 3 2
-6 4 1 4 2 3 2 5
-1 2 2 5 2 5 6 6
-5 2 6 1 1 4 2 1
-4 4 3 5 3 3 5 1
-3 3 1 1 4 4 3 3
-2 2 1 3 5 5 5 1
-5 4 3 2 2 4 1 6
-2 1 2 1 2 1 1 2
-6 5 4 3 2 1 3 4
-1 4 2 3 5 2 2 1
-4 5 4 2 4 2 6 1
-6 2 4 6 1 6 5 2
-3 5 4 4 5 1 3 1
-4 1 3 1 3 4 6 4
-6 6 5 1 1 1 5 1
-1 3 6 6 5 1 5 3
-4 1 5 3 5 6 4 2
-4 5 2 6 2 6 2 3
-3 5 2 2 3 5 5 3
-3 1 5 6 1 5 4 6
-4 4 5 1 5 5 3 5
-1 6 5 4 6 2 1 6
-5 4 5 4 4 6 5 4
-5 5 5 5 4 4 1 1
-1 6 3 2 4 6 3 2
-1 6 1 6 2 4 5 4
-4 6 6 2 1 6 1 4
-2 6 5 2 2 3 6 3
-2 3 2 6 6 4 6 1
-1 3 2 2 1 3 3 1
-1 1 3 3 4 4 5 5
-5 1 2 2 5 1 1 5
-2 4 2 4 1 6 3 6
-3 2 1 6 4 6 1 6
-1 5 5 6 5 3 2 4
-1 5 3 4 3 1 4 6
-4 2 1 4 6 1 6 3
-6 2 6 2 3 2 3 6
-2 5 1 5 5 6 6 4
-6 6 3 5 5 5 1 3
-4 2 5 2 4 5 2 5
-6 1 4 2 6 4 2 3
-2 2 3 5 1 1 3 5
-2 6 1 4 4 5 4 1
-4 4 1 3 1 1 1 3
-6 1 2 6 4 2 4 5
-""")
-
-OA_V32_L2_tbl=StringIO("""
-2 1 2 1 1 2 1 2 1 1 2 2 2 2 1 1 2 1 2 2 1 2 1 2 1 2 2 1 1 1 1 2
-1 1 2 2 2 1 1 1 1 2 2 2 2 1 2 1 1 1 1 2 2 2 1 2 1 1 2 2 2 2 2 2
-2 2 2 2 1 1 2 1 1 1 1 2 1 2 2 2 2 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2
-1 2 1 2 1 2 1 1 2 1 2 1 2 2 2 2 1 2 1 2 1 2 1 1 2 2 2 1 2 1 2 1
-2 2 1 2 1 2 2 1 2 1 1 2 2 1 1 2 1 1 2 2 2 2 2 1 1 1 1 1 1 2 2 2
-2 2 2 1 2 2 1 1 2 1 1 2 1 1 1 1 1 2 1 1 2 1 1 1 2 2 2 2 2 2 1 2
-2 2 1 1 1 1 2 2 2 1 1 2 2 2 2 1 1 1 1 1 2 2 2 2 1 1 2 2 2 1 1 1
-1 2 2 1 1 1 2 1 1 2 1 1 2 1 2 2 2 1 2 1 1 2 1 1 2 1 2 1 2 2 1 2
-2 1 1 1 1 1 2 1 2 2 2 1 1 1 2 2 2 2 1 2 2 1 2 2 1 2 2 1 1 2 1 2
-2 1 1 1 2 1 2 2 1 2 1 2 2 2 1 2 1 2 1 2 1 1 1 2 2 1 1 1 2 2 2 1
-2 2 1 2 1 1 1 2 1 1 2 1 2 2 2 1 2 2 1 2 2 1 1 1 2 1 1 2 1 2 1 2
-2 1 1 2 2 2 2 1 2 2 2 2 1 2 2 1 2 1 2 1 1 2 1 1 2 1 1 2 1 2 1 1
-2 1 2 2 2 1 2 1 2 2 1 1 2 2 1 1 2 2 1 1 2 2 1 1 1 2 2 1 1 1 2 1
-2 1 1 2 1 1 1 1 2 2 2 1 2 1 1 1 1 1 2 1 1 1 2 2 2 2 1 2 2 1 2 2
-2 2 2 2 2 1 2 2 1 1 2 1 1 1 1 1 2 1 2 2 2 1 2 1 2 1 2 1 2 1 2 1
-1 1 1 1 2 1 1 2 2 1 1 1 1 2 1 2 2 1 2 2 2 2 1 1 1 2 1 2 2 2 2 2
-1 1 1 1 2 2 2 1 1 1 1 1 2 1 2 1 2 2 2 2 2 2 2 2 2 2 1 2 2 1 1 1
-1 2 1 1 1 2 2 1 1 2 2 2 1 2 1 1 2 1 1 2 1 1 2 1 1 2 2 2 2 2 2 1
-1 2 1 2 2 2 1 2 2 2 1 1 2 2 1 1 2 2 2 1 1 1 2 2 1 1 2 1 2 2 1 2
-1 1 1 2 2 2 1 1 1 1 1 2 1 2 2 2 2 1 1 1 2 1 2 2 2 1 2 1 1 1 2 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-1 2 2 2 2 1 1 2 2 2 1 2 2 1 2 2 2 1 1 2 1 1 2 1 1 2 1 2 1 1 1 1
-1 2 1 1 2 2 2 2 1 2 2 2 2 1 2 1 1 2 2 1 2 1 1 1 1 2 1 1 1 1 2 2
-2 1 2 1 1 2 1 2 2 2 1 2 1 1 2 1 2 2 1 2 1 2 2 1 2 1 1 1 2 1 2 2
-2 2 1 2 2 2 2 2 1 2 1 1 1 1 1 2 1 1 1 2 1 2 1 2 2 2 2 2 1 1 1 2
-1 1 2 2 1 2 2 2 2 1 1 1 1 1 2 1 1 2 2 2 1 1 1 2 1 1 2 2 1 2 2 1
-1 2 2 2 1 1 1 1 1 2 1 2 1 2 1 1 1 2 2 2 2 2 2 2 2 2 1 1 1 2 1 1
-1 1 2 2 1 2 2 2 1 2 2 1 1 2 1 2 1 2 1 1 2 2 2 1 1 1 1 2 2 1 1 2
-2 1 2 1 1 2 1 2 1 2 1 1 2 2 2 2 1 1 2 1 2 1 2 1 2 2 2 2 1 2 2 1
-2 2 2 1 2 2 1 1 2 2 2 1 1 2 2 2 1 1 2 2 2 1 1 2 1 1 1 1 2 1 1 1
-1 2 2 1 2 1 2 2 2 1 2 1 1 2 2 1 1 1 1 1 1 2 2 2 2 2 1 1 1 2 2 2
-1 2 1 1 1 1 1 2 2 2 2 2 1 1 1 2 2 2 2 1 2 2 1 2 2 1 2 2 1 1 2 1
-1 1 2 2 1 2 2 2 2 1 2 2 2 1 1 2 2 1 1 1 2 1 1 2 2 2 1 1 2 2 1 1
-2 1 1 2 2 1 1 2 1 1 2 2 1 1 2 2 1 2 2 1 1 2 2 1 1 2 2 1 2 2 1 1
-1 1 2 1 2 1 2 1 2 1 2 2 2 2 1 2 1 2 2 2 1 1 2 1 2 1 2 2 1 1 1 2
-2 2 2 1 2 2 1 1 1 1 2 1 2 1 1 2 2 2 1 1 1 2 2 2 1 1 1 2 1 2 2 1
-""")
-
-OA_V6_L8_tbl=StringIO("""
-3 6 1 3 7 6
-7 7 4 5 2 8
-7 6 7 7 8 5
-8 5 3 6 2 5
-1 5 2 5 5 2
-3 2 5 5 8 1
-5 7 5 8 7 5
-2 6 6 8 3 2
-3 5 7 8 4 3
-8 7 2 3 3 1
-1 8 5 7 3 3
-5 4 7 5 3 7
-7 2 3 1 7 2
-3 8 4 6 6 2
-3 7 6 1 1 7
-1 4 1 1 4 8
-6 8 1 5 1 5
-4 3 4 1 3 5
-3 3 2 7 2 4
-5 2 6 4 2 3
-7 1 5 6 4 7
-5 3 1 2 8 2
-6 3 3 8 5 7
-7 4 2 8 6 6
-4 1 1 8 2 1
-8 8 8 8 8 8
-6 1 2 1 8 3
-8 3 6 5 4 6
-1 6 8 2 2 7
-5 8 3 3 4 4
-6 2 8 6 3 6
-2 7 1 6 5 3
-2 3 5 4 6 8
-1 3 7 6 7 1
-2 5 4 3 8 7
-3 1 3 2 3 8
-8 4 4 2 7 3
-8 2 1 7 6 7
-1 2 4 8 1 4
-1 1 6 3 6 5
-5 5 8 1 6 1
-4 2 7 3 5 8
-2 8 7 1 2 6
-3 4 8 4 5 5
-6 6 4 4 4 1
-4 5 5 2 1 6
-7 8 6 2 5 1
-2 2 2 2 4 5
-6 4 5 3 2 2
-6 7 7 2 6 4
-4 6 3 5 6 3
-2 1 8 5 7 4
-1 7 3 4 8 6
-4 8 2 4 7 7
-4 7 8 7 4 2
-4 4 6 6 8 4
-6 5 6 7 7 8
-5 6 2 6 1 8
-8 1 7 4 1 2
-2 4 3 7 1 1
-8 6 5 1 5 4
-7 5 1 4 3 4
-5 1 4 7 5 6
-7 3 8 3 1 3
-""")
-
-OA_V1_L9_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-""")
-
-OA_V1_L10_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-10
-""")
-
-OA_V1_L11_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-10
-11
-""")
-
-OA_V1_L12_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-10
-11
-12
-""")
-
-OA_V1_L13_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-10
-11
-12
-13
-""")
-
-OA_V1_L14_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-10
-11
-12
-13
-14
-""")
-
-OA_V1_L15_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-10
-11
-12
-13
-14
-15
-""")
-
-OA_V1_L16_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-10
-11
-12
-13
-14
-15
-16
-""")
-
-OA_V1_L17_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-10
-11
-12
-13
-14
-15
-16
-17
-""")
-
-OA_V1_L18_tbl=StringIO("""
-1
-2
-3
-4
-5
-6
-7
-8
-9
-10
-11
-12
-13
-14
-15
-16
-17
-18
-""")
-
-
-OA_V4_L9_tbl=StringIO("""
-9 6 3 7
-1 7 4 7
-3 5 7 6
-1 4 7 4
-8 6 1 8
-6 9 3 4
-5 1 9 9
-4 9 2 6
-4 7 1 4
-7 2 6 5
-6 4 5 2
-9 9 9 1
-8 7 9 3
-5 3 7 8
-6 3 9 7
-3 8 4 9
-1 5 9 5
-2 6 7 5
-8 2 5 4
-7 5 3 8
-3 7 5 8
-2 3 1 2
-2 8 5 7
-8 3 4 5
-4 3 8 9
-1 2 3 2
-4 4 4 1
-7 3 5 6
-1 1 1 1
-3 4 8 5
-8 9 7 2
-4 1 7 7
-9 4 2 8
-3 9 6 7
-4 8 3 5
-6 8 1 6
-2 7 6 9
-5 5 5 1
-4 5 6 2
-6 5 4 3
-2 4 9 6
-5 6 4 2
-7 9 8 3
-3 3 3 1
-3 1 2 2
-8 8 8 1
-8 1 6 6
-1 9 5 9
-2 5 8 4
-9 8 7 3
-5 4 6 3
-2 2 2 1
-5 7 3 6
-5 2 8 7
-2 1 3 3
-1 6 8 6
-3 6 9 4
-6 7 2 5
-1 3 2 3
-7 4 1 7
-4 6 5 3
-9 2 4 6
-5 9 1 5
-9 3 6 4
-7 7 7 1
-5 8 2 4
-7 8 9 2
-7 1 4 4
-9 7 8 2
-3 2 1 3
-7 6 2 9
-8 5 2 7
-6 6 6 1
-9 5 1 9
-2 9 4 8
-1 8 6 8
-9 1 5 5
-6 1 8 8
-8 4 3 9
-6 2 7 9
-4 2 9 8
-""")
-
-OA_V7_L7_tbl=StringIO("""
-3 2 1 7 6 5 4
-3 4 5 6 7 1 2
-6 3 7 4 1 5 2
-2 7 5 3 1 6 4
-4 4 4 4 4 4 4
-3 1 6 4 2 7 5
-2 3 4 5 6 7 1
-1 2 3 4 5 6 7
-7 3 6 2 5 1 4
-7 1 2 3 4 5 6
-7 7 7 7 7 7 7
-4 2 7 5 3 1 6
-1 3 5 7 2 4 6
-6 6 6 6 6 6 6
-3 3 3 3 3 3 3
-4 7 3 6 2 5 1
-2 6 3 7 4 1 5
-5 7 2 4 6 1 3
-3 6 2 5 1 4 7
-5 2 6 3 7 4 1
-4 1 5 2 6 3 7
-6 5 4 3 2 1 7
-7 2 4 6 1 3 5
-2 4 6 1 3 5 7
-5 4 3 2 1 7 6
-6 1 3 5 7 2 4
-1 1 1 1 1 1 1
-5 1 4 7 3 6 2
-2 5 1 4 7 3 6
-1 4 7 3 6 2 5
-4 6 1 3 5 7 2
-7 6 5 4 3 2 1
-6 2 5 1 4 7 3
-7 5 3 1 6 4 2
-2 1 7 6 5 4 3
-5 3 1 6 4 2 7
-5 6 7 1 2 3 4
-3 7 4 1 5 2 6
-7 4 1 5 2 6 3
-3 5 7 2 4 6 1
-6 4 2 7 5 3 1
-1 6 4 2 7 5 3
-4 3 2 1 7 6 5
-1 5 2 6 3 7 4
-2 2 2 2 2 2 2
-6 7 1 2 3 4 5
-4 5 6 7 1 2 3
-5 5 5 5 5 5 5
-1 7 6 5 4 3 2
-""")
-
-OA_V3_L6_tbl=StringIO("""
-4 4 5
-1 2 6
-6 4 4
-3 5 1
-2 6 3
-3 6 4
-5 3 6
-3 2 5
-1 4 1
-4 6 6
-6 3 1
-4 1 4
-1 1 3
-6 6 5
-1 6 2
-3 1 2
-5 6 1
-3 4 6
-5 4 3
-2 1 1
-5 5 4
-3 3 3
-2 3 5
-5 1 5
-2 4 2
-4 3 2
-2 5 6
-6 5 2
-6 1 6
-1 5 5
-1 3 4
-4 5 3
-2 2 4
-4 2 1
-6 2 3
-5 2 2
-""")
-
-OA_V4_L2_tbl=StringIO("""
-2 2 2 2
-2 2 1 1
-1 1 2 2
-1 2 1 2
-1 2 2 1
-2 1 1 2
-1 1 1 1
-2 1 2 1
-""")
-
-OA_V13_L2_tbl=StringIO("""
-2 2 1 2 1 2 1 2 2 1 1 1 1
-2 1 2 2 1 2 2 1 2 2 1 2 1
-1 2 2 1 2 2 1 2 2 1 2 2 1
-2 2 1 1 2 2 1 1 1 2 1 2 2
-1 1 1 2 2 1 1 2 2 2 1 2 2
-2 1 2 2 2 1 1 1 1 1 2 2 1
-2 1 2 1 2 2 2 2 1 1 1 1 2
-1 2 2 2 2 1 2 1 2 1 1 1 2
-1 1 1 1 2 2 2 1 2 2 2 1 1
-2 2 1 2 2 1 2 2 1 2 2 1 1
-1 1 1 1 1 1 1 1 1 1 1 1 1
-1 1 1 2 1 2 2 2 1 1 2 2 2
-1 2 2 1 1 1 2 2 1 2 1 2 1
-2 1 2 1 1 1 1 2 2 2 2 1 2
-1 2 2 2 1 2 1 1 1 2 2 1 2
-2 2 1 1 1 1 2 1 2 1 2 2 2
-""")
-
-OA_V5_L6_tbl=StringIO("""
-3 4 2 1 5
-6 5 2 3 4
-6 2 3 2 3
-1 4 6 3 2
-5 1 2 1 2
-5 3 3 4 2
-1 2 6 5 3
-5 2 4 1 6
-1 3 5 1 6
-4 5 3 2 6
-3 2 6 4 4
-4 4 4 4 4
-1 3 4 3 4
-4 1 3 6 5
-3 6 5 1 3
-6 6 1 5 2
-1 2 1 4 6
-1 1 1 1 1
-2 4 6 2 1
-2 3 1 6 4
-3 3 4 2 5
-3 5 6 5 6
-2 1 5 3 3
-2 5 4 6 2
-2 3 2 5 1
-2 6 3 3 6
-1 5 2 2 5
-3 4 3 6 2
-5 2 1 3 5
-5 5 5 5 5
-2 2 3 1 4
-6 6 6 6 6
-2 1 4 5 6
-4 6 1 6 1
-5 5 6 4 1
-5 6 5 2 4
-2 2 2 2 2
-5 1 3 5 4
-5 3 6 6 3
-6 4 4 5 3
-3 5 1 3 2
-4 6 2 4 3
-4 3 1 5 5
-6 3 2 4 6
-3 3 3 3 3
-1 6 3 4 5
-6 3 5 2 1
-4 2 2 3 1
-1 5 5 6 4
-2 5 1 4 3
-3 2 5 6 1
-6 1 6 3 5
-6 1 5 4 2
-5 6 4 3 1
-2 6 6 1 5
-2 4 5 4 5
-4 5 4 1 3
-6 5 3 1 1
-6 2 4 6 5
-1 6 4 2 2
-3 1 1 2 6
-1 4 3 5 1
-3 6 2 5 4
-5 4 1 2 3
-5 4 2 6 6
-1 1 2 6 3
-6 4 1 1 4
-4 4 5 3 6
-4 3 6 1 2
-4 2 5 5 2
-3 1 4 4 1
-4 1 6 2 4
-""")
-
-OA_V6_L9_tbl=StringIO("""
-9 6 5 2 8 7
-9 7 2 3 1 2
-5 9 2 6 7 5
-6 3 2 8 5 7
-2 4 1 6 8 6
-4 4 4 4 4 1
-3 2 7 9 8 3
-6 8 5 7 3 6
-7 4 6 3 9 7
-6 7 3 4 8 5
-1 4 5 8 2 4
-3 7 1 8 6 8
-8 1 7 3 5 6
-8 7 6 5 4 3
-3 4 9 1 5 5
-6 6 6 6 6 1
-7 2 4 8 3 5
-8 2 3 6 9 4
-3 9 8 5 2 7
-8 6 9 4 2 8
-8 8 8 8 8 1
-7 8 3 1 2 2
-4 8 1 5 9 5
-1 7 9 6 3 7
-2 7 5 1 9 9
-9 4 7 5 3 8
-6 1 4 2 9 8
-5 1 8 4 3 9
-3 5 2 4 9 6
-1 2 6 4 5 2
-4 3 7 6 2 9
-9 8 4 6 5 3
-1 5 7 2 6 5
-3 6 4 7 1 4
-7 3 9 2 4 6
-4 6 2 1 3 3
-9 9 9 9 9 1
-5 2 1 7 4 7
-9 3 1 4 7 4
-2 9 3 7 5 8
-8 3 5 9 1 5
-1 3 8 7 9 3
-8 9 1 2 3 2
-5 6 7 8 9 2
-7 9 5 4 6 3
-2 8 7 4 1 7
-5 8 9 3 6 4
-8 5 4 1 7 7
-1 6 3 5 7 6
-9 2 8 1 6 6
-6 5 1 3 2 3
-5 3 6 1 8 8
-3 1 5 6 4 2
-2 5 6 9 3 4
-4 1 3 9 6 7
-1 1 1 1 1 1
-3 3 3 3 3 1
-2 3 4 5 6 2
-7 5 8 6 1 8
-2 6 8 3 4 5
-1 9 4 3 8 9
-5 5 5 5 5 1
-7 1 2 5 8 4
-8 4 2 7 6 9
-3 8 6 2 7 9
-7 6 1 9 5 9
-6 2 9 5 1 9
-4 7 8 2 5 4
-2 2 2 2 2 1
-6 4 8 9 7 2
-6 9 7 1 4 4
-4 9 6 8 1 6
-1 8 2 9 4 8
-4 5 9 7 8 2
-7 7 7 7 7 1
-2 1 9 8 7 3
-5 7 4 9 2 6
-9 1 6 7 2 5
-5 4 3 2 1 3
-9 5 3 8 4 9
-4 2 5 3 7 8
-""")
-
-OA_V23_L2_tbl=StringIO("""
-2 2 1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 1 1 1
-2 1 2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 2 1
-2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 1 2 2 1 2
-1 2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1 1 2 2
-1 2 1 1 2 1 2 2 2 1 2 1 2 2 1 2 1 1 1 2 2 2 1
-1 2 2 2 1 1 1 2 1 1 1 2 2 2 1 1 1 2 1 1 1 1 1
-2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 1 2 2 1
-1 1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2 2 1 2
-1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2 1 2 2 1
-1 1 2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1 2 2
-2 1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 2 1 1 1
-1 2 2 2 1 1 1 2 1 1 2 1 1 1 2 2 2 1 2 2 2 1 2
-1 2 1 2 2 2 1 1 1 2 1 2 1 2 2 2 1 1 1 2 1 2 2
-2 1 1 2 1 2 2 2 1 1 1 2 2 1 2 1 1 1 2 2 2 2 1
-1 1 2 1 2 2 2 1 1 1 1 1 2 1 2 2 2 1 1 1 1 1 1
-2 1 1 1 2 1 1 2 1 2 1 2 2 2 1 2 2 1 2 1 2 1 2
-2 2 2 1 1 1 2 1 1 2 2 2 2 1 1 1 2 1 1 2 1 2 2
-1 1 2 1 1 2 1 2 2 2 2 2 1 2 2 1 2 1 1 1 2 2 1
-2 1 1 2 1 2 2 2 1 1 2 1 1 2 1 2 2 2 1 1 1 2 2
-1 1 1 2 1 1 2 1 2 2 1 1 1 2 1 1 2 1 2 2 1 1 1
-2 1 2 2 2 1 1 1 2 1 2 1 2 2 2 1 1 1 2 1 1 2 2
-2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 1 1 1
-1 1 1 2 1 1 2 1 2 2 2 2 2 1 2 2 1 2 1 1 2 1 2
-2 2 2 2 2 2 2 2 2 2 1 1 1 1 1 1 1 1 1 1 2 1 2
-""")
-
-OA_V35_L2_tbl=StringIO("""
-1 1 1 1 2 2 2 1 1 1 1 1 2 1 2 1 2 2 2 2 2 2 2 2 2 2 1 2 2 1 1 1 2 1 1
-2 2 2 2 2 1 2 2 1 1 2 1 1 1 1 1 2 1 2 2 2 1 2 1 2 1 2 1 2 1 2 1 1 1 2
-1 1 2 2 1 2 2 2 2 1 1 1 1 1 2 1 1 2 2 2 1 1 1 2 1 1 2 2 1 2 2 1 2 2 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 2 1 2 2 2 2 2 1 2 1 1 1 1 1 2 1 1 1 2 1 2 1 2 2 2 2 2 1 1 1 2 1 2 1
-1 1 1 2 2 2 1 1 1 1 1 2 1 2 2 2 2 1 1 1 2 1 2 2 2 1 2 1 1 1 2 2 2 2 2
-2 1 1 1 2 1 2 2 1 2 1 2 2 2 1 2 1 2 1 2 1 1 1 2 2 1 1 1 2 2 2 1 2 1 2
-2 1 2 1 1 2 1 2 2 2 1 2 1 1 2 1 2 2 1 2 1 2 2 1 2 1 1 1 2 1 2 2 1 2 1
-2 2 2 1 2 2 1 1 2 2 2 1 1 2 2 2 1 1 2 2 2 1 1 2 1 1 1 1 2 1 1 1 2 2 1
-1 2 1 2 2 2 1 2 2 2 1 1 2 2 1 1 2 2 2 1 1 1 2 2 1 1 2 1 2 2 1 2 1 1 1
-2 1 1 2 2 2 2 1 2 2 2 2 1 2 2 1 2 1 2 1 1 2 1 1 2 1 1 2 1 2 1 1 1 1 2
-1 2 1 2 1 2 1 1 2 1 2 1 2 2 2 2 1 2 1 2 1 2 1 1 2 2 2 1 2 1 2 1 1 1 2
-2 2 2 1 2 2 1 1 2 1 1 2 1 1 1 1 1 2 1 1 2 1 1 1 2 2 2 2 2 2 1 2 2 1 2
-1 1 2 2 2 1 1 1 1 2 2 2 2 1 2 1 1 1 1 2 2 2 1 2 1 1 2 2 2 2 2 2 1 1 1
-2 1 2 1 1 2 1 2 1 2 1 1 2 2 2 2 1 1 2 1 2 1 2 1 2 2 2 2 1 2 2 1 1 1 1
-2 1 2 2 2 1 2 1 2 2 1 1 2 2 1 1 2 2 1 1 2 2 1 1 1 2 2 1 1 1 2 1 2 2 1
-1 1 1 1 2 1 1 2 2 1 1 1 1 2 1 2 2 1 2 2 2 2 1 1 1 2 1 2 2 2 2 2 1 2 2
-2 1 2 1 1 2 1 2 1 1 2 2 2 2 1 1 2 1 2 2 1 2 1 2 1 2 2 1 1 1 1 2 2 1 2
-2 1 1 2 1 1 1 1 2 2 2 1 2 1 1 1 1 1 2 1 1 1 2 2 2 2 1 2 2 1 2 2 2 2 2
-1 2 1 1 1 1 1 2 2 2 2 2 1 1 1 2 2 2 2 1 2 2 1 2 2 1 2 2 1 1 2 1 2 1 1
-1 2 2 2 1 1 1 1 1 2 1 2 1 2 1 1 1 2 2 2 2 2 2 2 2 2 1 1 1 2 1 1 1 2 2
-2 1 1 2 2 1 1 2 1 1 2 2 1 1 2 2 1 2 2 1 1 2 2 1 1 2 2 1 2 2 1 1 2 2 1
-2 2 1 1 1 1 2 2 2 1 1 2 2 2 2 1 1 1 1 1 2 2 2 2 1 1 2 2 2 1 1 1 1 2 2
-2 2 2 1 2 2 1 1 1 1 2 1 2 1 1 2 2 2 1 1 1 2 2 2 1 1 1 2 1 2 2 1 1 2 2
-1 1 2 2 1 2 2 2 2 1 2 2 2 1 1 2 2 1 1 1 2 1 1 2 2 2 1 1 2 2 1 1 1 2 1
-2 2 1 2 1 2 2 1 2 1 1 2 2 1 1 2 1 1 2 2 2 2 2 1 1 1 1 1 1 2 2 2 2 1 1
-1 2 2 1 2 1 2 2 2 1 2 1 1 2 2 1 1 1 1 1 1 2 2 2 2 2 1 1 1 2 2 2 2 1 1
-2 2 2 2 1 1 2 1 1 1 1 2 1 2 2 2 2 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 1 1 1
-1 2 1 1 1 2 2 1 1 2 2 2 1 2 1 1 2 1 1 2 1 1 2 1 1 2 2 2 2 2 2 1 2 2 1
-2 2 1 2 1 1 1 2 1 1 2 1 2 2 2 1 2 2 1 2 2 1 1 1 2 1 1 2 1 2 1 2 2 2 1
-1 2 2 2 2 1 1 2 2 2 1 2 2 1 2 2 2 1 1 2 1 1 2 1 1 2 1 2 1 1 1 1 2 1 2
-1 2 2 1 1 1 2 1 1 2 1 1 2 1 2 2 2 1 2 1 1 2 1 1 2 1 2 1 2 2 1 2 2 2 2
-2 1 1 1 1 1 2 1 2 2 2 1 1 1 2 2 2 2 1 2 2 1 2 2 1 2 2 1 1 2 1 2 1 1 2
-1 2 1 1 2 2 2 2 1 2 2 2 2 1 2 1 1 2 2 1 2 1 1 1 1 2 1 1 1 1 2 2 1 2 2
-1 1 2 2 1 2 2 2 1 2 2 1 1 2 1 2 1 2 1 1 2 2 2 1 1 1 1 2 2 1 1 2 2 1 2
-1 1 2 1 2 1 2 1 2 1 2 2 2 2 1 2 1 2 2 2 1 1 2 1 2 1 2 2 1 1 1 2 1 2 1
-""")
-
-OA_V14_L2_tbl=StringIO("""
-2 2 1 1 2 2 1 1 1 2 1 2 2 1
-1 2 2 1 1 1 2 2 1 2 1 2 1 2
-1 2 2 1 2 2 1 2 2 1 2 2 1 1
-1 1 1 2 1 2 2 2 1 1 2 2 2 1
-2 2 1 2 1 2 1 2 2 1 1 1 1 2
-2 1 2 1 1 1 1 2 2 2 2 1 2 1
-2 1 2 2 1 2 2 1 2 2 1 2 1 1
-1 1 1 2 2 1 1 2 2 2 1 2 2 2
-2 2 1 2 2 1 2 2 1 2 2 1 1 1
-1 2 2 2 1 2 1 1 1 2 2 1 2 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1
-2 2 1 1 1 1 2 1 2 1 2 2 2 2
-2 1 2 2 2 1 1 1 1 1 2 2 1 2
-1 1 1 1 2 2 2 1 2 2 2 1 1 2
-2 1 2 1 2 2 2 2 1 1 1 1 2 2
-1 2 2 2 2 1 2 1 2 1 1 1 2 1
-""")
-
-OA_V40_L2_tbl=StringIO("""
-1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1
-1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1
-2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2
-2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2
-1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2
-1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2
-2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2
-1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2
-2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2
-1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2
-2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1
-2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1
-2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2
-1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2
-2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1
-1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2
-1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1
-2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1
-2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2
-1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2
-2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2
-1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1
-2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1
-2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1
-1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1
-2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1
-1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1
-1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1
-1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2
-2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1
-1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2
-2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2
-2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2
-2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2
-2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2
-1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1
-1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1
-1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1
-1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2
-1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2
-2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1
-2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1
-1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1 2 1 1 2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1
-2 2 2 1 2 2 2 2 2 1 1 1 2 1 2 2 2 1 1 1 1 1 2 1 1 1 2 2 1 2 1 2 2 1 1 2 1 1 2 1
-""")
-
-OA_V1_L3_tbl=StringIO("""
-1
-2
-3
-""")
-
-OA_V8_L7_tbl=StringIO("""
-2 6 3 7 4 1 5 5
-3 7 4 1 5 2 6 5
-5 5 5 5 5 5 5 1
-7 5 3 1 6 4 2 6
-3 4 5 6 7 1 2 2
-4 2 7 5 3 1 6 6
-7 6 5 4 3 2 1 7
-6 4 2 7 5 3 1 6
-5 6 7 1 2 3 4 2
-5 3 1 6 4 2 7 6
-6 5 4 3 2 1 7 7
-3 5 7 2 4 6 1 3
-5 1 4 7 3 6 2 4
-5 7 2 4 6 1 3 3
-3 2 1 7 6 5 4 7
-5 2 6 3 7 4 1 5
-4 7 3 6 2 5 1 4
-4 4 4 4 4 4 4 1
-7 1 2 3 4 5 6 2
-6 3 7 4 1 5 2 5
-1 1 1 1 1 1 1 1
-2 2 2 2 2 2 2 1
-1 6 4 2 7 5 3 6
-1 3 5 7 2 4 6 3
-2 3 4 5 6 7 1 2
-7 4 1 5 2 6 3 5
-2 1 7 6 5 4 3 7
-1 7 6 5 4 3 2 7
-6 2 5 1 4 7 3 4
-6 1 3 5 7 2 4 3
-7 7 7 7 7 7 7 1
-4 5 6 7 1 2 3 2
-2 4 6 1 3 5 7 3
-3 6 2 5 1 4 7 4
-4 1 5 2 6 3 7 5
-1 5 2 6 3 7 4 5
-2 5 1 4 7 3 6 4
-3 3 3 3 3 3 3 1
-1 4 7 3 6 2 5 4
-7 3 6 2 5 1 4 4
-1 2 3 4 5 6 7 2
-7 2 4 6 1 3 5 3
-6 6 6 6 6 6 6 1
-6 7 1 2 3 4 5 2
-4 3 2 1 7 6 5 7
-3 1 6 4 2 7 5 6
-4 6 1 3 5 7 2 3
-5 4 3 2 1 7 6 7
-2 7 5 3 1 6 4 6
-""")
-
-OA_V8_L3_tbl=StringIO("""
-2 2 2 1 1 1 3 3
-1 2 3 2 3 1 3 1
-1 3 2 1 3 2 1 3
-3 3 3 1 1 1 2 2
-1 3 2 2 1 3 3 2
-3 1 2 2 3 1 1 2
-2 3 1 2 3 1 2 3
-2 3 1 1 2 3 3 1
-3 3 3 3 3 3 3 3
-3 1 2 3 1 2 3 1
-3 2 1 3 2 1 3 2
-3 2 1 1 3 2 2 1
-1 2 3 1 2 3 1 2
-1 1 1 3 3 3 2 2
-2 3 1 3 1 2 1 2
-1 1 1 2 2 2 3 3
-2 1 3 2 1 3 2 1
-1 2 3 3 1 2 2 3
-2 2 2 2 2 2 2 2
-1 3 2 3 2 1 2 1
-2 2 2 3 3 3 1 1
-3 2 1 2 1 3 1 3
-3 1 2 1 2 3 2 3
-1 1 1 1 1 1 1 1
-3 3 3 2 2 2 1 1
-2 1 3 1 3 2 3 2
-2 1 3 3 2 1 1 3
-""")
-
-OA_V7_L5_tbl=StringIO("""
-2 4 1 3 5 3 5
-2 4 2 1 1 5 4
-4 5 1 2 3 3 4
-1 2 4 2 1 3 5
-5 4 3 2 1 4 3
-1 3 5 2 4 2 4
-3 1 5 5 1 3 4
-1 4 3 3 4 1 2
-1 3 1 5 5 4 3
-4 3 2 1 5 3 2
-3 4 1 4 3 5 2
-2 3 5 3 2 4 1
-2 2 3 5 3 4 4
-1 1 1 1 1 1 1
-2 3 4 5 1 1 2
-4 3 3 4 1 2 5
-4 4 5 2 5 1 1
-3 1 4 2 5 4 2
-3 2 1 5 4 2 1
-2 5 4 4 5 2 3
-4 1 3 5 2 5 2
-1 5 4 3 2 5 4
-3 3 3 3 3 3 3
-3 3 4 1 4 5 5
-5 5 1 3 1 2 2
-3 4 5 1 2 2 3
-1 5 5 1 3 4 2
-5 3 1 4 2 1 4
-2 1 1 2 4 5 3
-3 5 3 2 2 1 5
-5 2 5 4 4 3 2
-2 5 3 1 4 3 1
-4 2 5 3 1 5 3
-3 2 2 3 5 1 4
-4 5 2 5 4 1 3
-4 4 4 4 4 4 4
-2 2 2 2 2 2 2
-5 4 4 5 2 3 1
-5 3 2 2 3 5 1
-5 5 5 5 5 5 5
-3 5 2 4 1 4 1
-1 4 2 5 3 2 5
-1 2 3 4 5 5 1
-5 1 2 3 4 4 5
-5 2 4 1 3 1 3
-4 1 4 3 3 2 1
-1 1 2 4 2 3 3
-5 1 3 1 5 2 4
-4 2 1 1 2 4 5
-2 1 5 4 3 1 5
-""")
-
-OA_V16_L2_tbl=StringIO("""
-2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1
-1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2
-2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2
-1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2
-2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1
-2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2
-1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1
-1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2
-2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2
-1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2
-1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1
-2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1
-1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1
-1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1
-2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2
-2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1
-1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1
-2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1
-1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2
-2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2
-""")
-
-OA_V37_L2_tbl=StringIO("""
-2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2
-2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1
-2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1
-2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2
-2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 2
-2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 2
-1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 2
-2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2
-1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2
-2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1
-2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 2
-1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1
-1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 2
-2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 2
-1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 1
-1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2
-1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1
-2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 2
-1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 2
-2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1
-2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1
-2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 1
-2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1
-1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2
-1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1
-2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1
-1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1
-1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1
-1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1
-2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2
-2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1
-1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 1
-1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2
-1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2
-2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2
-2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1
-1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 2
-1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1
-""")
-
-OA_V1_L4_tbl=StringIO("""
-1
-2
-3
-4
-""")
-
-OA_V4_L7_tbl=StringIO("""
-5 5 5 5
-1 2 3 4
-2 3 4 5
-4 4 4 4
-5 4 3 2
-7 1 2 3
-4 5 6 7
-3 2 1 7
-4 6 1 3
-2 1 7 6
-6 1 3 5
-6 6 6 6
-1 1 1 1
-3 3 3 3
-4 7 3 6
-6 4 2 7
-6 2 5 1
-6 3 7 4
-7 6 5 4
-7 5 3 1
-2 5 1 4
-4 2 7 5
-5 3 1 6
-3 7 4 1
-1 4 7 3
-7 7 7 7
-1 7 6 5
-3 5 7 2
-3 4 5 6
-4 1 5 2
-3 1 6 4
-7 4 1 5
-2 6 3 7
-5 6 7 1
-1 5 2 6
-7 3 6 2
-2 2 2 2
-5 1 4 7
-3 6 2 5
-2 7 5 3
-6 7 1 2
-5 2 6 3
-6 5 4 3
-4 3 2 1
-2 4 6 1
-5 7 2 4
-7 2 4 6
-1 6 4 2
-1 3 5 7
-""")
-
-OA_V2_L5_tbl=StringIO("""
-1 4
-3 3
-4 5
-5 3
-3 1
-3 5
-3 4
-2 5
-3 2
-5 2
-1 5
-1 3
-4 3
-5 1
-4 1
-4 4
-2 2
-2 1
-2 4
-2 3
-5 4
-4 2
-1 1
-1 2
-5 5
-""")
-
-OA_V1_L2_tbl=StringIO("""
-1
-2
-""")
-
-OA_V4_L3_tbl=StringIO("""
-2 3 1 2
-1 2 3 2
-1 1 1 1
-3 1 2 2
-2 1 3 3
-3 2 1 3
-1 3 2 3
-3 3 3 1
-2 2 2 1
-""")
-
-OA_V5_L3_tbl=StringIO("""
-3 1 2 3 1
-3 3 3 3 3
-2 3 2 1 1
-1 2 1 3 3
-2 1 1 3 2
-1 3 2 3 2
-3 3 1 1 2
-2 2 2 2 2
-1 2 3 1 2
-1 1 2 2 3
-3 2 2 1 3
-3 1 3 2 2
-1 1 1 1 1
-3 2 1 2 1
-2 3 1 2 3
-2 1 3 1 3
-1 3 3 2 1
-2 2 3 3 1
-""")
-
-OA_V3_L8_tbl=StringIO("""
-2 5 8
-8 5 4
-6 1 5
-1 8 7
-4 2 4
-8 1 3
-8 2 2
-6 6 7
-7 4 4
-1 6 2
-2 1 7
-4 4 5
-8 6 1
-8 3 6
-2 4 3
-3 6 8
-1 5 3
-3 7 4
-1 2 1
-5 7 8
-6 3 4
-5 6 4
-4 6 3
-7 5 7
-6 8 2
-4 3 8
-2 3 2
-8 7 5
-4 1 1
-7 6 6
-7 7 2
-4 8 6
-3 4 2
-5 8 5
-5 2 3
-2 2 6
-7 1 8
-1 3 5
-1 4 8
-8 4 7
-6 5 6
-4 7 7
-7 2 5
-8 8 8
-5 5 1
-6 4 1
-2 7 1
-1 7 6
-3 1 6
-7 3 1
-1 1 4
-2 8 4
-4 5 2
-6 7 3
-3 3 3
-5 1 2
-6 2 8
-7 8 3
-5 3 7
-3 5 5
-3 8 1
-3 2 7
-5 4 6
-2 6 5
-""")
-
-OA_V4_L5_tbl=StringIO("""
-5 4 3 2
-2 5 3 1
-5 2 4 1
-3 3 3 3
-5 5 5 5
-2 1 5 4
-3 4 5 1
-2 4 1 3
-3 5 2 4
-4 1 3 5
-1 3 5 2
-1 2 3 4
-1 1 1 1
-5 1 2 3
-2 2 2 2
-1 5 4 3
-4 5 1 2
-5 3 1 4
-1 4 2 5
-3 2 1 5
-4 2 5 3
-3 1 4 2
-2 3 4 5
-4 3 2 1
-4 4 4 4
-""")
-
-OA_V6_L2_tbl=StringIO("""
-2 1 2 1 1 2
-2 2 1 1 2 1
-2 1 1 2 2 2
-1 1 2 2 2 1
-1 2 2 1 2 2
-2 2 2 2 1 1
-1 2 1 2 1 2
-1 1 1 1 1 1
-""")
-
-OA_V6_L6_tbl=StringIO("""
-3 4 2 2 4 6
-6 5 1 2 6 4
-4 6 6 4 3 5
-4 6 1 5 2 3
-6 5 4 1 3 6
-6 6 1 3 4 2
-5 1 1 5 4 6
-5 5 5 5 5 5
-1 3 4 2 5 6
-1 1 2 4 5 3
-4 5 2 1 6 3
-2 5 1 6 1 6
-6 3 5 4 5 4
-1 4 1 3 3 4
-3 4 1 6 5 2
-3 3 4 6 1 5
-1 5 4 5 2 2
-4 2 6 3 1 6
-1 2 5 4 3 6
-6 4 2 5 3 2
-2 6 4 1 5 4
-6 2 3 1 4 5
-5 2 4 3 4 3
-6 2 2 6 5 1
-5 4 3 6 2 5
-1 3 3 1 6 2
-6 6 6 6 6 6
-3 1 5 2 6 5
-5 3 1 4 2 1
-4 1 3 2 3 2
-3 1 6 1 4 4
-6 4 3 4 1 1
-1 4 6 5 6 5
-2 6 5 6 3 3
-3 5 6 4 1 2
-4 1 4 6 6 1
-3 6 3 5 5 6
-2 1 6 3 5 2
-2 4 5 3 6 1
-2 3 6 5 4 1
-4 4 4 4 4 4
-3 3 3 3 3 3
-6 1 4 3 2 5
-6 3 6 2 2 3
-4 3 5 6 4 2
-5 5 6 2 3 1
-5 4 6 1 5 3
-3 2 4 5 3 1
-4 5 3 3 5 1
-2 2 2 2 2 2
-2 5 2 4 4 5
-1 2 6 6 2 4
-3 2 1 4 6 3
-1 6 5 2 4 1
-6 1 5 5 1 3
-2 3 1 1 3 5
-5 3 2 3 6 6
-1 1 1 1 1 1
-4 2 1 2 5 5
-3 6 2 1 2 1
-1 5 3 6 4 3
-5 1 2 6 3 4
-2 1 3 4 2 6
-2 2 3 5 6 4
-1 6 2 3 1 5
-3 5 5 3 2 4
-5 6 4 4 6 2
-2 4 4 2 1 3
-4 3 2 5 1 4
-5 6 3 2 1 4
-5 2 5 1 1 2
-4 4 5 1 2 6
-""")
-
-OA_V8_L9_tbl=StringIO("""
-9 7 1 4 5 8 2 4
-5 3 8 4 2 7 6 9
-1 7 3 5 2 4 9 6
-4 1 6 8 5 7 3 6
-6 2 1 3 8 7 9 3
-2 5 3 7 1 8 6 8
-5 9 7 8 3 1 2 2
-2 4 8 3 5 9 1 5
-2 1 7 4 6 3 9 7
-9 9 9 9 9 9 9 1
-3 1 4 7 8 2 5 4
-9 6 8 1 7 3 5 6
-8 8 8 8 8 8 8 1
-5 5 5 5 5 5 5 1
-5 4 1 7 9 6 3 7
-7 6 5 4 3 2 1 3
-1 2 5 8 9 3 6 4
-3 8 7 9 5 4 6 3
-1 4 2 9 3 7 5 8
-8 2 9 4 7 5 3 8
-2 9 5 1 8 4 3 9
-3 9 2 4 1 6 8 6
-3 4 5 6 7 8 9 2
-9 3 7 5 8 6 1 8
-8 3 1 2 6 4 5 2
-3 3 3 3 3 3 3 1
-4 5 8 2 3 6 9 4
-6 6 6 6 6 6 6 1
-1 3 9 6 5 2 8 7
-4 7 5 3 6 1 8 8
-1 5 6 4 8 9 7 2
-8 1 5 9 2 6 7 5
-9 4 3 8 6 2 7 9
-9 5 4 6 2 1 3 3
-9 2 6 7 3 4 8 5
-6 3 5 7 4 9 2 6
-6 9 4 2 5 3 7 8
-4 2 7 6 1 9 5 9
-6 1 9 5 3 8 4 9
-8 5 7 3 9 2 4 6
-4 8 9 7 2 3 1 2
-3 6 1 8 2 9 4 8
-5 6 9 3 1 4 7 4
-6 4 7 1 2 5 8 4
-9 8 5 2 1 7 4 7
-8 6 2 7 5 1 9 9
-1 1 1 1 1 1 1 1
-5 1 3 2 7 9 8 3
-1 9 8 7 6 5 4 3
-2 7 9 8 4 6 5 3
-4 3 2 1 9 8 7 3
-8 7 4 1 3 9 6 7
-2 8 1 6 3 5 7 6
-5 8 6 1 4 2 9 8
-3 7 6 2 9 5 1 9
-4 9 1 5 7 2 6 5
-7 8 2 5 6 9 3 4
-3 2 8 5 4 1 7 7
-7 9 6 3 2 8 5 7
-1 8 4 3 7 6 2 9
-7 3 4 8 1 5 9 5
-2 2 2 2 2 2 2 1
-9 1 2 3 4 5 6 2
-8 9 3 6 4 7 1 4
-4 6 3 9 8 5 2 7
-6 5 2 8 7 4 1 7
-3 5 9 1 6 7 2 5
-6 8 3 4 9 1 5 5
-7 1 8 6 9 4 2 8
-4 4 4 4 4 4 4 1
-6 7 8 9 1 2 3 2
-5 2 4 9 6 8 1 6
-1 6 7 2 4 8 3 5
-2 6 4 5 9 7 8 2
-8 4 6 5 1 3 2 3
-2 3 6 9 7 1 4 4
-5 7 2 6 8 3 4 5
-7 4 9 2 8 1 6 6
-7 2 3 1 5 6 4 2
-7 7 7 7 7 7 7 1
-7 5 1 9 4 3 8 9
-""")
-
-OA_V10_L5_tbl=StringIO("""
-1 5 4 3 2 5 4 3 2 1
-1 3 1 5 5 4 3 4 2 2
-1 4 3 3 4 1 2 5 5 2
-4 1 4 3 3 2 1 2 5 5
-1 5 5 1 3 4 2 2 4 3
-4 1 3 5 2 5 2 4 1 3
-2 3 4 5 1 1 2 3 4 5
-4 2 5 3 1 5 3 1 4 2
-1 3 5 2 4 2 4 1 3 5
-4 4 5 2 5 1 1 3 2 3
-1 4 2 5 3 2 5 3 1 4
-3 4 1 4 3 5 2 1 2 5
-3 1 5 5 1 3 4 2 2 4
-4 5 1 2 3 3 4 5 1 2
-4 5 2 5 4 1 3 2 3 1
-1 1 1 1 1 1 1 1 1 1
-5 4 3 2 1 4 3 2 1 5
-3 5 2 4 1 4 1 3 5 2
-2 2 2 2 2 2 2 2 2 2
-5 1 2 3 4 4 5 1 2 3
-4 2 1 1 2 4 5 3 3 5
-2 3 5 3 2 4 1 5 1 4
-3 3 4 1 4 5 5 2 1 2
-3 1 4 2 5 4 2 5 3 1
-2 4 2 1 1 5 4 5 3 3
-3 2 1 5 4 2 1 5 4 3
-2 4 1 3 5 3 5 2 4 1
-5 1 3 1 5 2 4 3 4 2
-4 4 4 4 4 4 4 4 4 4
-5 5 1 3 1 2 2 4 3 4
-2 5 4 4 5 2 3 1 1 3
-3 4 5 1 2 2 3 4 5 1
-2 1 5 4 3 1 5 4 3 2
-3 5 3 2 2 1 5 1 4 4
-2 1 1 2 4 5 3 3 5 4
-1 1 2 4 2 3 3 5 4 5
-5 2 5 4 4 3 2 3 1 1
-4 3 3 4 1 2 5 5 2 1
-2 5 3 1 4 3 1 4 2 5
-3 3 3 3 3 3 3 3 3 3
-5 4 4 5 2 3 1 1 3 2
-5 2 4 1 3 1 3 5 2 4
-3 2 2 3 5 1 4 4 1 5
-5 5 5 5 5 5 5 5 5 5
-4 3 2 1 5 3 2 1 5 4
-2 2 3 5 3 4 4 1 5 1
-5 3 2 2 3 5 1 4 4 1
-1 2 4 2 1 3 5 4 5 3
-5 3 1 4 2 1 4 2 5 3
-1 2 3 4 5 5 1 2 3 4
-""")
-
-OA_V4_L4_tbl=StringIO("""
-1 1 1 1
-2 2 2 2
-4 2 1 3
-1 3 4 2
-1 4 2 3
-3 2 4 1
-1 2 3 4
-2 4 3 1
-4 4 4 4
-4 3 2 1
-3 4 1 2
-3 3 3 3
-2 1 4 3
-2 3 1 4
-3 1 2 4
-4 1 3 2
-""")
-
-OA_V39_L2_tbl=StringIO("""
-1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 1 1
-2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 2 1
-1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 2 2
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 2 2
-1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 1
-2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1
-2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2
-1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 2 1 2
-2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 2 1
-2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 1 1
-2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 2 1 2
-1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 1
-2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 2 1 2
-2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 2 1 2
-1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 2 1 2
-1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 1 1 1
-1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 2 2
-2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 2 1
-2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 2 1
-1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1
-2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 1 1 1
-2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 1 1 1
-1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 2 1 2
-2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 2 1 2
-1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 1
-2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 2
-2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 1 1 1
-1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 2 1 2
-1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 2 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 2 1 2
-1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 1 1 1
-2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 2
-2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 1 2 1 1 2 2 2 2 1 2 1 2 1 1 1 1 2 2 2 1 2
-1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 2 2
-2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 2 2 1
-1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 2 1
-2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 1 2 2
-2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2
-1 1 2 1 2 1 2 2 2 2 1 1 2 2 1 2 2 1 2 2 1 2 1 2 1 1 1 1 2 2 1 1 2 1 1 2 2 2 1
-1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 1 2 2 2 2 1 1 2 2 1 2 2 1 1 1 1 2 1 1 1 1
-1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2 2 1 2 2 1 1 1 1 2 1 2 1 2 2 2 2 1 2 2
-""")
+All the tables are pre-parsed and stored in two NumPy files under resources/oa_table
+  - oatable.npy: a single uint8 blob of all OA tables (row-major, levels start from 0)
+  - oatable_index.npy: an int32 index where each row is (n_var, depth, offset, run)
+Both files are memory-mapped on the first lookup, so importing this module is cheap.
+OAs missing from the tables are constructed by oaconstruct module and cached on disk.
+"""
 
+import os
+from bisect import bisect_left
+import numpy as np
+from environ import EnvOaTable
+from oaconstruct import OrthogonalArrayGenerator
+
+OA_TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'oa_table')
+OA_BLOB_FILENAME = 'oatable.npy'
+OA_INDEX_FILENAME = 'oatable_index.npy'
+
+#------------------------------------------------------
+class OrthogonalArrayStore(object):
+  ''' Read-only store of pre-parsed OA tables.
+        - dirname: directory where the blob and its index are located
+        - generator: OA generator (e.g. oaconstruct.OrthogonalArrayGenerator) 
+                     for the OAs missing from the tables
+  '''
+  def __init__(self, dirname=OA_TABLE_DIR, generator=None):
+    self._blob = np.load(os.path.join(dirname, OA_BLOB_FILENAME), mmap_mode='r')
+    index = np.load(os.path.join(dirname, OA_INDEX_FILENAME))
+    # (n_var, depth) -> (offset, run)
+    self._index = dict([ ((int(v), int(l)), (int(o), int(r))) for v, l, o, r in index ])
+    self._generator = generator
+    self._blocks = {} # (n_var, start, stop) -> (depths, running max of runs) of a contiguous depth block
+
+  def keys(self): # list of (n_var, depth) in the tables
+    return sorted(self._index.keys())
+
+  def has_table(self, n_var, depth): # test if OA exists in the tables
+    return (n_var, depth) in self._index
+
+  def has(self, n_var, depth): # test if OA exists for given # of vars, OA depth
+    return self.get_run(n_var, depth) > 0
+
+  def get_run(self, n_var, depth): # number of runs (rows) of OA if exists, else 0
+    if (n_var, depth) in self._index:
+      return self._index[(n_var, depth)][1]
+    return self._generator.get_run(n_var, depth) if self._generator else 0
+
+  def _get_block(self, n_var, start, stop):
+    ''' return depths of the contiguous block [start, start+1, ..., stop) of existing OAs 
+        and the running maximum of their runs, which is non-decreasing for bisection
+    '''
+    key = (n_var, start, stop)
+    if key not in self._blocks:
+      depths = []
+      runs = []
+      for d in range(start, stop):
+        run = self.get_run(n_var, d)
+        if run == 0:
+          break
+        depths.append(d)
+        runs.append(max(runs[-1], run) if runs else run)
+      self._blocks[key] = (depths, runs)
+    return self._blocks[key]
+
+  def last_depth(self, n_var, start, stop):
+    ''' return the largest depth d (< stop) such that OAs of depth start..d all exist, 
+        else None if OA of depth start does not exist
+    '''
+    depths = self._get_block(n_var, start, stop)[0]
+    return depths[-1] if depths else None
+
+  def find_depth(self, n_var, min_run, start, stop):
+    ''' return the smallest depth d in [start, stop) whose OA has at least min_run runs,
+        searching only the contiguous block of existing OAs from start. None if not found.
+    '''
+    depths, runs = self._get_block(n_var, start, stop)
+    i = bisect_left(runs, min_run)
+    return depths[i] if i < len(runs) else None
+
+  def lookup(self, n_var, depth):
+    ''' return a read-only (run x n_var) view of the OA if exists, else None '''
+    try:
+      offset, run = self._index[(n_var, depth)]
+    except KeyError:
+      return self._generator.lookup(n_var, depth) if self._generator else None
+    return self._blob[offset:offset+run*n_var].reshape(run, n_var).view(np.ndarray)
+
+_store = None
+
+def get_store():
+  ''' return the OA store, which is loaded on the first call '''
+  global _store
+  if _store is None:
+    _store = OrthogonalArrayStore(generator=OrthogonalArrayGenerator(EnvOaTable().oa_cache_dir))
+  return _store
+
+def get_run(n_var, depth):
+  ''' return the number of runs of OA for given # of vars, OA depth if exists, else 0 '''
+  return get_store().get_run(n_var, depth)
+
+def find_depth(n_var, min_run, start, stop):
+  ''' return the smallest OA depth in [start, stop) having at least min_run runs, else None '''
+  return get_store().find_depth(n_var, min_run, start, stop)
+
+def last_depth(n_var, start, stop):
+  ''' return the largest depth d < stop where OAs of depth from start to d all exist '''
+  return get_store().last_depth(n_var, start, stop)
+
+def has_table(n_var, depth):
+  ''' test if OA for given # of vars, OA depth exists in the tables '''
+  return get_store().has_table(n_var, depth)
+
+def lookup(n_var, depth):
+  ''' return a read-only OA view for given # of vars, OA depth if exists, else None '''
+  return get_store().lookup(n_var, depth)
+
+def build_store(tables, dirname=OA_TABLE_DIR):
+  ''' build the OA blob and its index from tables
+        - tables: a dict of {(n_var, depth): 2D array of OA with levels starting from 1}
+  '''
+  blob = []
+  index = []
+  offset = 0
+  for (n_var, depth) in sorted(tables.keys()):
+    table = np.asarray(tables[(n_var, depth)], dtype=int).reshape(-1, n_var) - 1
+    assert table.min() >= 0 and table.max() < min(depth, 256), 'Invalid OA table (V%d, L%d)' % (n_var, depth)
+    blob.append(table.astype(np.uint8).ravel())
+    index.append((n_var, depth, offset, table.shape[0]))
+    offset += table.size
+  np.save(os.path.join(dirname, OA_BLOB_FILENAME), np.concatenate(blob))
+  np.save(os.path.join(dirname, OA_INDEX_FILENAME), np.array(index, dtype=np.int32))
@@ -0,0 +1,272 @@
+__doc__ = """
+Ordinary least squares (OLS) of linear models on the same samples.
+
+This computes the same estimates and statistics as statsmodels' OLS with the
+default (pinv) method, but without patsy formula parsing and design matrix
+construction for every fit:
+
+  - A formula is parsed to its terms, i.e. variables, their powers (I(x**n))
+    and interactions (x:y), whose names and order are the same as patsy's.
+  - A column of a term is computed once for all the models on the same data
+    (DesignMatrix), and the design matrix of a model is a subset of the columns.
+  - The pseudo-inverse of a design matrix is computed by SVD once for the same
+    subset of columns, so that the models of responses with the same terms
+    (e.g. of golden and revised models, or of the same model suggested again)
+    are fitted without another factorization (fit_ols).
+  - If samples are added over time (e.g. on-the-fly equivalence checking as
+    test vectors are simulated), IncrementalDesignMatrix keeps the triangular
+    factor R of the QR decomposition of the columns and a response, which is
+    updated with the new samples only, and models are fitted by SVD of the
+    columns of R instead of those of the design matrix.
+
+A formula with any other expression is not supported; see parse_formula().
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from scipy import stats
+from statsmodels.regression.linear_model import OLS
+
+INTERCEPT = 'Intercept'
+_VARIABLE = re.compile(r'^[A-Za-z_]\w*$')
+_POWER = re.compile(r'^I\(\s*([A-Za-z_]\w*)\s*\*\*\s*(\d+)\s*\)$')
+
+#------------------------------------------------------
+def parse_formula(formula):
+  ''' return a list of (term name, factors) of a formula without its response, e.g. 'a+I(b**2)+a:b' gives
+        [('Intercept', ()), ('a', (('a',1),)), ('I(b ** 2)', (('b',2),)), ('a:b', (('a',1),('b',1)))]
+      in the order of the columns of a design matrix built by patsy. A factor is (variable, power).
+      Return None if the formula has other than an intercept, variables, their powers and interactions.
+  '''
+  terms = [(INTERCEPT, ())]
+  seen = set()
+  for t in formula.split('+'):
+    t = t.strip()
+    if t == '1':
+      continue
+    names, factors = [], []
+    for f in t.split(':'):
+      f = f.strip()
+      m = _POWER.match(f)
+      if m:
+        name, factor = 'I(%s ** %s)' % m.groups(), (m.group(1), int(m.group(2)))
+      elif _VARIABLE.match(f):
+        name, factor = f, (f, 1)
+      else:
+        return None
+      if factor not in factors: # x:x is x
+        names.append(name)
+        factors.append(factor)
+    if frozenset(factors) not in seen: # the first of the same terms, e.g. x:y and y:x, is kept
+      seen.add(frozenset(factors))
+      terms.append((':'.join(names), tuple(factors)))
+  return terms
+
+#------------------------------------------------------
+class DesignMatrix(object):
+  ''' Columns of terms computed from data samples, which are shared by the models on the data
+        - data: a dict of {variable: samples}
+  '''
+  def __init__(self, data):
+    self._data = data
+    self._columns = {}
+    self._pinv = {} # terms -> (pseudo-inverse, diagonal of normalized covariance, rank)
+    self.nobs = len(data.values()[0]) if data else 0
+
+  def has_factors(self, factors):
+    ''' True if the variables of factors are in the data and numeric '''
+    return all([ self._get_column(((v, 1),)) is not None for v, n in factors ])
+
+  def get_matrix(self, terms):
+    ''' return a design matrix of terms, i.e. a list of (term name, factors) from parse_formula() '''
+    return np.column_stack([ self._get_column(factors) for name, factors in terms ])
+
+  def solve(self, terms, X, Y):
+    ''' return (params, diagonal of normalized covariance, rank) of the least squares of Y (columns of responses)
+        on X, the design matrix of terms, in the same way as statsmodels' OLS with pinv method.
+        The pseudo-inverse of X is computed once for the same terms.
+    '''
+    key = tuple([ frozenset(f) for n, f in terms ])
+    if key not in self._pinv:
+      u, s, vt = np.linalg.svd(X, 0)
+      s_inv = np.where(s > 1e-15*s.max(), 1.0/np.where(s > 0, s, 1.0), 0.0)
+      pinv = np.dot(vt.T, s_inv[:, np.newaxis]*u.T)
+      self._pinv[key] = (pinv, np.diag(np.dot(pinv, pinv.T)), np.linalg.matrix_rank(np.diag(s)))
+    pinv, ncov_diag, rank = self._pinv[key]
+    return np.dot(pinv, Y), ncov_diag, rank
+
+  def _get_column(self, factors):
+    key = frozenset(factors)
+    if key not in self._columns:
+      if not factors:
+        column = np.ones(self.nobs)
+      elif len(factors) > 1:
+        column = np.prod([ self._get_column((f,)) for f in factors ], axis=0)
+      elif factors[0][1] > 1:
+        column = self._get_column(((factors[0][0], 1),))**factors[0][1]
+      else:
+        column = np.asarray(self._data.get(factors[0][0], []))
+        column = column.astype(float) if column.dtype.kind in 'iuf' and len(column) == self.nobs else None # otherwise, patsy may treat it as categorical
+      self._columns[key] = column
+    return self._columns[key]
+
+#------------------------------------------------------
+class IncrementalDesignMatrix(DesignMatrix):
+  ''' DesignMatrix to which samples are appended.
+      A response y is fitted from R, the triangular factor of the QR decomposition of [X y], where X has the
+      columns of all the terms used so far. R is updated with the new samples only, i.e. by the QR of [R; X_new y_new],
+      which costs O(new samples*terms^2) instead of O(samples*terms^2) of SVD. Since X = QR, the columns of R of
+      the terms of a model have the same singular values as its design matrix, whose SVD gives the same params,
+      rank and statistics as DesignMatrix.solve() without squaring the condition number of X (cf. normal equations).
+      The factors of the responses fitted since the last append are kept, and found by their samples.
+        - data: a dict of {variable: samples} at first
+  '''
+  def __init__(self, data={}):
+    DesignMatrix.__init__(self, dict([ (k, list(v)) for k, v in data.items() ]))
+    self._keys = {} # term key -> column index of X in R
+    self._factors = [] # [samples of a response, R of [X y], used since the last append]
+
+  def append(self, data):
+    ''' append samples, i.e. a dict of {variable: new samples} '''
+    new = DesignMatrix(data)
+    if new.nobs == 0:
+      return
+    for key in [ k for k, c in self._columns.items() if c is not None ]:
+      self._columns[key] = np.concatenate((self._columns[key], new._get_column(tuple(key))))
+    for k, v in data.items():
+      self._data.setdefault(k, []).extend(v)
+    self.nobs += new.nobs
+    self._factors = [ [y, R, False] for y, R, used in self._factors if used ]
+
+  def solve(self, terms, X, Y):
+    ''' return (params, diagonal of normalized covariance, rank) of the least squares of Y on X, the design matrix of terms,
+        in the same way as DesignMatrix.solve() but from the factors of the responses.
+        The normalized covariance and rank are those from the factor of the first response.
+    '''
+    keys = [ frozenset(f) for n, f in terms ]
+    self._keys.update([ (k, len(self._keys)+i) for i, k in enumerate([ k for i, k in enumerate(keys) if k not in self._keys and k not in keys[:i] ]) ])
+    idx = [ self._keys[k] for k in keys ]
+    params = []
+    for i in range(Y.shape[1]):
+      R = self._get_factor(Y[:,i])
+      u, s, vt = np.linalg.svd(R[:,idx], 0)
+      s_inv = np.where(s > 1e-15*s.max(), 1.0/np.where(s > 0, s, 1.0), 0.0)
+      pinv = np.dot(vt.T, s_inv[:, np.newaxis]*u.T)
+      params.append(np.dot(pinv, R[:,-1]))
+      if i == 0:
+        ncov_diag, rank = np.diag(np.dot(pinv, pinv.T)), np.linalg.matrix_rank(np.diag(s))
+    return np.column_stack(params), ncov_diag, rank
+
+  def _get_factor(self, y): # R of [X y] for the samples of a response y, which is updated with the new samples or new columns
+    keys = sorted(self._keys, key=self._keys.get)
+    for factor in self._factors:
+      n = len(factor[0])
+      if factor[1].shape[1] == len(keys)+1 and np.array_equal(factor[0], y[:n]):
+        break
+    else:
+      factor, n = [y[:0], np.zeros((0, len(keys)+1)), False], 0
+      self._factors.append(factor)
+    if n < self.nobs:
+      X = np.column_stack([ self._get_column(tuple(k))[n:] for k in keys ] + [y[n:]])
+      factor[1] = np.linalg.qr(np.vstack((factor[1], X)), mode='r')
+      factor[0] = y.copy()
+    factor[2] = True
+    return factor[1]
+
+#------------------------------------------------------
+class OLSResult(object):
+  ''' Estimates and statistics of a linear model of a response,
+      whose attributes are named after those of statsmodels' results
+  '''
+  def __init__(self, response, formula, names, params, bse, tvalues, pvalues, df_resid, rsquared, rsquared_adj, fittedvalues, endog, exog):
+    self.response = response
+    self.formula = formula # '<response> ~ <terms>'
+    self.names = names # list of term names
+    self.params = params
+    self.bse = bse
+    self.tvalues = tvalues
+    self.pvalues = pvalues
+    self.df_resid = df_resid
+    self.rsquared = rsquared
+    self.rsquared_adj = rsquared_adj
+    self.fittedvalues = fittedvalues
+    self.resid = endog - fittedvalues
+    self.endog = endog
+    self.exog = exog # a dict of {term name: column}
+    self._summary = None
+
+  @classmethod
+  def from_statsmodels(cls, response, fit):
+    ''' wrap a result of statsmodels.formula.api.ols(...).fit() '''
+    data = fit.model.data
+    names = list(data.xnames)
+    exog = dict([ (n, data.orig_exog[n].values) for n in names ])
+    result = cls(response, fit.model.formula, names, fit.params.values, fit.bse.values, fit.tvalues.values, fit.pvalues.values,
+                 fit.df_resid, fit.rsquared, fit.rsquared_adj, np.asarray(fit.fittedvalues), np.asarray(data.orig_endog).ravel(), exog)
+    result.resid = fit.resid.values
+    result._summary = fit.summary
+    return result
+
+  def conf_int(self, alpha=0.05):
+    ''' return (lower, upper) bounds of the confidence interval (1-alpha) of the params '''
+    q = stats.t.ppf(1.0-alpha/2.0, self.df_resid)
+    return np.column_stack((self.params - q*self.bse, self.params + q*self.bse))
+
+  def predict(self):
+    ''' return the predicted response at the samples '''
+    return self.fittedvalues
+
+  def summary(self):
+    ''' return the statsmodels summary of this model, whose fit is repeated only for the summary '''
+    if self._summary is None:
+      X = pd.DataFrame(np.column_stack([ self.exog[n] for n in self.names ]), columns=self.names)
+      self._summary = OLS(pd.Series(self.endog, name=self.response), X).fit().summary
+    return self._summary()
+
+#------------------------------------------------------
+def fit_ols(design, data, formula):
+  ''' fit linear models of responses on a design matrix
+        - design: DesignMatrix of the samples
+        - data: a dict of {response: samples}
+        - formula: a dict of {response: terms without the response and '~'}
+      return a dict of {response: OLSResult}. A response is left out if its formula is not supported
+      or its samples are not finite, for which statsmodels should be used instead.
+  '''
+  groups = {} # term names -> (terms, responses)
+  for dv in sorted(formula.keys()):
+    terms = parse_formula(formula[dv])
+    if terms is None or not all([ design.has_factors(f) for n, f in terms ]):
+      continue
+    groups.setdefault(tuple([ n for n, f in terms ]), (terms, []))[1].append(dv)
+
+  result = {}
+  for terms, responses in groups.values():
+    X = design.get_matrix(terms)
+    Y = np.column_stack([ np.asarray(data[dv], dtype=float) for dv in responses ])
+    if not (np.isfinite(X).all() and np.isfinite(Y).all()): # statsmodels drops samples with NaN
+      continue
+    names = [ n for n, f in terms ]
+    exog = dict(zip(names, X.T))
+    result.update( _fit_group(X, Y, design.solve(terms, X, Y), names, responses, [ '%s ~ %s' % (dv, formula[dv]) for dv in responses ], exog) )
+  return result
+
+def _fit_group(X, Y, solution, names, responses, formulas, exog):
+  ''' statistics of the fits of responses (columns of Y) on X from DesignMatrix.solve() '''
+  params, ncov_diag, rank = solution
+  nobs = float(X.shape[0])
+  df_resid = np.float64(nobs - rank)
+  fitted = np.dot(X, params)
+  result = {}
+  with np.errstate(divide='ignore', invalid='ignore'):
+    for i, dv in enumerate(responses):
+      y, b = Y[:,i], params[:,i]
+      resid = y - fitted[:,i]
+      ssr = np.dot(resid, resid)
+      centered_tss = np.sum((y - np.mean(y))**2)
+      bse = np.sqrt(ncov_diag*(ssr/df_resid))
+      tvalues = b/bse
+      rsquared = 1.0 - ssr/centered_tss
+      result[dv] = OLSResult(dv, formulas[i], names, b, bse, tvalues, stats.t.sf(np.abs(tvalues), df_resid)*2,
+                             df_resid, rsquared, 1.0 - (nobs-1.0)/df_resid*(1.0-rsquared), fitted[:,i], y, exog)
+  return result
@@ -0,0 +1,109 @@
+__doc__ = """
+Runner of external processes such as simulators and post-processing routines.
+
+A process runs in its own directory (cwd) instead of changing the working
+directory of mProbo, and its stdout/stderr are streamed to a log file in that
+directory rather than being held in memory. The runner limits the number of
+processes running at once, kills a process which doesn't complete within its
+timeout, and kills all the running processes when it is cancelled
+(e.g. by a keyboard interrupt).
+
+Since a process is waited in the thread of a simulation job, a single mProbo
+process drives concurrent simulations with worker threads (see executor.py).
+"""
+
+import os
+import signal
+import subprocess
+import threading
+
+from dave.common.davelogger import DaVELogger
+from dave.mprobo.profiler import get_profiler
+import dave.mprobo.mchkmsg as mcode
+
+#------------------------------------------------------
+class ProcessRunner(object):
+  ''' Run shell commands with a concurrency limit, timeouts and cancellation
+        - max_process: maximum number of processes running at once, no limit if it is 0
+  '''
+  def __init__(self, max_process=0, logger_id='logger_id'):
+    self.configure(max_process, logger_id)
+    self._running = set() # running processes
+    self._lock = threading.Lock()
+    self._cancelled = threading.Event()
+
+  def configure(self, max_process=0, logger_id='logger_id'):
+    ''' set the concurrency limit and logger. This should be called before running any process '''
+    self._logger = DaVELogger.get_logger('%s.%s.%s' % (logger_id, __name__, self.__class__.__name__))
+    self._semaphore = threading.BoundedSemaphore(max_process) if max_process > 0 else None
+
+  def run(self, cmd, cwd, logfile, timeout=0, stage='process'):
+    ''' run a shell command in cwd while writing its stdout/stderr to logfile, and wait for it.
+        The process is killed if it doesn't complete in timeout seconds (no timeout if 0).
+        Return the return code of the process, or None if the runner is cancelled.
+        Launching the process is timed as a stage of <stage>_launch (see profiler.py).
+    '''
+    if self._semaphore:
+      self._semaphore.acquire()
+    try:
+      with self._lock:
+        if self._cancelled.is_set():
+          self._logger.debug(mcode.DEBUG_027 % cwd)
+          return None
+        with open(logfile, 'w') as f, get_profiler().stage('%s_launch' % stage):
+          # a new session so that the process and its children are killed at once
+          # close_fds so that a process doesn't hold files (e.g. log files) opened by other threads
+          p = subprocess.Popen(cmd, shell=True, cwd=cwd, stdout=f, stderr=subprocess.STDOUT, close_fds=True, preexec_fn=os.setsid)
+        self._running.add(p)
+      timer = None
+      if timeout > 0:
+        timer = threading.Timer(timeout, self._timeout, (p, cwd, timeout))
+        timer.daemon = True
+        timer.start()
+      try:
+        returncode = p.wait()
+      except: # e.g. keyboard interrupt while waiting in the main thread
+        self._kill(p)
+        raise
+      finally:
+        if timer:
+          timer.cancel()
+        with self._lock:
+          self._running.discard(p)
+      return None if self._cancelled.is_set() else returncode
+    finally:
+      if self._semaphore:
+        self._semaphore.release()
+
+  def cancel(self):
+    ''' kill all the running processes, and do not run any process afterwards '''
+    with self._lock:
+      self._cancelled.set()
+      running = list(self._running)
+    for p in running:
+      self._kill(p)
+
+  def is_cancelled(self):
+    return self._cancelled.is_set()
+
+  def _timeout(self, p, cwd, timeout):
+    self._logger.warn(mcode.WARN_030 % (os.path.relpath(cwd), timeout))
+    self._kill(p)
+
+  def _kill(self, p): # kill the process group of p
+    try:
+      os.killpg(p.pid, signal.SIGKILL)
+    except OSError: # already completed
+      pass
+
+def read_log(logfile): # content of a log file written by a process, '' if it doesn't exist
+  if not os.path.isfile(logfile):
+    return ''
+  with open(logfile, 'r') as f:
+    return f.read()
+
+_runner = ProcessRunner()
+
+def get_process_runner():
+  ''' return the process runner shared by all the simulations '''
+  return _runner
@@ -0,0 +1,153 @@
+__doc__ = """
+Per-stage timing of mProbo runs.
+
+A stage (e.g. a simulation of a vector) is timed by
+
+  with get_profiler().stage('simulation'):
+    ...
+
+which records its wall time and CPU time, tagged with the test, mode, model and
+vector set by get_profiler().context(...) in the thread running it. The stages are
+written to a trace file as soon as they complete, either in Chrome trace format
+(viewed with chrome://tracing or Perfetto) or in JSON lines if the file name
+ends with ".jsonl", and summarized by stage name at the end of a run.
+
+CPU time is that of the mProbo process (cpu) and of its waited child processes
+such as simulators (child_cpu) during a stage. Since stages run in threads
+concurrently, it may include the time spent by the other stages running at the
+same time. The profiler does nothing unless it is configured with a trace file.
+"""
+
+import os
+import json
+import time
+import threading
+import texttable
+from contextlib import contextmanager
+
+from dave.common.davelogger import DaVELogger
+import dave.mprobo.mchkmsg as mcode
+
+#------------------------------------------------------
+class Profiler(object):
+  ''' Record the wall/CPU time of stages to a trace file
+        - filename: trace file name, disabled if ''
+  '''
+  def __init__(self, filename='', logger_id='logger_id'):
+    self._trace = None
+    self.configure(filename, logger_id)
+
+  def configure(self, filename='', logger_id='logger_id'):
+    ''' set the trace file, which is (re)written from scratch '''
+    self.close()
+    self._logger = DaVELogger.get_logger('%s.%s.%s' % (logger_id, __name__, self.__class__.__name__))
+    self._filename = os.path.abspath(filename) if filename else ''
+    self._jsonl = self._filename.endswith('.jsonl')
+    self._stats = {} # stage name -> [count, wall, cpu, child_cpu]
+    self._threads = set() # threads whose names are written to a Chrome trace
+    self._local = threading.local()
+    self._lock = threading.Lock()
+    self._pid = os.getpid()
+    self._start = time.time()
+    if self._filename:
+      self._trace = open(self._filename, 'w')
+      self._first = True
+      if not self._jsonl:
+        self._trace.write('[\n')
+      self._logger.info(mcode.INFO_065 % self._filename)
+
+  def is_enabled(self):
+    return self._trace != None
+
+  @contextmanager
+  def context(self, **tags):
+    ''' tag the stages in this thread in the block, e.g. context(test='test1', mode=0) '''
+    if not self._trace:
+      yield
+      return
+    saved = self._get_tags()
+    self._local.tags = dict(saved, **tags)
+    try:
+      yield
+    finally:
+      self._local.tags = saved
+
+  @contextmanager
+  def stage(self, name, **tags):
+    ''' time the block as a stage of name, tagged with the context tags and tags '''
+    if not self._trace:
+      yield
+      return
+    tags = dict(self._get_tags(), **tags)
+    t0, c0 = time.time(), os.times()
+    try:
+      yield
+    finally:
+      t1, c1 = time.time(), os.times()
+      self._record(name, tags, t0, t1-t0, max(0.0, c1[0]+c1[1]-c0[0]-c0[1]), max(0.0, c1[2]+c1[3]-c0[2]-c0[3]))
+
+  def get_stats(self):
+    ''' return a dict of {stage name: {'count', 'wall', 'cpu', 'child_cpu'}} of the stages recorded so far '''
+    with self._lock:
+      return dict([ (k, dict(zip(['count', 'wall', 'cpu', 'child_cpu'], v))) for k, v in self._stats.items() ])
+
+  def get_summary_table(self):
+    ''' return a table of stages summarized by name in decreasing order of total wall time '''
+    tab = texttable.Texttable(max_width=132)
+    with self._lock:
+      stats = sorted(self._stats.items(), key=lambda x: -x[1][1])
+    rows = [[]] + [ [k, n, '%.3f' % w, '%.3f' % (w/n), '%.3f' % c, '%.3f' % cc] for k, (n, w, c, cc) in stats ]
+    tab.add_rows(rows)
+    tab.set_cols_align(['l', 'r', 'r', 'r', 'r', 'r'])
+    tab.header(['Stage', 'Count', 'Wall [s]', 'Mean wall [s]', 'CPU [s]', 'Child CPU [s]'])
+    return tab
+
+  def report(self):
+    ''' log the summary of stages and the total elapsed time '''
+    if not self._trace:
+      return
+    self._logger.info(mcode.INFO_066 % (time.time()-self._start, self._filename))
+    self._logger.info(self.get_summary_table().draw())
+
+  def close(self):
+    ''' close the trace file '''
+    if self._trace:
+      with self._lock:
+        if not self._jsonl:
+          self._trace.write('\n]\n')
+        self._trace.close()
+        self._trace = None
+
+  def _get_tags(self):
+    return getattr(self._local, 'tags', {})
+
+  def _record(self, name, tags, start, wall, cpu, child_cpu):
+    thread = threading.current_thread()
+    if self._jsonl:
+      events = [ dict(tags, stage=name, start=start, wall=wall, cpu=cpu, child_cpu=child_cpu, thread=thread.name) ]
+    else:
+      events = [ {'name': name, 'cat': 'mProbo', 'ph': 'X', 'pid': self._pid, 'tid': thread.ident,
+                  'ts': int((start-self._start)*1e6), 'dur': int(wall*1e6),
+                  'args': dict(tags, cpu=cpu, child_cpu=child_cpu)} ]
+      if thread.ident not in self._threads:
+        events.insert(0, {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': thread.ident, 'args': {'name': thread.name}})
+    with self._lock:
+      stat = self._stats.setdefault(name, [0, 0.0, 0.0, 0.0])
+      for i, v in enumerate([1, wall, cpu, child_cpu]):
+        stat[i] += v
+      if not self._trace: # closed meanwhile
+        return
+      self._threads.add(thread.ident)
+      for e in events:
+        if self._jsonl:
+          self._trace.write(json.dumps(e) + '\n')
+        else: # an array of events, which Chrome trace viewer reads even if a run is interrupted
+          self._trace.write(('' if self._first else ',\n') + json.dumps(e))
+          self._first = False
+      self._trace.flush()
+
+_profiler = Profiler()
+
+def get_profiler():
+  ''' return the profiler shared by all the stages of a run '''
+  return _profiler
@@ -2,6 +2,7 @@
 
 import numpy as np
 import copy
+import StringIO
 import operator
 from dave.common.misc import to_engr, add_column_list, get_absmax, get_letter_index
 import linearregression as lr
@@ -32,6 +33,19 @@ class ReportGenerator(object):
   def render(self):
     pass
 
+  def fork(self):
+    ''' return a copy of this report generator which writes to a buffer.
+        It is merged back by join() so that reports of tests (or modes) running
+        concurrently are written in order.
+    '''
+    rpt = copy.copy(self)
+    rpt.fid = StringIO.StringIO()
+    return rpt
+
+  def join(self, rpt): # write the buffer of a forked report generator
+    self.write(rpt.fid.getvalue())
+    rpt.close()
+
 
   ###############
   # Report header
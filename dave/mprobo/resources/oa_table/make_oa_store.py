@@ -0,0 +1,12 @@
+import glob
+import os
+import numpy as np
+from dave.mprobo.oatable import build_store
+
+# build the OA store (oatable.npy, oatable_index.npy) from OA.V<n_var>.L<depth>.tbl files
+table = {}
+
+for f in glob.glob("*.tbl"):
+  n_var, depth = [int(x[1:]) for x in f.split(".")[1:3]]
+  table[(n_var, depth)] = np.loadtxt(f, dtype=int)
+build_store(table, os.getcwd())
@@ -9,14 +9,18 @@ __doc__ = """ A class
 
 import os
 import sys
-import shutil
 import texttable
 import yaml
 from dave.mprobo.testunit import TestUnit
 from dave.mprobo.testconfig import TestConfig
 from dave.mprobo.simulatorconfig import SimulatorConfig
 from dave.mprobo.reportgen import ReportGenerator
-from dave.mprobo.environ import EnvFileLoc
+from dave.mprobo.environ import EnvFileLoc, EnvSimCache
+from dave.mprobo.simcache import SimulationCache
+from dave.mprobo.executor import JobExecutor
+from dave.mprobo.processrunner import get_process_runner
+from dave.mprobo.rundir import get_rundir_manager
+from dave.mprobo.profiler import get_profiler
 import dave.mprobo.mchkmsg as mcode
 from dave.mprobo.modelparameter import LinearModelParameter 
 from dave.mprobo.checker import generate_check_summary_table
@@ -32,6 +36,7 @@ class RunChecker(object):
     self._workdir = args.workdir # working directory
     self._rptfile = os.path.abspath(os.path.join(self._workdir,args.rpt)) # report file name
     self._cache = args.use_cache # use cached data if True
+    self._use_sim_cache = getattr(args, 'sim_cache', False) # use persistent simulation result cache if True
     self._no_otfc = args.no_otf_check # no on-the-fly check for pin consistency
     self._np = args.process # num. of threads for simulations
     self._goldenonly = args.extract # run in extraction mode
@@ -44,13 +49,24 @@ class RunChecker(object):
 
     self._inv = not ehdnsxmgor(featureinfo())
 
-    self._tcfg = TestConfig(self._testfile, port_xref = self._port_xref, logger_id=logger_id) # get test cfg obj
-    self._scfg = SimulatorConfig(self._simfile, self._goldenonly, logger_id=logger_id) # get sim cfg obj
+    get_profiler().configure(getattr(args, 'profile', ''), logger_id=logger_id) # stage timing if enabled
+    with get_profiler().stage('config_parse'):
+      self._tcfg = TestConfig(self._testfile, port_xref = self._port_xref, logger_id=logger_id) # get test cfg obj
+      self._scfg = SimulatorConfig(self._simfile, self._goldenonly, logger_id=logger_id) # get sim cfg obj
+    if self._use_sim_cache: # both models use the simulation result cache
+      self._scfg.enable_sim_cache()
     self._rptgen = ReportGenerator(filename=self._rptfile, logger_id=logger_id) # reportgenerator obj
 
     self._root_rundir = os.path.join(self._workdir, EnvFileLoc().root_rundir) # for e.g. workdir/.mProbo, this will store all the data for the checking
     make_dir(self._workdir, self._logger)
     make_dir(self._root_rundir, self._logger)
+    self._sim_cache = self._get_sim_cache() # persistent simulation result cache if enabled
+    # worker pool for simulations shared by all the tests; commands to a client are serialized in client-server mode
+    self._executor = JobExecutor(1 if csocket != None else self._np, logger_id=logger_id)
+    get_process_runner().configure(self._np, logger_id=logger_id) # limit the number of simulator processes
+    # run directories on a scratch path in standalone mode, and their cleanup in background
+    scratch_dir = getattr(args, 'scratch_dir', '') if csocket == None else ''
+    get_rundir_manager().configure(scratch_dir, getattr(args, 'scratch_quota', 0), getattr(args, 'prune', False), logger_id=logger_id)
 
     if self._inv: dlrtmvkdldjem()
 
@@ -68,16 +84,29 @@ class RunChecker(object):
     if self._inv: dlrtmvkdldjem()
 
     # run the checking for each test
+    # tests run concurrently sharing the worker pool, and their reports are written in order
+    tasks = []
     for idx, t in enumerate(self._testnames):
       test = self._tcfg.get_test(t)
+      rptgen = self._rptgen.fork()
       # print test information
-      self._rptgen.print_testname(t)
-      self._rptgen.print_test_info(test.get_dut_name(), test.get_description())
+      rptgen.print_testname(t)
+      rptgen.print_test_info(test.get_dut_name(), test.get_description())
       #
-      res = self._run_a_test( t, os.path.join(self._root_rundir, t), test, self._scfg, self._rptgen )
-      testres.append((t, [(r[1], r[2]['error_flag_pin'], r[2]['error_flag_residue']) for r in res]))
-
-      self._mp.formulate_model_parameters(t, res) # extract parameters of linear models 
+      tasks.append((t, rptgen, self._executor.spawn(t, self._run_a_test, t, os.path.join(self._root_rundir, t), test, self._scfg, rptgen)))
+
+    try:
+      for t, rptgen, task in tasks:
+        res = task.result()
+        self._rptgen.join(rptgen)
+        testres.append((t, [(r[1], r[2]['error_flag_pin'], r[2]['error_flag_residue']) for r in res]))
+
+        self._mp.formulate_model_parameters(t, res) # extract parameters of linear models 
+    except KeyboardInterrupt: # kill running simulations
+      get_process_runner().cancel()
+      raise
+    self._executor.shutdown()
+    get_rundir_manager().shutdown() # wait for the files being removed
     # save the extracted model parameters
     self._mp.save_model_parameters(self._root_rundir)
 
@@ -85,13 +114,18 @@ class RunChecker(object):
     if not self._goldenonly:
       self._test_error_summary(testres)
     # report gen
-    self._rptgen.render()
-    self._rptgen.close()
+    with get_profiler().stage('report_generation'):
+      self._rptgen.render()
+      self._rptgen.close()
 
     # print where the report file is
     rptpath = os.path.relpath(self._rptfile, self._workdir)
     map(self._logger.info, print_section(mcode.INFO_013 % rptpath, 1))
 
+    # summarize stage timing if enabled
+    get_profiler().report()
+    get_profiler().close()
+
     if self._inv: dlrtmvkdldjem()
 
   def _run_a_test(self, testname, testdir, testcfg, simcfg, rptgen):
@@ -103,16 +137,34 @@ class RunChecker(object):
       self._logger.warn(mcode.WARN_002 % os.path.relpath(testdir))
 
 
-    testrun = TestUnit(testcfg, simcfg, testdir, rptgen, use_cache=self._cache, no_thread=self._np, goldensim_only=self._goldenonly, no_otfc = self._no_otfc, csocket=self._csocket, logger_id=self._logger_id)
-    res = testrun.run_test()
+    with get_profiler().context(test=testname), get_profiler().stage('test'):
+      testrun = TestUnit(testcfg, simcfg, testdir, rptgen, use_cache=self._cache, sim_cache=self._sim_cache, executor=self._executor, no_thread=self._np, goldensim_only=self._goldenonly, no_otfc = self._no_otfc, csocket=self._csocket, logger_id=self._logger_id)
+      res = testrun.run_test()
 
     if simcfg.get_sweep(): # sweep==True for either golden or revised 
-      shutil.rmtree(testdir)
+      get_rundir_manager().remove(testdir)
       self._logger.info(mcode.INFO_015 % os.path.relpath(testdir))
+    else:
+      get_rundir_manager().finish_test(testdir)
 
     map(self._logger.info, print_end_msg(mcode.INFO_016 % testname, '=='))
     return res
 
+  def _get_sim_cache(self):
+    ''' return a persistent simulation result cache if enabled for either model in standalone mode, else None.
+        The results of golden and revised models are stored independently with keys of their own 
+        fingerprints, e.g. golden results are reused while only a revised model is changed.
+    '''
+    if not self._scfg.get_sim_cache() or self._csocket != None:
+      return None
+    env = EnvSimCache()
+    max_size = float(env.max_size)
+    cache = SimulationCache(env.dbfile, int(max_size*1024*1024))
+    self._logger.info(mcode.INFO_060 % (cache.dbfile, cache.get_size()/1024.0/1024.0, max_size))
+    models = [ m for m, c in [('golden', self._scfg.get_golden()), ('revised', self._scfg.get_revised())] if c.get_sim_cache() ]
+    self._logger.info(mcode.INFO_062 % ', '.join(models))
+    return cache
+
   def _test_error_summary(self, result):
     ''' logging error summary '''
     msg = mcode.INFO_017 % (mcode.INFO_018) 
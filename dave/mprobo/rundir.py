@@ -0,0 +1,171 @@
+__doc__ = """
+Lifecycle manager of run directories.
+
+  - Run directories of a test (i.e. <test dir>/golden and <test dir>/revised) can be
+    placed on a scratch path (e.g. tmpfs or a local SSD) instead of the working
+    directory, where they are linked from the test directory.
+  - Simulator artefacts and swept test directories are removed by background
+    workers instead of a simulation job or a test.
+  - Run directories can be pruned after a test so that only the files needed for
+    cached data (-c option) and reports are kept, and log files are compressed.
+  - A disk quota of the scratch path is enforced by evicting the run directories
+    of previous runs, oldest first.
+"""
+
+import os
+import glob
+import gzip
+import shutil
+import fnmatch
+import threading
+
+from dave.common.davelogger import DaVELogger
+from dave.common.misc import generate_random_str, make_dir
+from dave.mprobo.environ import EnvRunDir
+from dave.mprobo.executor import JobExecutor
+import dave.mprobo.mchkmsg as mcode
+
+#------------------------------------------------------
+class RunDirManager(object):
+  ''' Manage run directories and their cleanup
+        - scratch_dir: path where run directories are placed, in the working directory if ''
+        - quota: maximum size of the scratch path in MB, no quota if 0
+        - prune: keep only the files needed for cached data and reports in run directories after a test
+  '''
+  def __init__(self, scratch_dir='', quota=0, prune=False, logger_id='logger_id'):
+    self.configure(scratch_dir, quota, prune, logger_id)
+
+  def configure(self, scratch_dir='', quota=0, prune=False, logger_id='logger_id'):
+    ''' set up the manager. This should be called before any run directory is made '''
+    self._logger = DaVELogger.get_logger('%s.%s.%s' % (logger_id, __name__, self.__class__.__name__))
+    self._scratch_dir = os.path.abspath(os.path.expandvars(os.path.expanduser(scratch_dir))) if scratch_dir else ''
+    self._quota = int(float(quota)*1024*1024)
+    self._prune = prune
+    self._env = EnvRunDir()
+    self._executor = JobExecutor(int(self._env.n_worker), logger_id=logger_id) # files are removed inline if n_worker <= 1
+    self._futures = []
+    self._in_use = set() # scratch directories of this run
+    self._lock = threading.Lock()
+    if self._scratch_dir:
+      if not os.path.exists(self._scratch_dir):
+        os.makedirs(self._scratch_dir)
+      self._logger.info(mcode.INFO_063 % (self._scratch_dir, '%g MB' % float(quota) if self._quota > 0 else 'none'))
+
+  def make_run_dir(self, testdir, name):
+    ''' make a run directory, <testdir>/<name>, and return its path.
+        If there is a scratch path, it is made there and linked from testdir.
+    '''
+    rundir = os.path.join(testdir, name)
+    if not self._scratch_dir:
+      make_dir(rundir, self._logger)
+      return rundir
+    self.enforce_quota()
+    scratch = os.path.join(self._scratch_dir, generate_random_str('%s_%s_' % (os.path.basename(os.path.abspath(testdir)), name), 8))
+    os.makedirs(scratch)
+    with self._lock:
+      self._in_use.add(scratch)
+    if os.path.lexists(rundir):
+      self.remove(rundir)
+    os.symlink(scratch, rundir)
+    self._logger.debug(mcode.DEBUG_029 % (rundir, scratch))
+    return rundir
+
+  def sweep(self, paths):
+    ''' remove files or directories (e.g. simulator artefacts) in background '''
+    self._submit(paths, self._remove_paths, paths)
+
+  def remove(self, dirname):
+    ''' remove a directory, including the scratch directories linked from it, in background '''
+    links = [ os.path.join(r, d) for r, ds, fs in os.walk(dirname) for d in ds if os.path.islink(os.path.join(r, d)) ] + \
+            ([dirname] if os.path.islink(dirname) else [])
+    targets = [ os.path.realpath(l) for l in links ]
+    tmpname = dirname.rstrip(os.sep) + generate_random_str('_removing_', 5) # the directory can be made again at once
+    os.rename(dirname, tmpname)
+    self._submit(dirname, self._remove_paths, [tmpname] + targets)
+
+  def finish_test(self, testdir):
+    ''' prune the run directories of a test if enabled, and enforce the quota '''
+    if self._prune:
+      for rundir in [ d for d in glob.glob(os.path.join(testdir, '*')) if os.path.isdir(d) ]:
+        for d in [ os.path.join(rundir, x) for x in os.listdir(rundir) ]:
+          if os.path.isdir(d):
+            self._submit(d, self._prune_dir, d)
+    self.enforce_quota()
+
+  def enforce_quota(self):
+    ''' evict the run directories of previous runs in the scratch path, oldest first, until it fits the quota '''
+    if not self._scratch_dir or self._quota <= 0:
+      return
+    with self._lock:
+      entries = [ os.path.join(self._scratch_dir, x) for x in os.listdir(self._scratch_dir) ]
+      sizes = dict([ (d, get_size(d)) for d in entries ])
+      total = sum(sizes.values())
+      for d in sorted([ d for d in entries if d not in self._in_use ], key=os.path.getmtime):
+        if total <= self._quota:
+          break
+        self._logger.info(mcode.INFO_064 % (d, sizes[d]/1024.0/1024.0))
+        self._remove_paths([d])
+        total -= sizes[d]
+    if total > self._quota:
+      self._logger.warn(mcode.WARN_031 % (self._scratch_dir, total/1024.0/1024.0, self._quota/1024.0/1024.0))
+
+  def shutdown(self):
+    ''' wait until all the background jobs are done '''
+    with self._lock:
+      futures, self._futures = self._futures, []
+    for f in futures:
+      try:
+        f.result()
+      except Exception, e:
+        self._logger.debug(mcode.DEBUG_030 % (f.key, e))
+    self._executor.shutdown()
+
+  def _submit(self, key, func, *args):
+    with self._lock:
+      self._futures = [ f for f in self._futures if not f.done() ]
+      self._futures.append(self._executor.submit(key, func, *args))
+
+  def _remove_paths(self, paths):
+    for p in paths:
+      if os.path.isdir(p) and not os.path.islink(p):
+        shutil.rmtree(p, True)
+      elif os.path.lexists(p):
+        os.remove(p)
+
+  def _prune_dir(self, dirname): # remove all but the files to keep, and compress log files
+    keep = self._env.keep_files
+    keep = keep if isinstance(keep, list) else [keep]
+    for x in os.listdir(dirname):
+      p = os.path.join(dirname, x)
+      if not any([ fnmatch.fnmatch(x, k) for k in keep ]):
+        self._remove_paths([p])
+      elif fnmatch.fnmatch(x, '*.log') and os.path.isfile(p):
+        with open(p, 'rb') as src:
+          dst = gzip.open(p + '.gz', 'wb')
+          try:
+            shutil.copyfileobj(src, dst)
+          finally:
+            dst.close()
+        os.remove(p)
+
+def get_size(path):
+  ''' return the total size of files in a path in bytes '''
+  if not os.path.isdir(path) or os.path.islink(path):
+    return os.path.getsize(path) if os.path.isfile(path) else 0
+  total = 0
+  for r, ds, fs in os.walk(path):
+    for f in fs:
+      try:
+        total += os.path.getsize(os.path.join(r, f))
+      except OSError: # removed meanwhile
+        pass
+  return total
+
+_manager = None
+
+def get_rundir_manager():
+  ''' return the run directory manager shared by all the tests '''
+  global _manager
+  if _manager == None:
+    _manager = RunDirManager()
+  return _manager
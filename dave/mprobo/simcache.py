@@ -0,0 +1,161 @@
+__doc__ = """
+Persistent, content-addressed cache of simulation results.
+
+A simulation result (i.e. the measurement record of a run after
+post-processing, see measurement.py) is stored in a SQLite database with a key which is a hash of
+everything that determines the result: the testbench bound with a test vector,
+the contents of HDL/circuit files, simulator options, and post-processing scripts.
+Therefore, a result can be reused across runs, tests, and working directories
+as long as none of those is changed.
+
+The least recently used results are evicted when the total size of the stored
+results exceeds the maximum size of the cache.
+"""
+
+import os
+import time
+import zlib
+import hashlib
+import sqlite3
+import cPickle as pkl
+
+#------------------------------------------------------
+class SimulationCache(object):
+  ''' Cache of simulation results in a SQLite database.
+        - dbfile: database filename
+        - max_size: maximum total size of the stored results in bytes
+      A connection is made for each access so that the cache can be shared by
+      processes running simulations concurrently.
+  '''
+  SCHEMA = '''CREATE TABLE IF NOT EXISTS result (
+                key TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                atime REAL NOT NULL)'''
+
+  def __init__(self, dbfile, max_size, timeout=60.0):
+    self._dbfile = os.path.abspath(os.path.expandvars(os.path.expanduser(dbfile)))
+    self._max_size = max_size
+    self._timeout = timeout
+    dirname = os.path.dirname(self._dbfile)
+    if not os.path.exists(dirname):
+      os.makedirs(dirname)
+    conn = self._connect()
+    try:
+      with conn:
+        conn.execute(self.SCHEMA)
+        conn.execute('CREATE INDEX IF NOT EXISTS result_atime ON result (atime)')
+    finally:
+      conn.close()
+
+  @property
+  def dbfile(self):
+    return self._dbfile
+
+  def _connect(self):
+    return sqlite3.connect(self._dbfile, timeout=self._timeout)
+
+  def get(self, key):
+    ''' return a dict of {filename: content} stored with key, else None '''
+    conn = self._connect()
+    try:
+      with conn:
+        row = conn.execute('SELECT data FROM result WHERE key=?', (key,)).fetchone()
+        if row is None:
+          return None
+        conn.execute('UPDATE result SET atime=? WHERE key=?', (time.time(), key))
+    finally:
+      conn.close()
+    return pkl.loads(zlib.decompress(str(row[0])))
+
+  def put(self, key, files):
+    ''' store a dict of {filename: content} with key, and evict LRU results if necessary '''
+    data = zlib.compress(pkl.dumps(files, pkl.HIGHEST_PROTOCOL))
+    if len(data) > self._max_size:
+      return
+    conn = self._connect()
+    try:
+      with conn:
+        conn.execute('INSERT OR REPLACE INTO result (key, data, size, atime) VALUES (?,?,?,?)',
+                     (key, sqlite3.Binary(data), len(data), time.time()))
+        self._evict(conn)
+    finally:
+      conn.close()
+
+  def get_files(self, key, workdir, filenames):
+    ''' write the stored files to workdir if all of filenames are stored with key.
+        Return True if it is a hit.
+    '''
+    files = self.get(key)
+    if files is None or not all([ f in files for f in filenames ]):
+      return False
+    for f in filenames:
+      with open(os.path.join(workdir, f), 'wb') as fid:
+        fid.write(files[f])
+    return True
+
+  def put_files(self, key, workdir, filenames):
+    ''' store the files in workdir with key '''
+    files = {}
+    for f in filenames:
+      with open(os.path.join(workdir, f), 'rb') as fid:
+        files[f] = fid.read()
+    self.put(key, files)
+
+  def get_size(self): # total size of the stored results
+    conn = self._connect()
+    try:
+      return conn.execute('SELECT COALESCE(SUM(size), 0) FROM result').fetchone()[0]
+    finally:
+      conn.close()
+
+  def _evict(self, conn): # evict least recently used results until the total size fits
+    total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM result').fetchone()[0]
+    if total <= self._max_size:
+      return
+    for key, size in conn.execute('SELECT key, size FROM result ORDER BY atime').fetchall():
+      conn.execute('DELETE FROM result WHERE key=?', (key,))
+      total -= size
+      if total <= self._max_size:
+        break
+
+#------------------------------------------------------
+class Fingerprint(object):
+  ''' Incremental hash of the things which determine a simulation result '''
+  def __init__(self):
+    self._hash = hashlib.sha1()
+
+  def update(self, tag, value): # hash a tagged value with its repr
+    self._hash.update('%s\0%r\0' % (tag, value))
+
+  def update_file(self, tag, filename):
+    ''' hash the basename and content of a file if it exists, else its name
+        (e.g. a simulator option in the list of HDL files).
+        The directory is not hashed so that a result is reusable across working directories.
+    '''
+    if filename and os.path.isfile(filename):
+      self.update(tag, os.path.basename(filename))
+      with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), ''):
+          self._hash.update(chunk)
+    else:
+      self.update(tag, filename)
+
+  def update_dir(self, tag, dirname):
+    ''' hash the basenames and contents of the files in a directory if it exists, else its name
+        (e.g. a library directory of Verilog modules)
+    '''
+    if dirname and os.path.isdir(dirname):
+      for f in sorted(os.listdir(dirname)):
+        if os.path.isfile(os.path.join(dirname, f)):
+          self.update_file(tag, os.path.join(dirname, f))
+    else:
+      self.update(tag, dirname)
+
+  def copy(self):
+    fp = Fingerprint()
+    fp._hash = self._hash.copy()
+    return fp
+
+  def hexdigest(self):
+    return self._hash.hexdigest()
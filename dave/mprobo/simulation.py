@@ -5,23 +5,33 @@ import tempfile
 import copy
 import os
 import shutil
-import subprocess
 import dave.common.misc as misc
 import stat
 import numpy as np
 import pickle as pkl
+import threading
 
 from dave.common.davelogger import DaVELogger
 from dave.common.misc import get_basename
-from simulatorinterface import NCVerilogAMS, NCVerilogD, VCSSimulator
+from simulatorinterface import get_simulator_backend
+import behavioralsimulator # registers the behavioral simulator backend
 from testbench import TestBench
+from vectorgenerator import vector_to_dict
+from simcache import Fingerprint
+from processrunner import get_process_runner, read_log
+from measurement import MeasurementSink, encode, decode, read_record
+from profiler import get_profiler
 import dave.mprobo.mchkmsg as mcode
 from dave.mprobo.environ import EnvFileLoc
 
 #-----------------------
 class RunVector(object):
-  ''' Simulate a model with a given test vector '''
-  def __init__(self, test_cfg, sim_cfg, port, tb_raw_file, use_cache, csocket, logger_id='logger_id'):
+  ''' Simulate a model with a given test vector 
+        - results_file: if given, the measurement of each run is appended to this file 
+                        (see measurement.MeasurementSink) with a key of its run directory name, 
+                        and the stored results are loaded at once when cached data are used
+  '''
+  def __init__(self, test_cfg, sim_cfg, port, tb_raw_file, use_cache, csocket, sim_cache=None, results_file=None, logger_id='logger_id'):
     self._logger_id = logger_id
     self._logger = DaVELogger.get_logger('%s.%s.%s' % (logger_id, __name__, self.__class__.__name__))
 
@@ -31,14 +41,27 @@ class RunVector(object):
     self._tb_raw_file = tb_raw_file
     self._use_cache = use_cache
     self._csocket = csocket
+    self._sim_cache = sim_cache if csocket == None else None # simulation result cache (standalone mode only)
+    self._sim_cache_hit = False # True once a result is reused from the simulation result cache
+    self._sink = MeasurementSink(results_file) if results_file else None # results file shared by runs
+    if self._sink and not use_cache:
+      self._sink.reset()
     
     self._create_instance()
+    self._batch_size = self._sim.get_batch_size() # number of vectors simulated by a testbench
+    if self._batch_size > 1 and self._pp._is_exist():
+      self._logger.warn(mcode.WARN_029)
+      self._batch_size = 1
+
+  def get_batch_size(self):
+    return self._batch_size
 
   def run(self, vector, workdir):
     ''' Run a simulation with given vector at dir=workdir
         Returns a tuple of ( is successful ?, measurement data) 
         after validating measurement data
     '''
+    vector = vector_to_dict(vector) # a row of vector store is bound to a testbench by port names
     cached = self._use_cache
     if cached and not os.path.exists(workdir):
       self._logger.warn(mcode.WARN_025 % workdir)
@@ -48,13 +71,16 @@ class RunVector(object):
       misc.make_dir(workdir, self._logger)
       with open(os.path.join(workdir, 'vector.dat'), 'wb') as f: 
         pkl.dump(vector, f)
-    self._sim.run(vector, cached, workdir) # run a simulation
-    self._pp.run(workdir, cached) # run postprocessing routine(s) if any
-    if self._csocket: # client-server mode, ask for measurement
-      relpath = os.path.relpath(workdir)
-      self._upload_measurement_client(relpath)
-    # read/validate measurement
-    meas = self.read_measurement(workdir)
+    if self._sim_cache and not cached: # look up the simulation result cache
+      meas = self._run_with_sim_cache(vector, workdir)
+    else:
+      self._sim.run(vector, cached, workdir) # run a simulation
+      self._pp.run(workdir, cached) # run postprocessing routine(s) if any
+      if self._csocket: # client-server mode, ask for measurement
+        relpath = os.path.relpath(workdir)
+        self._upload_measurement_client(relpath)
+      meas = self.read_measurement(workdir, cached)
+    # validate measurement
     result = self._validate_measurement(meas, self._port)
     #try:
     #  result = self._validate_measurement(meas, self._port)
@@ -67,22 +93,115 @@ class RunVector(object):
     #  sys.exit()
     return result
 
-  def read_measurement(self, workdir): # read measurement from simulation or postprocessed result files 
-    measurement = {}
-    for p in self._port.get_output_port_name():
-      fname = 'meas_' + p + '.txt'
-      _meas_file = fname if os.path.isfile(fname) else os.path.join(workdir, fname)
+  def run_batch(self, vectors, workdirs, batchdir):
+    ''' Run a simulation of multiple vectors with a testbench at dir=batchdir,
+        whose measurement data are loaded at once and stored for each vector (workdirs).
+        Returns a list of tuples of ( is successful ?, measurement data) 
+    '''
+    if self._use_cache: # cached data are in the directory of each vector
+      return [ self.run(v, w) for v, w in zip(vectors, workdirs) ]
+    vectors = [ vector_to_dict(v) for v in vectors ]
+    for vector, workdir in zip(vectors, workdirs): # dump vectors
+      misc.make_dir(workdir, self._logger)
+      with open(os.path.join(workdir, 'vector.dat'), 'wb') as f: 
+        pkl.dump(vector, f)
+    outputs = self._port.get_output_port_name()
+    keys = [ self._get_sim_cache_key(v, w)[1] if self._sim_cache else None for v, w in zip(vectors, workdirs) ]
+    measurements = [ self._get_cached_measurement(key, workdir) for key, workdir in zip(keys, workdirs) ]
+    misses = [ i for i, m in enumerate(measurements) if m == None ]
+    if misses:
+      misc.make_dir(batchdir, self._logger)
+      self._sim.run_batch([ vectors[i] for i in misses ], batchdir)
+      with get_profiler().stage('measurement_read'):
+        batch_measurements = self._sim.read_batch_measurement(batchdir, outputs, len(misses))
+      for i, m in zip(misses, batch_measurements):
+        if m != None: # store a record for each vector
+          record = encode(m)
+          self._store_record(workdirs[i], record)
+          self._put_cached_measurement(keys[i], record)
+        measurements[i] = m
+    return [ self._validate_measurement((m != None, m), self._port) for m in measurements ]
+
+  def _run_with_sim_cache(self, vector, workdir):
+    ''' return the measurement in the simulation result cache if hit,
+        otherwise run a simulation and store its measurement to the cache
+    '''
+    sim, key = self._get_sim_cache_key(vector, workdir)
+    measurement = self._get_cached_measurement(key, workdir)
+    if measurement != None:
+      return True, measurement
+    sim.simulate(vector, False)
+    self._pp.run(workdir, False)
+    meas = self.read_measurement(workdir)
+    if meas[0]: # store successful results only
+      self._put_cached_measurement(key, encode(meas[1]))
+    return meas
+
+  def _get_sim_cache_key(self, vector, workdir):
+    ''' return a tuple of (simulation bound with vector, key of its result in the simulation result cache) '''
+    sim = self._sim.bind(vector, workdir)
+    fp = sim.get_fingerprint(vector)
+    self._pp.update_fingerprint(fp)
+    return sim, fp.hexdigest()
+
+  def _get_cached_measurement(self, key, workdir): 
+    ''' return the measurement in the simulation result cache if hit, else None.
+        Its record is stored for workdir so that it can be read as cached data.
+    '''
+    files = self._sim_cache.get(key) if key != None else None
+    record = files.get(EnvFileLoc().meas_record) if files else None
+    if record == None:
+      return None
+    try:
+      measurement = self._select_outputs(decode(record))
+    except KeyError: # outputs are changed
+      return None
+    self._store_record(workdir, record)
+    if not self._sim_cache_hit:
+      self._sim_cache_hit = True
+      self._logger.info(mcode.INFO_067 % self._sim_cfg.get_config_name())
+    self._logger.debug(mcode.DEBUG_023 % (key, workdir))
+    return measurement
+
+  def _put_cached_measurement(self, key, record): # store the record of a measurement to the simulation result cache
+    if key != None:
+      self._sim_cache.put(key, {EnvFileLoc().meas_record: record})
+      self._logger.debug(mcode.DEBUG_024 % key)
+
+  def _store_record(self, workdir, record): # store the record of a measurement to the results file if any, else to workdir
+    if self._sink:
+      self._sink.append(os.path.basename(workdir), record)
+    else:
+      with open(os.path.join(workdir, EnvFileLoc().meas_record), 'wb') as f:
+        f.write(record)
+
+  def _select_outputs(self, measurement):
+    return dict([ (p, measurement[p]) for p in self._port.get_output_port_name() ])
+
+  def read_measurement(self, workdir, cached=False): 
+    ''' read measurement from simulation or postprocessed result files.
+        If there is a results file, a new measurement is appended to it, and 
+        a cached one is looked up in it first.
+    '''
+    key = os.path.basename(workdir)
+    with get_profiler().stage('measurement_read'):
+      record = self._sink.get(key) if self._sink and cached else None
       try:
-        measurement[p] = (np.loadtxt(_meas_file)).tolist()
+        if record != None:
+          measurement = self._select_outputs(decode(record))
+        else:
+          measurement = self._sim.read_measurement(workdir, self._port.get_output_port_name())
       except Exception, e:
         self._logger.debug(mcode.DEBUG_007 % (workdir, e))
         return False, None
+    if self._sink and record == None:
+      self._sink.put(key, measurement)
     self._logger.debug(mcode.DEBUG_008 % workdir)
     return True, measurement # success, measurement data dictionary
 
   def _create_instance(self): # create simulation and postprocess classes
     # simulation instance
-    self._sim = VerilogSimulation(self._test_cfg, self._sim_cfg, self._tb_raw_file, csocket=self._csocket, logger_id=self._logger_id)
+    self._sim = VerilogSimulation(self._test_cfg, self._sim_cfg, self._tb_raw_file, self._port.get_output_port_name(), csocket=self._csocket, logger_id=self._logger_id)
     # post processor instance
     pp_scripts, pp_cmd = self._test_cfg.get_postprocessor()
     self._pp  = PostProcessSimulation(pp_scripts, pp_cmd, self._csocket, self._logger_id) 
@@ -97,74 +216,139 @@ class RunVector(object):
     self._csocket.issue_command('@upload %s' % ' '.join(files))
 
 class VerilogSimulation(object):
-  ''' Run a Verilog simulation by instantiating one of Verilog simulators.
+  ''' Run a Verilog simulation with a simulator backend registered by the simulator name in sim_cfg.
     - sim_cfg is either golden simcfg or revised simcfg
     - raw_tb_file: raw testbench file (vector unbound) including directory info
+    - outputs: output port names, whose measurement files are indexed in a batch testbench
   '''
-  def __init__(self, test_cfg, sim_cfg, raw_tb_file, csocket=None, logger_id='logger_id'):
+  def __init__(self, test_cfg, sim_cfg, raw_tb_file, outputs=[], csocket=None, logger_id='logger_id'):
     self._csocket = csocket
     self._logger_id = logger_id
+    self._logger = DaVELogger.get_logger('%s.%s.%s' % (logger_id, __name__, self.__class__.__name__))
 
     self._raw_tb_file = raw_tb_file
+    self._tb_template = TestBench.compile(raw_tb_file) # compiled once for binding vectors
+    self._outputs = outputs # output port names
     self._model_type = sim_cfg.get_model()
     self._hdl_files = sim_cfg.get_hdl_files()
+    self._hdl_include_files = sim_cfg.get_hdl_include_files()
     self._simulator_name = sim_cfg.get_simulator_name() 
-    self._simulator_option = sim_cfg.get_simulator_option()
-    self._ams_option = { 'ams_controlfile' : sim_cfg.get_ams_control_filename(),
-                         'ams_circuits' : sim_cfg.get_circuits(),
-                         'spice_lib' : sim_cfg.get_spice_lib(),
-                         'ams_connrules' : sim_cfg.get_ncams_connrules()}
+    self._backend = get_simulator_backend(self._simulator_name)(sim_cfg, csocket, logger_id=logger_id)
+    self._compile_once = self._backend.is_compile_once() # vectors are bound at runtime to a testbench compiled once
 
     self._option={'workdir' : '',
                   'sweep_file' : sim_cfg.get_sweep(),
                   'hdl_files' : [], 
+                  'compiled_dir' : '',
+                  'timeout' : sim_cfg.get_timeout(),
                   'ic' : self._get_ic(test_cfg, sim_cfg),
                   'temperature': test_cfg.get_temperature(),
                   'sim_time': test_cfg.get_simulation_time(),
                   'timescale' : test_cfg.get_timescale()
             }
+    # states shared by bound copies
+    self._fingerprint = {} # fingerprint of the simulation setup except the testbench
+    self._compiled = [] # True if the backend is compiled
+    self._compiled_tb = [] # testbench compiled once if compile_once
+    self._lock = threading.Lock()
 
   def run(self, vector, use_cache, workdir='/tmp'):
-    ''' run simulation '''
+    ''' run simulation, and return the simulation bound with vector '''
+    sim = self.bind(vector, workdir)
+    sim.simulate(vector, use_cache)
+    return sim
+
+  def bind(self, vector, workdir='/tmp'):
+    ''' return a copy of this simulation after binding a vector to the testbench in workdir.
+        The copy holds its own options so that simulations can run concurrently.
+    '''
+    sim = copy.copy(self)
+    with get_profiler().stage('testbench_bind'):
+      if self._compile_once: # the vector is passed to the compiled testbench at runtime
+        testbench = self._get_compiled_testbench(vector, workdir)
+      else:
+        testbench = self._bind_vector_to_testbench(vector, workdir)
     # list of hdl files with the testbench 
-    self._option.update({ 'workdir' : workdir,
-                          'hdl_files' : [self._bind_vector_to_testbench(vector, workdir)] + self._hdl_files })
-    self._ams_option.update({'vector':vector})
-    if self._csocket: # if client-server mode
-      rootdir = workdir[:workdir.rfind('%s'%EnvFileLoc().root_rundir)]
-      self._ams_option.update({'ams_controlfile': os.path.join(rootdir,'circuit.scs')})
+    sim._option = dict(self._option, workdir=workdir, hdl_files=[testbench] + self._hdl_files)
+    return sim
+
+  def simulate(self, vector, use_cache):
+    ''' run simulation with the testbench bound by bind() '''
+    if not use_cache:
+      self._compile()
+    with get_profiler().stage('simulation'):
+      self._sim_msg = self._backend.run(vector, self._option, use_cache)
+
+  def run_batch(self, vectors, workdir='/tmp'):
+    ''' run a simulation of vectors with a testbench in workdir (see TestBench.generate_batch),
+        and return the simulation bound with the vectors
+    '''
+    sim = copy.copy(self)
+    with get_profiler().stage('testbench_bind'):
+      testbench = misc.get_basename(TestBench.generate_batch(self._tb_template, vectors, self._outputs, misc.get_basename(self._raw_tb_file), workdir))
+    sim._option = dict(self._option, workdir=workdir, hdl_files=[testbench] + self._hdl_files)
+    sim._compile()
+    with get_profiler().stage('simulation'):
+      sim._sim_msg = self._backend.run_batch(vectors, sim._option)
+    return sim
 
-    self._simulator = self._get_simulator(vector, self._model_type, self._simulator_name, 
-                                          self._simulator_option, self._ams_option, 
-                                          self._option, use_cache)
+  def get_batch_size(self):
+    return self._backend.get_batch_size()
+
+  def read_batch_measurement(self, workdir, names, n):
+    ''' return a list of measurements of n vectors of a batch simulated in workdir, where a failed one is None '''
+    return self._backend.read_batch_measurement(workdir, names, n)
 
   def get_log(self):
-    return self._simulator.get_log()
+    return self._sim_msg
+
+  def read_measurement(self, workdir, names):
+    ''' return a dict of measured values of output ports (names) '''
+    return self._backend.read_measurement(workdir, names)
+
+  def _compile(self): # compile once before the first simulation
+    with self._lock:
+      if not self._compiled:
+        with get_profiler().stage('compile'):
+          self._backend.compile(self._option)
+        self._compiled.append(True)
+
+  def get_fingerprint(self, vector):
+    ''' return a fingerprint (simcache.Fingerprint) of a simulation with the testbench bound by bind() '''
+    if 'setup' not in self._fingerprint: # the simulation setup is hashed once
+      fp = Fingerprint()
+      for k in ['model_type', 'simulator_name']:
+        fp.update(k, getattr(self, '_'+k))
+      for f in self._hdl_files + self._hdl_include_files:
+        fp.update_file('hdl_file', f)
+      for k in ['ic', 'temperature', 'sim_time', 'timescale']:
+        fp.update(k, sorted(self._option[k].items()) if k == 'ic' else self._option[k])
+      self._backend.update_fingerprint(fp)
+      self._fingerprint['setup'] = fp
+    fp = self._fingerprint['setup'].copy()
+    fp.update_file('testbench', os.path.join(self._option['workdir'], self._option['hdl_files'][0]))
+    fp.update('vector', sorted(vector.items()))
+    return fp
 
   def _get_ic(self, test_cfg, sim_cfg):
     ''' return initial condition '''
     return test_cfg.get_ic_golden() if sim_cfg.is_golden() else test_cfg.get_ic_revised()
 
-  def _get_simulator(self, vector, model_type, simulator_name, simulator_option, ams_option, cls_attribute, use_cache):
-    '''
-      Returns vendor-specific simulator object
-      model_type: modeling language; either ams or verilog
-    '''
-    invalid_combination = (simulator_name == 'vcs' and model_type == 'ams')
-    assert not invalid_combination, mcode.ERR_008 % (simulator_name.upper(), model_type.upper())
-
-    if model_type == 'ams':
-      simulator= NCVerilogAMS(vector, simulator_option, cls_attribute, ams_option, use_cache, self._csocket, logger_id=self._logger_id)
-    elif model_type == 'verilog' and simulator_name == 'vcs':
-      simulator = VCSSimulator(vector, simulator_option, cls_attribute, use_cache, self._csocket, logger_id=self._logger_id)
-    elif model_type == 'verilog' and simulator_name == 'ncsim':
-      simulator = NCVerilogD(vector, simulator_option, cls_attribute, use_cache, self._csocket, logger_id=self._logger_id)
-
-    return simulator
-    
   def _bind_vector_to_testbench(self, vector, workdir):
     ''' return a testbench location after binding a test vector to an intermediate testbench for simulation '''
-    return misc.get_basename(TestBench.generate(self._raw_tb_file, vector, misc.get_basename(self._raw_tb_file), workdir))
+    return misc.get_basename(TestBench.generate(self._tb_template, vector, misc.get_basename(self._raw_tb_file), workdir))
+
+  def _get_compiled_testbench(self, vector, workdir):
+    ''' return a testbench location to be compiled once, where the variables of a test vector are set by plusargs.
+        It is generated in a directory next to workdir when the first vector is bound.
+    '''
+    with self._lock:
+      if not self._compiled_tb:
+        compiled_dir = os.path.abspath(os.path.join(os.path.dirname(workdir), EnvFileLoc().compiled_dirname))
+        misc.make_dir(compiled_dir, self._logger)
+        self._option['compiled_dir'] = compiled_dir
+        self._compiled_tb.append(TestBench.generate(self._tb_template, TestBench.get_runtime_vector(vector), misc.get_basename(self._raw_tb_file), compiled_dir))
+    return self._compiled_tb[0]
 
 
 #-----------------------------------
@@ -178,26 +362,28 @@ class PostProcessSimulation(object):
     self._pp_script = pp_files # list of script filenames
     self._pp_cmd = pp_cmd # post-processing run command
     self._csocket = csocket
+    self._sim_msg = ''
+    self._logfile = None # log file of post-processing routine(s)
     self._logger.debug(mcode.DEBUG_009 % str(self._pp_script))
     self._logger.debug(mcode.DEBUG_010 % str(self._pp_cmd))
   
   def run(self, workdir, cached=False): # run post-processing routine
     self._sim_msg = ''
+    self._logfile = None
     relpath = workdir[workdir.rfind('%s'%EnvFileLoc().root_rundir):]
     if self._is_exist(): # run pp routines if exsits
       if not cached:
         self._logger.debug(mcode.DEBUG_011 % workdir)
         if self._csocket == None: # standalone mode
-          for f in self._pp_script: # copy script files to simulation directory
-            shutil.copy(f, workdir) 
-          cwd = os.getcwd()
-          self._logger.debug(mcode.DEBUG_012 % os.path.relpath(workdir))
-          os.chdir(workdir)
-          p=subprocess.Popen(self._pp_cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE) # run pp scripts
-          out, err  = p.communicate()
-          self._sim_msg = out + '\n' + err
-          os.chdir(cwd)
-          self._logger.debug(mcode.DEBUG_013)
+          with get_profiler().stage('post_process'):
+            for f in self._pp_script: # copy script files to simulation directory
+              shutil.copy(f, workdir) 
+            self._expand_record(workdir)
+            self._logger.debug(mcode.DEBUG_012 % os.path.relpath(workdir))
+            # run pp scripts in workdir, whose output is written to a log file
+            self._logfile = os.path.join(workdir, EnvFileLoc().pplogfile)
+            returncode = get_process_runner().run(self._pp_cmd, workdir, self._logfile, stage='post_process')
+          self._logger.debug(mcode.DEBUG_028 % (returncode, self._logfile))
         else: # server/client mode
           logfile = os.path.join(relpath,EnvFileLoc().simlogfile)
           self._csocket.issue_command('@pp_list %s' % ' '.join(self._pp_script))
@@ -205,8 +391,23 @@ class PostProcessSimulation(object):
       else:
         self._logger.debug(mcode.DEBUG_014)
 
-  def get_log(self): # get simulation log
+  def get_log(self): # get post-processing log
+    if self._logfile:
+      return read_log(self._logfile)
     return self._sim_msg
 
+  def update_fingerprint(self, fp): # add post-processing routine(s) to a fingerprint (simcache.Fingerprint)
+    if self._is_exist():
+      for f in self._pp_script:
+        fp.update_file('pp_script', f)
+      fp.update('pp_cmd', self._pp_cmd)
+
+  def _expand_record(self, workdir): # measurement record of a run to meas_<port>.txt files which post-processing may update
+    record = os.path.join(workdir, EnvFileLoc().meas_record)
+    if os.path.isfile(record):
+      for p, v in read_record(record).items():
+        np.savetxt(os.path.join(workdir, 'meas_%s.txt' % p), np.atleast_1d(v))
+      os.remove(record)
+
   def _is_exist(self): # check if pp rountine actually exists
     return True if self._pp_script != None and self._pp_cmd != '' else False
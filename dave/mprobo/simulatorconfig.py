@@ -42,6 +42,14 @@ class SimulatorConfig(object):
   def get_sweep(self):
     return self.get_golden().get_sweep() and self.get_revised().get_sweep()
 
+  def get_sim_cache(self): # True if either model uses the simulation result cache
+    return self.get_golden().get_sim_cache() or self.get_revised().get_sim_cache()
+
+  def enable_sim_cache(self):
+    ''' use the simulation result cache for both golden and revised models '''
+    self.get_golden().set_sim_cache(True)
+    self.get_revised().set_sim_cache(True)
+
   def get_characterization(self):
     return self._characterization
 
@@ -163,9 +171,45 @@ class SimulatorConfigModel(object):
     except:
       return None
 
+  def get_behavioral_model(self):
+    ''' return "<python file or module>:<function>" of a behavioral model '''
+    return interpolate_env(self.cfg_model[self._tenv.behavioral_model], self._logger)
+
+  def get_linear_model(self):
+    ''' return a linear model, {output: {'const': offset, input: gain}}, of a behavioral model '''
+    try:
+      return dict([ (k, dict([ (p, float(g)) for p, g in v.items() ])) for k, v in self.cfg_model[self._tenv.linear_model].items() ])
+    except KeyError:
+      return {}
+
   def get_sweep(self):
     ''' return sweep_file field, default is True '''
     return self.cfg_model[self._tenv.sweep_file]
 
+  def get_compile_once(self):
+    ''' return compile_once field, default is False '''
+    return self.cfg_model[self._tenv.compile_once]
+
+  def get_batch_size(self):
+    ''' return batch_size field, the number of vectors simulated by a testbench, default is 1 '''
+    return self.cfg_model[self._tenv.batch_size]
+
+  def get_timeout(self):
+    ''' return timeout field, seconds to wait for a simulation to complete, default is 0 (no timeout) '''
+    return self.cfg_model[self._tenv.timeout]
+
+  def get_sim_cache(self):
+    ''' return sim_cache field, True if simulation results are stored in/reused from the simulation result cache.
+        Default is False, and -k option enables it for both models.
+    '''
+    return self.cfg_model[self._tenv.sim_cache]
+
+  def set_sim_cache(self, flag):
+    self.cfg_model[self._tenv.sim_cache] = flag
+
+  def get_shared_results(self):
+    ''' return shared_results field, True if the measurements of runs are appended to a results file, default is False '''
+    return self.cfg_model[self._tenv.shared_results]
+
 def dlrtmvkdldjem():
   sys.exit()
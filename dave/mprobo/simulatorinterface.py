@@ -2,25 +2,259 @@
 import tempfile
 import os
 import stat
-import shutil
 import glob
 import numpy as np
 import copy
 import re
-import subprocess
+import importlib
+from StringIO import StringIO
 import dave.common.misc as misc
 from dave.common.davelogger import DaVELogger
 from environ import EnvSimulatorClassOpt
-from dave.common.empyinterface import EmpyInterface
-from dave.mprobo.environ import EnvFileLoc
+from dave.common.empyinterface import CompiledTemplate
+from dave.mprobo.environ import EnvFileLoc, EnvSimcfg
+from testbench import TestBench
+from processrunner import get_process_runner, read_log
+from measurement import MeasurementSink, read_record
+from rundir import get_rundir_manager
+import dave.mprobo.mchkmsg as mcode
 
 __doc__ = '''
 The interface to the actual AMS simulator is defined. Currently, we support NC-Simulator 
 for both (System)Verilog and Verilog-AMS, and VCS for (System)Verilog.
 This writes a shell script to run a simulation for given options. 
 Note that 'sweep_file' option is obsolete now.
+If 'compile_once' is set, a testbench is compiled once and each simulation 
+only launches the compiled one with the test vector given as plusargs.
+
+Simulators are plugged in as backends (SimulatorBackend) registered by the 
+"simulator" name used in sim.cfg. A backend which is not registered can be
+given as "<module>:<class>" in sim.cfg.
 '''
 
+#-----------------------
+_simulator_backends = {} # simulator name -> backend class
+
+def register_simulator(name, backend):
+  ''' register a simulator backend class with a simulator name used in sim.cfg '''
+  _simulator_backends[name] = backend
+
+def get_simulator_backend(name):
+  ''' return the simulator backend class of a simulator name, 
+      which is imported if it is in "<module>:<class>" format
+  '''
+  if name not in _simulator_backends and ':' in name:
+    module, cls = name.rsplit(':', 1)
+    register_simulator(name, getattr(importlib.import_module(module), cls))
+  assert name in _simulator_backends, mcode.ERR_023 % (name, ', '.join(sorted(_simulator_backends.keys())))
+  return _simulator_backends[name]
+
+#-----------------------
+class SimulatorBackend(object):
+  ''' Interface of a simulator backend, which is created for each model (golden/revised) of a test.
+        - compile(option): build what is shared by all the vectors of the model. 
+                           It is called once before the first simulation.
+        - run(vector, option, use_cache): run a simulation of a vector and return its log.
+                           option['workdir'] is the run directory and option['hdl_files'][0] is 
+                           the testbench bound with the vector in it. 
+                           This can be called by multiple threads concurrently.
+        - read_measurement(workdir, names): return a dict of measured values of output ports (names)
+                           from the measurement record of a run (see measurement.py) if it exists,
+                           else from the measurement files (meas_<name>.txt).
+        - get_batch_size(): the number of vectors simulated at once by run_batch(), 1 if not supported.
+        - run_batch(vectors, option): run a simulation of vectors and return its log.
+                           option['hdl_files'][0] is the testbench of all the vectors in it 
+                           (see TestBench.generate_batch).
+        - read_batch_measurement(workdir, names, n): return a list of measurements of n vectors 
+                           of a batch in workdir, where a failed one is None. They are loaded at once 
+                           from the results file of the batch if it exists (e.g. the records appended 
+                           with keys of the vector indices by run_batch()), else from the indexed 
+                           measurement files.
+        - update_fingerprint(fp): add backend-specific settings to a fingerprint (simcache.Fingerprint)
+                           which identifies a simulation result.
+        - is_compile_once(): True if the testbench is compiled once by compile(), and run() binds 
+                           a vector at runtime. Then, option['compiled_dir'] is the directory where 
+                           the testbench is compiled.
+      "option" is a dict of simulator class options (see Simulator.cls_attribute).
+  '''
+  def __init__(self, sim_cfg, csocket=None, logger_id='logger_id'):
+    self._logger_id = logger_id
+    self._logger = DaVELogger.get_logger('%s.%s.%s' % (logger_id, __name__, self.__class__.__name__))
+    self._csocket = csocket
+    self._simulator_name = sim_cfg.get_simulator_name()
+    self._model_type = sim_cfg.get_model()
+
+  def compile(self, option):
+    pass
+
+  def is_compile_once(self):
+    return False
+
+  def get_batch_size(self):
+    return 1
+
+  def run(self, vector, option, use_cache):
+    raise NotImplementedError
+
+  def run_batch(self, vectors, option):
+    raise NotImplementedError
+
+  def read_batch_measurement(self, workdir, names, n):
+    sink = MeasurementSink(os.path.join(workdir, EnvFileLoc().meas_results))
+    if os.path.isfile(sink.filename):
+      return [ dict([ (p, m[p]) for p in names ]) if m != None and set(names) <= set(m) else None
+               for m in sink.load([ str(k) for k in range(n) ]) ]
+    measurements = []
+    for k in range(n):
+      try:
+        measurements.append(dict([ (p, np.loadtxt(os.path.join(workdir, TestBench.get_batch_meas_filename(p, k))).tolist()) for p in names ]))
+      except Exception:
+        measurements.append(None)
+    return measurements
+
+  def read_measurement(self, workdir, names):
+    record = os.path.join(workdir, EnvFileLoc().meas_record)
+    if os.path.isfile(record): # all the outputs at once
+      measurement = read_record(record)
+      return dict([ (p, measurement[p]) for p in names ])
+    measurement = {}
+    for p in names:
+      fname = 'meas_' + p + '.txt'
+      _meas_file = fname if os.path.isfile(fname) else os.path.join(workdir, fname)
+      measurement[p] = (np.loadtxt(_meas_file)).tolist()
+    return measurement
+
+  def update_fingerprint(self, fp):
+    pass
+
+class HDLSimulatorBackend(SimulatorBackend):
+  ''' Backend which runs an HDL simulator (one of Simulator classes) for each vector 
+        - simulators: a dict of simulator classes for model types
+  '''
+  simulators = {}
+
+  def __init__(self, sim_cfg, csocket=None, logger_id='logger_id'):
+    SimulatorBackend.__init__(self, sim_cfg, csocket, logger_id)
+    assert self._model_type in self.simulators, mcode.ERR_008 % (self._simulator_name.upper(), self._model_type.upper())
+    self._simulator_option = sim_cfg.get_simulator_option()
+    self._ams_option = { 'ams_controlfile' : sim_cfg.get_ams_control_filename(),
+                         'ams_circuits' : sim_cfg.get_circuits(),
+                         'spice_lib' : sim_cfg.get_spice_lib(),
+                         'ams_connrules' : sim_cfg.get_ncams_connrules()}
+    # compile once only for Verilog model in standalone mode, since an AMS control file is bound with a vector
+    self._compile_once = sim_cfg.get_compile_once() and self._model_type == EnvSimcfg().model_vlog and csocket == None
+    if sim_cfg.get_compile_once() and not self._compile_once:
+      self._logger.warn(mcode.WARN_026 % (self._model_type, self._simulator_name))
+    # a batch testbench binds vectors at compile time, thus it is exclusive with compile_once
+    is_batch = self._model_type == EnvSimcfg().model_vlog and csocket == None and not self._compile_once
+    self._batch_size = sim_cfg.get_batch_size() if is_batch else 1
+    if sim_cfg.get_batch_size() > 1 and not is_batch:
+      self._logger.warn(mcode.WARN_028 % (self._model_type, self._simulator_name))
+
+  def is_compile_once(self):
+    return self._compile_once
+
+  def get_batch_size(self):
+    return self._batch_size
+
+  def compile(self, option):
+    ''' compile the testbench in option['compiled_dir'] if compile_once '''
+    if not self._compile_once:
+      return
+    compiled_dir = option['compiled_dir']
+    self._logger.info(mcode.INFO_061 % os.path.relpath(compiled_dir))
+    sim = self._create_simulator({}, dict(option, workdir=compiled_dir, compiled_dir='', compile_only=True), False)
+    if sim.get_executable() == None:
+      self._logger.warn(mcode.WARN_027 % (os.path.relpath(compiled_dir), sim.get_log()))
+    else:
+      self._logger.debug(mcode.DEBUG_026 % (compiled_dir, sim.get_log()))
+
+  def run(self, vector, option, use_cache):
+    return self._create_simulator(vector, option, use_cache).get_log()
+
+  def run_batch(self, vectors, option): # vectors are already bound to the testbench of Verilog model
+    return self._create_simulator({}, option, False).get_log()
+
+  def _create_simulator(self, vector, option, use_cache): # create a simulator object, which runs a simulation
+    simulator = self.simulators[self._model_type]
+    if self._model_type == 'ams':
+      ams_option = dict(self._ams_option, vector=vector)
+      if self._csocket: # if client-server mode
+        workdir = option['workdir']
+        rootdir = workdir[:workdir.rfind('%s'%EnvFileLoc().root_rundir)]
+        ams_option.update({'ams_controlfile': os.path.join(rootdir,'circuit.scs')})
+      sim = simulator(vector, self._simulator_option, option, ams_option, use_cache, self._csocket, logger_id=self._logger_id)
+    else:
+      sim = simulator(vector, self._simulator_option, option, use_cache, self._csocket, logger_id=self._logger_id)
+    return sim
+
+  def update_fingerprint(self, fp):
+    ''' add the simulator options and the files they refer to, i.e. files and library directories of 
+        -v, -f, -y and +incdir+, and AMS netlists, SPICE library and the files they include 
+    '''
+    fp.update('simulator_option', self._simulator_option)
+    files, dirs = get_option_files(self._simulator_option)
+    for f in files:
+      fp.update_file('option_file', f)
+    for d in dirs:
+      fp.update_dir('option_dir', d)
+    fp.update('compile_once', self._compile_once)
+    if self._model_type == 'ams':
+      fp.update_file('ams_controlfile', self._ams_option['ams_controlfile'])
+      for k, v in sorted((self._ams_option['ams_circuits'] or {}).items()):
+        fp.update_file('ams_circuit_%s' % k, v)
+      fp.update('spice_lib', self._ams_option['spice_lib'])
+      netlists = [self._ams_option['ams_controlfile']] + sorted((self._ams_option['ams_circuits'] or {}).values())
+      for f in get_netlist_includes(netlists + (self._ams_option['spice_lib'] or '').split()[:1]):
+        fp.update_file('netlist_include', f)
+      fp.update('ams_connrules', self._ams_option['ams_connrules'])
+
+#-----------------------
+def get_option_files(option):
+  ''' return (files, directories) referred to by simulator options, i.e. files of -v and -f (and the files 
+      listed in them) and directories of -y and +incdir+, which determine a simulation result 
+  '''
+  files, dirs = [], []
+  tokens = option.split()
+  while tokens:
+    t = tokens.pop(0)
+    if t in ['-v', '-f', '-y'] and tokens:
+      name = tokens.pop(0)
+      if t == '-y':
+        dirs.append(name)
+      elif name not in files:
+        files.append(name)
+        if t == '-f' and os.path.isfile(name): # options and files listed in a file
+          with open(name) as f:
+            tokens = [ x for l in f for x in l.split('//')[0].split() ] + tokens
+    elif t.startswith('+incdir+'):
+      dirs += [ d for d in t.split('+')[2:] if d ]
+    elif not t.startswith(('-', '+')) and os.path.isfile(t) and t not in files: # e.g. a source file listed by -f
+      files.append(t)
+  return files, dirs
+
+_NETLIST_INCLUDE = re.compile(r'^\s*\.?(?:include|lib)\s+["\']?([^"\'\s]+)', re.IGNORECASE)
+
+def get_netlist_includes(filenames):
+  ''' return the files included by SPICE/Spectre netlists (include/.include/.lib statements) recursively.
+      A relative path is resolved from the directory of the including file.
+  '''
+  found = []
+  todo = [ f for f in filenames if f ]
+  while todo:
+    filename = todo.pop(0)
+    if not os.path.isfile(filename):
+      continue
+    with open(filename) as f:
+      for l in f:
+        m = _NETLIST_INCLUDE.match(l)
+        if m:
+          inc = os.path.join(os.path.dirname(filename), os.path.expandvars(m.group(1)))
+          if inc not in found and inc not in filenames:
+            found.append(inc)
+            todo.append(inc)
+  return found
+
 #-----------------------
 class Simulator(object):
   def __init__(self, cls_attr={}, csocket=None, logger_id='logger_id'):
@@ -32,12 +266,16 @@ class Simulator(object):
     self.cls_attribute = { 'sweep_file' : True, 
                            'hdl_files' : [], 
                            'workdir' : '/tmp',
+                           'compile_only' : False, # compile the testbench only (compile_once)
+                           'compiled_dir' : '', # run the testbench compiled in this directory if any (compile_once)
+                           'timeout' : 0, # kill a simulation after timeout seconds if not 0
                            'ic' : {},
                            'temperature' : 27,
                            'timescale' : '', 
                            'sim_time'  : '' }
 
     self.cls_attribute.update(cls_attr)
+    self._logfile = None
 
     for k,v in self.cls_attribute.items(): # create class attributes
       setattr(self, '_'+k, v)
@@ -48,19 +286,19 @@ class Simulator(object):
     relpath = workdir[workdir.rfind('%s'%EnvFileLoc().root_rundir):]
 
     if self._csocket == None: # standalone mode
-      self._logger.debug("Changing directory to '%s' for running simulation" % relpath)
       if use_cache:
         self._logger.debug("Using cached resuts.")
-        out = 'Use cached data'
-        err = ''
-      else:
-        self._runscript = 'pushd ${PWD}>/dev/null\n cd %s\n' % workdir +self._runscript+'\n popd'
-        p=subprocess.Popen(self._runscript, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        out, err  = p.communicate()
-      sim_msg = out + '\n' + err
-      self._logger.debug("Simulation message: %s" % sim_msg)
-      self._logger.debug("Going back to running directory")
-      self._sweep_files(workdir) # sweep temporary simulation files
+        sim_msg = 'Use cached data'
+      else: # run the script in workdir, whose output is written to a log file
+        self._logger.debug("Running simulation at '%s'" % relpath)
+        self._logfile = os.path.join(workdir, EnvFileLoc().simlogfile)
+        # the script is read by a shell rather than executed, since executing a file just written 
+        # fails (text file busy) if a process forked by another thread at that time holds it open
+        returncode = get_process_runner().run('sh %s' % self._runscript, workdir, self._logfile, self._timeout, stage='simulator')
+        self._logger.debug(mcode.DEBUG_028 % (returncode, self._logfile))
+        sim_msg = ''
+      if not self._compile_only: # keep the compiled testbench
+        self._sweep_files(workdir) # sweep temporary simulation files
     else: # client-server mode
       files = filter(os.path.isfile, glob.glob(os.path.join(self._workdir,'*')))
       files = [os.path.join(relpath, misc.get_basename(f)) for f in files]
@@ -72,9 +310,14 @@ class Simulator(object):
         sim_msg = f.readlines()
     return sim_msg
 
-  def get_log(self): # simulation log
+  def get_log(self): # simulation log, which is read from the log file if a simulation ran
+    if self._logfile:
+      return read_log(self._logfile)
     return self._sim_msg
 
+  def get_executable(self): # compiled testbench if compile_only and it exists, else None
+    return None
+
   def _generate_runscript(self, run_cmd, is_vcs, workdir): # generate a run script in C-shell
     filename = os.path.join(workdir, 'run_vlog.csh')
     run_script = run_cmd + '\n nice ./simv' if is_vcs else run_cmd # content of a script
@@ -88,22 +331,28 @@ class VCSSimulator(Simulator):
   ''' Simulator for Synopsys' VCS '''
   def __init__(self, vector, simulator_option, cls_attr={}, use_cache=False, csocket=None, logger_id='logger_id'):
     Simulator.__init__(self, cls_attr, csocket, logger_id=logger_id)
-    sim_cmd = ['nice vcs'] 
-    self.run_cmd = ' '.join( sim_cmd + 
-                             self._hdl_files + 
-                             self._default_simulator_option() + 
-                             [simulator_option] )
-    self._runscript = self._generate_runscript(self.run_cmd, True, self._workdir)
+    if self._compiled_dir: # launch the compiled testbench with the vector
+      self.run_cmd = ' '.join( ['nice', os.path.join(self._compiled_dir, 'simv')] + 
+                               TestBench.get_plusargs(vector) )
+      self._runscript = self._generate_runscript(self.run_cmd, False, self._workdir)
+    else:
+      sim_cmd = ['nice vcs'] 
+      self.run_cmd = ' '.join( sim_cmd + 
+                               self._hdl_files + 
+                               self._default_simulator_option() + 
+                               [simulator_option] )
+      self._runscript = self._generate_runscript(self.run_cmd, not self._compile_only, self._workdir)
     self._sim_msg = self.run(use_cache)
 
+  def get_executable(self):
+    simv = os.path.join(self._workdir, 'simv')
+    return simv if self._compile_only and os.path.isfile(simv) else None
+
   def _default_simulator_option(self):
     return ['-sverilog -top test', '-timescale=' + self._timescale, '-debug_pp'] 
 
-  def _sweep_files(self, workdir):
-    shutil.rmtree(os.path.join(workdir, 'simv.daidir'), True)
-    shutil.rmtree(os.path.join(workdir, 'csrc'), True)
-    for x in ['simv', 'ucli.key', 'vc_hdrs.h', 'vcdplus.vpd']:
-      misc.rmfile(os.path.join(workdir, x)) 
+  def _sweep_files(self, workdir): # removed in background
+    get_rundir_manager().sweep([ os.path.join(workdir, x) for x in ['simv.daidir', 'csrc', 'simv', 'ucli.key', 'vc_hdrs.h', 'vcdplus.vpd'] ])
 
 
 #----------------------------
@@ -119,11 +368,21 @@ class NCSimulator(Simulator):
     ''' initialize '''
     Simulator.__init__(self, cls_attr, csocket, logger_id=logger_id)
     sim_cmd = ['nice ncverilog']
-    self.run_cmd = ' '.join( sim_cmd + 
-                             self._hdl_files + 
-                             self._default_simulator_option() +
-                             [simulator_option] )
+    if self._compiled_dir: # run the snapshot compiled in compiled_dir with the vector
+      self.run_cmd = ' '.join( sim_cmd + 
+                               ['-R', '+nclibdirname+' + os.path.join(self._compiled_dir, 'INCA_libs'), '+NCINPUT+hdl.tcl'] + 
+                               TestBench.get_plusargs(vector) )
+    else:
+      self.run_cmd = ' '.join( sim_cmd + 
+                               self._hdl_files + 
+                               self._default_simulator_option() +
+                               [simulator_option] + 
+                               (['-c'] if self._compile_only else []) )
     self._generate_hdl_tcl(self._workdir)
+
+  def get_executable(self):
+    libdir = os.path.join(self._workdir, 'INCA_libs')
+    return libdir if self._compile_only and os.path.isdir(libdir) else None
   
   def _generate_hdl_tcl(self, workdir): # generate hdl.tcl in simulation directory '''
     with open(os.path.join(workdir, 'hdl.tcl'),'w') as f:
@@ -134,25 +393,25 @@ class NCSimulator(Simulator):
 
   def _sweep_files(self, workdir): # sweep temporary simulation files
     # Common to Verilog & VerilogAMS
-    shutil.rmtree(os.path.join(workdir, 'INCA_libs'), True)
-    shutil.rmtree(os.path.join(workdir, 'test.shm'), True)
-    misc.rmfile(os.path.join(workdir, 'ncverilog.key'))
+    files = [ os.path.join(workdir, x) for x in ['INCA_libs', 'test.shm', 'ncverilog.key'] ]
 
     # VerilogAMS only
     try:
-      shutil.rmtree(os.path.join(workdir, '{0}.raw'.format(os.path.splitext(self.scsfile)[0])), True)
-      shutil.rmtree(os.path.join(workdir, '{0}.ahdlSimDB'.format(os.path.split(os.path.splitext(self.scsfile)[0])[1])), True)
-      shutil.rmtree(os.path.join(workdir, 'portmap_files'), True)
-      shutil.rmtree(os.path.join(workdir, '.ams_spice_in'), True)
+      files += [ os.path.join(workdir, '{0}.raw'.format(os.path.splitext(self.scsfile)[0])),
+                 os.path.join(workdir, '{0}.ahdlSimDB'.format(os.path.split(os.path.splitext(self.scsfile)[0])[1])),
+                 os.path.join(workdir, 'portmap_files'),
+                 os.path.join(workdir, '.ams_spice_in') ]
     except:
       pass
+    get_rundir_manager().sweep(files) # removed in background
 
 #-----------------------------
 class NCVerilogD(NCSimulator):
   ''' Simulator for (S)Verilog-D using NC simulator '''
   def __init__(self, vector, simulator_option, cls_attr={}, use_cache=False, csocket=None, logger_id='logger_id'):
     NCSimulator.__init__(self, vector, simulator_option, cls_attr, csocket, logger_id=logger_id)
-    self.run_cmd = self.run_cmd + ' -SV '
+    if not self._compiled_dir:
+      self.run_cmd = self.run_cmd + ' -SV '
     self._runscript = self._generate_runscript(self.run_cmd, False, self._workdir)
     self._sim_msg = self.run(use_cache)
 
@@ -167,6 +426,7 @@ class NCVerilogAMS(NCSimulator):
       string prop sourcefile_opts="-auto_bus -bus_delim <>";
     }}
   '''
+  _scs_templates = {} # (filename, mtime) -> compiled analog control file template
   def __init__(self, vector, simulator_option, cls_attr={}, ams_option={}, use_cache=False, csocket=None, logger_id='logger_id'):
     NCSimulator.__init__(self, vector, simulator_option, cls_attr, csocket, logger_id=logger_id)
     self._ams_option = {'ams_controlfile': '', 'ams_circuits': None, 'spice_lib': None, 'ams_connrules': None}
@@ -205,13 +465,19 @@ class NCVerilogAMS(NCSimulator):
 
   def _gen_scs_file(self, scs_template, param, vector, workdir): # generate analog control file 
     # two step, the second phase bind vectors to initial condition statement in .scs file if any 
-    tmp_file = os.path.join(workdir, 'analog_%s.scs' % misc.generate_random_str('',5))
-    tmpfile = EmpyInterface(tmp_file)(scs_template, param)
+    # the template is compiled once, and the first phase is done in memory
+    tmp_scs = CompiledTemplate(StringIO(self._get_scs_template(scs_template).expand(param)))
     dst_file = os.path.join(workdir, 'analog_%s.scs' % misc.generate_random_str('',5))
-    scsfile = EmpyInterface(dst_file)(tmpfile, vector)
-    misc.rmfile(tmpfile)
+    scsfile = tmp_scs(dst_file, vector)
     return misc.get_basename(scsfile)
 
+  @classmethod
+  def _get_scs_template(cls, scs_template): # compiled analog control file template, which is cached
+    key = (scs_template, os.path.getmtime(scs_template))
+    if key not in cls._scs_templates:
+      cls._scs_templates[key] = CompiledTemplate(scs_template)
+    return cls._scs_templates[key]
+
   def _gen_ckt_propspath(self, circuit, workdir='/tmp'):
     ''' generate cadence props.cfg file to import circuit netlist 
         TODO: Sometimes, the auto_bus expansion of cadence NCAMS does not work '''
@@ -220,3 +486,14 @@ class NCVerilogAMS(NCSimulator):
       for p, v in circuit.items():
         f.write(self.PROP_STR.format(cellname=p, netlistfile=os.path.abspath(v)))
     return misc.get_basename(filename)
+
+
+#-----------------------------------------
+class NCSimulatorBackend(HDLSimulatorBackend):
+  simulators = {'ams': NCVerilogAMS, 'verilog': NCVerilogD}
+
+class VCSSimulatorBackend(HDLSimulatorBackend):
+  simulators = {'verilog': VCSSimulator}
+
+register_simulator('ncsim', NCSimulatorBackend)
+register_simulator('vcs', VCSSimulatorBackend)
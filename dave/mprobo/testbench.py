@@ -4,8 +4,8 @@ __doc__ = '''
 '''
 
 import os
-from environ import EnvFileLoc, EnvSimcfg, EnvTestcfgSection
-from dave.common.empyinterface import EmpyInterface
+from environ import EnvFileLoc, EnvSimcfg, EnvTestcfgSection, EnvTestcfgTestbench, EnvPortName
+from dave.common.empyinterface import EmpyInterface, CompiledTemplate
 from dave.common.davelogger import DaVELogger
 import testbench_template
 from dave.common.primitive import WireCrossReference 
@@ -14,6 +14,7 @@ import copy
 import subprocess
 import StringIO
 import re
+import numpy as np
 import dave.mprobo.mchkmsg as mcode
 
 #-----------------------
@@ -40,7 +41,8 @@ class TestBench(object):
     param ={ envsim.model : model, 
              envsim.simulator : sim_cfg.get_simulator_name(), 
              envsim.hdl_include_files : sim_cfg.get_hdl_include_files(),
-             envtest.initial_condition : ic }
+             envtest.initial_condition : ic,
+             'runtime_vector' : self._get_runtime_vector_type(test_cfg) if sim_cfg.get_compile_once() and model == envsim.model_vlog else [] }
     param.update(test)
 
     filename = 'tb_%s_%s.v' % (test_cfg.get_test_name(), config_name)
@@ -48,15 +50,70 @@ class TestBench(object):
 
   @classmethod
   def generate(cls, raw_tb_file, param, filename, workdir='/tmp'):
-    ''' return a testbench file after binding testvectors (param) to the raw testbench file '''
+    ''' return a testbench file after binding testvectors (param) to the raw testbench file,
+        which is either a filename, a file object, or a compiled one (see compile())
+    '''
+    if isinstance(raw_tb_file, CompiledTemplate):
+      return raw_tb_file(os.path.join(workdir, filename), param)
     if type(raw_tb_file) == type(''):
       assert os.path.exists(raw_tb_file), mcode.ERR_020 % raw_tb_file
     return EmpyInterface(os.path.join(workdir, filename))(raw_tb_file, param)
 
+  @classmethod
+  def compile(cls, raw_tb_file):
+    ''' return the raw testbench file compiled once for binding testvectors repeatedly '''
+    assert os.path.exists(raw_tb_file), mcode.ERR_020 % raw_tb_file
+    return CompiledTemplate(raw_tb_file)
+
+  @classmethod
+  def generate_batch(cls, raw_tb_file, vectors, outputs, filename, workdir='/tmp'):
+    ''' return a testbench file which simulates multiple test vectors at once.
+        Each vector is bound to its own copy of the testbench module, test_<k>, which dumps 
+        the responses (outputs) to indexed measurement files (see get_batch_meas_filename). 
+        A top module, test, instantiates all the copies to simulate them in parallel.
+    '''
+    header = ''
+    modules = []
+    if not isinstance(raw_tb_file, CompiledTemplate):
+      raw_tb_file = cls.compile(raw_tb_file)
+    for k, vector in enumerate(vectors):
+      header_k, module = re.split(r'^module test;', raw_tb_file.expand(vector), 1, flags=re.M)
+      header = header or header_k # include/timescale directives are declared once
+      module = re.sub(r'\btest\.', 'test.test_%d.' % k, module) # hierarchical names
+      for p in outputs:
+        module = re.sub(r'\bmeas_%s\.txt\b' % re.escape(p), cls.get_batch_meas_filename(p, k), module)
+      modules.append('module test_%d;' % k + module)
+    top = '\n'.join(['module test;'] + [ 'test_%d test_%d ();' % (k, k) for k in range(len(vectors)) ] + ['endmodule\n'])
+    with open(os.path.join(workdir, filename), 'w') as f:
+      f.write(re.sub(r'[\r\n][\r\n]{2,}', '\n\n', '\n'.join([header] + modules + [top])))
+    return os.path.abspath(os.path.join(workdir, filename))
+
+  @classmethod
+  def get_batch_meas_filename(cls, name, index):
+    ''' return a measurement filename of a response (name) of the index-th vector in a batch '''
+    return 'meas_%s_%d.txt' % (name, index)
+
   def get_raw_filename(self):
     ''' it returns raw testbench filename '''
     return self._tb_raw
 
+  @classmethod
+  def get_runtime_vector(cls, vector):
+    ''' return a dict of {port name: variable name} to bind a test vector at runtime (compile_once) '''
+    prefix = EnvTestcfgTestbench().runtime_vector_prefix
+    return dict([ (k, prefix+k) for k in vector.keys() ])
+
+  @classmethod
+  def get_plusargs(cls, vector):
+    ''' return a list of plusargs of a test vector to be read by a testbench compiled once '''
+    return [ '+%s=%d' % (k, v) if isinstance(v, (int, long, np.integer)) else '+%s=%r' % (k, float(v)) for k, v in sorted(vector.items()) ]
+
+  def _get_runtime_vector_type(self, test_cfg):
+    ''' return a list of (port name, variable type) of input ports bound at runtime '''
+    envport = EnvPortName()
+    input_type = { envport.AnalogInput : 'real', envport.QuantizedAnalog : 'integer', envport.DigitalMode : 'integer' }
+    return sorted([ (k, input_type[test_cfg.get_port_type(v)]) for k, v in test_cfg.get_port().items() if test_cfg.get_port_type(v) in input_type ])
+
 
 #-----------------------------------
 class TestBenchCDSInterface(object):
@@ -41,6 +41,25 @@ module test;
 @p @x; 
 @[end for] @[end for]
 
+@[if runtime_vector]
+///////////////////////////////////////////////////////////////////////////
+// test vector bound at runtime by plusargs (compile_once)
+///////////////////////////////////////////////////////////////////////////
+function automatic real mProbo_real_plusarg(input string name);
+  real value;
+  if (!$value$plusargs({name, "=%f"}, value)) value = 0.0;
+  return value;
+endfunction
+function automatic integer mProbo_integer_plusarg(input string name);
+  integer value;
+  if (!$value$plusargs({name, "=%d"}, value)) value = 0;
+  return value;
+endfunction
+@[for p,t in runtime_vector]@
+@t @(_tenvtb.runtime_vector_prefix)@p = mProbo_@(t)_plusarg("@p");
+@[end for]@
+@[end if]
+
 ///////////////////////////////////////////////////////////////////////////
 // initial condition if Verilog
 ///////////////////////////////////////////////////////////////////////////
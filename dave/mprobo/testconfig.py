@@ -3,7 +3,7 @@ import sys
 from configobj import ConfigObj
 from configobjwrapper import ConfigObjWrapper
 import copy
-from dave.common.misc import from_engr, eval_str, flatten_list, generate_random_str, get_abspath, all_therm, all_bin, all_gray, all_onehot, featureinfo, interpolate_env, print_section
+from dave.common.misc import from_engr, eval_str, flatten_list, get_abspath, all_therm, all_bin, all_gray, all_onehot, featureinfo, interpolate_env, print_section
 import os
 import collections
 from BitVector import BitVector
@@ -256,6 +256,12 @@ class UnitTestConfig(object):
   def get_option_regression_input_sensitivity_threshold(self):
     return self.get_option()[self._tenvr.regression_sval_threshold]
 
+  def get_option_adaptive_sampling(self):
+    return self.get_option()[self._tenvr.adaptive_sampling]
+
+  def get_option_vector_seed(self): # None if not given
+    return self.get_option()[self._tenvr.vector_seed]
+
   def get_simulation_time(self):
     ''' return simulation time '''
     return self._test_cfg[self._tenvs.simulation][self._tenvts.sim_time] 
@@ -487,7 +493,7 @@ class UnitTestConfig(object):
     measfile = {}
     tname = self.get_test_name()
     for p, v in response.items():
-      fileid = generate_random_str('f', 5)
+      fileid = 'fid_%s' % p # not random so that a testbench is the same across runs
       filename = '_'.join(['meas', p + '.txt']) 
       time_opt = filter(lambda x,opt=[self._tenvtb.sample_at]:x in opt, v.keys())
       for x in time_opt:
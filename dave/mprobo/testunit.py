@@ -8,13 +8,17 @@ import copy
 import pandas as pd
 from pprint import pformat
 import numpy as np
-import multiprocessing as mp
 
 from port import PortHandler
 from vectorgenerator import TestVectorGenerator
+from adaptivesampler import AdaptiveSampler
 from simulation import RunVector
+from executor import JobExecutor, as_completed
 from linearregression import LinearRegressionSM
+from olsengine import DesignMatrix, IncrementalDesignMatrix
 from testbench import TestBench 
+from rundir import get_rundir_manager
+from profiler import get_profiler
 from dave.mprobo.environ import EnvTestcfgOption, EnvFileLoc, EnvSimcfg
 from dave.mprobo.checker import UnitChecker, generate_check_summary_table
 import dave.mprobo.verilogparser as vp
@@ -25,12 +29,13 @@ from dave.common.checkeval import ehdnsxmgor
 
 class TestUnit(object):
   ''' Do checking for a test '''
-  def __init__(self, test_cfg, sim_cfg, testdir='/tmp', rpt=None, goldensim_only=False, revisedsim_only=False, use_cache=False, no_thread=1, no_otfc=False, csocket=None, logger_id='logger_id'):
+  def __init__(self, test_cfg, sim_cfg, testdir='/tmp', rpt=None, goldensim_only=False, revisedsim_only=False, use_cache=False, no_thread=1, no_otfc=False, csocket=None, sim_cache=None, executor=None, logger_id='logger_id'):
     ''' 
       test_cfg : test configuration cls object of a single test
       sim_cfg_(golden,revised) : simulator configuration cls object for golden, revised
       testdir : top directory of this test run
       rpt : report cls object
+      executor : worker pool (executor.JobExecutor) for simulations, which may be shared by tests
     '''
 
     # get system reserved words
@@ -44,8 +49,12 @@ class TestUnit(object):
 
     self._rptgen = rpt # report gen obj
     self._cache = use_cache
+    self._sim_cache = sim_cache # persistent simulation result cache (simcache.SimulationCache) if any
 
-    self._np = no_thread # no of threads
+    self._np = no_thread # no of simulations running in parallel
+    # worker pool for simulations; commands to a client are serialized in client-server mode
+    self._own_executor = executor == None
+    self._executor = JobExecutor(1 if csocket else no_thread, logger_id=self._logger_id) if self._own_executor else executor
     self._no_otfc = no_otfc # no on-the-fly check for pin consistency
 
     sim_cfg_golden = sim_cfg.get_golden()
@@ -92,32 +101,23 @@ class TestUnit(object):
     self._create_port(self._test_cfg)
 
     # get vector generator obj.
-    self._tvh = TestVectorGenerator(self._ph, self._test_cfg, logger_id=self._logger_id)
+    with get_profiler().stage('vector_generation'):
+      # vectors are seeded if either model uses the simulation result cache, so that its results are reusable across runs
+      seed = 0 if self._get_sim_cache(True) or self._get_sim_cache(False) else None
+      self._tvh = TestVectorGenerator(self._ph, self._test_cfg, default_seed=seed, logger_id=self._logger_id)
 
     # running vector instance
-    self._rv_golden = RunVector(self._test_cfg, self._sim_cfg_golden, self._ph, self._tb_golden, self._cache, self._csocket, logger_id=self._logger_id)
-    self._rv_revised = RunVector(self._test_cfg, self._sim_cfg_revised, self._ph, self._tb_revised, self._cache, self._csocket, logger_id=self._logger_id)
+    # each model uses the simulation result cache if enabled, so that e.g. golden results are reused while a revised model is changed
+    self._rv_golden = RunVector(self._test_cfg, self._sim_cfg_golden, self._ph, self._tb_golden, self._cache, self._csocket, self._get_sim_cache(True), self._get_results_file(True), logger_id=self._logger_id)
+    self._rv_revised = RunVector(self._test_cfg, self._sim_cfg_revised, self._ph, self._tb_revised, self._cache, self._csocket, self._get_sim_cache(False), self._get_results_file(False), logger_id=self._logger_id)
 
-    # get a linear regressor obj.s for pin discrepancy check
-    self._lrg_simple = LinearRegressionSM(self._ph, logger_id=self._logger_id)
-    self._lrr_simple = LinearRegressionSM(self._ph, logger_id=self._logger_id)
-
-    # get a linear regressor obj.s for pin discrepancy check (suggested)
-    self._lrg_sgt_simple = LinearRegressionSM(self._ph, logger_id=self._logger_id)
-    self._lrr_sgt_simple = LinearRegressionSM(self._ph, logger_id=self._logger_id)
-
-    # get a linear regressor obj.s
-    self._lrg = LinearRegressionSM(self._ph, logger_id=self._logger_id)
-    self._lrr = LinearRegressionSM(self._ph, logger_id=self._logger_id)
-
-    # regressor obj for selected model
-    self._lrg_sgt = LinearRegressionSM(self._ph, logger_id=self._logger_id)
-    self._lrr_sgt = LinearRegressionSM(self._ph, logger_id=self._logger_id)
+    self._create_regressors()
 
-    if self._cache:
-      self._tvh.load_test_vector(self._ph, self.testdir)
-    else:
-      self._tvh.dump_test_vector(self._ph, self.testdir)
+    with get_profiler().stage('vector_dump'):
+      if self._cache:
+        self._tvh.load_test_vector(self._ph, self.testdir)
+      else:
+        self._tvh.dump_test_vector(self._ph, self.testdir)
 
     # report port information
     if self._rptgen != None:
@@ -134,19 +134,55 @@ class TestUnit(object):
     if self._rptgen != None:
       self._rptgen.print_testmode_title(self._testname, digital_mode, modetexts)
 
+    # modes run concurrently sharing the worker pool, and their reports are written in order
+    units = [ self._fork_mode_unit() for mode in digital_mode ]
+    tasks = [ self._executor.spawn((self._testname, idx), units[idx]._run_all_modes, mode, modetexts[idx], idx) 
+              for idx, mode in enumerate(digital_mode) ]
     for idx, mode in enumerate(digital_mode): # for each mode
-      _mode_res = self._run_all_modes(mode, modetexts[idx], idx)
+      _mode_res = tasks[idx].result()
+      if self._rptgen != None:
+        self._rptgen.join(units[idx]._rptgen)
       mode_result.append((mode, modetexts[idx], _mode_res)) # append a mode result
 
+    if self._own_executor:
+      self._executor.shutdown()
     return mode_result
 
+  def _create_regressors(self):
+    ''' create linear regressor objects of a mode '''
+    # get a linear regressor obj.s for pin discrepancy check
+    self._lrg_simple = LinearRegressionSM(self._ph, logger_id=self._logger_id)
+    self._lrr_simple = LinearRegressionSM(self._ph, logger_id=self._logger_id)
+
+    # get a linear regressor obj.s for pin discrepancy check (suggested)
+    self._lrg_sgt_simple = LinearRegressionSM(self._ph, logger_id=self._logger_id)
+    self._lrr_sgt_simple = LinearRegressionSM(self._ph, logger_id=self._logger_id)
+
+    # get a linear regressor obj.s
+    self._lrg = LinearRegressionSM(self._ph, logger_id=self._logger_id)
+    self._lrr = LinearRegressionSM(self._ph, logger_id=self._logger_id)
+
+    # regressor obj for selected model
+    self._lrg_sgt = LinearRegressionSM(self._ph, logger_id=self._logger_id)
+    self._lrr_sgt = LinearRegressionSM(self._ph, logger_id=self._logger_id)
+
+  def _fork_mode_unit(self):
+    ''' return a copy of this test unit with its own regressors and report buffer
+        so that a mode can run concurrently with the other modes 
+    '''
+    unit = copy.copy(self)
+    unit._create_regressors()
+    unit._rptgen = self._rptgen.fork() if self._rptgen != None else None
+    return unit
+
   def _run_all_modes(self, mode_vector, modetxt, mode_idx):
     ''' run modes configured by true digital inputs '''
     map(self._logger.info, print_section('Testing the mode (%s)' % modetxt, 2))
     if self._rptgen != None:
       self._rptgen.print_testmode(mode_idx+1, modetxt, self._rptgen.make_testmode_link(self._testname, mode_vector)) # create hyperlink for each mode in a report
 
-    return self._run_mode(mode_idx, mode_vector, modetxt) # checks each configuraed system
+    with get_profiler().context(test=self._testname, mode=mode_idx), get_profiler().stage('mode'):
+      return self._run_mode(mode_idx, mode_vector, modetxt) # checks each configuraed system
     
   def _run_mode(self, nth_mode, mode, modetxt): # run analog vectors for each linear circuit mode
     ''' runs a mode out of all possible linear circuit modes
@@ -159,15 +195,14 @@ class TestUnit(object):
     if self._cache:
       self._logger.info('\n'+mcode.INFO_023)
 
-    # empty space for vector, measurement
-    exec_vector = dict([ (p, np.zeros(max_run)) for p in self._ph.get_input_port_name() ])
+    # empty space for measurement
     meas_golden = dict([ (p, np.zeros(max_run)) for p in self._ph.get_output_port_name() ])
     meas_revised = dict([ (p, np.zeros(max_run)) for p in self._ph.get_output_port_name() ])
 
     if self._inv: dlrtmvkdldjem()
 
-    # test vector including digital mode
-    vector = [dict(self._tvh.get_analog_vector(i), **mode) for i in range(max_run)]
+    # test vector store including digital mode
+    vector = self._tvh.get_mode_vector(mode)
 
     # run simulation for each test vector/ gather measurements
     #if self._ph.get_by_name('dummy_analoginput') != None:
@@ -183,6 +218,11 @@ class TestUnit(object):
     #else:
     #  Nrun_u = 1
     #  Nrun_uchk = 1
+
+    # adaptive sampler picks the next vectors out of the rest of the vector store
+    sampler = self._get_adaptive_sampler(vector, mode) if (not self._no_otfc) and (not self._cache) else None
+    otf_design = IncrementalDesignMatrix() # samples of on-the-fly checks, to which the samples of each chunk are appended
+
     sim_idx = 0
     #for i in range(0, max_run, Nrun_u):
     while sim_idx < max_run:
@@ -191,18 +231,18 @@ class TestUnit(object):
       else:
         no_run = min(Nrun_u, (max_run - sim_idx))
       lastrun = True if (sim_idx+no_run == max_run) else False
+      if sampler:
+        sampler.select(sim_idx, no_run)
     
-      simres_golden, simres_revised = self._exercise_unit(nth_mode, mode, sim_idx, no_run, max_run, vector)
+      simres_golden, simres_revised = self._exercise_unit(nth_mode, mode, sim_idx, no_run, max_run, vector, sampler.index if sampler else None)
       for j in range(sim_idx, sim_idx+no_run): 
-        for k, v in vector[j].items():
-          exec_vector[k][j] = v
         for k, v in simres_golden[j-sim_idx][1].items():
           meas_golden[k][j] = v
         for k, v in simres_revised[j-sim_idx][1].items():
           meas_revised[k][j] = v
 
       # chop data upto current run
-      _exec_vector = dict([ (p, exec_vector[p][:sim_idx+no_run]) for p in self._ph.get_input_port_name() ])
+      _exec_vector = vector[:sim_idx+no_run]
       _meas_golden = dict([ (p, meas_golden[p][:sim_idx+no_run]) for p in self._ph.get_output_port_name() ])
       _meas_revised = dict([ (p, meas_revised[p][:sim_idx+no_run]) for p in self._ph.get_output_port_name() ])
 
@@ -212,9 +252,12 @@ class TestUnit(object):
       if (not self._no_otfc) and (not self._cache): # unlesss on-the-fly check is disabled
         self._logger.info('')
         exec_vector_new=TestVectorGenerator.get_effective_vector(_exec_vector, self._ph)
-        lr_formulas = self._run_linear_regression(mode, nth_mode, exec_vector_new, _meas_golden, _meas_revised, quite= True) # linear regression equation of a golden model
+        lr_formulas = self._run_linear_regression(mode, nth_mode, exec_vector_new, _meas_golden, _meas_revised, quite= True, design=otf_design) # linear regression equation of a golden model
         if not self._check_equivalence(): # not equivalent
           break
+        if sampler and sampler.is_converged([self._lrg_sgt, self._lrr_sgt]): # enough samples
+          self._logger.info(mcode.INFO_059 % (sim_idx+no_run))
+          break
       sim_idx += no_run
 
     ## dump vector/measurement 
@@ -226,7 +269,8 @@ class TestUnit(object):
 
     # generate reports
     if self._rptgen != None:
-      err_flag_pin, err_flag_residue = self._generate_mode_report()
+      with get_profiler().stage('report_generation'):
+        err_flag_pin, err_flag_residue = self._generate_mode_report()
 
 
     res =  {'vector_golden': self._remove_mode_vector(exec_vector_new, mode), 
@@ -244,6 +288,15 @@ class TestUnit(object):
 
     return res
 
+  def _get_adaptive_sampler(self, vector, mode):
+    ''' return an adaptive sampler over the vector store if enabled in test config '''
+    if not self._test_cfg.get_option_adaptive_sampling():
+      return None
+    return AdaptiveSampler(self._ph, vector, mode, 
+                           order=int(self._test_cfg.get_option_regression_order()), 
+                           en_interact=self._test_cfg.get_option_regression_en_interact(), 
+                           logger_id=self._logger_id)
+
   def _print_interim_summary(self, result, test, mode, modetxt):
     ''' logging error summary '''
     map(self._logger.info, print_section(mcode.INFO_058 % modetxt, 3))
@@ -253,65 +306,32 @@ class TestUnit(object):
     self._logger.info(tab.draw())
 
 
-  def _exercise_unit(self, nth_mode, mode, offset, nrun, max_run, vector):
+  def _exercise_unit(self, nth_mode, mode, offset, nrun, max_run, vector, index=None):
     ''' excercise a mode with generated (quantized) analog vectors 
-          - mutiprocessing capability is supported, yet need to be improved 
+          - index: generated order of the vectors if reordered (see AdaptiveSampler.index), which names
+            their run directories so that they match the dumped test vectors in a later run with cached data
+          - golden and revised simulations are submitted to the executor as jobs in one queue, 
+            and their results are gathered as each job completes
+          - a job simulates a batch of vectors if the batch size of a model is larger than 1
     '''
     
-    np = self._np # number of threads
     for i in range(offset, offset+nrun):
-      pretty_vector = dict([ (k, TestVectorGenerator.conv_tobin(self._ph, k, v)) for k, v in vector[i].items() ])
+      pretty_vector = dict([ (k, TestVectorGenerator.conv_tobin(self._ph, k, vector[i][k])) for k in vector.dtype.names ])
       self._logger.info(mcode.INFO_024 % (i+1, max_run, pformat(pretty_vector, width=1000))) # display running vector
 
-    # run vectors (Multiprocessing enabled)
-    if (self._np > 1):
-      # Queue
-      q_golden = [mp.Queue()]*nrun
-      q_revised = [mp.Queue()]*nrun
-      q = mp.Manager().Queue(4)
-      no_cpu = mp.cpu_count()
-      if not self.revisedsim_only:
-        p = [mp.Process(target=self._run_vector, args=(q_golden[i], vector[offset+i], nth_mode, offset+i, max_run, True)) for i in range(nrun)]
-        for i in range(nrun/np+1):
-          for j in range(np):
-            if i*np+j < nrun:
-              p[i*np+j].start()
-          if np < no_cpu:
-            for j in range(np):
-              if i*np+j < nrun:
-                p[i*np+j].join()
-  
-      if not self.goldensim_only:
-        p = [mp.Process(target=self._run_vector, args=(q_revised[i], vector[offset+i], nth_mode, offset+i, max_run, False)) for i in range(nrun)]
-        for i in range(nrun/np+1):
-          for j in range(np):
-            if i*np+j < nrun:
-              p[i*np+j].start()
-          if np < no_cpu:
-            for j in range(np):
-              if i*np+j < nrun:
-                p[i*np+j].join()
-
-      # get results
-      if not self.goldensim_only:
-        _tmp = sorted([q_revised[i].get() for i in range(nrun)], key=lambda t:t[0])
-        simres_revised = [t[1] for t in _tmp]
-
-      if not self.revisedsim_only:
-        _tmp = sorted([q_golden[i].get() for i in range(nrun)], key=lambda t:t[0])
-        simres_golden = [t[1] for t in _tmp]
-
-
-    else:
-      if not self.revisedsim_only:
-        _x = [self._run_vector(None, vector[offset+i], nth_mode, offset+i, max_run, True) for i in range(nrun)]
-        _tmp = sorted([_x[i] for i in range(nrun)], key=lambda t:t[0])
-        simres_golden = [t[1] for t in _tmp]
-
-      if not self.goldensim_only:
-        _x = [self._run_vector(None, vector[offset+i], nth_mode, offset+i, max_run, False) for i in range(nrun)]
-        _tmp = sorted([_x[i] for i in range(nrun)], key=lambda t:t[0])
-        simres_revised = [t[1] for t in _tmp]
+    models = [ m for m, skip in [(True, self.revisedsim_only), (False, self.goldensim_only)] if not skip ]
+    batches = sorted([ (i, is_golden, range(i, min(i+self._get_batch_size(is_golden), nrun)))
+                       for is_golden in models for i in range(0, nrun, self._get_batch_size(is_golden)) ])
+    run_ids = index if index is not None else range(max_run)
+    futures = [ self._executor.submit((is_golden, idx), self._run_vectors, vector[[offset+j for j in idx]].copy(), nth_mode, [offset+j for j in idx], 
+                                      [run_ids[offset+j] for j in idx], max_run, is_golden)
+                for i, is_golden, idx in batches ]
+    simres = {True: [None]*nrun, False: [None]*nrun}
+    for f in as_completed(futures):
+      is_golden, idx = f.key
+      for i, res in zip(idx, f.result()):
+        simres[is_golden][i] = res[1]
+    simres_golden, simres_revised = simres[True], simres[False]
 
     if self.revisedsim_only:
       simres_golden = simres_revised
@@ -321,18 +341,34 @@ class TestUnit(object):
 
     return simres_golden, simres_revised
 
-  def _run_vector(self, queue, vector, nth_mode, nth_sim, max_run, is_golden):
-    ''' run a simulation with a given vector'''
+  def _get_batch_size(self, is_golden): # number of vectors simulated at once
+    return (self._rv_golden if is_golden else self._rv_revised).get_batch_size()
+
+  def _run_vectors(self, vectors, nth_mode, nth_sims, run_ids, max_run, is_golden):
+    ''' run a simulation with a batch of vectors, or with a vector if there is only one '''
+    if len(vectors) == 1:
+      return [self._run_vector(vectors[0], nth_mode, nth_sims[0], run_ids[0], max_run, is_golden)]
+    rootdir = self.golden_dir if is_golden else self.revised_dir
+    rv = self._rv_golden if is_golden else self._rv_revised
+    rundirs = [ os.path.join(rootdir, 'run_mode%d_%d' %(nth_mode, run_id)) for run_id in run_ids ]
+    batchdir = os.path.join(rootdir, 'batch_mode%d_%d_%d' %(nth_mode, nth_sims[0], nth_sims[-1]))
+    with get_profiler().context(test=self._testname, mode=nth_mode, model=self.mdl_name(is_golden), vector='%d-%d' % (nth_sims[0], nth_sims[-1])):
+      measurements = rv.run_batch(vectors, rundirs, batchdir)
+    for nth_sim, measurement in zip(nth_sims, measurements):
+      self._logger.info(mcode.INFO_025 % (self.mdl_msg_header(is_golden), nth_sim+1, max_run, self.print_measurement(measurement)) )
+    if self._inv: dlrtmvkdldjem()
+    return zip(nth_sims, measurements)
+
+  def _run_vector(self, vector, nth_mode, nth_sim, run_id, max_run, is_golden):
+    ''' run a simulation with a given vector, whose run directory is named by run_id '''
     rootdir = self.golden_dir if is_golden else self.revised_dir
     rv = self._rv_golden if is_golden else self._rv_revised
-    rundir = os.path.join(rootdir, 'run_mode%d_%d' %(nth_mode, nth_sim))
-    measurement = rv.run(vector, rundir) # tuple of (success?, dict of output response name/value)
+    rundir = os.path.join(rootdir, 'run_mode%d_%d' %(nth_mode, run_id))
+    with get_profiler().context(test=self._testname, mode=nth_mode, model=self.mdl_name(is_golden), vector=nth_sim):
+      measurement = rv.run(vector, rundir) # tuple of (success?, dict of output response name/value)
     self._logger.info(mcode.INFO_025 % (self.mdl_msg_header(is_golden), nth_sim+1, max_run, self.print_measurement(measurement)) )
     if self._inv: dlrtmvkdldjem()
-    if queue !=None:
-      queue.put((nth_sim,measurement))
-    else:
-      return nth_sim,measurement
+    return nth_sim,measurement
 
 
   @classmethod
@@ -351,7 +387,7 @@ class TestUnit(object):
     ''' dump vector & measurement data to a .csv file under test directory '''
     mdl_type = 'golden' if is_golden else 'revised'
     csv_file = os.path.join(self.testdir, '_'.join([self._tenvf.csv_vector_meas_prefix, mdl_type, 'mode', str(nth_mode)]) + '.csv')
-    df = pd.DataFrame(dict([ (k, TestVectorGenerator.conv_tobin(self._ph, k, v)) for k, v in vector.items() ]))
+    df = TestVectorGenerator.to_dataframe(self._ph, vector)
     df = df.join(pd.DataFrame(meas))
     if not quite:
       map(self._logger.info, print_section(mcode.INFO_026 %(mdl_type), 4))
@@ -360,8 +396,10 @@ class TestUnit(object):
     df.to_csv(csv_file)
 
 
-  def _run_linear_regression(self, mode, nth_mode, vector, meas_golden, meas_revised, quite=False):
+  def _run_linear_regression(self, mode, nth_mode, vector, meas_golden, meas_revised, quite=False, design=None):
     ''' perform linear regression on the output responses with test vectors of a single mode
+          - design: IncrementalDesignMatrix of the test vectors of the previous call if any, 
+                    to which the new test vectors are appended
     '''
     if self._ph.get_by_name('dummy_analoginput') != None: # duplicates data for the case w/o unpinned analog inputs
       #vector = dict([ (k, [list(v)[0]+i for i in range(20)]) for k,v in vector.items()])
@@ -378,9 +416,14 @@ class TestUnit(object):
 
     # get rid of true digital input vectors from linear regression data
     vector_wo_mode = self._remove_mode_vector(vector, mode)
+    if design == None or self._ph.get_by_name('dummy_analoginput') != None:
+      design = DesignMatrix(vector_wo_mode)
+    else:
+      design.append(dict([ (k, v[design.nobs:]) for k, v in vector_wo_mode.items() ]))
     lr_param = { 'meas_golden': meas_golden,
                  'meas_revised': meas_revised,
-                 'vector_wo_mode': vector_wo_mode }
+                 'vector_wo_mode': vector_wo_mode,
+                 'design': design } # columns of predictor terms shared by all the regressors
 
     #############################################
     # Linear regression to detect pin discrepancy
@@ -421,7 +464,9 @@ class TestUnit(object):
       else:
         map(self._logger.debug, print_section(mcode.INFO_027, 3))
     # 1-phase linear regression
-    self._run_linear_regression_phase1( lrg, lrr, lr_param, is_simple, quite=quite )
+    check = 'pin' if is_simple else 'accuracy' # tag of stage timing
+    with get_profiler().stage('regression_phase1', check=check):
+      self._run_linear_regression_phase1( lrg, lrr, lr_param, is_simple, quite=quite )
 
     # Improving models by filtering out insiginicant predictors
     if is_simple:
@@ -436,7 +481,8 @@ class TestUnit(object):
         map(self._logger.debug, print_section(mcode.INFO_028, 3))
 
     # filter with normalized input sensitivity
-    self._run_linear_regression_phase2( lrg_sgt, lrr_sgt, lr_param, is_simple, no_iter=10, quite=quite )
+    with get_profiler().stage('regression_phase2', check=check):
+      self._run_linear_regression_phase2( lrg_sgt, lrr_sgt, lr_param, is_simple, no_iter=10, quite=quite )
     # filter with confidence interval
     #self._run_linear_regression_phase3( lrg_sgt, lrr_sgt, lr_param, is_simple )
 
@@ -459,15 +505,20 @@ class TestUnit(object):
     '''
     self._logger.debug(mcode.DEBUG_016)
     self._execute_regression(lrg, lrr, param)
+    user_model = param['regression_option'][self._tenv.regression_user_model]
     for i in range(no_iter-1):
+      prev_model = dict(user_model)
       # filter out insignificant predictors using sensitivity
       p = lrg.suggest_model_using_sensitivity()
-      param['regression_option'][self._tenv.regression_user_model].update(p)
+      user_model.update(p)
       self._execute_regression(lrg, lrr, param)
       # filter out insignificant predictors using abstol
       p = lrg.suggest_model_using_abstol()
-      param['regression_option'][self._tenv.regression_user_model].update(p)
+      user_model.update(p)
       self._execute_regression(lrg, lrr, param)
+      if user_model == prev_model: # the next iterations will suggest the same models
+        self._logger.debug(mcode.DEBUG_032 % (i+1))
+        break
 
     # print summary of golden/revised linear regression results
     self._print_linear_equation(lrg, True, is_simple, quite)
@@ -485,8 +536,8 @@ class TestUnit(object):
 
   def _execute_regression(self, lrg, lrr, param):
     ''' execute linear regression of both golden/revised models '''
-    lrg.load_data(param['meas_golden'], param['vector_wo_mode'], param['regression_option'])
-    lrr.load_data(param['meas_revised'], param['vector_wo_mode'], param['regression_option'])
+    lrg.load_data(param['meas_golden'], param['vector_wo_mode'], param['regression_option'], param.get('design'))
+    lrr.load_data(param['meas_revised'], param['vector_wo_mode'], param['regression_option'], param.get('design'))
     lrg.run()
     lrr.run()
 
@@ -570,15 +621,28 @@ class TestUnit(object):
     ''' make directories for simulating golden & revised models '''
     self.golden_dir = os.path.join(self.testdir,'golden')
     self.revised_dir = os.path.join(self.testdir,'revised')
-    if not self._cache:
-      make_dir(self.golden_dir, self._logger)
-      make_dir(self.revised_dir, self._logger)
+    if not self._cache: # they may be placed on a scratch path
+      get_rundir_manager().make_run_dir(self.testdir, 'golden')
+      get_rundir_manager().make_run_dir(self.testdir, 'revised')
+
+  def _get_sim_cache(self, is_golden): # simulation result cache of a model if enabled
+    sim_cfg = self._sim_cfg_golden if is_golden else self._sim_cfg_revised
+    return self._sim_cache if sim_cfg.get_sim_cache() else None
+
+  def _get_results_file(self, is_golden): # results file shared by the runs of a model if enabled
+    sim_cfg = self._sim_cfg_golden if is_golden else self._sim_cfg_revised
+    if sim_cfg.get_shared_results():
+      return os.path.join(self.golden_dir if is_golden else self.revised_dir, self._tenvf.meas_results)
 
   @classmethod
   def mdl_msg_header(cls, is_golden):
     ''' return a message header which indicates "golden" or "revised" '''
     return '[Golden]' if is_golden else '[Revised]'
 
+  @classmethod
+  def mdl_name(cls, is_golden):
+    return 'golden' if is_golden else 'revised'
+
   def _print_wires(self, tb_filename):
     wires_declared = sorted([w.split()[-1] for w in self._test_cfg.get_wires()])
     wires = []
@@ -610,9 +674,10 @@ class TestUnit(object):
           - However, if model accuracy is passed, pin inconsistency doesn't 
             matter
     '''
-    chkr = UnitChecker(self._test_cfg.get_option_regression_input_sensitivity_threshold(), self._logger_id)
-    simple = chkr.run(self._lrg_sgt_simple, self._lrr_sgt_simple, self._ph, True)
-    accurate = chkr.run(self._lrg_sgt, self._lrr_sgt, self._ph, False)
+    with get_profiler().stage('checker'):
+      chkr = UnitChecker(self._test_cfg.get_option_regression_input_sensitivity_threshold(), self._logger_id)
+      simple = chkr.run(self._lrg_sgt_simple, self._lrr_sgt_simple, self._ph, True)
+      accurate = chkr.run(self._lrg_sgt, self._lrr_sgt, self._ph, False)
 
     '''
     err_flag_pin = filter(lambda x: x == 'failure', [v['err_flag_pin'] for v in simple.values()])
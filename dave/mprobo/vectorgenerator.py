@@ -14,22 +14,27 @@ from itertools import product, ifilter, ifilterfalse
 import pandas as pd
 import random
 from dave.common.davelogger import DaVELogger
-from dave.common.misc import print_section, all_therm, dec2bin, bin2dec, bin2thermdec, flatten_list, assert_file, isNone
+from dave.common.misc import print_section, all_therm, dec2bin, bin2dec, dec2bin_array, dec2binstr_array, binstr2dec_array, bin2thermdec_array, flatten_list, assert_file, isNone
 from environ import EnvOaTable, EnvFileLoc, EnvTestcfgPort
 from port import get_singlebit_name
 import oatable
-import pyDOE
 import dave.mprobo.mchkmsg as mcode
 
+OA_RUN_FACTOR = 2 # a constructed OA is used if its runs are at most this times max_sample
+
 #------------------------------------------------------
 class LatinHyperCube(object):
-  ''' Perform Latin Hyper Cube sampling using pyDOE 
+  ''' Perform Latin Hyper Cube sampling (the same as pyDOE.lhs without criterion)
       and scale the generated samples by depth
       (i.e. number of levels) to make all integers
         - n_var : number of variables
         - depth : Depth applied to all variables
         - sample : number of samples to be generated
+        - rng : numpy RandomState of the samples, the global one if None
   '''
+  def __init__(self, rng=None):
+    self._rng = rng if rng is not None else np.random
+
   def __call__(self, n_var, depth, sample):
     lhs_samples = self._get_lhs(n_var, sample)
     return self._scale(lhs_samples, depth)
@@ -38,20 +43,23 @@ class LatinHyperCube(object):
     return np.ceil(depth*vector)
 
   def _get_lhs(self, n_var, sample): # get samples using LHS
-    return pyDOE.lhs(n_var, sample)
+    cut = np.linspace(0, 1, sample + 1)
+    u = self._rng.rand(sample, n_var) # a point in each interval
+    points = u*(cut[1:] - cut[:-1])[:, np.newaxis] + cut[:-1, np.newaxis]
+    return np.column_stack([ points[self._rng.permutation(range(sample)), j] for j in range(n_var) ]) if n_var > 0 else points
     
 #------------------------------------------------------
 class OrthogonalArray(object):
-  ''' NOT YET IMPLEMENTED for generic OA '''
+  ''' Base class of orthogonal array samplers '''
   def __init__(self, logger_id='logger_id'):
     self._logger = DaVELogger.get_logger('%s.%s.%s' % (logger_id, __name__, self.__class__.__name__))
 
 #------------------------------------------------------
 class OrthogonalArrayTable(OrthogonalArray):
-  ''' Generates orthogonal array samples from pre-defined tables.  '''
+  ''' Generates orthogonal array samples from pre-defined tables.
+      OAs missing from the tables are constructed algorithmically (see oaconstruct.py).
+  '''
   
-  TABLENAME_FORMAT = 'OA_V%d_L%d_tbl'
-
   def __init__(self, logger_id='logger_id'):
     OrthogonalArray.__init__(self, logger_id)
 
@@ -79,36 +87,46 @@ class OrthogonalArrayTable(OrthogonalArray):
   def generate(self, n_var, depth): 
     ''' generate OA+random vector for given # of vars, OA depth '''
     self._depth = depth
-    self._vector = self._read_oatable(n_var, depth)
+    self._vector = self.lookup(n_var, depth)
     self._length = self._vector.shape[0] if not isNone(self._vector) else 0
+    if self.length > 0 and not oatable.has_table(n_var, depth):
+      self._logger.debug(mcode.DEBUG_020 % (n_var, depth))
     self._logger.debug(mcode.DEBUG_019 %(self.depth, self.length))
 
   def test(self, n_var, depth): # test if OA exists for given # of vars, OA depth
-    return self._read_oatable(n_var, depth)
-
-  def get_oatable(self, n_var, depth): # return oa table StringIO if exists
-    try:
-      return getattr(oatable, self.TABLENAME_FORMAT %(n_var, depth))
-    except:
-      return None
-
-  def _read_oatable(self, n_var, depth): # return OA vector if exists
-    table = self.get_oatable(n_var, depth)
-    if table:
-      strio = copy.deepcopy(table) # copy since StringIO is read more than once
-      vector_array = np.loadtxt(strio, dtype=int)-1 # -1 because table starts from 1
-      return vector_array.reshape(vector_array.shape[0], n_var)
-    else:
-      return None
+    return self.lookup(n_var, depth)
+
+  def get_oatable(self, n_var, depth): # return oa table if exists
+    return self.lookup(n_var, depth)
+
+  def get_run(self, n_var, depth): # number of runs of OA if exists, else 0
+    return oatable.get_run(n_var, depth)
+
+  def find_depth(self, n_var, min_run, start, stop):
+    ''' return the smallest OA depth in [start, stop) having at least min_run runs 
+        without materializing OAs, else None. The search stops at the first missing depth.
+    '''
+    return oatable.find_depth(n_var, min_run, start, stop)
+
+  def last_depth(self, n_var, start, stop):
+    ''' return the largest depth d < stop where OAs of depth from start to d all exist '''
+    return oatable.last_depth(n_var, start, stop)
+
+  def lookup(self, n_var, depth):
+    ''' return a read-only (run x n_var) OA view if exists, else None.
+        Levels of the OA start from 0.
+    '''
+    return oatable.lookup(n_var, depth)
 
 
 
 #------------------------------------------------------
 class TestVectorGenerator(object):
-  def __init__(self, ph, test_cfg, logger_id='logger_id'):
+  def __init__(self, ph, test_cfg, default_seed=None, logger_id='logger_id'):
     ''' 
       ph: Port Handler class instance
       test_cfg: TestConfig class instance
+      default_seed: seed of random samples if vector_seed option is not given, unseeded if None
     '''
 
     self._logger_id = logger_id
@@ -119,7 +137,8 @@ class TestVectorGenerator(object):
                    'min_oa_depth': int(test_cfg.get_option_regression_min_oa_depth()),
                    'max_sample': int(test_cfg.get_option_regression_max_sample()),
                    'en_interact': test_cfg.get_option_regression_en_interact(),
-                   'order': int(test_cfg.get_option_regression_order()) }
+                   'order': int(test_cfg.get_option_regression_order()),
+                   'seed': test_cfg.get_option_vector_seed() if test_cfg.get_option_vector_seed() != None else default_seed }
 
     map(self._logger.info, print_section(mcode.INFO_036, 2)) # print section header
 
@@ -132,12 +151,17 @@ class TestVectorGenerator(object):
       self.option['max_sample'] = 1
     self._count_port(ph) # count number of (pinned, unpinned) ports
 
+    self._lhs_only = False # True if full LHS is used since the OA is too large for max_sample
     self._update_analog_grid()
 
+    # random samples are drawn from generators of this object, which are seeded if given so that 
+    # the same test vectors are generated across runs, e.g. to reuse results of the simulation result cache
+    self._rng = np.random.RandomState(self.option['seed'])
+    self._random = random.Random(self.option['seed'])
     analog_raw_vector = self._generate_analog_raw_vector()
 
     # analog test vectors by scaling raw vector to real range
-    self._a_vector = self._map_analog_vector(analog_raw_vector)
+    self._a_vector = make_vector_store(self._map_analog_vector(analog_raw_vector))
 
     self._logger.info(mcode.INFO_045 % self.get_analog_vector_length())
 
@@ -176,29 +200,36 @@ class TestVectorGenerator(object):
       Na = self.no_unpin_analog
       Ng = self.option['oa_depth']
       oa = OrthogonalArrayTable(self._logger_id) 
-      if not isNone(oa.get_oatable(Na, Ng)): # caculate # of grid, if oa exists
+      if oa.get_run(Na, Ng) > 0: # caculate # of grid, if oa exists
         max_sample = self.option['max_sample']
-        oa_vec0 = oa.test(Na, Ng)
-        if len(oa_vec0) <= max_sample:
+        if oa.get_run(Na, Ng) <= max_sample:
           max_depth = oa.max_depth+1 if Na > 1 else 100
-          for i in range (self.option['oa_depth'], max_depth):
-            oa_vec = oa.test(Na, i)
-            if isNone(oa_vec):
-              Ng = i - 1
-              break
-            elif len(oa_vec) >= max_sample:
-              Ng = i
-              break
-          #Ng = i
-          oa_vec0 = oa.test(Na, Ng)
-          if len(oa_vec0) > max_sample:
-            self.option['max_sample'] = len(oa_vec0)
+          depth = oa.find_depth(Na, max_sample, Ng, max_depth)
+          if isNone(depth): # no OA large enough; take the deepest one
+            last = oa.last_depth(Na, Ng, max_depth)
+            depth = last if not isNone(last) else Ng
+          Ng = depth
+          if not self._is_oa_affordable(oa, Na, Ng, max_sample) and Ng > self.option['oa_depth']: # the smaller OA is filled up with LHS
+            self._logger.warn(mcode.WARN_032 % (Na, Ng, oa.get_run(Na, Ng), max_sample, Ng-1))
+            Ng -= 1
+          if oa.get_run(Na, Ng) > max_sample:
+            self.option['max_sample'] = oa.get_run(Na, Ng)
+        elif self._is_oa_affordable(oa, Na, Ng, max_sample):
+          self.option['max_sample'] = oa.get_run(Na, Ng)
         else:
-          self.option['max_sample'] = len(oa_vec0)
+          self._logger.warn(mcode.WARN_033 % (Na, Ng, oa.get_run(Na, Ng), max_sample))
+          self._lhs_only = True
         self.option['oa_depth'] = Ng
         self._logger.info(mcode.INFO_036_2 % self.option['max_sample'])
         self._logger.info(mcode.INFO_036_3 % self.option['oa_depth'])
-        self._logger.info(mcode.INFO_036_4 % (Ng, len(oa.test(Na, Ng))))
+        if not self._lhs_only:
+          self._logger.info(mcode.INFO_036_4 % (Ng, oa.get_run(Na, Ng)))
+
+  def _is_oa_affordable(self, oa, n_var, depth, max_sample):
+    ''' True if OA is in the tables or its runs are within OA_RUN_FACTOR of max_sample.
+        A constructed OA can be much larger than max_sample, which is raised to the OA size otherwise.
+    '''
+    return oatable.has_table(n_var, depth) or oa.get_run(n_var, depth) <= OA_RUN_FACTOR*max_sample
 
   def get_unit_no_testvector_otf(self): # unit number of test vectors for on-the-fly check
     n = len(self.unpin_analog)*self.option['order']
@@ -227,11 +258,8 @@ class TestVectorGenerator(object):
     csv_d = os.path.join(workdir, EnvFileLoc().csv_vector_prefix+'_digital.csv') # for digital 
     csv_a = os.path.join(workdir, EnvFileLoc().csv_vector_prefix+'_analog.csv')  # for analog
 
-    d_vector = dict([ (k, self.conv_tobin(ph, k, v)) for k, v in self._d_vector.items() ])
-    a_vector = dict([ (k, self.conv_tobin(ph, k, v)) for k, v in self._a_vector.items() ])
-
-    df_d = pd.DataFrame(d_vector)
-    df_a = pd.DataFrame(a_vector)
+    df_d = self.to_dataframe(ph, self._d_vector)
+    df_a = self.to_dataframe(ph, self._a_vector)
 
     map(self._logger.info, print_section(mcode.INFO_040, 3))
     self._logger.info(df_d)
@@ -254,29 +282,46 @@ class TestVectorGenerator(object):
     self._logger.debug(' - %s' % csv_d)
     self._logger.debug(' - %s' % csv_a)
 
+    pname = flatten_list(ph.get_name().values())
     df = pd.read_csv(csv_a)
-    self._a_vector = dict([ (k, self.conv_frombin(ph, k, df[k])) for k in df.keys() if k in flatten_list(ph.get_name().values()) ])
+    self._a_vector = make_vector_store(dict([ (k, self.conv_frombin(ph, k, df[k])) for k in df.keys() if k in pname ]))
 
     df = pd.read_csv(csv_d)
-    self._d_vector = dict([ (k, self.conv_frombin(ph, k, df[k])) for k in df.keys() if k in flatten_list(ph.get_name().values()) ])
+    self._d_vector = make_vector_store(dict([ (k, self.conv_frombin(ph, k, df[k])) for k in df.keys() if k in pname ]))
     
   def get_analog_vector_length(self): # get # of analog vectors 
-    return self._get_vector_length(self._a_vector)
+    return len(self._a_vector)
 
   def get_digital_vector_length(self): # get # of digital vectors 
-    return self._get_vector_length(self._d_vector)
+    return len(self._d_vector)
     
   def get_all_digital_vector(self): # return all digital mode vectors 
     return [self.get_digital_vector(n) for n in range(self.get_digital_vector_length())]
 
-  def get_all_analog_vector(self): # return all analog vectors 
-    return [self.get_analog_vector(n) for n in range(self.get_analog_vector_length())]
+  def get_all_analog_vector(self): # return the analog vector store
+    return self._a_vector
+
+  def get_analog_vector(self, index): # return a view of analog_vector[index] 
+    return self._a_vector[index]
 
-  def get_analog_vector(self, index): # return analog_vector[index] 
-    return self._get_vector(index, True)
+  def get_analog_vectors(self, start=None, stop=None): # return a view of analog_vector[start:stop]
+    return self._a_vector[start:stop]
 
-  def get_digital_vector(self, index): # return digital_vector[index] 
-    return self._get_vector(index, False)
+  def get_digital_vector(self, index): # return digital_vector[index] as a dict
+    return dict(zip(self._d_vector.dtype.names, self._d_vector[index].item()))
+
+  def get_mode_vector(self, mode):
+    ''' return a vector store of analog vectors together with a digital mode 
+        mode: a dict of digital mode port name and its value
+    '''
+    vector = vector_to_dict(self._a_vector)
+    vector.update(dict([ (k, np.repeat(v, len(self._a_vector))) for k, v in mode.items() ]))
+    return make_vector_store(vector)
+
+  @classmethod
+  def to_dataframe(cls, ph, vector):
+    ''' return a pandas DataFrame of a vector store, where digital values are in binary strings '''
+    return pd.DataFrame(dict([ (k, cls.conv_tobin(ph, k, v)) for k, v in vector_to_dict(vector).items() ]))
 
   @classmethod
   def conv_tobin(cls, ph, pname, pvalue):
@@ -286,10 +331,11 @@ class TestVectorGenerator(object):
         pvalue: list of test vector for pname
     '''
     if pname in [v.name for v in ph.get_digital()]:
-      if type(pvalue) in [np.int64, np.float64, int, float]: # I hate this
-        return 'b'+str(dec2bin(pvalue, ph.get_by_name(pname).bit_width))
+      bitw = ph.get_by_name(pname).bit_width
+      if np.isscalar(pvalue):
+        return 'b'+dec2bin(pvalue, bitw)
       else:
-        return ['b'+str(dec2bin(v, ph.get_by_name(pname).bit_width)) for v in pvalue]  # convert to bin
+        return ['b'+v for v in dec2binstr_array(pvalue, bitw)]  # convert to bin
     else:
       return pvalue # dont convert
 
@@ -304,7 +350,7 @@ class TestVectorGenerator(object):
       if type(pvalue) == str: # I hate this
         return bin2dec(pvalue.lstrip('b'))
       else:
-        return [bin2dec(v.lstrip('b')) for v in pvalue]  # convert from bin
+        return binstr2dec_array(pvalue, 'b')  # convert from bin
     else:
       return pvalue.values # dont convert
 
@@ -313,12 +359,11 @@ class TestVectorGenerator(object):
     ''' Encode quantized analog vector for doing linear regression 
         #TODO: only thermometer/binary code are supported now
     '''
-    vector_out = copy.deepcopy(vector)
-    for p in vector.keys():
-      if p in ph.get_quantized_port_name():
-        v = ph.get_by_name(p)
-        if v.encode == EnvTestcfgPort().thermometer:
-          vector_out[p] = map(lambda k: bin2thermdec(dec2bin(k, v.bit_width)), vector_out[p])
+    vector_out = dict(vector) # columns are replaced, not modified
+    for p in set(vector.keys()) & set(ph.get_quantized_port_name()):
+      v = ph.get_by_name(p)
+      if v.encode == EnvTestcfgPort().thermometer:
+        vector_out[p] = bin2thermdec_array(vector[p], v.bit_width)
     return vector_out
 
   @classmethod
@@ -328,33 +373,19 @@ class TestVectorGenerator(object):
   @classmethod
   def expand_quantized_vector(cls, vector, ph):
     ''' if an input is a quantized analog input, expand bits '''
-    vector_new = copy.deepcopy(vector)
-    qa = ph.get_unpinned_quantized_port_name()
-
-    for p in filter(lambda x, qa=qa: x in qa, vector_new.keys()):
-      vector_p = vector_new[p]
-      del vector_new[p]
+    vector_new = dict(vector) # columns are replaced, not modified
+    for p in set(vector.keys()) & set(ph.get_unpinned_quantized_port_name()):
       bitw = ph.get_by_name(p).bit_width
-      vector_new.update( dict([ (get_singlebit_name(p, i), []) for i in range(bitw) ]) )
-      for i in range(len(vector_p)):
-        for j in range(bitw):
-          vector_new[get_singlebit_name(p, j)].append(int(dec2bin(vector_p[i], bitw)[bitw-j-1]))
+      bits = dec2bin_array(vector_new.pop(p), bitw).astype(int) # MSB first
+      vector_new.update( dict([ (get_singlebit_name(p, i), bits[:,bitw-i-1]) for i in range(bitw) ]) )
     return vector_new
 
   @classmethod
   def get_effective_vector(cls, vector, ph): 
     ''' return (quantized) analog vector for linear regression '''
-    _vector = cls.remove_pinned_input(vector, ph) 
+    _vector = cls.remove_pinned_input(vector_to_dict(vector), ph) 
     return cls.expand_quantized_vector(_vector, ph) 
 
-  def _get_vector_length(self, test_vector): # return the vector length 
-    return len(test_vector[test_vector.keys()[0]])
-
-  def _get_vector(self, index, analog=True): # get a vector with index 
-    vectors = self._a_vector if analog else self._d_vector
-    assert index < self._get_vector_length(vectors), mcode.ERR_007
-    return dict([(p,v[index]) for p,v in vectors.items()])
-
   def _get_max_bitwidth(self, qport):
     ''' return the max bit-width among digtal inputs (for quantized port) '''
     return max(map(lambda x: x.bit_width, qport)) if len(qport) > 0 else 0
@@ -369,13 +400,16 @@ class TestVectorGenerator(object):
     max_sample = self.option['max_sample']
     Ng = self.option['oa_depth']
     Na = self.no_unpin_analog
-    oa = OrthogonalArrayTable(self._logger_id)
-    oa.generate(Na, Ng) # generating orthogonal array 
-    vector = oa.vector
+    vector = None
+    if not self._lhs_only:
+      oa = OrthogonalArrayTable(self._logger_id)
+      oa.generate(Na, Ng) # generating orthogonal array 
+      vector = oa.vector
 
     if Na > 0:
-      if isNone(vector): # if do full LHS, oa unavailable,
-        self._logger.warn(mcode.WARN_011 % (Na, Ng) )
+      if isNone(vector): # if do full LHS, oa unavailable or too large
+        if not self._lhs_only:
+          self._logger.warn(mcode.WARN_011 % (Na, Ng) )
         if Na == 1: # only 1 var
           self.option['oa_depth'] = max_sample
         else:
@@ -386,8 +420,8 @@ class TestVectorGenerator(object):
         n_remain = max_sample - vector.shape[0]
   
       if n_remain > 0: # add LHS vectors to existing oa vector
-        lhs = LatinHyperCube()(Na, Ng-1, n_remain)
-        if vector:
+        lhs = LatinHyperCube(self._rng)(Na, Ng-1, n_remain)
+        if not isNone(vector):
           vector = np.vstack(( vector, lhs))
         else:
           vector = lhs
@@ -399,7 +433,7 @@ class TestVectorGenerator(object):
     order   = [p.name for p in dport]
     allowed = [tuple(p.allowed) for p in dport]
     vector_product = zip(*list(product(*allowed))) # cross product and transpose
-    self._d_vector = dict([(k,list(vector_product[i])) for i, k in enumerate(order)])
+    self._d_vector = make_vector_store(dict([(k,vector_product[i]) for i, k in enumerate(order)]))
 
   def _map_analog_vector(self, raw_vector): # scale raw vector to real analog range
     vector = dict()
@@ -429,21 +463,24 @@ class TestVectorGenerator(object):
     vlen = len(raw_vector)
     allowed = np.array(port.allowed)
     bitw = port.bit_width
-    base_vector = list(all_therm(bitw)) # toggle each bit once
-    self._logger.debug(mcode.DEBUG_006 % str(base_vector))
+    base_vector = np.array(all_therm(bitw)) # toggle each bit once
+    self._logger.debug(mcode.DEBUG_006 % str(list(base_vector)))
 
-    vector = np.array(filter(lambda x: x in allowed, base_vector)) # allowed base vector
-    allowed_ex_vector = list(set(allowed)-set(vector)) # allowed except "vector"
+    vector = base_vector[np.isin(base_vector, allowed)] # allowed base vector
+    allowed_ex_vector = np.setdiff1d(allowed, vector) # allowed except "vector"
 
     # find which bits are not toggling and add one among allowed codes
-    vector_bin = [dec2bin(v, bitw) for v in vector] # vector in binary
+    # (the added codes change the vectors of a port whose bit doesn't toggle,
+    #  which were left as they are since the result of np.append was discarded before)
+    vector_bin = dec2bin_array(vector, bitw) # vector in binary
+    allowed_ex_bin = dec2bin_array(allowed_ex_vector, bitw)
     for i in range(bitw):
-      bitvals = list(set([v[i] for v in vector_bin]))
+      bitvals = np.unique(vector_bin[:,i])
       if len(bitvals) != 2: # not toggled
-        for v in allowed_ex_vector: # find one among allowed code
-          if dec2bin(v, bitw)[i] != bitvals[0]:
-            np.append(vector, v)
-            break
+        candidate = np.flatnonzero(allowed_ex_bin[:,i] != bitvals[0]) if len(bitvals) > 0 else np.arange(len(allowed_ex_vector))
+        if len(candidate) > 0: # one among allowed code
+          vector = np.append(vector, allowed_ex_vector[candidate[0]])
+          vector_bin = np.vstack((vector_bin, allowed_ex_bin[candidate[0]]))
         
     # TODO: report which bits are not toggling in the end
 
@@ -451,10 +488,31 @@ class TestVectorGenerator(object):
     n_remain = vlen-len(vector)
     if n_remain > 0:
       # modulo by len(allowed) because n_remain could be larger than size of allowed
-      random_idx = np.array(random.sample(range(n_remain), n_remain)) % len(allowed)
+      random_idx = np.array(self._random.sample(range(n_remain), n_remain)) % len(allowed)
       vector = np.concatenate((vector, allowed[random_idx]))
-    np.random.shuffle(vector)
+    self._rng.shuffle(vector)
+    return vector
+
+#------------------------------------------------------
+def make_vector_store(columns):
+  ''' Build a vector store, which is a structured array 
+      whose fields are port names (sorted) from a dict of {port name: column}.
+      A row of the store is a vector and a field is a column view of a port.
+  '''
+  names = sorted(columns.keys())
+  columns = [np.asarray(columns[k]) for k in names]
+  store = np.empty(len(columns[0]) if columns else 0, dtype=[(k, v.dtype) for k, v in zip(names, columns)])
+  for k, v in zip(names, columns):
+    store[k] = v
+  return store
+
+def vector_to_dict(vector):
+  ''' return a dict of {port name: value} of a vector (a row of a vector store) 
+      or {port name: column view} of a vector store
+  '''
+  if isinstance(vector, dict):
     return vector
+  return dict([ (k, vector[k]) for k in vector.dtype.names ])
 
 #------------------------------------------------------
 def generate_random_vector(n_var, depth):
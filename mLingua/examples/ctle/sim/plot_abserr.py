@@ -5,7 +5,7 @@
 """
 
 import numpy as np
-from scipy.interpolate import interp1d
+from dave.mlingua.waveform import Waveform, load
 import matplotlib.pylab as plt
 import matplotlib
 from scipy.signal import lsim, zpk2tf
@@ -32,20 +32,20 @@ def plot(index):
     gs_filename = 'ctle_pulse_response_3.eps'
 
   # load verilog simulation data and get 1d interpolator
-  data1 = np.loadtxt(simout_filename)
+  data1 = load(simout_filename, cache=False)
   t = data1[:,0]
   yv = data1[:,1]
-  fn_vlog = interp1d(t,yv)
+  fn_vlog = Waveform(t,yv)
   time = np.arange(t[0],t[-1],ts)
   time2 = np.arange(t[0],tend,ts)
   time = time[:-1]
   time2 = time2[:-1]
   no_sample = len(time2)-len(time)
 
-  xdata = np.loadtxt('input.txt')
+  xdata = load('input.txt', cache=False)
   xt = np.append(xdata[:,0],t[-1])
   xy = np.append(xdata[:,1],xdata[:,1][-1])
-  fn_x = interp1d(xt,xy)
+  fn_x = Waveform(xt,xy)
   x=fn_x(time)
   if no_sample > 0:
     x2 = np.array(list(x) + no_sample*[x[-1]])
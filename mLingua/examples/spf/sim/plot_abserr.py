@@ -5,7 +5,7 @@
 """
 
 import numpy as np
-from scipy.interpolate import interp1d
+from dave.mlingua.waveform import Waveform, load
 import matplotlib.pylab as plt
 import matplotlib
 from scipy.signal import lsim, zpk2tf
@@ -23,18 +23,18 @@ def main():
 
 
   # load verilog simulation data and get 1d interpolator
-  data = np.loadtxt('output.txt')
+  data = load('output.txt', cache=False)
   t = data[:,0]
   yv = data[:,1]
-  fn_vlog = interp1d(t,yv)
+  fn_vlog = Waveform(t,yv)
   time = np.arange(t[0],t[-1],ts)
   time2 = np.arange(t[0],tend,ts)
   no_sample = len(time2)-len(time)
 
-  xdata = np.loadtxt('input.txt')
+  xdata = load('input.txt', cache=False)
   xt = np.append(xdata[:,0],t[-1])
   xy = np.append(xdata[:,1],xdata[:,1][-1])
-  fn_x = interp1d(xt,xy)
+  fn_x = Waveform(xt,xy)
   x=fn_x(time)
   if no_sample > 0:
     x2 = np.array(list(x) + no_sample*[x[-1]])
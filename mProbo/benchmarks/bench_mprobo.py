@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+
+__doc__ = '''
+End-to-end benchmark of the mProbo pipeline.
+
+Each case is a synthetic test with given numbers of analog input, quantized
+analog input, digital mode and output ports, whose golden and revised models
+are linear models evaluated by the behavioral simulator (no EDA tools needed).
+A case runs the whole checking (RunChecker) in a scratch directory with stage
+timing enabled (see dave/mprobo/profiler.py), and the time of each stage, e.g.
+vector generation, regression phases, checker and report generation, is stored
+to a results file for comparison between commits.
+
+Usage:
+  bench_mprobo.py run [-c CASE ...] [-r REPEAT] [-p PROCESS] [-o RESULTS]
+  bench_mprobo.py compare BASE.json NEW.json
+  bench_mprobo.py list
+  bench_mprobo.py check [-s SCALE ...]
+
+The results file is mProbo/benchmarks/results/<commit>.json by default.
+"check" compares the fits of IncrementalDesignMatrix, to which samples are
+appended as in on-the-fly checking, with those of DesignMatrix on the same
+samples, for inputs of given scales (see dave/mprobo/olsengine.py).
+'''
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import platform
+import subprocess
+import texttable
+import numpy as np
+
+from dave.mprobo.runchecker import RunChecker
+from dave.mprobo.environ import EnvRunArg
+from dave.mprobo.profiler import get_profiler
+from dave.mprobo.olsengine import DesignMatrix, IncrementalDesignMatrix, fit_ols
+from dave.common.misc import interpolate_env
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+# name: (no. of analog inputs, bit widths of quantized inputs, bit widths of digital modes, no. of outputs, max_sample)
+CASES = [
+  ('analog2',       (2, [],     [],     1, 10)),
+  ('quantized',     (2, [3, 2], [],     1, 10)),
+  ('modes',         (2, [2],    [1, 1], 1, 10)),
+  ('outputs',       (3, [2],    [],     3, 10)),
+  ('max_sample',    (2, [2],    [1],    1, 30)),
+  ('large',         (4, [3, 2], [1],    2, 20)),
+]
+
+STAGES = ['vector_generation', 'regression_phase1', 'regression_phase2', 'checker', 'report_generation',
+          'testbench_bind', 'simulation', 'measurement_read', 'test'] # stages shown by "compare"
+
+#------------------------------------------------------
+def make_test_cfg(name, n_analog, qbits, dbits, n_output, max_sample):
+  ''' return the text of test.cfg of a synthetic test '''
+  ports = []
+  for i in range(n_output):
+    ports.append(('vout%d' % i, ['port_type = analogoutput', 'regions = -10.0, 10.0', 'abstol = 1e-3']))
+  for i in range(n_analog):
+    ports.append(('vin%d' % i, ['port_type = analoginput', 'regions = 0.2, 1.6']))
+  for i, b in enumerate(qbits):
+    ports.append(('q%d' % i, ['port_type = quantizedanalog', 'bit_width = %d' % b, 'encode = %s' % ('thermometer' if i % 2 == 0 else 'binary')]))
+  for i, b in enumerate(dbits):
+    ports.append(('m%d' % i, ['port_type = digitalmode', 'bit_width = %d' % b, 'encode = binary']))
+
+  lines = ['[%s]' % name, '  [[option]]', '    max_sample = %d' % max_sample,
+           '  [[simulation]]', '    timeunit = 1ps', '    trantime = 1us', '  [[port]]']
+  for p, attrs in ports:
+    lines += ['    [[[%s]]]' % p] + [ '      %s' % a for a in attrs ]
+  inputs = [ p for p, attrs in ports if not p.startswith('vout') ]
+  tb = ['dut xdut (%s);' % ', '.join([ '.%s(%s)' % (p, p) for p, attrs in ports ])]
+  tb += [ 'vdc #(.dc(@vin%d)) xvin%d (.vout(vin%d));' % (i, i, i) for i in range(n_analog) ]
+  tb += [ 'bitvector #(.value(@q%d), .bit_width(%d)) xq%d (.out(q%d));' % (i, b, i, i) for i, b in enumerate(qbits) ]
+  tb += [ 'bitvector #(.value(@m%d), .bit_width(%d)) xm%d (.out(m%d));' % (i, b, i, i) for i, b in enumerate(dbits) ]
+  tb += [ 'strobe_ss #(.ts(0), .ti(1e-9), .tol(0.001), .filename("meas_vout%d.txt")) xstrobe%d (.in(vout%d), .detect(ss_detect));' % (i, i, i) for i in range(n_output) ]
+  lines += ['  [[testbench]]', "    tb_code = '''"] + tb + ["'''"]
+  return '\n'.join(lines) + '\n', inputs
+
+def make_sim_cfg(inputs, n_output):
+  ''' return the text of sim.cfg whose golden and revised models are linear models.
+      The revised model has a gain error in the last input so that the checker has some work.
+  '''
+  lines = []
+  for model, error in [('golden', 0.0), ('revised', 0.05)]:
+    lines += ['[%s]' % model, '  model = verilog', '  simulator = behavioral', '  sweep_file = False', '  [[linear_model]]']
+    for i in range(n_output):
+      lines += ['    [[[vout%d]]]' % i, '      const = %g' % (0.1*(i+1))]
+      for j, p in enumerate(inputs):
+        gain = (-1)**j * 0.5/(j+1) * (i+1)
+        lines += ['      %s = %g' % (p, gain*(1+error) if j == len(inputs)-1 else gain)]
+  return '\n'.join(lines) + '\n'
+
+#------------------------------------------------------
+def run_case(name, spec, process=1, keep=False):
+  ''' run the checking of a case once, and return a dict of stage timing (see Profiler.get_stats()) '''
+  n_analog, qbits, dbits, n_output, max_sample = spec
+  workdir = tempfile.mkdtemp(prefix='mprobo_bench_%s_' % name)
+  cwd = os.getcwd()
+  logger_id = 'mProbo_bench_%s' % name
+  handler = logging.FileHandler(os.path.join(workdir, 'mProbo.log'), 'w')
+  handler.setLevel(logging.INFO)
+  logging.getLogger(logger_id).addHandler(handler)
+  try:
+    test_cfg, inputs = make_test_cfg(name, n_analog, qbits, dbits, n_output, max_sample)
+    with open(os.path.join(workdir, 'test.cfg'), 'w') as f:
+      f.write(test_cfg)
+    with open(os.path.join(workdir, 'sim.cfg'), 'w') as f:
+      f.write(make_sim_cfg(inputs, n_output))
+    os.chdir(workdir)
+    args = argparse.Namespace(test='test.cfg', sim='sim.cfg', workdir='.', rpt='report.html',
+                              use_cache=False, no_otf_check=False, sim_cache=False, process=process, extract=False,
+                              port_xref=interpolate_env(EnvRunArg().port_xref_filename),
+                              scratch_dir='', scratch_quota=0, prune=False, profile='mProbo_profile.json')
+    t0 = time.time()
+    RunChecker(args, None, logger_id)()
+    stats = get_profiler().get_stats()
+    stats['total'] = {'count': 1, 'wall': time.time()-t0, 'cpu': 0.0, 'child_cpu': 0.0}
+    return stats
+  finally:
+    get_profiler().close()
+    os.chdir(cwd)
+    logging.getLogger(logger_id).removeHandler(handler)
+    handler.close()
+    if keep:
+      print 'Kept %s' % workdir
+    else:
+      shutil.rmtree(workdir, True)
+
+def summarize(runs):
+  ''' summary of repeated runs of a case: the median of each stage over runs '''
+  stages = sorted(set([ k for r in runs for k in r.keys() ]))
+  return dict([ (k, dict([ (x, float(np.median([ r.get(k, {}).get(x, 0.0) for r in runs ]))) for x in ['count', 'wall', 'cpu', 'child_cpu'] ]))
+                for k in stages ])
+
+def get_commit():
+  ''' current git commit of this repository, or 'unknown' '''
+  try:
+    return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, stderr=open(os.devnull, 'w')).strip()
+  except (OSError, subprocess.CalledProcessError):
+    return 'unknown'
+
+def run(args):
+  cases = [ (n, s) for n, s in CASES if not args.case or n in args.case ]
+  unknown = set(args.case or []) - set([ n for n, s in CASES ])
+  if unknown:
+    sys.exit('Unknown case(s): %s' % ', '.join(sorted(unknown)))
+  commit = get_commit()
+  results = {'commit': commit, 'date': time.strftime('%Y-%m-%d %H:%M:%S'), 'host': platform.node(),
+             'python': platform.python_version(), 'numpy': np.__version__,
+             'repeat': args.repeat, 'process': args.process, 'cases': {}}
+  for name, spec in cases:
+    runs = []
+    for i in range(args.repeat):
+      print '[%s] run %d/%d ...' % (name, i+1, args.repeat),
+      sys.stdout.flush()
+      runs.append(run_case(name, spec, args.process, args.keep))
+      print '%.2f s' % runs[-1]['total']['wall']
+    results['cases'][name] = {'spec': spec, 'stages': summarize(runs)}
+  output = args.output or os.path.join(RESULTS_DIR, '%s.json' % commit)
+  if not os.path.exists(os.path.dirname(os.path.abspath(output))):
+    os.makedirs(os.path.dirname(os.path.abspath(output)))
+  with open(output, 'w') as f:
+    json.dump(results, f, indent=1, sort_keys=True)
+  print 'Results are stored to %s' % output
+  print_results(results)
+
+def print_results(results):
+  tab = texttable.Texttable(max_width=132)
+  rows = [[]]
+  for name in sorted(results['cases']):
+    stages = results['cases'][name]['stages']
+    rows += [ [name, s, int(stages[s]['count']), '%.3f' % stages[s]['wall'], '%.3f' % stages[s]['cpu']] for s in STAGES + ['total'] if s in stages ]
+  tab.add_rows(rows)
+  tab.set_cols_align(['l', 'l', 'r', 'r', 'r'])
+  tab.header(['Case', 'Stage', 'Count', 'Wall [s]', 'CPU [s]'])
+  print tab.draw()
+
+def compare(args):
+  ''' print the wall time of stages of two results files, and their ratios (new/base) '''
+  base, new = [ json.load(open(f)) for f in [args.base, args.new] ]
+  print 'base: %s (%s), new: %s (%s)' % (base['commit'], base['date'], new['commit'], new['date'])
+  tab = texttable.Texttable(max_width=160)
+  rows = [[]]
+  for name in sorted(set(base['cases']) & set(new['cases'])):
+    b, n = base['cases'][name]['stages'], new['cases'][name]['stages']
+    for s in [ s for s in STAGES + ['total'] if s in b or s in n ]:
+      wb, wn = b.get(s, {}).get('wall', 0.0), n.get(s, {}).get('wall', 0.0)
+      rows.append([name, s, '%.3f' % wb, '%.3f' % wn, '%.2f' % (wn/wb) if wb > 0 else '-'])
+  tab.add_rows(rows)
+  tab.set_cols_align(['l', 'l', 'r', 'r', 'r'])
+  tab.header(['Case', 'Stage', 'Base [s]', 'New [s]', 'New/Base'])
+  print tab.draw()
+
+def list_cases(args):
+  tab = texttable.Texttable(max_width=160)
+  tab.add_rows([[]] + [ [n, s[0], ', '.join(map(str, s[1])), ', '.join(map(str, s[2])), s[3], s[4]] for n, s in CASES ])
+  tab.header(['Case', 'Analog inputs', 'Quantized bits', 'Digital mode bits', 'Outputs', 'max_sample'])
+  print tab.draw()
+
+def relative_error(base, new):
+  ''' max. difference of new from base relative to the max. of base, where NaN of both is no difference '''
+  base, new = np.atleast_1d(base).astype(float), np.atleast_1d(new).astype(float)
+  diff = np.where(np.isnan(base) & np.isnan(new), 0.0, np.abs(np.nan_to_num(base) - np.nan_to_num(new)))
+  return np.max(diff)/max(np.nanmax(np.abs(base)), 1e-300) if np.isfinite(base).any() else np.max(diff)
+
+def check(args):
+  ''' compare incremental and batch fits of a model with interactions, whose inputs are in [scale, 2*scale] '''
+  formula = {'y': 'a+b+c+a:b+a:c+b:c+I(a ** 2)'}
+  attrs = ['params', 'bse', 'pvalues', 'fittedvalues', 'rsquared', 'df_resid']
+  tab = texttable.Texttable(max_width=132)
+  rows = [['Scale', 'Samples', 'df_resid (batch)', 'df_resid (incr.)'] + attrs]
+  failed = False
+  for scale in args.scale:
+    rng = np.random.RandomState(1)
+    data = dict([ (k, (1.0 + rng.rand(48))*scale) for k in 'abc' ])
+    x = dict([ (k, v/scale) for k, v in data.items() ])
+    y = 0.5 + 2*x['a'] - 3*x['b'] + x['a']*x['b'] + 0.01*rng.randn(48)
+    design = IncrementalDesignMatrix()
+    for n in range(8, 49, 8):
+      design.append(dict([ (k, list(v[n-8:n])) for k, v in data.items() ]))
+      batch = fit_ols(DesignMatrix(dict([ (k, v[:n]) for k, v in data.items() ])), {'y': y[:n]}, formula)['y']
+      incremental = fit_ols(design, {'y': y[:n]}, formula)['y']
+      err = [ relative_error(getattr(batch, a), getattr(incremental, a)) for a in attrs ]
+      failed = failed or max(err) > args.tolerance
+      rows.append(['%g' % scale, '%d' % n, '%g' % batch.df_resid, '%g' % incremental.df_resid] + [ '%.1e' % e for e in err ])
+  tab.set_cols_dtype(['t']*len(rows[0]))
+  tab.set_cols_align(['r']*len(rows[0]))
+  tab.add_rows(rows)
+  print tab.draw()
+  if failed:
+    sys.exit('Incremental fits differ from batch fits by more than %g' % args.tolerance)
+
+def main():
+  parser = argparse.ArgumentParser(description='End-to-end benchmark of the mProbo pipeline.')
+  sub = parser.add_subparsers()
+  p = sub.add_parser('run', help='run benchmark cases')
+  p.add_argument('-c', '--case', nargs='+', help='cases to run. Default is all the cases')
+  p.add_argument('-r', '--repeat', type=int, default=3, help='number of runs of a case, whose median is stored. Default is 3')
+  p.add_argument('-p', '--process', type=int, default=1, help='number of processes (see mProbo -p). Default is 1')
+  p.add_argument('-o', '--output', help='results file. Default is results/<commit>.json')
+  p.add_argument('-k', '--keep', action='store_true', help='keep the run directories')
+  p.set_defaults(func=run)
+  p = sub.add_parser('compare', help='compare two results files')
+  p.add_argument('base')
+  p.add_argument('new')
+  p.set_defaults(func=compare)
+  p = sub.add_parser('list', help='list benchmark cases')
+  p.set_defaults(func=list_cases)
+  p = sub.add_parser('check', help='compare incremental and batch regression fits')
+  p.add_argument('-s', '--scale', type=float, nargs='+', default=[1.0, 1e-6, 1e-9, 1e-12], help='scales of inputs. Default is 1 1e-6 1e-9 1e-12')
+  p.add_argument('-t', '--tolerance', type=float, default=1e-6, help='max. relative difference. Default is 1e-6')
+  p.set_defaults(func=check)
+  args = parser.parse_args()
+  args.func(args)
+
+if __name__ == '__main__':
+  main()
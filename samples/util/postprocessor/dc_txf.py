@@ -42,9 +42,9 @@ OR
 import sys
 import numpy as np
 import argparse
-from scipy.interpolate import interp1d
 from lmfit import minimize, Parameters, report_fit
 import matplotlib.pylab as plt
+from dave.mlingua.waveform import load
 
 def main():
 
@@ -76,8 +76,8 @@ def main():
 
 
   # load simulation data
-  ramp_in = np.loadtxt(input_filename)
-  ramp_out = np.loadtxt(output_filename)
+  ramp_in = load(input_filename, cache=False)
+  ramp_out = load(output_filename, cache=False)
 
   # find time, x, y, sampling time interval
   t = ramp_in[:,0]   # time
@@ -99,7 +99,8 @@ def main():
   xs = x[-1]-x[-2] # x-step
 
   # create an interpolation function and resample data
-  fn_interp = interp1d(x,y)
+  order = np.argsort(x, kind='mergesort')
+  fn_interp = lambda xi, xp=x[order], fp=y[order]: np.interp(xi, xp, fp)
   x = np.arange(x[1],x[-2]+0.1*xs/oversample_rate,xs/oversample_rate) 
   y = fn_interp(x)
 
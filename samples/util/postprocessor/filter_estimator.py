@@ -9,7 +9,6 @@ Assumption:
   2. outputs poles and a zero such that p2>p1
 """
 
-from scipy.interpolate import interp1d
 from lmfit import minimize, Parameters, Parameter, report_fit
 import numpy as np
 import pickle as pkl
@@ -19,6 +18,7 @@ import pylab as plt
 import scipy
 import scipy.fftpack
 import math
+from dave.mlingua.waveform import Waveform
 
 def ceil_to_power_of_two(value):
   ''' convert a decimal number(value) to a binary string w/ given bit width(bw) '''
@@ -57,13 +57,10 @@ def resample_data(filename, ts, ti):
   ts: time offset to start resampling
   ti: resampling time step
   '''
-  data = np.loadtxt(filename)
-  t = data[:,0]
-  y = data[:,1]
+  wave = Waveform.load(filename, cache=False)
+  t = wave.t
   ti = min(t[-1]-t[-2],ti)
-  fn = interp1d(t,y)
-  time = np.arange(ts,t[-2],ti)
-  return time, fn(time)
+  return wave.resample(ts, t[-2], ti)
 
 def normalize(x, y, t):
   ''' normalize x and y,
@@ -111,8 +108,8 @@ def normalize_measurement(ifile, ofile, ts, te, ti):
   required_bin = tend/ti
   difference = required_bin - len(y)
   # interpolate
-  fx = interp1d(time, x)
-  fy = interp1d(time, y)
+  fx = Waveform(time, x)
+  fy = Waveform(time, y)
   time = np.arange(0, time[-1], ti)
   x = fx(time)
   y = fy(time)